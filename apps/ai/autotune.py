@@ -0,0 +1,42 @@
+# apps/ai/autotune.py
+import argparse
+
+from src.core.config import settings
+from src.services.ml.autotune import autotune_from_settings
+
+
+def print_profile(profile):
+    """
+    Measured candidates (fastest first) and the chosen settings
+    """
+    target = profile.target
+    print(f"\n{'='*50}")
+    print(f"Autotune: {target['cameras']} cameras x {target['fps']} FPS, p95 <= {target['p95_ms']} ms")
+    print(f"  host: {profile.host['cpu_model']} ({profile.host['cores']} cores)")
+    measurements = sorted(profile.measurements, key=lambda m: -m['throughput_fps'])
+    for m in measurements:
+        c = m['candidate']
+        status = m['error'] or f"{m['throughput_fps']:8.1f} FPS  p95 {m['p95_ms']:7.1f} ms"
+        print(f"    {c['model']:<8} {c['image_size']:>4}px  batch {c['batch_size']:<2} threads {c['threads']:<2} x{m['streams']:<2} {status}")
+    print(f"  chosen ({'meets target' if profile.meets_target else 'best effort, target NOT met'}):")
+    for name, value in profile.settings.items():
+        print(f"    {name}={value}")
+    print(f"{'='*50}\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark detection configurations on this host and cache the best profile")
+    parser.add_argument('--cameras', type=int, default=settings.AUTOTUNE_TARGET_CAMERAS)
+    parser.add_argument('--fps', type=float, default=settings.AUTOTUNE_TARGET_FPS, help='per camera')
+    parser.add_argument('--p95-ms', type=float, default=settings.AUTOTUNE_TARGET_P95_MS)
+    parser.add_argument('--force', action='store_true', help='benchmark even if a matching profile is cached')
+    args = parser.parse_args()
+
+    settings.AUTOTUNE_TARGET_CAMERAS = args.cameras
+    settings.AUTOTUNE_TARGET_FPS = args.fps
+    settings.AUTOTUNE_TARGET_P95_MS = args.p95_ms
+
+    profile = autotune_from_settings(force=args.force)
+    if profile is None:
+        raise SystemExit(f"No candidate could be measured (models looked up in {settings.MODELS_DIR})")
+    print_profile(profile)
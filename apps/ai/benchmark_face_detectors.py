@@ -0,0 +1,117 @@
+# apps/ai/benchmark_face_detectors.py
+import argparse
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from src.models.face.detector import DetectionConfig
+from src.services.ml.face_detectors import available_face_detectors, build_face_detector
+
+
+def load_frames(source, count=100):
+    """
+    BGR frames from a directory of images or a video file
+    """
+    source = Path(source)
+    if source.is_dir():
+        paths = sorted(p for p in source.rglob('*') if p.suffix.lower() in ('.jpg', '.jpeg', '.png', '.bmp'))
+        frames = [cv2.imread(str(p)) for p in paths[:count]]
+        return [f for f in frames if f is not None]
+
+    capture = cv2.VideoCapture(str(source))
+    frames = []
+    while len(frames) < count:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        frames.append(frame)
+    capture.release()
+    return frames
+
+
+def iou(a, b):
+    """
+    IoU of two (x, y, w, h) boxes
+    """
+    ix = max(0.0, min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0]))
+    iy = max(0.0, min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1]))
+    inter = ix * iy
+    union = a[2] * a[3] + b[2] * b[3] - inter
+    return inter / union if union > 0 else 0.0
+
+
+def match_count(reference, candidate, threshold=0.5):
+    """
+    Reference boxes with a candidate box at IoU >= threshold (greedy, one-to-one)
+    """
+    used = set()
+    matched = 0
+    for ref in reference:
+        best, best_iou = None, threshold
+        for j, cand in enumerate(candidate):
+            overlap = iou(ref, cand)
+            if j not in used and overlap >= best_iou:
+                best, best_iou = j, overlap
+        if best is not None:
+            used.add(best)
+            matched += 1
+    return matched
+
+
+def run_detector(detector, frames, confidence=0.7, warmup=3):
+    """
+    Per-frame boxes and latencies (ms) for one backend
+    """
+    for frame in frames[:warmup]:
+        detector.detect_with_quality(frame, confidence_threshold=confidence, return_crops=True)
+
+    boxes, latencies = [], []
+    for frame in frames:
+        start = time.perf_counter()
+        faces = detector.detect_with_quality(frame, confidence_threshold=confidence, return_crops=True)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+        boxes.append([tuple(float(v) for v in face.bbox) for face in faces])
+    return boxes, np.array(latencies)
+
+
+def benchmark_face_detectors(frames, backends, reference='mtcnn', confidence=0.7):
+    """
+    Latency of every backend, and recall / precision against the reference backend's faces
+    """
+    config = DetectionConfig(min_face_size=40, max_faces=10, quality_threshold=0.3, keep_all=True)
+    results = {name: run_detector(build_face_detector(name, config), frames, confidence) for name in backends}
+    ref_boxes = results[reference][0] if reference in results else None
+    h, w = frames[0].shape[:2]
+
+    print(f"\n{'='*50}")
+    print(f"Face detector benchmark ({len(frames)} frames, {w}x{h}):")
+    for name, (boxes, latencies) in results.items():
+        found = sum(len(b) for b in boxes)
+        print(f"  {name}:")
+        print(f"    latency median: {np.median(latencies):.2f} ms, p95: {np.percentile(latencies, 95):.2f} ms")
+        print(f"    faces: {found} ({found / len(frames):.2f}/frame)")
+        if ref_boxes is not None and name != reference:
+            matched = sum(match_count(r, c) for r, c in zip(ref_boxes, boxes))
+            total_ref = sum(len(r) for r in ref_boxes)
+            print(f"    recall vs {reference}: {matched / max(total_ref, 1):.3f}")
+            print(f"    precision vs {reference}: {matched / max(found, 1):.3f}")
+    print(f"{'='*50}\n")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare face detector backends on the same frames")
+    parser.add_argument('source', help='directory of frames or a video file')
+    parser.add_argument('--backends', nargs='+', default=available_face_detectors())
+    parser.add_argument('--reference', default='mtcnn')
+    parser.add_argument('--count', type=int, default=100)
+    parser.add_argument('--confidence', type=float, default=0.7)
+    args = parser.parse_args()
+
+    frames = load_frames(args.source, args.count)
+    if not frames:
+        raise SystemExit(f"No frames read from {args.source}")
+    benchmark_face_detectors(frames, args.backends, args.reference, args.confidence)
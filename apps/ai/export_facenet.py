@@ -0,0 +1,122 @@
+# apps/ai/export_facenet.py
+import argparse
+from pathlib import Path
+
+import cv2
+import numpy as np
+import torch
+from facenet_pytorch import InceptionResnetV1
+
+from src.models.face.embedder import EmbedderConfig, FaceEmbedder
+from src.services.ml.onnx_embedder import OnnxEmbedderConfig, OnnxFaceEmbedder, cosine_agreement
+
+IMAGE_SIZE = 160
+
+
+def load_facenet(pretrained='vggface2'):
+    """
+    FaceNet exactly as FaceEmbedder builds it (eval mode, CPU)
+    """
+    return InceptionResnetV1(pretrained=pretrained).eval()
+
+
+def export_onnx(model, output_path, opset=17):
+    """
+    Export FaceNet to ONNX with a dynamic batch axis
+    """
+    dummy = torch.randn(2, 3, IMAGE_SIZE, IMAGE_SIZE)
+    torch.onnx.export(
+        model,
+        dummy,
+        str(output_path),
+        input_names=['crops'],
+        output_names=['embeddings'],
+        dynamic_axes={'crops': {0: 'batch'}, 'embeddings': {0: 'batch'}},
+        opset_version=opset,
+        do_constant_folding=True,
+    )
+    print(f"✓ ONNX export complete: {output_path}")
+
+
+def export_torchscript(model, output_path):
+    """
+    Trace + freeze FaceNet to TorchScript (batch size is free at runtime)
+    """
+    dummy = torch.randn(2, 3, IMAGE_SIZE, IMAGE_SIZE)
+    with torch.inference_mode():
+        frozen = torch.jit.freeze(torch.jit.trace(model, dummy))
+    frozen.save(str(output_path))
+    print(f"✓ TorchScript export complete: {output_path}")
+
+
+def load_crops(crops_dir=None, count=64):
+    """
+    RGB face crops for the parity check: real crops if a directory is given,
+    random images otherwise
+    """
+    if crops_dir:
+        paths = sorted(p for p in Path(crops_dir).iterdir() if p.suffix.lower() in ('.jpg', '.jpeg', '.png'))
+        crops = []
+        for path in paths:
+            image = cv2.imread(str(path))
+            if image is None:
+                print(f"  skipping unreadable crop: {path}")
+                continue
+            crops.append(image[..., ::-1])
+            if len(crops) == count:
+                break
+        if crops:
+            return crops
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 255, (IMAGE_SIZE, IMAGE_SIZE, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def reference_embeddings(crops, pretrained='vggface2'):
+    """
+    Embeddings from the production PyTorch embedder, configured as the service builds it
+    """
+    embedder = FaceEmbedder(EmbedderConfig(
+        input_color_space='rgb',
+        pretrained=pretrained,
+        normalize_l2=True,
+    ))
+    return np.stack(embedder.embed_batch(crops))
+
+
+def check_parity(onnx_path, crops, tolerance=0.999):
+    """
+    Embeddings from the ONNX runtime must agree with the PyTorch FaceEmbedder within a cosine tolerance
+    """
+    embedder = OnnxFaceEmbedder(OnnxEmbedderConfig(model_path=onnx_path))
+    candidate = np.stack(embedder.embed_batch(crops))
+    agreement = cosine_agreement(reference_embeddings(crops), candidate)
+
+    print(f"\n{'='*50}")
+    print(f"Parity ({len(crops)} crops):")
+    print(f"  min cosine: {agreement.min():.6f}")
+    print(f"  mean cosine: {agreement.mean():.6f}")
+    print(f"  tolerance: {tolerance}")
+    print(f"{'='*50}\n")
+
+    return bool(agreement.min() >= tolerance)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export FaceNet (vggface2) for ONNX Runtime / TorchScript")
+    parser.add_argument('--output', default='data/models/production/facenet_vggface2.onnx')
+    parser.add_argument('--torchscript', action='store_true', help='also write a frozen TorchScript model')
+    parser.add_argument('--crops', default=None, help='directory of real face crops for the parity check')
+    parser.add_argument('--tolerance', type=float, default=0.999)
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    facenet = load_facenet()
+    export_onnx(facenet, output)
+    if args.torchscript:
+        export_torchscript(facenet, output.with_suffix('.torchscript.pt'))
+
+    if not check_parity(output, load_crops(args.crops), args.tolerance):
+        raise SystemExit("ONNX embeddings do not match PyTorch within tolerance")
+    print("✓ Parity check passed")
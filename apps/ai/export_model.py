@@ -10,7 +10,8 @@ def export_models(model_path='runs/detect/sssp_v1/weights/best.pt'):
     print("Exporting models...")
     
     # 1. ONNX (recommended for production)
-    model.export(format='onnx', simplify=True)
+    # dynamic batch lets the ONNX Runtime backend run a whole batch in one session call
+    model.export(format='onnx', simplify=True, dynamic=True)
     print("✓ ONNX export complete")
     
     # 2. TensorRT (for NVIDIA GPUs - fastest)
@@ -0,0 +1,170 @@
+# apps/ai/quantize_models.py
+import argparse
+import json
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from src.services.ml.onnx_detector import OnnxYoloDetector, letterbox, to_model_input
+from src.services.ml.onnx_embedder import (
+    OnnxEmbedderConfig,
+    OnnxFaceEmbedder,
+    cosine_agreement,
+    preprocess_crops,
+)
+from src.services.ml.quantization import (
+    IMAGE_SUFFIXES,
+    BatchCalibrationReader,
+    measure_latency_ms,
+    quantize_int8,
+    sample_frames,
+    similarity_drift,
+    yolo_head_nodes,
+)
+
+
+def int8_path(model_path):
+    """
+    Where the quantized model goes; the onnxruntime_int8 backends load it from here
+    """
+    return Path(model_path).with_suffix('.int8.onnx')
+
+
+def quantize_yolo(model_path, frames):
+    """
+    Static INT8 YOLO calibrated on letterboxed production frames (Detect head kept in float)
+    """
+    detector = OnnxYoloDetector(model_path)
+    size = detector.image_size
+    reader = BatchCalibrationReader(
+        detector.session.get_inputs()[0].name,
+        frames,
+        lambda batch: to_model_input([letterbox(frame, size)[0] for frame in batch]),
+    )
+    return quantize_int8(model_path, int8_path(model_path), reader, yolo_head_nodes(model_path))
+
+
+def yolo_report(model_path, quantized_path, frames, data=None):
+    """
+    Latency on real frames and, with a dataset yaml, the mAP delta from validate_model.py
+    """
+    fp32 = OnnxYoloDetector(model_path, intra_op_threads=1)
+    int8 = OnnxYoloDetector(quantized_path, intra_op_threads=1)
+    frame = frames[0]
+
+    report = {
+        'latency_ms_fp32': measure_latency_ms(lambda: fp32.predict(frame)),
+        'latency_ms_int8': measure_latency_ms(lambda: int8.predict(frame)),
+    }
+    if data:
+        from validate_model import validate_model
+
+        base = validate_model(str(model_path), data=data).box
+        quant = validate_model(str(quantized_path), data=data).box
+        report.update({
+            'map50_fp32': float(base.map50),
+            'map50_int8': float(quant.map50),
+            'map50_delta': float(quant.map50 - base.map50),
+            'map_fp32': float(base.map),
+            'map_int8': float(quant.map),
+            'map_delta': float(quant.map - base.map),
+        })
+    report['speedup'] = report['latency_ms_fp32'] / report['latency_ms_int8']
+    return report
+
+
+def load_face_crops(crops_dir, count=400, seed=0):
+    """
+    RGB face crops (as FaceDetector hands them to the embedder) from a directory of images
+    """
+    paths = sorted(p for p in Path(crops_dir).rglob('*') if p.suffix.lower() in IMAGE_SUFFIXES)
+    rng = np.random.default_rng(seed)
+    paths = [paths[i] for i in rng.permutation(len(paths))[:count]]
+    crops = [cv2.imread(str(p)) for p in paths]
+    return [c[..., ::-1].copy() for c in crops if c is not None]
+
+
+def quantize_facenet(model_path, crops):
+    """
+    Static INT8 FaceNet calibrated on real face crops
+    """
+    config = OnnxEmbedderConfig(model_path=model_path)
+    reader = BatchCalibrationReader(
+        'crops',
+        crops,
+        lambda batch: preprocess_crops(batch, config.image_size, config.input_color_space),
+        batch_size=16,
+    )
+    return quantize_int8(model_path, int8_path(model_path), reader)
+
+
+def facenet_report(model_path, quantized_path, crops):
+    """
+    Cosine agreement with the float model on held-out crops, plus how far any
+    pairwise similarity (i.e. a match score) moves
+    """
+    fp32 = OnnxFaceEmbedder(OnnxEmbedderConfig(model_path=model_path, intra_op_threads=1))
+    int8 = OnnxFaceEmbedder(OnnxEmbedderConfig(model_path=quantized_path, intra_op_threads=1))
+    reference = np.stack(fp32.embed_batch(crops))
+    candidate = np.stack(int8.embed_batch(crops))
+    agreement = cosine_agreement(reference, candidate)
+    batch = crops[:16]
+
+    latency_fp32 = measure_latency_ms(lambda: fp32.embed_batch(batch))
+    latency_int8 = measure_latency_ms(lambda: int8.embed_batch(batch))
+    return {
+        'holdout_crops': len(crops),
+        'cosine_min': float(agreement.min()),
+        'cosine_mean': float(agreement.mean()),
+        'similarity_max_drift': similarity_drift(reference, candidate),
+        'latency_ms_fp32_batch16': latency_fp32,
+        'latency_ms_int8_batch16': latency_int8,
+        'speedup': latency_fp32 / latency_int8,
+    }
+
+
+def print_report(name, report):
+    print(f"\n{'='*50}")
+    print(f"{name} INT8 vs FP32:")
+    for key, value in report.items():
+        print(f"  {key}: {value:.4f}" if isinstance(value, float) else f"  {key}: {value}")
+    print(f"{'='*50}\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Static INT8 quantization of the ONNX detector / embedder")
+    parser.add_argument('--yolo', default='runs/detect/sssp_v1/weights/best.onnx')
+    parser.add_argument('--facenet', default='data/models/production/facenet_vggface2.onnx')
+    parser.add_argument('--frames', default=None, help='directory of production frames or a video file')
+    parser.add_argument('--face-crops', default=None, help='directory of production face crops')
+    parser.add_argument('--data', default=None, help='dataset yaml for the mAP comparison')
+    parser.add_argument('--count', type=int, default=200, help='calibration samples')
+    parser.add_argument('--holdout', type=float, default=0.2, help='share of face crops kept out of calibration')
+    parser.add_argument('--report', default='quantization_report.json')
+    args = parser.parse_args()
+
+    if not args.frames and not args.face_crops:
+        parser.error("give --frames (YOLO) and/or --face-crops (FaceNet)")
+
+    results = {}
+    if args.frames:
+        frames = sample_frames(Path(args.frames), args.count)
+        print(f"Calibrating YOLO on {len(frames)} frames...")
+        quantized = quantize_yolo(Path(args.yolo), frames)
+        results['yolo'] = {'model_int8': str(quantized), **yolo_report(args.yolo, quantized, frames, args.data)}
+        print_report('YOLO', results['yolo'])
+
+    if args.face_crops:
+        crops = load_face_crops(args.face_crops, args.count)
+        split = max(1, int(len(crops) * (1.0 - args.holdout)))
+        print(f"Calibrating FaceNet on {split} crops ({len(crops) - split} held out)...")
+        quantized = quantize_facenet(Path(args.facenet), crops[:split])
+        results['facenet'] = {
+            'model_int8': str(quantized),
+            **facenet_report(args.facenet, quantized, crops[split:] or crops),
+        }
+        print_report('FaceNet', results['facenet'])
+
+    Path(args.report).write_text(json.dumps(results, indent=2))
+    print(f"✓ Report written: {args.report}")
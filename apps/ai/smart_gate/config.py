@@ -10,6 +10,10 @@ MOTION_MIN_AREA = 500
 GAUSSIAN_BLUR_KERNEL = (21, 21)
 THRESHOLD = 25
 
+# Face detector: "mtcnn" or "yunet" (faster on CPU)
+FACE_DETECTOR = "mtcnn"
+YUNET_MODEL_PATH = "data/models/face_detection_yunet_2023mar.onnx"
+
 # FaceNet settings
 FACENET_IMAGE_SIZE = (160, 160)
 EMBEDDING_THRESHOLD = 0.6
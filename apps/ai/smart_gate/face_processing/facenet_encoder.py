@@ -1,14 +1,30 @@
 # face_processing/facenet_model.py
 from facenet_pytorch import InceptionResnetV1
 import torch
-from utills.preprocessing import resize_image, normalize_image
-from camera.frame_utils import bgr_to_rgb
+from utills.preprocessing import preprocess_faces
 
 
 class FaceNetModel:
     def __init__(self, device='cpu', pretrained=True):
         self.device = device  #('cuda' if torch.cuda.is_available() else 'cpu')
         self.model = InceptionResnetV1(pretrained='vggface2' if pretrained else None).eval().to(self.device)
+        self._batch = None  # reused float32 input buffer
+
+    def get_embeddings(self, frame, boxes):
+        """
+        Input: frame (np array BGR), boxes [(x1, y1, x2, y2), ...]
+        Output: embeddings (torch tensor, n x 512)
+        """
+        if len(boxes) == 0:
+            return torch.empty((0, 512))
+
+        self._batch = preprocess_faces(frame, boxes, (160, 160), out=self._batch)
+        tensor_faces = torch.from_numpy(self._batch).to(self.device)
+
+        with torch.no_grad():
+            embeddings = self.model(tensor_faces)
+
+        return embeddings
 
     def get_embedding(self, face):
         """
@@ -18,15 +34,5 @@ class FaceNetModel:
         if face is None or face.size == 0:
             return None
 
-        rgb_face = bgr_to_rgb(face)
-        resized_face = resize_image(rgb_face, (160, 160))
-        normalized_face = normalize_image(resized_face)
-
-        #tensor_face = torch.tensor(normalized_face, dtype=torch.float33, device=self.device)
-        tensor_face = torch.from_numpy(normalized_face).float()  #faster.
-        tensor_face = tensor_face.permute(2, 0, 1).unsqueeze(0)
-
-        with torch.no_grad():
-            embedding = self.model(tensor_face)
-
-        return embedding.squeeze()
+        h, w = face.shape[:2]
+        return self.get_embeddings(face, [(0, 0, w, h)]).squeeze()
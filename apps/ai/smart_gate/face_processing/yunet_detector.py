@@ -0,0 +1,34 @@
+# face_processing/yunet_detector.py
+import cv2
+from camera.frame_utils import bgr_to_rgb
+
+class YuNetDetector:
+    """
+    OpenCV YuNet (cv2.FaceDetectorYN) with the same detect() contract as MTCNNDetector.
+    Much cheaper than MTCNN on CPU.
+    """
+    def __init__(self, model_path, score_threshold=0.7, nms_threshold=0.3):
+        self.detector = cv2.FaceDetectorYN.create(model_path, "", (320, 320), score_threshold, nms_threshold, 5000)
+
+    def detect(self, frame):
+        """
+        Input: frame numpy array BGR
+        Output: (boxes as x1, y1, x2, y2 or None, list of RGB face crops)
+        """
+        h, w = frame.shape[:2]
+        self.detector.setInputSize((w, h))
+        _, raw = self.detector.detect(frame)
+        if raw is None:
+            return None, []
+
+        boxes = raw[:, :4].copy()
+        boxes[:, 2:] += boxes[:, :2]  # x, y, w, h -> x1, y1, x2, y2
+        boxes = boxes.clip(0, [w, h, w, h])
+
+        rgb_frame = bgr_to_rgb(frame)
+        faces = []
+        for box in boxes:
+            x1, y1, x2, y2 = [int(b) for b in box]
+            faces.append(rgb_frame[y1:y2, x1:x2].copy())
+
+        return boxes, faces
@@ -2,6 +2,8 @@ import numpy as np
 from camera.stream import CameraStream
 from face_processing.facenet_encoder import FaceNetModel
 from face_processing.mtcnn_detector import MTCNNDetector
+from face_processing.yunet_detector import YuNetDetector
+from config import FACE_DETECTOR, YUNET_MODEL_PATH
 from database.db_manager import DBManager
 from utills.similarity import cosine_similarity
 import time
@@ -9,7 +11,7 @@ import time
 class FaceRecognitionSystem:
     def __init__(self, device = 'cpu', threshold = 0.6):
         self.camera = CameraStream()
-        self.detector = MTCNNDetector()
+        self.detector = YuNetDetector(YUNET_MODEL_PATH) if FACE_DETECTOR == "yunet" else MTCNNDetector()
         self.facenet = FaceNetModel()
         self.db = DBManager()
         self.device = device
@@ -57,13 +59,11 @@ class FaceRecognitionSystem:
         if not database:
             return []
 
-        results = []
-        for box in boxes:
-            x1, y1, x2, y2 = map(int, box)
-            face = frame[y1:y2, x1:x2]
-
-            embedding = self.facenet.get_embedding(face).cpu().numpy()
+        # one forward pass for every face in the frame
+        embeddings = self.facenet.get_embeddings(frame, boxes).cpu().numpy()
 
+        results = []
+        for box, embedding in zip(boxes, embeddings):
             best_match = None
             best_score = -1
 
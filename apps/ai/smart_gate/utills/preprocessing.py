@@ -1,13 +1,39 @@
 # utils/preprocessing.py
 import cv2
+import numpy as np
 
 def resize_image(image, size=(160, 160)):
     """Resize image to target size"""
     return cv2.resize(image, size)
 
 def normalize_image(image):
-    """Normalize pixel values to [0, 1]"""
-    return image / 255.0
+    """Normalize pixel values to [0, 1] (float32)"""
+    return np.multiply(image, np.float32(1.0 / 255.0), dtype=np.float32)
+
+def preprocess_faces(frame, boxes, size=(160, 160), out=None):
+    """
+    Crop (x1, y1, x2, y2) boxes out of a BGR frame and build one model batch.
+    Output: float32 (n, 3, h, w), RGB, values in [0, 1]
+    """
+    w, h = size
+    fh, fw = frame.shape[:2]
+    n = len(boxes)
+    if out is None or out.shape != (n, 3, h, w):
+        out = np.empty((n, 3, h, w), dtype=np.float32)
+
+    # resize every crop (a view of the frame) straight into its slot
+    staging = np.empty((n, h, w, 3), dtype=np.uint8)
+    for slot, box in zip(staging, boxes):
+        x1, y1, x2, y2 = map(int, box)
+        face = frame[max(y1, 0):min(y2, fh), max(x1, 0):min(x2, fw)]
+        if face.size == 0:
+            slot.fill(0)
+        else:
+            cv2.resize(face, size, dst=slot)
+
+    # BGR->RGB, HWC->CHW and /255 in one pass over the whole batch
+    np.multiply(staging[..., ::-1].transpose(0, 3, 1, 2), np.float32(1.0 / 255.0), out=out, casting="unsafe")
+    return out
 
 #def align_face(image, landmarks=None):
     #"""
@@ -0,0 +1,478 @@
+"""
+apps/ai/src/api/grpc/admission.py
+Global admission control and load shedding for inference RPCs.
+
+- At most `max_in_flight` inference calls run at once (MAX_CONCURRENT_REQUESTS)
+- Waiters queue in priority lanes: live stream frames > unary calls > batch jobs
+- A request is rejected up front with RESOURCE_EXHAUSTED when its projected
+  queue wait exceeds its budget, and again if the wait actually runs out
+- The budget is the lane budget, capped by REQUEST_TIMEOUT and the caller's
+  gRPC deadline
+
+Unary and batch RPCs are gated by `AdmissionInterceptor` (or
+`AioAdmissionInterceptor` on a grpc.aio server) for the whole call. The aio
+interceptor sheds or grants on the event loop and only hands real queue
+waits to its own bounded thread pool, with the time spent queueing for a
+thread taken out of the budget.
+Streaming RPCs are long-lived, so they are not gated at the RPC level; their
+handlers take a STREAM-lane slot per frame instead.
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, Iterator, Optional
+
+import grpc
+import structlog
+
+logger = structlog.get_logger("grpc.admission")
+
+
+class Lane(IntEnum):
+    """Priority lanes (lower value = served first)."""
+    STREAM = 0
+    UNARY = 1
+    BATCH = 2
+
+
+# RPC name -> lane. Anything not listed is UNARY; None means not gated.
+_METHOD_LANES: Dict[str, Optional[Lane]] = {
+    "StreamFrames": Lane.STREAM,
+    "DetectObjectsStream": Lane.STREAM,
+    "DetectObjectsBatch": Lane.BATCH,
+    "DetectObjectsBatchStream": Lane.BATCH,
+    "GetModelInfo": None,
+    "Check": None,   # grpc.health.v1
+    "Watch": None,
+}
+
+
+def lane_for_method(method: str) -> Optional[Lane]:
+    """Map a full gRPC method path (/pkg.Service/Method) to its lane."""
+    name = method.rsplit("/", 1)[-1]
+    if method.startswith("/grpc."):
+        return None
+    return _METHOD_LANES.get(name, Lane.UNARY)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed instead of queued."""
+
+    def __init__(self, lane: Lane, reason: str, retry_after_ms: float = 0.0) -> None:
+        super().__init__(reason)
+        self.lane = lane
+        self.reason = reason
+        self.retry_after_ms = retry_after_ms
+
+
+@dataclass
+class _Waiter:
+    lane: Lane
+    granted: bool = False
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class AdmissionTicket:
+    lane: Lane
+    granted_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _LaneStats:
+    admitted: int = 0
+    rejected_projected: int = 0
+    rejected_timeout: int = 0
+    total_wait_ms: float = 0.0
+
+
+class AdmissionController:
+    """
+    Priority-lane semaphore with queue-wait budgets.
+
+    Thread-safe; one instance per server.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 10,
+        queue_budgets_ms: Optional[Dict[Lane, float]] = None,
+        max_budget_ms: Optional[float] = None,
+        ewma_alpha: float = 0.2,
+    ) -> None:
+        self.max_in_flight = max(1, max_in_flight)
+        self.queue_budgets_ms: Dict[Lane, float] = {
+            Lane.STREAM: 500.0,
+            Lane.UNARY: 2000.0,
+            Lane.BATCH: 10000.0,
+            **(queue_budgets_ms or {}),
+        }
+        self.max_budget_ms = max_budget_ms
+        self.ewma_alpha = ewma_alpha
+
+        self._queues: Dict[Lane, Deque[_Waiter]] = {lane: deque() for lane in Lane}
+        self._stats: Dict[Lane, _LaneStats] = {lane: _LaneStats() for lane in Lane}
+        self._in_flight = 0
+        self._service_ewma_ms = 0.0
+        self._cond = threading.Condition()
+
+        logger.info(
+            "admission_controller_initialized",
+            max_in_flight=self.max_in_flight,
+            queue_budgets_ms={lane.name: ms for lane, ms in self.queue_budgets_ms.items()},
+            max_budget_ms=max_budget_ms,
+        )
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def acquire(
+        self,
+        lane: Lane,
+        budget_ms: Optional[float] = None,
+        since: Optional[float] = None,
+    ) -> AdmissionTicket:
+        """
+        Wait for an inference slot within the lane's queue budget.
+
+        Args:
+            lane: Priority lane
+            budget_ms: Caller's own budget (e.g. gRPC time remaining); the
+                smaller of this, the lane budget and max_budget_ms applies
+            since: time.monotonic() when the caller started waiting (e.g.
+                before queueing for a thread); that time counts against the
+                budget. Defaults to now.
+
+        Raises:
+            AdmissionRejected: projected or actual wait exceeds the budget
+        """
+        budget_ms = self._effective_budget_ms(lane, budget_ms)
+
+        with self._cond:
+            self._check_projected(lane, budget_ms)
+
+            waiter = _Waiter(lane=lane)
+            if since is not None:
+                waiter.enqueued_at = since
+            self._queues[lane].append(waiter)
+            self._dispatch()
+
+            deadline = waiter.enqueued_at + budget_ms / 1000.0
+            while not waiter.granted:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._queues[lane].remove(waiter)
+                    self._stats[lane].rejected_timeout += 1
+                    raise AdmissionRejected(
+                        lane,
+                        f"Server overloaded: no inference slot within {budget_ms:.0f}ms",
+                        retry_after_ms=max(self._projected_wait_ms(lane), budget_ms),
+                    )
+                self._cond.wait(timeout=remaining)
+
+            stats = self._stats[lane]
+            stats.admitted += 1
+            stats.total_wait_ms += (time.monotonic() - waiter.enqueued_at) * 1000.0
+            return AdmissionTicket(lane=lane)
+
+    def try_acquire(self, lane: Lane, budget_ms: Optional[float] = None) -> Optional[AdmissionTicket]:
+        """
+        Take a free slot without waiting.
+
+        Returns:
+            A ticket, or None when the caller would have to queue
+
+        Raises:
+            AdmissionRejected: projected wait exceeds the budget
+        """
+        budget_ms = self._effective_budget_ms(lane, budget_ms)
+
+        with self._cond:
+            self._check_projected(lane, budget_ms)
+            if self._in_flight >= self.max_in_flight:
+                return None
+            self._in_flight += 1  # free slots mean every queue is empty
+            self._stats[lane].admitted += 1
+            return AdmissionTicket(lane=lane)
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Free the slot and update the service-time estimate."""
+        held_ms = (time.monotonic() - ticket.granted_at) * 1000.0
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            if self._service_ewma_ms == 0.0:
+                self._service_ewma_ms = held_ms
+            else:
+                self._service_ewma_ms += self.ewma_alpha * (held_ms - self._service_ewma_ms)
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, lane: Lane, budget_ms: Optional[float] = None) -> Iterator[AdmissionTicket]:
+        """Context manager around acquire()/release()."""
+        ticket = self.acquire(lane, budget_ms)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current load and per-lane counters."""
+        with self._cond:
+            return {
+                "in_flight": self._in_flight,
+                "max_in_flight": self.max_in_flight,
+                "service_time_ewma_ms": round(self._service_ewma_ms, 2),
+                "lanes": {
+                    lane.name.lower(): {
+                        "queued": len(self._queues[lane]),
+                        "admitted": s.admitted,
+                        "rejected": s.rejected_projected + s.rejected_timeout,
+                        "rejected_projected": s.rejected_projected,
+                        "rejected_timeout": s.rejected_timeout,
+                        "avg_wait_ms": round(s.total_wait_ms / s.admitted, 2) if s.admitted else 0.0,
+                        "projected_wait_ms": round(self._projected_wait_ms(lane), 2),
+                    }
+                    for lane, s in self._stats.items()
+                },
+            }
+
+    # =========================================================================
+    # INTERNALS (lock held)
+    # =========================================================================
+
+    def _effective_budget_ms(self, lane: Lane, budget_ms: Optional[float]) -> float:
+        budget = self.queue_budgets_ms[lane]
+        if self.max_budget_ms is not None:
+            budget = min(budget, self.max_budget_ms)
+        if budget_ms is not None:
+            budget = min(budget, budget_ms)
+        return max(0.0, budget)
+
+    def _check_projected(self, lane: Lane, budget_ms: float) -> None:
+        projected = self._projected_wait_ms(lane)
+        if projected > budget_ms:
+            self._stats[lane].rejected_projected += 1
+            raise AdmissionRejected(
+                lane,
+                f"Server overloaded: projected queue wait {projected:.0f}ms "
+                f"exceeds {budget_ms:.0f}ms budget",
+                retry_after_ms=projected,
+            )
+
+    def _projected_wait_ms(self, lane: Lane) -> float:
+        """Expected wait for a new arrival in `lane`, from the service-time EWMA."""
+        ahead = sum(len(self._queues[ahead_lane]) for ahead_lane in Lane if ahead_lane <= lane)
+        completions_needed = self._in_flight + ahead - self.max_in_flight + 1
+        if completions_needed <= 0:
+            return 0.0
+        return completions_needed * self._service_ewma_ms / self.max_in_flight
+
+    def _dispatch(self) -> None:
+        granted = False
+        while self._in_flight < self.max_in_flight:
+            lane = next((candidate for candidate in Lane if self._queues[candidate]), None)
+            if lane is None:
+                break
+            self._queues[lane].popleft().granted = True
+            self._in_flight += 1
+            granted = True
+        if granted:
+            self._cond.notify_all()
+
+
+# ============================================================================
+# gRPC interceptor
+# ============================================================================
+
+class AdmissionInterceptor(grpc.ServerInterceptor):
+    """
+    Gates unary-response RPCs through an AdmissionController.
+
+    Streaming-request RPCs pass through untouched (they gate per frame).
+    """
+
+    def __init__(self, controller: AdmissionController) -> None:
+        self.controller = controller
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        lane = lane_for_method(handler_call_details.method)
+        if lane is None or lane is Lane.STREAM or handler.request_streaming:
+            return handler
+
+        method = handler_call_details.method
+        if handler.unary_unary is not None:
+            return grpc.unary_unary_rpc_method_handler(
+                self._wrap_unary(handler.unary_unary, lane, method),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream is not None:
+            return grpc.unary_stream_rpc_method_handler(
+                self._wrap_unary_stream(handler.unary_stream, lane, method),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
+
+    def _wrap_unary(self, behavior: Callable, lane: Lane, method: str) -> Callable:
+        def wrapper(request, context):
+            ticket = self._admit(lane, method, context)
+            try:
+                return behavior(request, context)
+            finally:
+                self.controller.release(ticket)
+        return wrapper
+
+    def _wrap_unary_stream(self, behavior: Callable, lane: Lane, method: str) -> Callable:
+        def wrapper(request, context):
+            ticket = self._admit(lane, method, context)
+            try:
+                yield from behavior(request, context)
+            finally:
+                self.controller.release(ticket)
+        return wrapper
+
+    def _admit(self, lane: Lane, method: str, context: grpc.ServicerContext) -> AdmissionTicket:
+        try:
+            return self.controller.acquire(lane, _budget_ms(context))
+        except AdmissionRejected as e:
+            _reject(method, context, e)
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, e.reason)
+
+
+class AioAdmissionInterceptor(grpc.aio.ServerInterceptor):
+    """
+    AdmissionInterceptor for grpc.aio servers.
+
+    Only coroutine handlers are gated; plain functions (run on the server's
+    migration thread pool) pass through. Requests are shed or granted on the
+    event loop without a thread; only queue waits block one of
+    `wait_threads` threads (default 2 x max_in_flight), never the loop itself.
+    """
+
+    def __init__(self, controller: AdmissionController, wait_threads: int = 0) -> None:
+        self.controller = controller
+        self._waiters = ThreadPoolExecutor(
+            max_workers=wait_threads or 2 * controller.max_in_flight,
+            thread_name_prefix="admission-wait",
+        )
+
+    def close(self) -> None:
+        """Stop the wait threads; waits already running finish on their own."""
+        self._waiters.shutdown(wait=False, cancel_futures=True)
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        lane = lane_for_method(handler_call_details.method)
+        if lane is None or lane is Lane.STREAM or handler.request_streaming:
+            return handler
+
+        method = handler_call_details.method
+        if handler.unary_unary is not None and inspect.iscoroutinefunction(handler.unary_unary):
+            return grpc.unary_unary_rpc_method_handler(
+                self._wrap_unary(handler.unary_unary, lane, method),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream is not None and inspect.isasyncgenfunction(handler.unary_stream):
+            return grpc.unary_stream_rpc_method_handler(
+                self._wrap_unary_stream(handler.unary_stream, lane, method),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
+
+    def _wrap_unary(self, behavior: Callable, lane: Lane, method: str) -> Callable:
+        async def wrapper(request, context):
+            ticket = await self._admit(lane, method, context)
+            try:
+                return await behavior(request, context)
+            finally:
+                self.controller.release(ticket)
+        return wrapper
+
+    def _wrap_unary_stream(self, behavior: Callable, lane: Lane, method: str) -> Callable:
+        async def wrapper(request, context):
+            ticket = await self._admit(lane, method, context)
+            try:
+                async for response in behavior(request, context):
+                    yield response
+            finally:
+                self.controller.release(ticket)
+        return wrapper
+
+    async def _admit(self, lane: Lane, method: str, context) -> AdmissionTicket:
+        budget_ms = _budget_ms(context)
+        queued_at = time.monotonic()
+        try:
+            ticket = self.controller.try_acquire(lane, budget_ms)
+            if ticket is not None:
+                return ticket
+
+            # Time spent waiting for a wait thread comes out of the budget
+            pending = asyncio.get_running_loop().run_in_executor(
+                self._waiters, self.controller.acquire, lane, budget_ms, queued_at
+            )
+            try:
+                # Shielded: the wait thread keeps waiting after a cancel, so
+                # the slot it may still win has to be handed back on completion.
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                pending.add_done_callback(self._release_abandoned)
+                raise
+        except AdmissionRejected as e:
+            _reject(method, context, e)
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, e.reason)
+
+    def _release_abandoned(self, pending: "asyncio.Future[AdmissionTicket]") -> None:
+        """Release a slot granted after its RPC was cancelled or timed out."""
+        if pending.cancelled() or pending.exception() is not None:
+            return
+        self.controller.release(pending.result())
+
+
+def _budget_ms(context) -> Optional[float]:
+    remaining = context.time_remaining()
+    return remaining * 1000.0 if remaining is not None else None
+
+
+def _reject(method: str, context, error: AdmissionRejected) -> None:
+    """Log a shed request and attach its retry-after hint."""
+    logger.warning(
+        "rpc_rejected_overload",
+        method=method,
+        lane=error.lane.name,
+        reason=error.reason,
+        retry_after_ms=round(error.retry_after_ms, 1),
+    )
+    context.set_trailing_metadata((("retry-after-ms", str(int(error.retry_after_ms))),))
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = [
+    "Lane",
+    "AdmissionController",
+    "AdmissionInterceptor",
+    "AioAdmissionInterceptor",
+    "AdmissionRejected",
+    "AdmissionTicket",
+    "lane_for_method",
+]
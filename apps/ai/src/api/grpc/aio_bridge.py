@@ -0,0 +1,270 @@
+"""
+apps/ai/src/api/grpc/aio_bridge.py
+grpc.aio front-ends for the synchronous servicers.
+
+With GRPC_SERVER_MODE=aio the server runs on an asyncio event loop: reading
+and writing messages, waiting for frames and keeping idle streams open cost
+no threads. Only the blocking work of a request (decode, model calls, proto
+mapping) is handed to a bounded inference executor
+(INFERENCE_EXECUTOR_WORKERS), which runs the existing sync servicer code.
+
+- Unary RPCs: the sync handler runs on the executor
+- Unary-stream RPCs: each step of the sync generator runs on the executor
+- DetectObjectsStream: requests are read on the loop; each frame's detection
+  runs on the executor
+- StreamFrames: requests are read on the loop into the latest-frame-wins
+  mailbox; each admitted frame runs its stages on the executor
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+import grpc
+import structlog
+
+from packages.contracts.python import (
+    detection_pb2_grpc,
+    face_pb2_grpc,
+    frame_analysis_pb2_grpc,
+    video_stream_pb2_grpc,
+)
+from src.core.deadline import Deadline
+
+logger = structlog.get_logger("grpc.aio_bridge")
+
+_DONE = object()
+
+
+# ============================================================================
+# Sync context shim
+# ============================================================================
+
+class _Aborted(Exception):
+    def __init__(self, code: grpc.StatusCode, details: str) -> None:
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+class _ThreadContext:
+    """
+    Sync ServicerContext stand-in for servicer code on executor threads.
+    Status set there is applied to the real aio context back on the loop.
+    """
+
+    def __init__(self, context: grpc.aio.ServicerContext) -> None:
+        self._remaining = context.time_remaining()
+        self._created_at = time.monotonic()
+        self._peer = context.peer()
+        self._metadata = context.invocation_metadata()
+        self._done = threading.Event()
+        context.add_done_callback(lambda _: self._done.set())
+        self.code: Optional[grpc.StatusCode] = None
+        self.details: Optional[str] = None
+
+    def time_remaining(self) -> Optional[float]:
+        if self._remaining is None:
+            return None
+        return max(0.0, self._remaining - (time.monotonic() - self._created_at))
+
+    def peer(self) -> str:
+        return self._peer
+
+    def invocation_metadata(self):
+        return self._metadata
+
+    def is_active(self) -> bool:
+        return not self._done.is_set()
+
+    def set_code(self, code: grpc.StatusCode) -> None:
+        self.code = code
+
+    def set_details(self, details: str) -> None:
+        self.details = details
+
+    def abort(self, code: grpc.StatusCode, details: str) -> None:
+        raise _Aborted(code, details)
+
+    def apply(self, context: grpc.aio.ServicerContext) -> None:
+        if self.code is not None:
+            context.set_code(self.code)
+        if self.details:
+            context.set_details(self.details)
+
+
+# ============================================================================
+# Bridge base
+# ============================================================================
+
+class _AioBridge:
+    """Runs a sync servicer's handlers on the inference executor."""
+
+    def __init__(self, servicer: Any, executor: Executor) -> None:
+        self._sync = servicer
+        self._executor = executor
+
+    async def _unary(self, behavior: Callable, request, context):
+        shim = _ThreadContext(context)
+        loop = asyncio.get_running_loop()
+        try:
+            response = await loop.run_in_executor(self._executor, behavior, request, shim)
+        except _Aborted as e:
+            await context.abort(e.code, e.details)
+        shim.apply(context)
+        return response
+
+    async def _unary_stream(self, behavior: Callable, request, context) -> AsyncIterator[Any]:
+        shim = _ThreadContext(context)
+        loop = asyncio.get_running_loop()
+        responses = behavior(request, shim)
+        try:
+            while True:
+                response = await loop.run_in_executor(self._executor, next, responses, _DONE)
+                if response is _DONE:
+                    break
+                yield response
+        except _Aborted as e:
+            await context.abort(e.code, e.details)
+        finally:
+            try:
+                responses.close()
+            except ValueError:
+                pass  # still running on the executor after a cancel
+        shim.apply(context)
+
+
+def _unary_rpc(name: str) -> Callable:
+    async def rpc(self: _AioBridge, request, context):
+        return await self._unary(getattr(self._sync, name), request, context)
+    rpc.__name__ = name
+    return rpc
+
+
+def _unary_stream_rpc(name: str) -> Callable:
+    async def rpc(self: _AioBridge, request, context):
+        async for response in self._unary_stream(getattr(self._sync, name), request, context):
+            yield response
+    rpc.__name__ = name
+    return rpc
+
+
+# ============================================================================
+# Servicers
+# ============================================================================
+
+class AioFaceServicer(_AioBridge, face_pb2_grpc.FaceServiceServicer):
+    """FaceServicer on the event loop."""
+
+    DetectFaces = _unary_rpc("DetectFaces")
+    ExtractEmbedding = _unary_rpc("ExtractEmbedding")
+    ExtractEmbeddings = _unary_rpc("ExtractEmbeddings")
+    VerifyFace = _unary_rpc("VerifyFace")
+    EnrollFace = _unary_rpc("EnrollFace")
+    GetModelInfo = _unary_rpc("GetModelInfo")
+    ProcessFrame = _unary_rpc("ProcessFrame")
+
+
+class AioDetectionServicer(_AioBridge, detection_pb2_grpc.DetectionServiceServicer):
+    """DetectionServicer on the event loop (unimplemented RPCs keep the base behaviour)."""
+
+    DetectObjects = _unary_rpc("DetectObjects")
+    DetectWaste = _unary_rpc("DetectWaste")
+    DetectObjectsBatch = _unary_rpc("DetectObjectsBatch")
+    DetectObjectsBatchStream = _unary_stream_rpc("DetectObjectsBatchStream")
+
+    async def DetectObjectsStream(self, request_iterator, context):
+        service = self._sync
+        loop = asyncio.get_running_loop()
+        deadline = Deadline.from_grpc_context(context)
+        frame_count = 0
+        try:
+            logger.info("stream_detection_started", client=context.peer())
+            async for request in request_iterator:
+                frame_count += 1
+                yield await loop.run_in_executor(
+                    self._executor, service._detect_stream_frame, request, deadline
+                )
+            logger.info("stream_detection_completed", total_frames=frame_count)
+
+        except Exception as e:
+            logger.error("stream_detection_error", error=str(e), exc_info=True)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+
+
+class AioFrameAnalysisServicer(_AioBridge, frame_analysis_pb2_grpc.FrameAnalysisServiceServicer):
+    """FrameAnalysisServicer on the event loop."""
+
+    AnalyzeFrame = _unary_rpc("AnalyzeFrame")
+
+
+class AioVideoStreamService(_AioBridge, video_stream_pb2_grpc.VideoStreamServiceServicer):
+    """
+    StreamFrames on the event loop.
+
+    An idle stream is just a pending read, so hundreds of low-FPS cameras can
+    stay connected. Frames of one stream are processed one at a time;
+    concurrency comes from running many streams on the shared executor.
+    """
+
+    async def StreamFrames(self, request_iterator, context):
+        service = self._sync
+        loop = asyncio.get_running_loop()
+        camera_metrics: Dict[str, Any] = {}
+        admission = service._new_admission(max_in_flight=1)
+        stream_deadline = Deadline.from_grpc_context(context)
+        ready = asyncio.Event()
+
+        async def read_frames() -> None:
+            try:
+                async for req in request_iterator:
+                    service._offer_request(req, admission)
+                    ready.set()
+            except Exception as e:
+                if not context.done():
+                    logger.warning("stream_reader_failed", error=str(e))
+            finally:
+                admission.close()
+                ready.set()
+
+        reader = loop.create_task(read_frames())
+
+        try:
+            while True:
+                taken = admission.take(timeout=0)
+                if taken is None:
+                    if reader.done():
+                        break
+                    ready.clear()
+                    await ready.wait()
+                    continue
+
+                job = service._admit_job(*taken, stream_deadline)
+                job = await loop.run_in_executor(self._executor, service._run_stages, job)
+                service._record_job(job, camera_metrics, admission)
+                yield job.response
+
+        except Exception as e:
+            logger.exception("stream_fatal_error", error=str(e))
+            await context.abort(grpc.StatusCode.INTERNAL, f"Stream failed: {str(e)}")
+
+        finally:
+            admission.abort()
+            reader.cancel()
+            service._log_final_metrics(camera_metrics)
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = [
+    "AioDetectionServicer",
+    "AioFaceServicer",
+    "AioFrameAnalysisServicer",
+    "AioVideoStreamService",
+]
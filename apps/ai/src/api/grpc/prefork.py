@@ -0,0 +1,587 @@
+"""
+apps/ai/src/api/grpc/prefork.py
+Pre-fork multi-process gRPC serving.
+
+The parent loads model weights once and forks a spawner process with the GC
+frozen, then unfreezes its own GC (it keeps serving FastAPI). The spawner
+stays single-threaded with its heap frozen and forks N workers, both at
+startup and whenever one dies, so no fork() ever happens from a
+multithreaded process. Each worker starts its own gRPC server on the same
+port (SO_REUSEPORT; the kernel spreads connections across them), so every
+core gets its own interpreter while the weights stay shared copy-on-write:
+inference only reads them, and the frozen GC keeps the collector from
+dirtying the pages of objects created before the fork.
+
+The parent never starts gRPC itself (gRPC core must not be running when
+fork() happens). A supervisor thread in the parent reads the worker events
+the spawner forwards and folds them into the HealthRegistry:
+- grpc_worker_<n>: one entry per child
+- grpc_server: healthy when every child serves, degraded when some do,
+  unhealthy when none do
+
+CPU only: CUDA contexts do not survive fork().
+"""
+
+import gc
+import multiprocessing as mp
+import os
+import signal
+import threading
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait as wait_connections
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import structlog
+
+from src.api.lifespan.health_registry import HealthStatus, get_health_registry
+from src.core.cpu_budget import limit_threads, pin_process
+
+logger = structlog.get_logger("grpc_prefork")
+
+SERVER_COMPONENT = "grpc_server"
+
+
+# ============================================================================
+# Worker process
+# ============================================================================
+
+def _worker_main(
+    worker_id: int,
+    server_factory: Callable[[], Any],
+    conn: Any,
+    threads: int,
+    heartbeat_s: float,
+    grace_period: float,
+    cpus: Optional[Sequence[int]] = None,
+    inherited: Sequence[Any] = (),
+) -> None:
+    """Worker entry point: build and start a server, heartbeat until SIGTERM."""
+    for other in inherited:
+        other.close()  # so the spawner sees EOF when a sibling (or the parent) goes away
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the spawner owns shutdown
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    if cpus:
+        pin_process(cpus)
+    limit_threads(threads)  # so the workers do not oversubscribe the cores
+
+    try:
+        server = server_factory()
+        server.start()
+    except BaseException as e:
+        conn.send(("failed", str(e)))
+        raise SystemExit(1)
+    conn.send(("ready", os.getpid()))
+
+    while not stop.wait(heartbeat_s):
+        admission = getattr(server, "admission", None)
+        try:
+            conn.send((
+                "heartbeat",
+                {
+                    "running": server.is_running,
+                    "in_flight": admission.snapshot()["in_flight"] if admission else 0,
+                },
+            ))
+        except (BrokenPipeError, OSError):
+            break  # spawner is gone; do not linger as an orphan
+
+    server.stop(grace_period=grace_period)
+
+
+# ============================================================================
+# Spawner process
+# ============================================================================
+
+@dataclass
+class _Worker:
+    worker_id: int
+    process: Any
+    conn: Any
+    started_at: float = field(default_factory=time.monotonic)
+    restarts: int = 0
+    ready: bool = False
+    exited: bool = False
+
+
+class _Spawner:
+    """
+    Runs in the single-threaded spawner process: forks the workers, forwards
+    their messages to the parent as (worker_id, kind, payload) and restarts
+    the ones that die.
+    """
+
+    def __init__(
+        self,
+        parent: Any,
+        server_factory: Callable[[], Any],
+        num_workers: int,
+        threads_per_worker: int,
+        cpu_sets: Optional[Sequence[Sequence[int]]],
+        heartbeat_s: float,
+        grace_period: float,
+        restart_backoff_s: float,
+    ) -> None:
+        self.parent = parent
+        self.server_factory = server_factory
+        self.num_workers = num_workers
+        self.threads_per_worker = threads_per_worker
+        self.cpu_sets = cpu_sets
+        self.heartbeat_s = heartbeat_s
+        self.grace_period = grace_period
+        self.restart_backoff_s = restart_backoff_s
+        self._ctx = mp.get_context("fork")
+        self._workers: Dict[int, _Worker] = {}
+        self._serving = False
+
+    def run(self) -> None:
+        for worker_id in range(self.num_workers):
+            self._fork(worker_id)
+
+        grace_period = self.grace_period
+        while True:
+            conns = {w.conn: w for w in self._workers.values() if not w.exited}
+            ready = wait_connections([self.parent, *conns], timeout=self.heartbeat_s)
+            if self.parent in ready:
+                try:
+                    kind, payload = self.parent.recv()
+                except (EOFError, OSError):
+                    kind, payload = "stop", 0.0  # the parent died; take the workers down
+                if kind == "stop":
+                    grace_period = payload
+                    break
+
+            for conn in ready:
+                if conn is self.parent:
+                    continue
+                try:
+                    kind, payload = conn.recv()
+                except (EOFError, OSError):
+                    continue  # the worker is gone; reaped below
+                worker = conns[conn]
+                if kind == "ready":
+                    worker.ready = True
+                    self._serving = self._serving or all(w.ready for w in self._workers.values())
+                self._send(worker.worker_id, kind, payload)
+
+            self._reap_dead_workers()
+
+        self._stop_workers(grace_period)
+
+    def _send(self, worker_id: int, kind: str, payload: Any) -> None:
+        try:
+            self.parent.send((worker_id, kind, payload))
+        except (BrokenPipeError, OSError):
+            pass  # the parent is gone; the next recv() stops the loop
+
+    def _fork(self, worker_id: int, restarts: int = 0) -> None:
+        reader, writer = self._ctx.Pipe(duplex=False)
+        inherited = [self.parent, reader] + [w.conn for w in self._workers.values() if not w.exited]
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                worker_id,
+                self.server_factory,
+                writer,
+                self.threads_per_worker,
+                self.heartbeat_s,
+                self.grace_period,
+                self.cpu_sets[worker_id % len(self.cpu_sets)] if self.cpu_sets else None,
+                inherited,
+            ),
+            name=f"grpc-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        writer.close()  # the worker holds the write end
+        self._workers[worker_id] = _Worker(worker_id, process, reader, restarts=restarts)
+        self._send(worker_id, "started", {"pid": process.pid, "restarts": restarts})
+
+    def _reap_dead_workers(self) -> None:
+        now = time.monotonic()
+        for worker in list(self._workers.values()):
+            if worker.process.is_alive():
+                continue
+
+            if not worker.exited:
+                worker.exited = True
+                worker.ready = False
+                self._send(worker.worker_id, "exited", worker.process.exitcode)
+                logger.error(
+                    "grpc_worker_died",
+                    worker_id=worker.worker_id,
+                    pid=worker.process.pid,
+                    exitcode=worker.process.exitcode,
+                )
+
+            # Only restart once serving, and not faster than the backoff
+            if not self._serving or now - worker.started_at < self.restart_backoff_s:
+                continue
+
+            worker.conn.close()
+            self._fork(worker.worker_id, restarts=worker.restarts + 1)
+            logger.info(
+                "grpc_worker_restarted",
+                worker_id=worker.worker_id,
+                pid=self._workers[worker.worker_id].process.pid,
+                restarts=worker.restarts + 1,
+            )
+
+    def _stop_workers(self, grace_period: float) -> None:
+        """SIGTERM every worker, wait for them to drain, then kill stragglers."""
+        workers = list(self._workers.values())
+        for worker in workers:
+            if worker.process.is_alive():
+                worker.process.terminate()
+        deadline = time.monotonic() + grace_period + 5.0
+        for worker in workers:
+            worker.process.join(timeout=max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                logger.warning("grpc_worker_killed", worker_id=worker.worker_id, pid=worker.process.pid)
+                worker.process.kill()
+                worker.process.join(timeout=1.0)
+            worker.conn.close()
+
+
+def _spawner_main(parent: Any, inherited: Any, *args: Any) -> None:
+    """
+    Spawner entry point, forked from the parent's calling thread at start()
+    (the same point the workers used to be forked from). It never starts a
+    thread, so every later fork() of a worker is from a single-threaded
+    process. SIGTERM / SIGINT are ignored; the parent sends "stop".
+    """
+    inherited.close()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    _Spawner(parent, *args).run()
+
+
+# ============================================================================
+# Supervisor
+# ============================================================================
+
+@dataclass
+class _Child:
+    """The parent's view of one worker, built from the spawner's events."""
+
+    worker_id: int
+    pid: Optional[int] = None
+    ready: bool = False
+    exited: bool = False
+    exitcode: Optional[int] = None
+    last_seen: float = 0.0
+    in_flight: int = 0
+    restarts: int = 0
+
+
+class PreforkSupervisor:
+    """
+    Forks `num_workers` gRPC server processes and keeps them running.
+
+    `server_factory()` runs in each worker and returns an unstarted server
+    with start() / stop(grace_period) / is_running (GRPCServer). Everything
+    the parent built before start() is inherited by the workers.
+    """
+
+    def __init__(
+        self,
+        server_factory: Callable[[], Any],
+        num_workers: int,
+        host: str,
+        port: int,
+        threads_per_worker: Optional[int] = None,
+        cpu_sets: Optional[Sequence[Sequence[int]]] = None,
+        heartbeat_s: float = 2.0,
+        grace_period: float = 5.0,
+        restart_backoff_s: float = 1.0,
+        ready_timeout_s: float = 300.0,
+    ) -> None:
+        self.server_factory = server_factory
+        self.num_workers = max(1, num_workers)
+        self.host = host
+        self.port = port
+        self.threads_per_worker = threads_per_worker or max(
+            1, (os.cpu_count() or 1) // self.num_workers
+        )
+        self.cpu_sets = [tuple(cpus) for cpus in cpu_sets] if cpu_sets else None  # per worker; None = no pinning
+        self.heartbeat_s = heartbeat_s
+        self.grace_period = grace_period
+        self.restart_backoff_s = restart_backoff_s
+        self.ready_timeout_s = ready_timeout_s
+        self.mode = "prefork"
+
+        self._spawner_pid: Optional[int] = None
+        self._spawner_exitcode: Optional[int] = None
+        self._conn = None
+        self._children: List[_Child] = [_Child(worker_id) for worker_id in range(self.num_workers)]
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._monitor: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._serving = False
+        self._published: Dict[str, str] = {}
+        self._health = get_health_registry()
+
+    # =========================================================================
+    # LIFECYCLE
+    # =========================================================================
+
+    def start(self) -> None:
+        """Fork the spawner and wait until every worker is serving."""
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Pre-fork serving needs fork() (Linux / macOS)")
+        if self._monitor is not None:
+            logger.warning("prefork_supervisor_already_started")
+            return
+
+        self._health.register_component(
+            SERVER_COMPONENT, HealthStatus.UNKNOWN, host=self.host, port=self.port
+        )
+        self._conn, spawner_conn = mp.get_context("fork").Pipe(duplex=True)
+
+        # Everything alive now is shared with the workers; keep the spawner's GC
+        # off it, but not the parent's, which keeps allocating while it serves.
+        # A bare fork(): a multiprocessing child would be barred from forking.
+        gc.collect()
+        gc.freeze()
+        try:
+            self._spawner_pid = os.fork()
+            if self._spawner_pid == 0:
+                code = 1
+                try:
+                    _spawner_main(
+                        spawner_conn,
+                        self._conn,
+                        self.server_factory,
+                        self.num_workers,
+                        self.threads_per_worker,
+                        self.cpu_sets,
+                        self.heartbeat_s,
+                        self.grace_period,
+                        self.restart_backoff_s,
+                    )
+                    code = 0
+                finally:
+                    os._exit(code)
+        finally:
+            frozen = gc.get_freeze_count()
+            gc.unfreeze()
+        spawner_conn.close()
+
+        self._monitor = threading.Thread(
+            target=self._supervise, name="grpc-prefork-supervisor", daemon=True
+        )
+        self._monitor.start()
+
+        with self._changed:
+            self._changed.wait_for(
+                lambda: all(c.ready for c in self._children)
+                or any(c.exited for c in self._children),
+                timeout=self.ready_timeout_s,
+            )
+            failed = [c.worker_id for c in self._children if not c.ready]
+            self._serving = not failed
+
+        if failed:
+            self._health.mark_failed(SERVER_COMPONENT, f"gRPC workers {failed} did not start")
+            self.stop(grace_period=0)
+            raise RuntimeError(f"gRPC prefork workers {failed} did not start")
+
+        logger.info(
+            "grpc_prefork_started",
+            address=f"{self.host}:{self.port}",
+            workers=self.num_workers,
+            threads_per_worker=self.threads_per_worker,
+            cpu_sets=self.cpu_sets,
+            pids=[c.pid for c in self._children],
+            frozen_objects=frozen,
+        )
+
+    def stop(self, grace_period: Optional[float] = None) -> None:
+        """Ask the spawner to drain and stop the workers, then wait for it."""
+        if self._monitor is None or self._stopping.is_set():
+            return
+
+        if grace_period is None:
+            grace_period = self.grace_period
+        logger.info("stopping_grpc_prefork", grace_period=grace_period)
+        self._health.register_component(
+            SERVER_COMPONENT, HealthStatus.DEGRADED, status_message="Shutting down"
+        )
+        self._stopping.set()
+        self._serving = False
+
+        try:
+            self._conn.send(("stop", grace_period))
+        except (BrokenPipeError, OSError):
+            pass  # the spawner is already gone
+        if self._spawner_alive(timeout=grace_period + 10.0):
+            logger.warning("grpc_prefork_spawner_killed", pid=self._spawner_pid)
+            os.kill(self._spawner_pid, signal.SIGKILL)
+            self._spawner_alive(timeout=1.0)
+
+        self._monitor.join(timeout=self.heartbeat_s + 1.0)
+        self._conn.close()
+        with self._changed:
+            for child in self._children:
+                child.ready = False
+                child.exited = True
+        self._health.register_component(
+            SERVER_COMPONENT, HealthStatus.UNKNOWN, status_message="Stopped"
+        )
+        logger.info("grpc_prefork_stopped")
+
+    def wait_for_termination(self) -> None:
+        """Block until stop() has been called and the supervisor has exited."""
+        if self._monitor is not None:
+            self._monitor.join()
+
+    @property
+    def is_running(self) -> bool:
+        return (
+            self._serving
+            and self._spawner_pid is not None
+            and self._spawner_alive()
+            and any(not c.exited for c in self._children)
+        )
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "worker_id": c.worker_id,
+                    "pid": c.pid,
+                    "alive": not c.exited,
+                    "ready": c.ready,
+                    "in_flight": c.in_flight,
+                    "restarts": c.restarts,
+                }
+                for c in self._children
+            ]
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _spawner_alive(self, timeout: float = 0.0) -> bool:
+        """Reap the spawner if it has exited, waiting up to `timeout` seconds."""
+        deadline = time.monotonic() + timeout
+        while self._spawner_exitcode is None:
+            try:
+                pid, status = os.waitpid(self._spawner_pid, os.WNOHANG)
+            except ChildProcessError:
+                self._spawner_exitcode = -1  # reaped elsewhere
+                break
+            if pid:
+                self._spawner_exitcode = os.waitstatus_to_exitcode(status)
+                break
+            if time.monotonic() >= deadline:
+                return True
+            time.sleep(0.05)
+        return False
+
+    def _supervise(self) -> None:
+        """Apply the spawner's worker events, publish health."""
+        while not self._stopping.is_set():
+            try:
+                if self._conn.poll(self.heartbeat_s):
+                    worker_id, kind, payload = self._conn.recv()
+                    self._on_message(self._children[worker_id], kind, payload)
+            except (EOFError, OSError):
+                if not self._stopping.is_set():
+                    self._on_spawner_died()
+                return
+            self._publish_health()
+
+    def _on_message(self, child: _Child, kind: str, payload: Any) -> None:
+        with self._changed:
+            child.last_seen = time.monotonic()
+            if kind == "started":
+                child.pid = payload["pid"]
+                child.restarts = payload["restarts"]
+                child.ready = False
+                child.exited = False
+                child.exitcode = None
+            elif kind == "ready":
+                child.ready = True
+                child.pid = payload
+                logger.info("grpc_worker_ready", worker_id=child.worker_id, pid=payload)
+            elif kind == "heartbeat":
+                child.ready = payload["running"]
+                child.in_flight = payload["in_flight"]
+            elif kind == "failed":
+                logger.error("grpc_worker_start_failed", worker_id=child.worker_id, error=payload)
+            elif kind == "exited":
+                child.ready = False
+                child.exited = True
+                child.exitcode = payload
+            self._changed.notify_all()
+
+    def _on_spawner_died(self) -> None:
+        self._spawner_alive(timeout=1.0)
+        logger.error(
+            "grpc_prefork_spawner_died", pid=self._spawner_pid, exitcode=self._spawner_exitcode
+        )
+        with self._changed:
+            for child in self._children:
+                child.ready = False
+                child.exited = True
+            self._changed.notify_all()
+        self._publish_health()
+
+    def _publish_health(self) -> None:
+        now = time.monotonic()
+        stale_after = self.heartbeat_s * 3
+        serving = 0
+
+        for child in list(self._children):
+            name = f"grpc_worker_{child.worker_id}"
+            if child.exited:
+                reason = "spawner exited" if child.exitcode is None else f"exited with code {child.exitcode}"
+                self._publish(name, "failed", reason,
+                              restarts=child.restarts)
+            elif not child.ready:
+                self._publish(name, "starting", pid=child.pid, restarts=child.restarts)
+            elif now - child.last_seen > stale_after:
+                self._publish(name, "degraded", f"no heartbeat for over {stale_after:.0f}s",
+                              pid=child.pid, restarts=child.restarts)
+            else:
+                serving += 1
+                self._publish(name, "healthy", pid=child.pid, restarts=child.restarts)
+
+        if not self._serving:
+            return
+        if serving == self.num_workers:
+            self._publish(SERVER_COMPONENT, "healthy", host=self.host, port=self.port,
+                          mode=self.mode, workers=serving)
+        elif serving:
+            self._publish(SERVER_COMPONENT, "degraded",
+                          f"{serving}/{self.num_workers} gRPC workers serving",
+                          host=self.host, port=self.port, mode=self.mode, workers=serving)
+        else:
+            self._publish(SERVER_COMPONENT, "failed", "no gRPC workers serving",
+                          host=self.host, port=self.port, mode=self.mode, workers=0)
+
+    def _publish(self, name: str, state: str, reason: str = "", **metadata: Any) -> None:
+        """Update the HealthRegistry only when a component's state changes."""
+        key = f"{state}:{reason}"
+        if self._published.get(name) == key:
+            return
+        self._published[name] = key
+
+        if state == "healthy":
+            self._health.mark_healthy(name, **metadata)
+        elif state == "degraded":
+            self._health.mark_degraded(name, reason, **metadata)
+        elif state == "failed":
+            self._health.mark_failed(name, reason, **metadata)
+        else:
+            self._health.register_component(name, HealthStatus.UNKNOWN, **metadata)
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["PreforkSupervisor"]
@@ -3,8 +3,8 @@ apps/ai/src/api/grpc/server.py
 Simple gRPC server for AI inference.
 
 Responsibilities:
-- Create and configure gRPC server
-- Register servicers (Detection, Face, VideoStream)
+- Create and configure gRPC server (sync thread pool or grpc.aio event loop)
+- Register servicers (Detection, Face, VideoStream, FrameAnalysis)
 - Start/stop server
 
 AI responsibilities:
@@ -16,15 +16,32 @@ All higher-level business logic (recognize, verify, enroll, etc.)
 is implemented in .NET and NOT in this AI service.
 """
 
+import asyncio
+import threading
 import grpc
 from concurrent import futures
 import structlog
-from typing import Optional
+from typing import Any, Coroutine, List, Optional, Sequence, Tuple
 from src.api.lifespan.health_registry import get_health_registry, HealthStatus
 from src.api.grpc.servicers.detection_servicer import DetectionServicer
 from src.api.grpc.servicers.face_servicer import FaceServicer
 from src.api.grpc.servicers.video_stream_servicer import VideoStreamService
+from src.api.grpc.servicers.frame_analysis_servicer import FrameAnalysisServicer
+from src.services.streaming.scheduler import CameraScheduler
+from src.api.grpc.admission import (
+    AdmissionController,
+    AdmissionInterceptor,
+    AioAdmissionInterceptor,
+    Lane,
+)
+from src.api.grpc.aio_bridge import (
+    AioDetectionServicer,
+    AioFaceServicer,
+    AioFrameAnalysisServicer,
+    AioVideoStreamService,
+)
 from src.services.ml.Face_Recognition_Service import FaceRecognitionService
+from src.services.ml.frame_analysis import FrameAnalysisService
 from src.core.config import settings
 
 # ---------------------------------------------------------------------------
@@ -54,18 +71,52 @@ from face_pb2_grpc import add_FaceServiceServicer_to_server
 # Video stream service for live frames + embeddings
 from video_stream_pb2_grpc import add_VideoStreamServiceServicer_to_server
 
+# Multi-task frame analysis (one decode: objects + waste + faces)
+from frame_analysis_pb2_grpc import add_FrameAnalysisServiceServicer_to_server
+
 logger = structlog.get_logger("grpc_server")
 
 
+def sync_rpc_threads() -> int:
+    """Sync-mode RPC threads: one for every RPC gRPC accepts."""
+    return max(settings.GRPC_MAX_WORKERS, settings.GRPC_MAX_CONCURRENT_RPCS)
+
+
+def create_sync_server(
+    admission: AdmissionController,
+    options: Sequence[Tuple[str, int]] = (),
+) -> grpc.Server:
+    """
+    Unstarted thread-per-RPC server gated by `admission`.
+
+    The pool has a thread for every RPC gRPC accepts, so none waits for a
+    worker (with no lane and no budget) behind open streams that pin theirs;
+    each one reaches AdmissionInterceptor at once. gRPC itself rejects RPCs
+    beyond the cap.
+    """
+    rpc_threads = sync_rpc_threads()
+    return grpc.server(
+        futures.ThreadPoolExecutor(max_workers=rpc_threads),
+        interceptors=[AdmissionInterceptor(admission)],
+        maximum_concurrent_rpcs=rpc_threads,
+        options=list(options),
+    )
+
+
 class GRPCServer:
     """
     Simple gRPC server for AI services.
 
     - Single shared FaceRecognitionService instance
+    - GRPC_SERVER_MODE=sync: one worker thread per in-flight RPC (streams
+      hold theirs for their whole lifetime; GRPC_MAX_CONCURRENT_RPCS threads)
+    - GRPC_SERVER_MODE=aio: networking and streams on an asyncio loop in a
+      background thread; model calls on INFERENCE_EXECUTOR_WORKERS threads
     - Registers:
         * DetectionServicer          → object detection (if you have it)
         * FaceServicer              → DetectFaces, ExtractEmbedding, GetModelInfo
         * VideoStreamService        → streaming frames + embeddings
+        * FrameAnalysisServicer     → AnalyzeFrame (objects + faces, one decode)
 
     NOTE:
         FaceServicer intentionally does NOT implement business logic RPCs
@@ -74,29 +125,241 @@ class GRPCServer:
         for the business logic side.
     """
 
-    def __init__(self, face_service: Optional[FaceRecognitionService] = None) -> None:
+    def __init__(
+        self,
+        face_service: Optional[FaceRecognitionService] = None,
+        detection_service: Optional[Any] = None,
+        reuse_port: bool = False,
+    ) -> None:
         # Server basic config from settings
         self.host = settings.GRPC_HOST
         self.port = settings.GRPC_PORT
-        self.max_workers = settings.GRPC_MAX_WORKERS
+        self.mode = settings.GRPC_SERVER_MODE
+        self.max_workers = sync_rpc_threads() if self.mode == "sync" else settings.GRPC_MAX_WORKERS
+        # Pre-forked workers all bind the same port (SO_REUSEPORT)
+        self.reuse_port = reuse_port
 
         # Shared ML service (YOLO/ArcFace/etc.)
         self.face_service: FaceRecognitionService = (
             face_service or FaceRecognitionService()
         )
-
-        self.server: Optional[grpc.Server] = None
+        # Object detection backend (None = in-process ObjectDetectionService)
+        self.detection_service = detection_service
+
+        self.server: Optional[Any] = None  # grpc.Server or grpc.aio.Server
+        self.video_stream_servicer: Optional[VideoStreamService] = None
+
+        # aio mode only
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._inference_executor: Optional[futures.ThreadPoolExecutor] = None
+        self._aio_admission: Optional[AioAdmissionInterceptor] = None
+
+        # Global inference admission (MAX_CONCURRENT_REQUESTS, priority lanes)
+        self.admission = AdmissionController(
+            max_in_flight=settings.MAX_CONCURRENT_REQUESTS,
+            queue_budgets_ms={
+                Lane.STREAM: settings.ADMISSION_STREAM_QUEUE_BUDGET_MS,
+                Lane.UNARY: settings.ADMISSION_UNARY_QUEUE_BUDGET_MS,
+                Lane.BATCH: settings.ADMISSION_BATCH_QUEUE_BUDGET_MS,
+            },
+            max_budget_ms=settings.REQUEST_TIMEOUT * 1000.0,
+        )
         logger.info(
             "grpc_server_initialized",
             host=self.host,
             port=self.port,
-            max_workers=self.max_workers
+            max_workers=self.max_workers,
+            mode=self.mode,
         )
 
+    # ------------------------------------------------------------------ #
+    # Server construction
+    # ------------------------------------------------------------------ #
+
+    @property
+    def _bind_address(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    def _server_options(self) -> List[Tuple[str, int]]:
+        options = [
+            ("grpc.max_send_message_length", 100 * 1024 * 1024),   # 100 MB
+            ("grpc.max_receive_message_length", 100 * 1024 * 1024),  # 100 MB
+            ("grpc.keepalive_time_ms", 30000),           # 30s keepalive
+            ("grpc.keepalive_timeout_ms", 10000),        # 10s timeout
+            ("grpc.http2.max_pings_without_data", 0),    # Unlimited pings
+            ("grpc.keepalive_permit_without_calls", 1),  # Allow keepalive
+        ]
+        if self.reuse_port:
+            options.append(("grpc.so_reuseport", 1))
+        return options
+
+    def _create_servicers(
+        self,
+    ) -> Tuple[DetectionServicer, FaceServicer, VideoStreamService, FrameAnalysisServicer]:
+        """Build the (synchronous) servicers shared by both server modes."""
+        # 1) Detection service (if you have non-face detection, e.g. objects)
+        detection_servicer = DetectionServicer(
+            detection_service=self.detection_service,
+            admission=self.admission,
+        )
+
+        # 2) Face service (AI-only: detect, embeddings, model info)
+        face_servicer = FaceServicer(face_service=self.face_service)
+
+        # 3) Video stream service (stream frames & return boxes + embeddings)
+        video_stream_servicer = VideoStreamService(
+            face_service=self.face_service,
+            pipelined=settings.STREAM_PIPELINE_ENABLED,
+            pipeline_queue_size=settings.STREAM_PIPELINE_QUEUE_SIZE,
+            min_frame_interval_ms=1000.0 / settings.STREAM_MAX_FPS,
+            min_fps=settings.STREAM_MIN_FPS,
+            max_frame_age_ms=settings.STREAM_MAX_FRAME_AGE_MS,
+            target_latency_ms=settings.STREAM_TARGET_LATENCY_MS,
+            scheduler=CameraScheduler(
+                slots=settings.STREAM_INFERENCE_SLOTS,
+                quantum_ms=settings.STREAM_SCHEDULER_QUANTUM_MS,
+                active_weight=settings.STREAM_ACTIVE_CAMERA_WEIGHT,
+                idle_ttl_s=settings.STREAM_CAMERA_IDLE_TTL_S,
+                max_cameras=settings.STREAM_MAX_CAMERAS,
+            ),
+            admission=self.admission,
+        )
+
+        # 4) Frame analysis (one decode shared by the detection and face services)
+        frame_analysis_servicer = FrameAnalysisServicer(
+            FrameAnalysisService(
+                face_service=self.face_service,
+                detection_service=detection_servicer.detection_service,
+                max_workers=settings.FRAME_ANALYSIS_WORKERS,
+            )
+        )
+        return detection_servicer, face_servicer, video_stream_servicer, frame_analysis_servicer
+
+    def _start_sync(
+        self,
+        detection_servicer: DetectionServicer,
+        face_servicer: FaceServicer,
+        video_stream_servicer: VideoStreamService,
+        frame_analysis_servicer: FrameAnalysisServicer,
+    ) -> None:
+        # Thread per accepted RPC (open streams count for their lifetime);
+        # AdmissionController sheds by priority lane below the cap
+        self.server = create_sync_server(self.admission, self._server_options())
+
+        logger.info("registering_grpc_servicers")
+        add_DetectionServiceServicer_to_server(detection_servicer, self.server)
+        logger.info("servicer_registered", servicer="DetectionService")
+        add_FaceServiceServicer_to_server(face_servicer, self.server)
+        logger.info("servicer_registered", servicer="FaceService")
+        add_VideoStreamServiceServicer_to_server(video_stream_servicer, self.server)
+        logger.info("servicer_registered", servicer="VideoStreamService")
+        add_FrameAnalysisServiceServicer_to_server(frame_analysis_servicer, self.server)
+        logger.info("servicer_registered", servicer="FrameAnalysisService")
+
+        self.server.add_insecure_port(self._bind_address)
+        # Start server (non-blocking)
+        self.server.start()
+
+    def _start_aio(
+        self,
+        detection_servicer: DetectionServicer,
+        face_servicer: FaceServicer,
+        video_stream_servicer: VideoStreamService,
+        frame_analysis_servicer: FrameAnalysisServicer,
+    ) -> None:
+        self._inference_executor = futures.ThreadPoolExecutor(
+            max_workers=settings.INFERENCE_EXECUTOR_WORKERS,
+            thread_name_prefix="inference",
+        )
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="grpc-aio-loop",
+            daemon=True,
+        )
+        self._loop_thread.start()
+
+        try:
+            self.server = self._run_on_loop(
+                self._serve_aio(
+                    detection_servicer, face_servicer, video_stream_servicer, frame_analysis_servicer
+                )
+            )
+        except Exception:
+            self._shutdown_aio_loop()
+            raise
+
+    async def _serve_aio(
+        self,
+        detection_servicer: DetectionServicer,
+        face_servicer: FaceServicer,
+        video_stream_servicer: VideoStreamService,
+        frame_analysis_servicer: FrameAnalysisServicer,
+    ) -> "grpc.aio.Server":
+        executor = self._inference_executor
+        self._aio_admission = AioAdmissionInterceptor(
+            self.admission, wait_threads=settings.ADMISSION_AIO_WAIT_THREADS
+        )
+        # Sync handlers not bridged (unimplemented RPCs) run on the executor too
+        server = grpc.aio.server(
+            migration_thread_pool=executor,
+            interceptors=[self._aio_admission],
+            maximum_concurrent_rpcs=settings.GRPC_AIO_MAX_CONCURRENT_RPCS,
+            options=self._server_options(),
+        )
+
+        logger.info(
+            "registering_grpc_servicers",
+            inference_executor_workers=settings.INFERENCE_EXECUTOR_WORKERS,
+        )
+        add_DetectionServiceServicer_to_server(
+            AioDetectionServicer(detection_servicer, executor), server
+        )
+        logger.info("servicer_registered", servicer="DetectionService")
+        add_FaceServiceServicer_to_server(AioFaceServicer(face_servicer, executor), server)
+        logger.info("servicer_registered", servicer="FaceService")
+        add_VideoStreamServiceServicer_to_server(
+            AioVideoStreamService(video_stream_servicer, executor), server
+        )
+        logger.info("servicer_registered", servicer="VideoStreamService")
+        add_FrameAnalysisServiceServicer_to_server(
+            AioFrameAnalysisServicer(frame_analysis_servicer, executor), server
+        )
+        logger.info("servicer_registered", servicer="FrameAnalysisService")
+
+        server.add_insecure_port(self._bind_address)
+        await server.start()
+        return server
+
+    def _run_on_loop(self, coro: Coroutine) -> Any:
+        """Run a coroutine on the aio loop thread and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _shutdown_aio_loop(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._loop_thread is not None:
+            self._loop_thread.join(timeout=5)
+        if self._loop is not None and not self._loop.is_running():
+            self._loop.close()
+        if self._inference_executor is not None:
+            self._inference_executor.shutdown(wait=False)
+        if self._aio_admission is not None:
+            self._aio_admission.close()
+        self._loop = None
+        self._loop_thread = None
+        self._inference_executor = None
+        self._aio_admission = None
+
     # ------------------------------------------------------------------ #
     # Lifecycle
     # ------------------------------------------------------------------ #
 
+    @property
+    def is_running(self) -> bool:
+        return self.server is not None
+
     def start(self) -> None:
         """
         Start gRPC server (non-blocking).
@@ -117,57 +380,23 @@ class GRPCServer:
         )
 
         try:
-            # Create server with thread pool
-            self.server = grpc.server(
-                futures.ThreadPoolExecutor(max_workers=self.max_workers),
-                options=[
-                    ("grpc.max_send_message_length", 100 * 1024 * 1024),   # 100 MB
-                    ("grpc.max_receive_message_length", 100 * 1024 * 1024),  # 100 MB
-                    ("grpc.keepalive_time_ms", 30000),           # 30s keepalive
-                    ("grpc.keepalive_timeout_ms", 10000),        # 10s timeout
-                    ("grpc.http2.max_pings_without_data", 0),    # Unlimited pings
-                    ("grpc.keepalive_permit_without_calls", 1),  # Allow keepalive
-                ],
-            )
+            servicers = self._create_servicers()
+            self.video_stream_servicer = servicers[2]
+
+            if self.mode == "aio":
+                self._start_aio(*servicers)
+            else:
+                self._start_sync(*servicers)
 
-            # ----------------------------------------------------------
-            # Register servicers
-            # ----------------------------------------------------------
-            logger.info("registering_grpc_servicers")
-
-            # 1) Detection service (if you have non-face detection, e.g. objects)
-            detection_servicer = DetectionServicer()
-            add_DetectionServiceServicer_to_server(detection_servicer, self.server)
-            logger.info("servicer_registered", servicer="DetectionService")
-
-            # 2) Face service (AI-only: detect, embeddings, model info)
-            face_servicer = FaceServicer(face_service=self.face_service)
-            add_FaceServiceServicer_to_server(face_servicer, self.server)
-            logger.info("servicer_registered", servicer="FaceService")
-
-            # 3) Video stream service (stream frames & return boxes + embeddings)
-            video_stream_servicer = VideoStreamService(face_service=self.face_service)
-            add_VideoStreamServiceServicer_to_server(
-                video_stream_servicer, self.server
-            )
-            logger.info("servicer_registered", servicer="VideoStreamService")
-
-            # ----------------------------------------------------------
-            # Bind & start
-            # ----------------------------------------------------------
-            bind_address = f"{self.host}:{self.port}"
-            self.server.add_insecure_port(bind_address)
-            
-            # Start server (non-blocking)
-            self.server.start()
             # Mark as healthy (NEW!)
             health_registry.mark_healthy(
                 "grpc_server",
                 host=self.host,
                 port=self.port,
                 max_workers=self.max_workers,
+                mode=self.mode,
             )
-            logger.info("grpc_server_started", address=bind_address)
+            logger.info("grpc_server_started", address=self._bind_address, mode=self.mode)
 
         except Exception as e:
             health_registry.mark_failed("grpc_server", str(e))
@@ -198,9 +427,12 @@ class GRPCServer:
         )
 
         try:
-            stop_event = self.server.stop(grace_period)
-            if stop_event:
-                stop_event.wait()
+            if self.mode == "aio":
+                self._run_on_loop(self.server.stop(grace_period))
+            else:
+                stop_event = self.server.stop(grace_period)
+                if stop_event:
+                    stop_event.wait()
             health_registry.register_component(
                 "grpc_server",
                 HealthStatus.UNKNOWN,
@@ -212,6 +444,8 @@ class GRPCServer:
             logger.error("error_stopping_grpc_server", error=str(e))
         finally:
             self.server = None
+            if self.mode == "aio":
+                self._shutdown_aio_loop()
             if self.face_service is not None:
                 logger.info("cleaning_up_face_service_from_grpc")
                 try:
@@ -223,7 +457,11 @@ class GRPCServer:
         """
         Block the current thread until the server is terminated.
         """
-        if self.server:
+        if self.server is None:
+            return
+        if self.mode == "aio":
+            self._run_on_loop(self.server.wait_for_termination())
+        else:
             self.server.wait_for_termination()
 
 
@@ -1,7 +1,10 @@
 """Detection service gRPC implementation."""
+import contextlib
+import math
+
 import grpc
 import structlog
-from typing import Iterator
+from typing import Iterator, Optional
 # from pathlib import Path
 # import sys
 
@@ -13,8 +16,16 @@ from typing import Iterator
 from packages.contracts.python import detection_pb2, detection_pb2_grpc
 
 # Import business logic
+from src.api.grpc.admission import AdmissionController, AdmissionRejected, Lane
 from src.services.ml.object_detection import ObjectDetectionService
-from src.core.exceptions import ModelNotLoadedException, InferenceException
+from src.schemas.detection import DetectRequest, DetectBatchRequest, DetectResponse
+from src.core.config import settings
+from src.core.deadline import Deadline
+from src.core.exceptions import (
+    DeadlineExceededException,
+    InferenceException,
+    ModelNotLoadedException,
+)
 
 logger = structlog.get_logger("grpc.detection_servicer")
 
@@ -33,11 +44,18 @@ class DetectionServicer(detection_pb2_grpc.DetectionServiceServicer):
     Business logic stays in services/ directory.
     """
     
-    def __init__(self):
-        self.detection_service = ObjectDetectionService()
+    def __init__(
+        self,
+        detection_service: Optional[ObjectDetectionService] = None,
+        admission: Optional[AdmissionController] = None,
+    ):
+        # A RemoteObjectDetectionService when inference runs in worker processes
+        self.detection_service = detection_service or ObjectDetectionService()
+        # Stream frames bypass the interceptor; each one takes a STREAM-lane slot
+        self.admission = admission
         logger.info("detection_servicer_initialized")
     
-    def Detect(self, request: detection_pb2.DetectRequest, context):
+    def DetectObjects(self, request: detection_pb2.DetectRequest, context):
         """
         Single image detection.
         
@@ -48,6 +66,23 @@ class DetectionServicer(detection_pb2_grpc.DetectionServiceServicer):
         Returns:
             DetectResponse proto
         """
+        return self._detect_unary(self.detection_service.detect_objects, request, context)
+    
+    def DetectWaste(self, request: detection_pb2.DetectRequest, context):
+        """
+        Waste-only detection (WASTE_CLASSES, confidence capped at WASTE_CONFIDENCE).
+        
+        Args:
+            request: DetectRequest proto
+            context: gRPC context
+            
+        Returns:
+            DetectResponse proto
+        """
+        return self._detect_unary(self.detection_service.detect_waste, request, context)
+    
+    def _detect_unary(self, detect, request: detection_pb2.DetectRequest, context):
+        """Run one unary detection under the caller's deadline and map errors to status codes."""
         try:
             logger.debug(
                 "detection_request_received",
@@ -56,28 +91,11 @@ class DetectionServicer(detection_pb2_grpc.DetectionServiceServicer):
             )
             
             # Call business logic
-            result = self.detection_service.detect(request.image)
+            deadline = Deadline.from_grpc_context(context)
+            result = detect(self._to_detect_request(request), deadline=deadline)
             
             # Convert to proto response
-            response = detection_pb2.DetectResponse(
-                success=True,
-                detections=[
-                    detection_pb2.Detection(
-                        class_id=det.class_id,
-                        class_name=det.class_name,
-                        confidence=det.confidence,
-                        bbox=detection_pb2.BoundingBox(
-                            x1=det.bbox.x1,
-                            y1=det.bbox.y1,
-                            x2=det.bbox.x2,
-                            y2=det.bbox.y2
-                        )
-                    )
-                    for det in result.detections
-                ],
-                inference_time_ms=result.inference_time_ms,
-                model_version=result.model_version
-            )
+            response = self._to_proto_response(result)
             
             logger.info(
                 "detection_completed",
@@ -87,6 +105,16 @@ class DetectionServicer(detection_pb2_grpc.DetectionServiceServicer):
             
             return response
             
+        except DeadlineExceededException as e:
+            logger.warning("detection_deadline_exceeded", stage=e.details.get("stage"))
+            context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+            context.set_details(e.message)
+            return detection_pb2.DetectResponse(
+                success=False,
+                error_message=e.message,
+                request_id=request.request_id
+            )
+            
         except ModelNotLoadedException as e:
             logger.error("model_not_loaded", error=str(e))
             context.set_code(grpc.StatusCode.UNAVAILABLE)
@@ -132,35 +160,12 @@ class DetectionServicer(detection_pb2_grpc.DetectionServiceServicer):
         try:
             logger.info("stream_detection_started", client=context.peer())
             
+            # Frames are not started once the stream's deadline has passed
+            deadline = Deadline.from_grpc_context(context)
             frame_count = 0
             for request in request_iterator:
                 frame_count += 1
-                
-                # Process each frame
-                result = self.detection_service.detect(request.image)
-                
-                # Convert and yield response
-                response = detection_pb2.DetectResponse(
-                    success=True,
-                    detections=[
-                        detection_pb2.Detection(
-                            class_id=det.class_id,
-                            class_name=det.class_name,
-                            confidence=det.confidence,
-                            bbox=detection_pb2.BoundingBox(
-                                x1=det.bbox.x1,
-                                y1=det.bbox.y1,
-                                x2=det.bbox.x2,
-                                y2=det.bbox.y2
-                            )
-                        )
-                        for det in result.detections
-                    ],
-                    inference_time_ms=result.inference_time_ms,
-                    frame_number=frame_count
-                )
-                
-                yield response
+                yield self._detect_stream_frame(request, deadline)
             
             logger.info(
                 "stream_detection_completed",
@@ -171,3 +176,215 @@ class DetectionServicer(detection_pb2_grpc.DetectionServiceServicer):
             logger.error("stream_detection_error", error=str(e), exc_info=True)
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
+
+    def _detect_stream_frame(
+        self,
+        request: detection_pb2.DetectRequest,
+        deadline: Deadline
+    ) -> detection_pb2.DetectResponse:
+        """Detect one stream frame (shared by the sync and aio stream RPCs)."""
+        try:
+            with self._inference_slot(deadline):
+                # Joins the cross-stream YOLO batch
+                result = self.detection_service.detect_objects(
+                    self._to_detect_request(request),
+                    deadline=deadline,
+                )
+        except AdmissionRejected as e:
+            # Shed frames are reported per frame; the stream keeps going
+            logger.debug("stream_frame_rejected_overload", reason=e.reason)
+            return detection_pb2.DetectResponse(
+                success=False,
+                error_message=e.reason,
+                request_id=request.request_id,
+                timestamp=request.timestamp,
+            )
+        # Frames are matched by the echoed request_id / timestamp
+        return self._to_proto_response(result)
+
+    def _inference_slot(self, deadline: Optional[Deadline] = None):
+        """STREAM-lane admission slot (no-op without a controller)."""
+        if self.admission is None:
+            return contextlib.nullcontext()
+        budget_ms = deadline.remaining_ms() if deadline is not None else math.inf
+        return self.admission.slot(
+            Lane.STREAM, budget_ms=None if math.isinf(budget_ms) else budget_ms
+        )
+
+    def DetectObjectsStream(
+        self,
+        request_iterator: Iterator[detection_pb2.DetectRequest],
+        context
+    ):
+        """DetectObjectsStream RPC (the proto name of DetectStream)."""
+        return self.DetectStream(request_iterator, context)
+
+    def DetectObjectsBatch(
+        self,
+        request: detection_pb2.DetectBatchRequest,
+        context
+    ):
+        """
+        Batch detection, one response for the whole batch.
+        
+        Responses are in request order. Images not yet run when the
+        caller's deadline passes come back as "Deadline exceeded" errors.
+        
+        Args:
+            request: DetectBatchRequest proto
+            context: gRPC context
+            
+        Returns:
+            DetectBatchResponse proto
+        """
+        try:
+            logger.info(
+                "batch_detection_started",
+                batch_size=len(request.requests),
+                client=context.peer()
+            )
+            
+            batch_request = DetectBatchRequest(
+                requests=[self._to_detect_request(req) for req in request.requests],
+                parallel_processing=request.parallel_processing
+            )
+            
+            deadline = Deadline.from_grpc_context(context)
+            result = self.detection_service.detect_batch(batch_request, deadline=deadline)
+            
+            responses = []
+            for index, item in enumerate(result.responses):
+                response = self._to_proto_response(item)
+                response.batch_index = index
+                responses.append(response)
+            
+            return detection_pb2.DetectBatchResponse(
+                responses=responses,
+                total_time_ms=result.total_time_ms
+            )
+            
+        except ModelNotLoadedException as e:
+            logger.error("model_not_loaded", error=str(e))
+            context.set_code(grpc.StatusCode.UNAVAILABLE)
+            context.set_details("Detection model not loaded")
+            return detection_pb2.DetectBatchResponse()
+            
+        except Exception as e:
+            logger.error("batch_detection_error", error=str(e), exc_info=True)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+            return detection_pb2.DetectBatchResponse()
+
+    def DetectObjectsBatchStream(
+        self,
+        request: detection_pb2.DetectBatchRequest,
+        context
+    ):
+        """
+        Batch detection, streaming each response as soon as it is ready.
+        
+        Images are decoded in parallel and run through batched forward passes;
+        responses arrive in completion order, tagged with batch_index.
+        Images not yet run when the caller's deadline passes are returned
+        as "Deadline exceeded" errors instead of being processed.
+        
+        Args:
+            request: DetectBatchRequest proto
+            context: gRPC context
+            
+        Yields:
+            DetectResponse protos
+        """
+        try:
+            logger.info(
+                "batch_stream_detection_started",
+                batch_size=len(request.requests),
+                client=context.peer()
+            )
+            
+            batch_request = DetectBatchRequest(
+                requests=[self._to_detect_request(req) for req in request.requests],
+                parallel_processing=True
+            )
+            
+            emitted = 0
+            deadline = Deadline.from_grpc_context(context)
+            for index, result in self.detection_service.iter_detect_batch(
+                batch_request, deadline=deadline
+            ):
+                if not context.is_active():
+                    logger.warning("batch_stream_cancelled_by_client", emitted=emitted)
+                    return
+                
+                response = self._to_proto_response(result)
+                response.batch_index = index
+                emitted += 1
+                yield response
+            
+            logger.info("batch_stream_detection_completed", total_responses=emitted)
+            
+        except Exception as e:
+            logger.error("batch_stream_detection_error", error=str(e), exc_info=True)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+
+    @staticmethod
+    def _to_proto_response(result: DetectResponse) -> detection_pb2.DetectResponse:
+        """Map the service DetectResponse DTO to proto."""
+        response = detection_pb2.DetectResponse(
+            success=result.success,
+            error_message=result.error_message or "",
+            total_objects=result.total_objects,
+            inference_time_ms=result.inference_time_ms,
+            preprocessing_time_ms=result.preprocessing_time_ms,
+            postprocessing_time_ms=result.postprocessing_time_ms,
+            total_time_ms=result.total_time_ms,
+            request_id=result.request_id or "",
+            timestamp=result.timestamp or 0,
+            detections=[
+                detection_pb2.Detection(
+                    class_id=det.class_id,
+                    class_name=det.class_name,
+                    confidence=det.confidence,
+                    area=det.area or 0.0,
+                    bbox=detection_pb2.BoundingBox(
+                        x1=det.bbox.x1,
+                        y1=det.bbox.y1,
+                        x2=det.bbox.x2,
+                        y2=det.bbox.y2,
+                        x1_norm=det.bbox.x1_norm or 0.0,
+                        y1_norm=det.bbox.y1_norm or 0.0,
+                        x2_norm=det.bbox.x2_norm or 0.0,
+                        y2_norm=det.bbox.y2_norm or 0.0
+                    )
+                )
+                for det in result.detections
+            ]
+        )
+        
+        if result.image_metadata:
+            response.image_metadata.CopyFrom(
+                detection_pb2.ImageMetadata(
+                    width=result.image_metadata.width,
+                    height=result.image_metadata.height,
+                    channels=result.image_metadata.channels,
+                    format=result.image_metadata.format
+                )
+            )
+        
+        return response
+
+    @staticmethod
+    def _to_detect_request(request: detection_pb2.DetectRequest) -> DetectRequest:
+        """Map proto DetectRequest to the service DTO (defaults from settings)."""
+        return DetectRequest(
+            image=request.image,
+            confidence_threshold=request.confidence_threshold or settings.DETECTION_CONFIDENCE,
+            iou_threshold=request.iou_threshold or settings.DETECTION_IOU_THRESHOLD,
+            target_classes=list(request.target_classes),
+            exclude_classes=list(request.exclude_classes),
+            camera_id=request.camera_id or None,
+            timestamp=request.timestamp or None,
+            request_id=request.request_id or None,
+            max_detections=request.max_detections or settings.DETECTION_MAX_DETECTIONS,
+        )
@@ -1,8 +1,6 @@
 from __future__ import annotations
 import structlog
 from typing import Any, Dict, Optional
-import numpy as np
-import cv2
 from packages.contracts.python.face_pb2 import (
     FaceDetectResponse,
     FaceEmbeddingResponse,
@@ -19,7 +17,10 @@ from packages.contracts.python.face_pb2 import (
 from packages.contracts.python.face_pb2_grpc import FaceServiceServicer
 
 from src.services.ml.Face_Recognition_Service import FaceRecognitionService
-from src.core.exceptions import InvalidImageException
+from src.core.config import settings
+from src.core.deadline import Deadline
+from src.core.exceptions import DeadlineExceededException, InvalidImageException
+from src.utils.image_decode import decode_image
 
 logger = structlog.get_logger("grpc.face_servicer")
 
@@ -29,7 +30,7 @@ class FaceServicer(FaceServiceServicer):
     gRPC FaceService implementation that wraps FaceRecognitionService.
     This layer:
       - Maps protobuf requests to Python dicts / numpy
-      - Calls FaceRecognitionService
+      - Calls FaceRecognitionService (with the caller's gRPC deadline)
       - Maps results back into protobuf responses
     """
 
@@ -48,6 +49,7 @@ class FaceServicer(FaceServiceServicer):
                 max_faces=request.max_faces or 0,
                 include_crops=request.include_crops,
                 max_image_dimension=request.max_image_dimension or 0,
+                deadline=self._deadline(context),
             )
 
             faces_result = result.get("faces", [])
@@ -56,6 +58,7 @@ class FaceServicer(FaceServiceServicer):
                 total_faces=len(faces_result),
                 total_time_ms=float(result.get("time_ms", 0.0)),
             )
+            self._map_partial_to_proto(result, resp)
             
             # Map metrics if present
             metrics = self._map_metrics_to_proto(result.get("metrics"))
@@ -95,6 +98,10 @@ class FaceServicer(FaceServiceServicer):
             )
             return resp
 
+        except DeadlineExceededException as e:
+            logger.warning("detect_faces_rpc_deadline_exceeded", stage=e.details.get("stage"))
+            return FaceDetectResponse(success=False, error_message=e.message)
+
         except InvalidImageException as e:
             logger.error("detect_faces_rpc_invalid_image", error=str(e), exc_info=True)
             return FaceDetectResponse(success=False, error_message=str(e))
@@ -123,6 +130,7 @@ class FaceServicer(FaceServiceServicer):
                 max_faces=request.max_faces or 0,
                 include_crops=request.include_crops,
                 max_image_dimension=request.max_image_dimension or 0,
+                deadline=self._deadline(context),
             )
 
             faces_result = result.get("faces") or []
@@ -134,6 +142,7 @@ class FaceServicer(FaceServiceServicer):
                 camera_id=result.get("camera_id", "") or (request.camera_id or ""),
                 error_code=ErrorCode.ERROR_CODE_UNSPECIFIED,
             )
+            self._map_partial_to_proto(result, resp)
             
             # Map metrics
             metrics = self._map_metrics_to_proto(result.get("metrics"))
@@ -155,35 +164,7 @@ class FaceServicer(FaceServiceServicer):
                 return resp
 
             # OPTIMIZED: Map faces with helper methods
-            for f in faces_result:
-                face_msg = Face()
-                
-                # Bbox
-                bbox_proto = self._map_bbox_to_proto(f.get("bbox"))
-                if bbox_proto:
-                    face_msg.bbox.CopyFrom(bbox_proto)
-                
-                # Embedding
-                embedding = f.get("embedding") or []
-                if embedding:
-                    face_msg.embedding_vector.extend(float(v) for v in embedding)
-                
-                face_msg.confidence = float(f.get("confidence", 1.0))
-                
-                # Crop
-                crop = f.get("crop_jpeg") or f.get("cropped_image")
-                if crop is not None:
-                    face_msg.cropped_image = crop
-                
-                # Face ID
-                face_id = f.get("face_id")
-                if face_id is not None:
-                    face_msg.face_id = int(face_id)
-                
-                # Quality
-                self._map_quality_to_proto(f.get("quality"), face_msg)
-                
-                resp.faces.append(face_msg)
+            resp.faces.extend(self._map_face_to_proto(f) for f in faces_result)
 
             logger.info(
                 "extract_embedding_rpc_completed",
@@ -193,6 +174,14 @@ class FaceServicer(FaceServiceServicer):
             )
             return resp
 
+        except DeadlineExceededException as e:
+            logger.warning("extract_embedding_rpc_deadline_exceeded", stage=e.details.get("stage"))
+            return FaceEmbeddingResponse(
+                success=False,
+                error_message=e.message,
+                error_code=ErrorCode.TIMEOUT,
+            )
+
         except InvalidImageException as e:
             logger.error("extract_embedding_rpc_invalid_image", error=str(e), exc_info=True)
             return FaceEmbeddingResponse(
@@ -289,6 +278,8 @@ class FaceServicer(FaceServiceServicer):
         Enables bypassing VideoStreamService for face-only cameras.
         """
         try:
+            deadline = self._deadline(context)
+
             # Validate frame data
             if not request.frame or len(request.frame) == 0:
                 logger.warning("process_frame_empty_image")
@@ -297,16 +288,9 @@ class FaceServicer(FaceServiceServicer):
                     error_message="Empty frame data",
                 )
 
-            # Decode JPEG
-            np_arr = np.frombuffer(request.frame, np.uint8)
-            frame = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
-
-            if frame is None:
-                logger.error("process_frame_decode_failed")
-                return FrameProcessResponse(
-                    success=False,
-                    error_message="Failed to decode frame",
-                )
+            # Decode JPEG (size limits checked from the header first)
+            deadline.check("decode")
+            frame = decode_image(request.frame, max_source_pixels=settings.IMAGE_MAX_SOURCE_PIXELS)
 
             # Call service layer
             result = self.face_service.process_frame(
@@ -315,6 +299,7 @@ class FaceServicer(FaceServiceServicer):
                 confidence_threshold=request.confidence_threshold or 0.7,
                 max_faces=request.max_faces or 10,
                 skip_embedding=request.skip_embedding,
+                deadline=deadline,
             )
 
             faces_result = result.get("faces", [])
@@ -324,6 +309,7 @@ class FaceServicer(FaceServiceServicer):
                 camera_id=result.get("camera_id", "") or request.camera_id,
                 total_time_ms=float(result.get("time_ms", 0.0)),
             )
+            self._map_partial_to_proto(result, resp)
 
             # Map metrics
             metrics = self._map_metrics_to_proto(result.get("metrics"))
@@ -365,6 +351,10 @@ class FaceServicer(FaceServiceServicer):
             )
             return resp
 
+        except DeadlineExceededException as e:
+            logger.warning("process_frame_rpc_deadline_exceeded", stage=e.details.get("stage"))
+            return FrameProcessResponse(success=False, error_message=e.message)
+
         except InvalidImageException as e:
             logger.error("process_frame_rpc_invalid_image", error=str(e), exc_info=True)
             return FrameProcessResponse(success=False, error_message=str(e))
@@ -373,6 +363,18 @@ class FaceServicer(FaceServiceServicer):
             logger.error("process_frame_rpc_error", error=str(e), exc_info=True)
             return FrameProcessResponse(success=False, error_message=str(e))
 # ==================================== Helpers ++ ========================================
+    @staticmethod
+    def _deadline(context) -> Deadline:
+        """Caller's gRPC deadline, capped at REQUEST_TIMEOUT."""
+        return Deadline.from_grpc_context(context, max_seconds=settings.REQUEST_TIMEOUT)
+
+    @staticmethod
+    def _map_partial_to_proto(result: Dict[str, Any], resp) -> None:
+        """Flag responses where optional stages were dropped to meet the deadline."""
+        skipped = result.get("skipped_stages") or []
+        resp.partial_result = bool(result.get("partial", False))
+        resp.skipped_stages.extend(skipped)
+
     @staticmethod
     def _map_bbox_to_proto(bbox_data: Any) -> Optional[BoundingBox]:
         """
@@ -413,6 +415,37 @@ class FaceServicer(FaceServiceServicer):
         
         return None
     
+    @staticmethod
+    def _map_face_to_proto(f: Dict[str, Any]) -> Face:
+        """Map one process_frame face dict (bbox, embedding, quality, ...) to a Face message."""
+        face_msg = Face()
+
+        # Bbox
+        bbox_proto = FaceServicer._map_bbox_to_proto(f.get("bbox"))
+        if bbox_proto:
+            face_msg.bbox.CopyFrom(bbox_proto)
+
+        # Embedding
+        embedding = f.get("embedding") or []
+        if embedding:
+            face_msg.embedding_vector.extend(float(v) for v in embedding)
+
+        face_msg.confidence = float(f.get("confidence", 1.0))
+
+        # Face ID
+        face_id = f.get("face_id")
+        if face_id is not None:
+            face_msg.face_id = int(face_id)
+
+        # Quality
+        FaceServicer._map_quality_to_proto(f.get("quality"), face_msg)
+
+        # Crops (only present when include_crops was requested)
+        crop = f.get("crop_jpeg") or f.get("cropped_image")
+        if crop is not None:
+            face_msg.cropped_image = crop
+        return face_msg
+
     @staticmethod
     def _map_quality_to_proto(quality_data: Optional[Dict[str, Any]], target_msg) -> None:
         """
@@ -0,0 +1,119 @@
+"""Frame analysis (multi-task) gRPC implementation."""
+import structlog
+
+from packages.contracts.python import frame_analysis_pb2, frame_analysis_pb2_grpc
+
+from src.api.grpc.servicers.detection_servicer import DetectionServicer
+from src.api.grpc.servicers.face_servicer import FaceServicer
+from src.services.ml.frame_analysis import DEFAULT_ANALYZERS, FrameAnalysisService
+from src.core.exceptions import DeadlineExceededException
+
+logger = structlog.get_logger("grpc.frame_analysis_servicer")
+
+
+class FrameAnalysisServicer(frame_analysis_pb2_grpc.FrameAnalysisServiceServicer):
+    """
+    gRPC FrameAnalysisService implementation.
+
+    One request carries the image once; objects, waste and faces are
+    answered from a single decode by FrameAnalysisService. Results reuse
+    the DetectResponse / Face messages of the single-task services.
+    """
+
+    def __init__(self, analysis_service: FrameAnalysisService) -> None:
+        self.analysis_service = analysis_service
+        logger.info("frame_analysis_servicer_initialized")
+
+    def AnalyzeFrame(self, request: frame_analysis_pb2.AnalyzeFrameRequest, context):
+        """
+        Decode the frame once and run the requested analyzers.
+
+        Returns:
+            AnalyzeFrameResponse proto
+        """
+        try:
+            deadline = FaceServicer._deadline(context)
+            if not request.image:
+                logger.warning("analyze_frame_empty_image")
+                return frame_analysis_pb2.AnalyzeFrameResponse(
+                    success=False,
+                    error_message="Empty image data",
+                    camera_id=request.camera_id,
+                    request_id=request.request_id,
+                )
+
+            result = self.analysis_service.analyze_frame(
+                request.image,
+                analyzers=self._analyzer_names(request.analyzers),
+                camera_id=request.camera_id or "unknown",
+                request_id=request.request_id or None,
+                timestamp=request.timestamp or None,
+                object_confidence_threshold=request.object_confidence_threshold or None,
+                iou_threshold=request.iou_threshold or None,
+                target_classes=list(request.target_classes),
+                max_detections=request.max_detections or None,
+                face_confidence_threshold=request.face_confidence_threshold or 0.7,
+                max_faces=request.max_faces or 10,
+                faces_in_persons_only=request.faces_in_persons_only,
+                deadline=deadline,
+            )
+            return self._to_proto_response(result)
+
+        except DeadlineExceededException as e:
+            logger.warning("analyze_frame_rpc_deadline_exceeded", stage=e.details.get("stage"))
+            return frame_analysis_pb2.AnalyzeFrameResponse(success=False, error_message=e.message)
+
+        except Exception as e:
+            logger.error("analyze_frame_rpc_error", error=str(e), exc_info=True)
+            return frame_analysis_pb2.AnalyzeFrameResponse(success=False, error_message=str(e))
+
+    # ========================================================================
+    # Helpers
+    # ========================================================================
+
+    @staticmethod
+    def _analyzer_names(analyzers) -> list:
+        """Proto Analyzer enums -> service analyzer names (empty = defaults)."""
+        names = [
+            frame_analysis_pb2.Analyzer.Name(a).lower()
+            for a in analyzers
+            if a != frame_analysis_pb2.ANALYZER_UNSPECIFIED
+        ]
+        return names or list(DEFAULT_ANALYZERS)
+
+    @staticmethod
+    def _to_proto_response(result: dict) -> frame_analysis_pb2.AnalyzeFrameResponse:
+        """Map the FrameAnalysisService result dict to proto."""
+        response = frame_analysis_pb2.AnalyzeFrameResponse(
+            success=bool(result.get("success", False)),
+            error_message=result.get("error_message", ""),
+            camera_id=result.get("camera_id", ""),
+            request_id=result.get("request_id") or "",
+            timestamp=int(result.get("timestamp") or 0),
+            decode_time_ms=float(result.get("decode_ms", 0.0)),
+            total_time_ms=float(result.get("time_ms", 0.0)),
+            partial_result=bool(result.get("partial", False)),
+        )
+        response.skipped_stages.extend(result.get("skipped_stages") or [])
+        response.failed_analyzers.extend(result.get("failed_analyzers") or [])
+
+        image = result.get("image")
+        if image:
+            response.image_metadata.width = image["width"]
+            response.image_metadata.height = image["height"]
+            response.image_metadata.channels = image["channels"]
+
+        if result.get("objects") is not None:
+            response.objects.CopyFrom(DetectionServicer._to_proto_response(result["objects"]))
+        if result.get("waste") is not None:
+            response.waste.CopyFrom(DetectionServicer._to_proto_response(result["waste"]))
+
+        faces = result.get("faces")
+        if faces is not None:
+            response.faces.extend(FaceServicer._map_face_to_proto(f) for f in faces.get("faces", []))
+            metrics = FaceServicer._map_metrics_to_proto(faces.get("metrics"))
+            if metrics:
+                response.face_metrics.CopyFrom(metrics)
+
+        return response
+
@@ -5,21 +5,35 @@ Optimized Video Stream Servicer
 - Improved error recovery with response feedback
 - Memory-efficient frame processing
 - Better metrics aggregation
+- Pipelined decode / detect / embed / serialize stages with bounded queues
+- Latest-frame-wins adaptive admission (staleness budget + AIMD FPS)
+- Fair deficit-round-robin inference turns across cameras
+- Per-frame deadlines: expired frames are skipped, embedding dropped if late
 """
 from __future__ import annotations
 
+import contextlib
+import math
+import threading
 import time
 from typing import Iterator, Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from collections import deque
 
-import cv2
 import numpy as np
 import structlog
 import grpc
 
 from packages.contracts.python import video_stream_pb2, video_stream_pb2_grpc
-from src.services.ml.Face_Recognition_Service import FaceRecognitionService
+from src.core.deadline import Deadline
+from src.core.config import settings
+from src.core.exceptions import DeadlineExceededException, InvalidImageException
+from src.services.ml.Face_Recognition_Service import FaceRecognitionService, FrameDetection
+from src.api.grpc.admission import AdmissionController, AdmissionRejected, Lane
+from src.services.streaming.admission import FrameAdmission
+from src.services.streaming.pipeline import StagePipeline
+from src.services.streaming.scheduler import CameraScheduler
+from src.utils.image_decode import decode_image
 
 logger = structlog.get_logger("grpc.video_stream_servicer")
 
@@ -30,6 +44,8 @@ class CameraMetrics:
     camera_id: str
     frames_processed: int = 0
     frames_dropped: int = 0
+    frames_stale: int = 0
+    target_fps: float = 0.0
     faces_detected: int = 0
     total_processing_ms: float = 0.0
     start_time: float = field(default_factory=time.time)
@@ -61,16 +77,34 @@ class CameraMetrics:
         )
 
 
+@dataclass
+class _FrameJob:
+    """One frame travelling through the StreamFrames stages."""
+    camera_id: str
+    frame_id: int
+    timestamp_ms: int
+    image_jpeg: bytes
+    received_at: float = 0.0  # server monotonic receive time
+    deadline: Optional[Deadline] = None
+    failed: bool = False
+    frame: Optional[np.ndarray] = None
+    detection: Optional[FrameDetection] = None
+    result: Optional[Dict[str, Any]] = None
+    response: Optional[video_stream_pb2.VideoFrameResponse] = None
+
+
 class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
     """
     Optimized bidirectional gRPC streaming service.
     
     Key improvements:
     - Zero-copy frame decoding where possible
-    - Backpressure via frame throttling
+    - Latest-frame-wins admission with adaptive FPS
     - Error responses sent back to client
     - Efficient metrics aggregation
     - Memory-bounded per-camera state
+    - Optional staged pipeline (bounded queues, in-order responses)
+    - Shared scheduler so no camera starves the others
     """
 
     def __init__(
@@ -78,18 +112,38 @@ class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
         face_service: FaceRecognitionService,
         min_frame_interval_ms: float = 33.0,  # ~30 FPS max
         max_metrics_buffer: int = 100,
+        pipelined: bool = True,
+        pipeline_queue_size: int = 2,
+        min_fps: float = 1.0,
+        max_frame_age_ms: float = 500.0,
+        target_latency_ms: float = 200.0,
+        scheduler: Optional[CameraScheduler] = None,
+        admission: Optional[AdmissionController] = None,
     ) -> None:
         self.face_service = face_service
         self.min_frame_interval_ms = min_frame_interval_ms
         self.max_metrics_buffer = max_metrics_buffer
+        self.pipelined = pipelined
+        self.pipeline_queue_size = pipeline_queue_size
+        self.max_fps = 1000.0 / min_frame_interval_ms if min_frame_interval_ms > 0 else 1000.0
+        self.min_fps = min(min_fps, self.max_fps)
+        self.max_frame_age_ms = max_frame_age_ms
+        self.target_latency_ms = target_latency_ms
         
-        # Per-camera last process time for throttling
-        self._last_process_time: Dict[str, float] = {}
+        # Shared by every stream: fair detection turns + bounded per-camera state
+        self.scheduler = scheduler or CameraScheduler()
+        # Server-wide inference cap; stream frames use the highest-priority lane
+        self.admission = admission
         
         logger.info(
             "video_stream_servicer_initialized",
             min_frame_interval_ms=min_frame_interval_ms,
-            max_fps=1000.0 / min_frame_interval_ms if min_frame_interval_ms > 0 else 0,
+            max_fps=round(self.max_fps, 2),
+            min_fps=self.min_fps,
+            max_frame_age_ms=max_frame_age_ms,
+            target_latency_ms=target_latency_ms,
+            pipelined=pipelined,
+            pipeline_queue_size=pipeline_queue_size,
         )
 
     def StreamFrames(
@@ -101,112 +155,319 @@ class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
         Bidirectional streaming RPC handler.
         
         Receives frames from .NET, processes them, and streams back results.
-        Implements backpressure, error recovery, and comprehensive metrics.
+        Implements adaptive admission, error recovery, and comprehensive metrics.
+        
+        A reader thread drains the request stream into a per-camera one-slot
+        mailbox (newest frame wins), so the server never works through a
+        backlog of old frames. Frames that are superseded, rate-limited or too
+        old get no response of their own; every response carries the
+        camera's running dropped / stale counts and current target FPS so the
+        client can lower its send rate.
+        
+        When pipelining is enabled, decode / detect / embed / serialize run on
+        separate stage threads joined by bounded queues, so consecutive frames
+        overlap while responses keep admission order.
+        
+        Each frame's deadline is the earlier of the stream's gRPC deadline and
+        receive time + max_frame_age_ms. Frames past it skip detection; frames
+        that can no longer afford embedding return detection-only results
+        flagged `partial_result`.
         """
         camera_metrics: Dict[str, CameraMetrics] = {}
+        admission = self._new_admission(
+            max_in_flight=4 if self.pipelined else 1,  # one frame per stage
+        )
+        reader = threading.Thread(
+            target=self._read_frames,
+            args=(request_iterator, context, admission),
+            name="stream-reader",
+            daemon=True,
+        )
+        reader.start()
+        jobs = self._admitted_jobs(admission, Deadline.from_grpc_context(context))
+        
+        try:
+            if self.pipelined:
+                pipeline = StagePipeline(
+                    stages=[
+                        ("decode", self._stage_decode),
+                        ("detect", self._stage_detect),
+                        ("embed", self._stage_embed),
+                        ("serialize", self._stage_serialize),
+                    ],
+                    queue_size=self.pipeline_queue_size,
+                    name="stream",
+                )
+                completed = pipeline.run(jobs)
+            else:
+                completed = (self._run_stages(job) for job in jobs)
+
+            for job in completed:
+                self._record_job(job, camera_metrics, admission)
+                yield job.response
+        
+        except Exception as e:
+            logger.exception("stream_fatal_error", error=str(e))
+            context.abort(grpc.StatusCode.INTERNAL, f"Stream failed: {str(e)}")
         
+        finally:
+            admission.abort()
+            # Always log final metrics
+            self._log_final_metrics(camera_metrics)
+
+    # =========================================================================
+    # FRAME STAGES - each stage skips jobs that already have a response
+    # =========================================================================
+
+    def _read_frames(
+        self,
+        request_iterator: Iterator[video_stream_pb2.VideoFrameRequest],
+        context: grpc.ServicerContext,
+        admission: FrameAdmission,
+    ) -> None:
+        """Reader thread: drain requests into the admission mailbox."""
         try:
             for req in request_iterator:
                 # Check if client cancelled
                 if not context.is_active():
                     logger.warning("stream_cancelled_by_client")
-                    self._log_final_metrics(camera_metrics)
                     return
 
-                # Extract request fields
-                camera_id = getattr(req, "camera_id", "") or "unknown"
-                frame_id = getattr(req, "frame_id", 0)
-                timestamp_ms = getattr(req, "timestamp_ms", 0)
-                
-                # Initialize metrics for new camera
-                if camera_id not in camera_metrics:
-                    camera_metrics[camera_id] = CameraMetrics(camera_id=camera_id)
-                
-                metrics = camera_metrics[camera_id]
-                
-                # Throttle check (backpressure)
-                if not self._should_process_frame(camera_id, timestamp_ms):
-                    metrics.frames_dropped += 1
-                    logger.debug(
-                        "frame_throttled",
-                        camera_id=camera_id,
-                        frame_id=frame_id,
-                        dropped_count=metrics.frames_dropped,
-                    )
-                    
-                    # Send throttled response
-                    yield self._create_throttled_response(camera_id, frame_id)
-                    continue
-
-                # Decode frame
-                frame = self._decode_jpeg(getattr(req, "image_jpeg", b""))
-                if frame is None:
-                    logger.warning(
-                        "frame_decode_failed",
-                        camera_id=camera_id,
-                        frame_id=frame_id,
-                        timestamp_ms=timestamp_ms,
-                    )
-                    
-                    # Send error response (client knows it failed)
-                    yield self._create_error_response(
-                        camera_id,
-                        frame_id,
-                        "Failed to decode JPEG frame",
-                    )
-                    continue
+                self._offer_request(req, admission)
+        except Exception as e:
+            if context.is_active():
+                logger.warning("stream_reader_failed", error=str(e))
+        finally:
+            admission.close()
 
-                # Process frame
-                try:
-                    result = self.face_service.process_frame(
-                        frame=frame,
-                        camera_id=camera_id,
-                    )
-                except Exception as e:
-                    logger.exception(
-                        "process_frame_exception",
-                        camera_id=camera_id,
-                        frame_id=frame_id,
-                        error=str(e),
-                    )
-                    
-                    # Send error response
-                    yield self._create_error_response(
-                        camera_id,
-                        frame_id,
-                        f"Processing failed: {str(e)}",
+    def _new_admission(self, max_in_flight: int) -> FrameAdmission:
+        """Per-stream admission controller built from the servicer settings."""
+        return FrameAdmission(
+            max_fps=self.max_fps,
+            min_fps=self.min_fps,
+            max_age_ms=self.max_frame_age_ms,
+            target_latency_ms=self.target_latency_ms,
+            max_in_flight=max_in_flight,
+        )
+
+    @staticmethod
+    def _offer_request(
+        req: video_stream_pb2.VideoFrameRequest,
+        admission: FrameAdmission,
+    ) -> None:
+        """Wrap a request in a job and offer it to the camera's mailbox."""
+        job = _FrameJob(
+            camera_id=getattr(req, "camera_id", "") or "unknown",
+            frame_id=getattr(req, "frame_id", 0),
+            timestamp_ms=getattr(req, "timestamp_ms", 0),
+            image_jpeg=getattr(req, "image_jpeg", b""),
+        )
+
+        if not admission.offer(job.camera_id, job):
+            logger.debug(
+                "frame_throttled",
+                camera_id=job.camera_id,
+                frame_id=job.frame_id,
+            )
+
+    def _admitted_jobs(
+        self,
+        admission: FrameAdmission,
+        stream_deadline: Deadline,
+    ) -> Iterator[_FrameJob]:
+        """Yield jobs as they are released by the admission controller."""
+        for job, received_at in admission.drain():
+            yield self._admit_job(job, received_at, stream_deadline)
+
+    def _admit_job(
+        self,
+        job: _FrameJob,
+        received_at: float,
+        stream_deadline: Deadline,
+    ) -> _FrameJob:
+        """Stamp receive time and the per-frame deadline on an admitted job."""
+        max_age_s = self.max_frame_age_ms / 1000.0
+        job.received_at = received_at
+        job.deadline = Deadline.earliest(
+            stream_deadline,
+            Deadline(received_at + max_age_s) if max_age_s > 0 else None,
+        )
+        return job
+
+    def _run_stages(self, job: _FrameJob) -> _FrameJob:
+        """Run every stage inline (non-pipelined mode)."""
+        return self._stage_serialize(
+            self._stage_embed(self._stage_detect(self._stage_decode(job)))
+        )
+
+    def _stage_decode(self, job: _FrameJob) -> _FrameJob:
+        if job.response is not None:
+            return job
+
+        job.frame = self._decode_jpeg(job.image_jpeg)
+        job.image_jpeg = b""  # release the encoded bytes early
+        if job.frame is None:
+            logger.warning(
+                "frame_decode_failed",
+                camera_id=job.camera_id,
+                frame_id=job.frame_id,
+                timestamp_ms=job.timestamp_ms,
+            )
+            
+            # Send error response (client knows it failed)
+            job.response = self._create_error_response(
+                job.camera_id,
+                job.frame_id,
+                "Failed to decode JPEG frame",
+            )
+            job.failed = True
+        return job
+
+    def _stage_detect(self, job: _FrameJob) -> _FrameJob:
+        if job.response is not None:
+            return job
+
+        remaining_ms = job.deadline.remaining_ms() if job.deadline is not None else math.inf
+        turn_timeout = None if math.isinf(remaining_ms) else max(0.0, remaining_ms) / 1000.0
+        try:
+            with self.scheduler.turn(job.camera_id, timeout=turn_timeout) as turn:
+                with self._inference_slot(job.deadline):
+                    job.detection = self.face_service.detect_frame(
+                        frame=job.frame,
+                        camera_id=job.camera_id,
+                        deadline=job.deadline,
                     )
-                    continue
-
-                # Build response
-                resp = self._build_response(result, camera_id, frame_id)
-                
-                # Update metrics
-                metrics.add_frame(
-                    processing_ms=resp.processing_time_ms,
-                    face_count=len(resp.faces),
-                )
-                
-                # Periodic logging
-                self._maybe_log_metrics(metrics)
-
-                logger.debug(
-                    "frame_processed",
-                    camera_id=camera_id,
-                    frame_id=frame_id,
-                    faces=len(resp.faces),
-                    processing_ms=resp.processing_time_ms,
-                )
+                turn.faces = len(job.detection.faces)
+        except DeadlineExceededException as e:
+            logger.debug("frame_deadline_exceeded", camera_id=job.camera_id, frame_id=job.frame_id)
+            job.response = self._create_error_response(
+                job.camera_id, job.frame_id, e.message, skipped_stages=["faces"]
+            )
+            job.failed = True
+        except TimeoutError as e:
+            # No scheduler turn before the frame's deadline
+            logger.debug("frame_deadline_exceeded", camera_id=job.camera_id, frame_id=job.frame_id)
+            job.response = self._create_error_response(
+                job.camera_id, job.frame_id, str(e), skipped_stages=["faces"]
+            )
+            job.failed = True
+        except AdmissionRejected as e:
+            logger.debug("frame_rejected_overload", camera_id=job.camera_id, reason=e.reason)
+            job.response = self._create_error_response(
+                job.camera_id, job.frame_id, e.reason, skipped_stages=["faces"]
+            )
+            job.failed = True
+        except Exception as e:
+            self._fail_job(job, e)
+        finally:
+            job.frame = None
+        return job
 
-                yield resp
-        
+    def _inference_slot(self, deadline: Optional[Deadline] = None):
+        """STREAM-lane admission slot (no-op without a controller)."""
+        if self.admission is None:
+            return contextlib.nullcontext()
+        budget_ms = deadline.remaining_ms() if deadline is not None else math.inf
+        if math.isinf(budget_ms):
+            budget_ms = self.max_frame_age_ms or None
+        return self.admission.slot(Lane.STREAM, budget_ms=budget_ms)
+
+    def _stage_embed(self, job: _FrameJob) -> _FrameJob:
+        if job.response is not None:
+            return job
+
+        try:
+            job.result = self.face_service.embed_frame(job.detection, deadline=job.deadline)
+            # Embedding runs in the shared batcher, outside the turn - charge it too
+            embed_ms = job.result.get("metrics", {}).get("embedding_ms", 0.0)
+            if embed_ms:
+                self.scheduler.charge(job.camera_id, embed_ms)
+        except DeadlineExceededException:
+            # Replica checkout or remote call ran out of time: keep the detections
+            logger.debug(
+                "frame_embedding_skipped", camera_id=job.camera_id, frame_id=job.frame_id
+            )
+            job.result = self.face_service.detection_only_frame(
+                job.detection, skipped_stages=["embedding"]
+            )
         except Exception as e:
-            logger.exception("stream_fatal_error", error=str(e))
-            context.abort(grpc.StatusCode.INTERNAL, f"Stream failed: {str(e)}")
-        
+            self._fail_job(job, e)
         finally:
-            # Always log final metrics
-            self._log_final_metrics(camera_metrics)
+            job.detection = None
+        return job
+
+    def _stage_serialize(self, job: _FrameJob) -> _FrameJob:
+        if job.response is not None:
+            return job
+
+        job.response = self._build_response(job.result, job.camera_id, job.frame_id)
+        job.result = None
+        return job
+
+    def _fail_job(self, job: _FrameJob, error: Exception) -> None:
+        logger.exception(
+            "process_frame_exception",
+            camera_id=job.camera_id,
+            frame_id=job.frame_id,
+            error=str(error),
+        )
+        
+        # Send error response
+        job.response = self._create_error_response(
+            job.camera_id,
+            job.frame_id,
+            f"Processing failed: {str(error)}",
+        )
+        job.failed = True
+
+    def _record_job(
+        self,
+        job: _FrameJob,
+        camera_metrics: Dict[str, CameraMetrics],
+        admission: FrameAdmission,
+    ) -> None:
+        """
+        Feed latency back to admission, stamp admission counters on the
+        response and update per-camera metrics (consumer thread only).
+        """
+        latency_ms = (time.monotonic() - job.received_at) * 1000.0
+        admission.complete(job.camera_id, latency_ms)
+        stats = admission.stats(job.camera_id)
+
+        resp = job.response
+        resp.frames_dropped = stats.frames_dropped
+        resp.frames_stale = stats.frames_stale
+        resp.target_fps = float(stats.target_fps)
+
+        # Initialize metrics for new camera
+        if job.camera_id not in camera_metrics:
+            camera_metrics[job.camera_id] = CameraMetrics(camera_id=job.camera_id)
+        
+        metrics = camera_metrics[job.camera_id]
+        metrics.frames_dropped = stats.frames_dropped
+        metrics.frames_stale = stats.frames_stale
+        metrics.target_fps = stats.target_fps
+
+        if job.failed:
+            return
+        
+        # Update metrics
+        metrics.add_frame(
+            processing_ms=resp.processing_time_ms,
+            face_count=len(resp.faces),
+        )
+        
+        # Periodic logging
+        self._maybe_log_metrics(metrics)
+
+        logger.debug(
+            "frame_processed",
+            camera_id=job.camera_id,
+            frame_id=job.frame_id,
+            faces=len(resp.faces),
+            processing_ms=resp.processing_time_ms,
+            latency_ms=round(latency_ms, 2),
+        )
 
     # =========================================================================
     # RESPONSE BUILDERS - Centralized, optimized, zero duplication
@@ -226,6 +487,8 @@ class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
             frame_id=frame_id,
             processing_time_ms=float(result.get("time_ms", 0.0)),
             total_faces_detected=len(faces_result),
+            partial_result=bool(result.get("partial", False)),
+            skipped_stages=result.get("skipped_stages") or [],
         )
         
         # Map metrics
@@ -245,7 +508,9 @@ class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
         
         # Map faces - OPTIMIZED: Direct, type-safe extraction
         for face_dict in faces_result:
-            face_result = self._map_face_to_proto(face_dict)
+            face_result = self._map_face_to_proto(
+                face_dict, require_embedding=not resp.partial_result
+            )
             if face_result:
                 resp.faces.append(face_result)
         
@@ -254,10 +519,12 @@ class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
     def _map_face_to_proto(
         self,
         face_dict: Dict[str, Any],
+        require_embedding: bool = True,
     ) -> Optional[video_stream_pb2.FaceResult]:
         """
         Map a single face dict to protobuf FaceResult.
         Centralized, type-safe, with validation.
+        Faces without an embedding are kept only for partial results.
         """
         # Extract and validate bbox
         bbox = face_dict.get("bbox")
@@ -271,12 +538,12 @@ class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
         
         # Extract embedding
         embedding = face_dict.get("embedding")
-        if not embedding:
+        if not embedding and require_embedding:
             logger.warning("face_missing_embedding", face_id=face_dict.get("face_id"))
             return None
         
-        emb_list = self._to_float_list(embedding)
-        if not emb_list:
+        emb_list = self._to_float_list(embedding) if embedding else []
+        if not emb_list and require_embedding:
             return None
         
         # Build FaceResult
@@ -287,10 +554,11 @@ class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
                 w=float(w),
                 h=float(h),
             ),
-            embedding=video_stream_pb2.FaceEmbedding(vector=emb_list),
             confidence=float(face_dict.get("confidence", 1.0)),
             face_id=int(face_dict.get("face_id", 0)),
         )
+        if emb_list:
+            face_result.embedding.CopyFrom(video_stream_pb2.FaceEmbedding(vector=emb_list))
         
         # Map quality if present
         quality = face_dict.get("quality")
@@ -311,27 +579,22 @@ class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
         camera_id: str,
         frame_id: int,
         error_message: str,
+        skipped_stages: Optional[List[str]] = None,
     ) -> video_stream_pb2.VideoFrameResponse:
-        """Create error response to send back to client."""
-        return video_stream_pb2.VideoFrameResponse(
-            camera_id=camera_id,
-            frame_id=frame_id,
-            processing_time_ms=0.0,
-            total_faces_detected=0,
-            # Note: Add error_message field to proto if needed
-        )
+        """
+        Create error response to send back to client.
 
-    @staticmethod
-    def _create_throttled_response(
-        camera_id: str,
-        frame_id: int,
-    ) -> video_stream_pb2.VideoFrameResponse:
-        """Create response indicating frame was throttled."""
+        Frames skipped for the deadline or for overload list the skipped
+        stages and set partial_result, so they are not read as "no faces".
+        """
         return video_stream_pb2.VideoFrameResponse(
             camera_id=camera_id,
             frame_id=frame_id,
             processing_time_ms=0.0,
             total_faces_detected=0,
+            partial_result=bool(skipped_stages),
+            skipped_stages=skipped_stages or [],
+            # Note: Add error_message field to proto if needed
         )
 
     # =========================================================================
@@ -407,31 +670,19 @@ class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
             return None
         
         try:
-            arr = np.frombuffer(jpeg_bytes, dtype=np.uint8)
-            img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-            
-            if img is None or img.size == 0:
-                return None
-            
-            return img
+            img = decode_image(jpeg_bytes, max_source_pixels=settings.IMAGE_MAX_SOURCE_PIXELS)
+            return img if img.size else None
+        except InvalidImageException as e:
+            logger.warning("jpeg_decode_rejected", reason=e.details.get("reason"))
+            return None
         except Exception as e:
             logger.error("jpeg_decode_error", error=str(e))
             return None
 
     # =========================================================================
-    # THROTTLING & METRICS
+    # METRICS
     # =========================================================================
 
-    def _should_process_frame(self, camera_id: str, timestamp_ms: float) -> bool:
-        """Check if frame should be processed based on throttling."""
-        last_time = self._last_process_time.get(camera_id, 0.0)
-        
-        if (timestamp_ms - last_time) < self.min_frame_interval_ms:
-            return False
-        
-        self._last_process_time[camera_id] = timestamp_ms
-        return True
-
     def _maybe_log_metrics(self, metrics: CameraMetrics) -> None:
         """Log metrics every 5 seconds."""
         now = time.time()
@@ -446,6 +697,8 @@ class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
             camera_id=metrics.camera_id,
             frames_processed=metrics.frames_processed,
             frames_dropped=metrics.frames_dropped,
+            frames_stale=metrics.frames_stale,
+            target_fps=round(metrics.target_fps, 2),
             faces_detected=metrics.faces_detected,
             fps=round(metrics.get_fps(), 2),
             avg_processing_ms=round(metrics.get_avg_processing_ms(), 2),
@@ -465,6 +718,7 @@ class VideoStreamService(video_stream_pb2_grpc.VideoStreamServiceServicer):
                 camera_id=metrics.camera_id,
                 total_frames=metrics.frames_processed,
                 frames_dropped=metrics.frames_dropped,
+                frames_stale=metrics.frames_stale,
                 total_faces=metrics.faces_detected,
                 session_duration_seconds=round(elapsed, 1),
                 avg_fps=round(metrics.frames_processed / elapsed if elapsed > 0 else 0, 2),
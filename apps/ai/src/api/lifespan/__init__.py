@@ -3,12 +3,20 @@ Enterprise-grade lifecycle management system for SSSP AI Service.
 Manages component startup, health monitoring, dependencies, and graceful shutdown.
 """
 
-from src.api.lifespan.manager import lifespan
 from src.api.lifespan.base import BaseLifecycleComponent, ComponentState, ComponentPriority
 from src.api.lifespan.registry import ComponentRegistry, register_component
 from src.api.lifespan.health_registry import HealthRegistry, ComponentHealth, HealthStatus
 
 
+def __getattr__(name):
+    # manager imports the gRPC servers, which import health_registry from this
+    # package; loading it lazily keeps that import from being circular
+    if name == "lifespan":
+        from src.api.lifespan.manager import lifespan
+        return lifespan
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "LifespanManager",
     "lifespan",
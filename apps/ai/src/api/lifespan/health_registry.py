@@ -1,4 +1,5 @@
 """Health monitoring and status tracking for all components."""
+import os
 from typing import Dict, Optional, Any
 from datetime import datetime
 from enum import Enum
@@ -236,6 +237,10 @@ class HealthRegistry:
                 }
             }
     
+    def _reset_lock_after_fork(self) -> None:
+        """A lock held by another thread at fork() would never be released in the child."""
+        self._component_lock = RLock()
+
     def clear(self) -> None:
         """Clear all health data (testing only)."""
         with self._component_lock:
@@ -246,6 +251,9 @@ class HealthRegistry:
 # Singleton instance
 _health_registry = HealthRegistry()
 
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_health_registry._reset_lock_after_fork)
+
 
 # Public API
 def get_health_registry() -> HealthRegistry:
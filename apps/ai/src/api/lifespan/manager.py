@@ -3,8 +3,11 @@ apps/ai/src/api/lifespan/manager.py
 Simple lifespan manager for FastAPI.
 
 Responsibilities:
+0. Apply the autotune profile and the CPU budget (AUTOTUNE_MODE, CPU_BUDGET_ENABLED)
 1. Load YOLO model on startup
-2. Start gRPC server on startup
+1b. Warm up face + YOLO models per shape bucket (in the background with
+    WARMUP_BACKGROUND; readiness per bucket in the health registry)
+2. Start gRPC server on startup (or fork GRPC_PREFORK_WORKERS servers)
 3. Stop gRPC server on shutdown
 4. Unload model on shutdown
 
@@ -12,16 +15,80 @@ Clean and simple - no over-engineering.
 """
 
 from contextlib import asynccontextmanager
+from functools import partial
 import structlog
 
+from src.api.lifespan.health_registry import get_health_registry
 from src.core.config import settings
+from src.core.exceptions import InferenceException
+from src.core.cpu_budget import (
+    apply_cpu_layout,
+    available_cpus,
+    intra_op_threads,
+    limit_threads,
+    plan_cpu_layout,
+    read_cgroup_quota,
+    worker_cpu_sets,
+)
 from src.models.object.model_loader import get_model_loader
 from src.services.ml.Face_Recognition_Service import FaceRecognitionService
+from src.services.ml.autotune import apply_profile, autotune_from_settings
+from src.services.ml.detector_backends import get_detector_backend
+from src.services.ml.object_detection import ObjectDetectionService
+from src.services.ml.warmup import ShapeWarmup
+from src.services.workers.remote import (
+    RemoteFaceService,
+    RemoteObjectDetectionService,
+    create_inference_pool,
+)
 from src.api.grpc.server import GRPCServer
+from src.utils.buffer_pool import configure_buffer_pool
 
 logger = structlog.get_logger("lifespan")
 
 
+def _forked_grpc_server(face_service: FaceRecognitionService) -> GRPCServer:
+    """Runs in each pre-forked worker: first inference happens after fork()."""
+    _model_warmup(face_service, background=False)
+    return GRPCServer(face_service=face_service, reuse_port=True)
+
+
+def _model_warmup(face_service: FaceRecognitionService, background: bool) -> ShapeWarmup:
+    """
+    Face detector / embedder and YOLO warmup per shape bucket.
+
+    Raises:
+        InferenceException: a bucket failed (inline warmup only; in the
+            background it is reported as a degraded health component)
+    """
+    tasks = face_service.warmup_tasks() + ObjectDetectionService().warmup_tasks()
+    warmup = ShapeWarmup(tasks, iterations=settings.WARMUP_ITERATIONS, registry=get_health_registry())
+    logger.info("warming_up_models", buckets=len(tasks), background=background)
+    if background:
+        warmup.start()
+    else:
+        failed = warmup.run()
+        if failed:
+            raise InferenceException("model warmup failed", {"buckets": failed})
+    return warmup
+
+
+def _inference_concurrency() -> int:
+    """
+    Model executors that run at the same time (each gets an equal share of the cores).
+
+    Pool workers when models run out of process; otherwise, per server
+    process, the YOLO model (or its batcher thread) plus the face replicas
+    (or the shared face models and their embedding batcher thread).
+    """
+    if settings.CPU_INFERENCE_CONCURRENCY:
+        return settings.CPU_INFERENCE_CONCURRENCY
+    if settings.INFERENCE_PROCESS_WORKERS:
+        return settings.INFERENCE_PROCESS_WORKERS
+    face = settings.FACE_MODEL_REPLICAS or 1 + int(settings.FACE_EMBEDDING_BATCHING_ENABLED)
+    return max(1, settings.GRPC_PREFORK_WORKERS) * (1 + face)
+
+
 @asynccontextmanager
 async def lifespan(app):
     """
@@ -48,30 +115,70 @@ async def lifespan(app):
         environment=settings.ENVIRONMENT
     )
     
+    # Per-frame arrays (letterbox canvases, input tensors, detector proxies) are reused
+    configure_buffer_pool(settings.FRAME_BUFFER_POOL_MB * 1024 * 1024)
+
+    # Model size / input size / batch / threads from this host's autotune profile
+    if settings.AUTOTUNE_MODE != "off":
+        profile = autotune_from_settings(run=settings.AUTOTUNE_MODE == "run")
+        if profile is not None:
+            apply_profile(settings, profile)
+
+    # Thread budgets are fixed before any model (and its thread pool) is created
+    if settings.CPU_BUDGET_ENABLED:
+        apply_cpu_layout(plan_cpu_layout(
+            available_cpus(),
+            read_cgroup_quota(),
+            io_cores=settings.CPU_IO_CORES,
+            inference_concurrency=_inference_concurrency(),
+            pin_workers=settings.CPU_PIN_INFERENCE_WORKERS,
+            intra_op_threads=settings.CPU_INTRA_OP_THREADS,
+        ))
+    elif settings.CPU_INTRA_OP_THREADS:
+        limit_threads(settings.CPU_INTRA_OP_THREADS)
+
     # 1. Load Detection Model
-    logger.info("loading_detection_model")
+    logger.info("loading_detection_model", backend=settings.DETECTION_BACKEND)
     try:
         model_loader = get_model_loader()
-        model_loader.load_detector()
+        if settings.DETECTION_BACKEND.startswith("onnxruntime"):
+            get_detector_backend()  # ORT session only; the PyTorch YOLO is never loaded
+        else:
+            model_loader.load_detector()
         logger.info("detection_model_loaded_successfully")
     except Exception as e:
         logger.error("failed_to_load_model", error=str(e), exc_info=True)
         raise  # Fail fast if model doesn't load
     
-    # Load Face Recognition Service
-    logger.info("initializing_face_recognition_service")
-    try:        
-        face_service = FaceRecognitionService()
-        
-        # Warmup models to avoid cold start latency
-        logger.info("warming_up_face_models")
-        face_service.warmup()  # Call the warmup method we added earlier
+    # Load Face Recognition Service (in-process, or replicas in worker processes)
+    prefork = settings.GRPC_PREFORK_WORKERS > 0
+    logger.info(
+        "initializing_face_recognition_service",
+        process_workers=settings.INFERENCE_PROCESS_WORKERS,
+        prefork_workers=settings.GRPC_PREFORK_WORKERS,
+    )
+    detection_service = None
+    try:
+        if prefork:
+            if settings.use_gpu:
+                raise RuntimeError("GRPC_PREFORK_WORKERS requires DETECTION_DEVICE=cpu")
+            if settings.INFERENCE_PROCESS_WORKERS > 0:
+                logger.warning("inference_process_workers_ignored_in_prefork_mode")
+            # Weights only: the forked servers share them copy-on-write and warm up themselves
+            face_service = FaceRecognitionService()
+            face_service.load_models()
+        elif settings.INFERENCE_PROCESS_WORKERS > 0:
+            inference_pool = create_inference_pool()
+            inference_pool.start()  # each worker loads + warms up its own models
+            face_service = RemoteFaceService(inference_pool)
+            detection_service = RemoteObjectDetectionService(inference_pool)
+        else:
+            face_service = FaceRecognitionService()
+
+            # Warmup models to avoid cold start latency (every batch / frame size bucket)
+            app.state.model_warmup = _model_warmup(face_service, background=settings.WARMUP_BACKGROUND)
         
-        logger.info(
-            "face_service_ready",
-            detector_loaded=face_service.detector is not None,
-            embedder_loaded=face_service.embedder is not None
-        )
+        logger.info("face_service_ready", models_loaded=face_service.is_ready)
     except Exception as e:
         logger.error("failed_to_initialize_face_service", error=str(e), exc_info=True)
         raise  # Fail fast if face models don't load
@@ -79,7 +186,24 @@ async def lifespan(app):
     # 2. Start gRPC Server
     logger.info("starting_grpc_server")
     try:
-        grpc_server = GRPCServer(face_service=face_service)  # Pass initialized service
+        if prefork:
+            # prefork imports health_registry, whose package imports this module
+            from src.api.grpc.prefork import PreforkSupervisor
+
+            grpc_server = PreforkSupervisor(
+                partial(_forked_grpc_server, face_service),
+                num_workers=settings.GRPC_PREFORK_WORKERS,
+                host=settings.GRPC_HOST,
+                port=settings.GRPC_PORT,
+                threads_per_worker=settings.INFERENCE_THREADS_PER_WORKER or intra_op_threads() or None,
+                cpu_sets=worker_cpu_sets(settings.GRPC_PREFORK_WORKERS),
+                heartbeat_s=settings.GRPC_PREFORK_HEARTBEAT_S,
+            )
+        else:
+            grpc_server = GRPCServer(  # Pass initialized services
+                face_service=face_service,
+                detection_service=detection_service,
+            )
         grpc_server.start()
         logger.info("grpc_server_started_successfully")
     except Exception as e:
@@ -125,7 +249,8 @@ async def lifespan(app):
     # 3. Unload Detection Model
     logger.info("unloading_model")
     try:
-        model_loader.unload_detector()
+        if not settings.DETECTION_BACKEND.startswith("onnxruntime"):
+            model_loader.unload_detector()
         logger.info("model_unloaded")
     except Exception as e:
         logger.error("error_unloading_model", error=str(e))
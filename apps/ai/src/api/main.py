@@ -19,10 +19,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.core.config import settings
+from src.core.cpu_budget import get_cpu_layout
 from src.core.logging import setup_logging, get_logger
 from src.api.lifespan.manager import lifespan
 from src.api.routes import health, detection
 from src.api.lifespan.health_registry import get_health_registry
+from src.utils.buffer_pool import get_buffer_pool
 
 # Setup logging first
 setup_logging()
@@ -139,13 +141,13 @@ async def detailed_health():
     grpc_running = (
         hasattr(app.state, 'grpc_server') 
         and app.state.grpc_server is not None 
-        and app.state.grpc_server.server is not None
+        and app.state.grpc_server.is_running
     )
     
     face_models_loaded = (
         hasattr(app.state, 'face_service') 
         and app.state.face_service is not None
-        and app.state.face_service.detector is not None
+        and app.state.face_service.is_ready
     )
     
     detection_model_loaded = (
@@ -158,6 +160,7 @@ async def detailed_health():
             "status": "running" if grpc_running else "stopped",
             "host": settings.GRPC_HOST if grpc_running else None,
             "port": settings.GRPC_PORT if grpc_running else None,
+            "mode": app.state.grpc_server.mode if grpc_running else None,
         },
         "face_recognition": {
             "status": "loaded" if face_models_loaded else "not_loaded",
@@ -168,6 +171,10 @@ async def detailed_health():
             "status": "loaded" if detection_model_loaded else "not_loaded",
         }
     }
+
+    cpu_layout = get_cpu_layout()
+    if cpu_layout is not None:
+        health_summary["cpu_layout"] = cpu_layout.as_dict()
     
     # Add uptime if available
     if hasattr(app.state, 'startup_time'):
@@ -235,17 +242,149 @@ async def get_metrics():
         metrics.append(f'frames_processed_total {frame_count}')
         metrics.append('')
     
+    # Startup CPU budget (CPU_BUDGET_ENABLED)
+    cpu_layout = get_cpu_layout()
+    if cpu_layout is not None:
+        metrics.append('# HELP cpu_budget_cores Usable cores and their split between I/O and inference')
+        metrics.append('# TYPE cpu_budget_cores gauge')
+        for pool, value in (
+            ('total', cpu_layout.cores),
+            ('io', cpu_layout.io_cores),
+            ('inference', cpu_layout.inference_cores),
+        ):
+            metrics.append(f'cpu_budget_cores{{pool="{pool}"}} {value}')
+        metrics.append('')
+        for name, value, help_text in (
+            ('cpu_budget_quota_cores', cpu_layout.quota_cores or 0, 'cgroup CPU quota in cores (0 = unlimited)'),
+            ('cpu_budget_inference_concurrency', cpu_layout.inference_concurrency, 'Model calls sharing the inference cores'),
+            ('cpu_budget_intra_op_threads', cpu_layout.intra_op_threads, 'torch / ORT / OpenCV threads per model call'),
+        ):
+            metrics.append(f'# HELP {name} {help_text}')
+            metrics.append(f'# TYPE {name} gauge')
+            metrics.append(f'{name} {value}')
+            metrics.append('')
+
+    # In-process face model replicas (FACE_MODEL_REPLICAS)
+    replica_stats_fn = getattr(getattr(app.state, 'face_service', None), 'replica_stats', None)
+    replica_stats = replica_stats_fn() if replica_stats_fn is not None else None
+    if replica_stats is not None:
+        for name, key, kind, help_text in (
+            ('face_model_replicas', 'replicas', 'gauge', 'Face model replicas in the pool'),
+            ('face_model_replicas_in_use', 'in_use', 'gauge', 'Replicas currently checked out'),
+            ('face_model_replica_utilization', 'utilization', 'gauge', 'Busy share of replica time since start (0-1)'),
+            ('face_model_replica_checkouts_total', 'checkouts', 'counter', 'Replica checkouts'),
+            ('face_model_replica_timeouts_total', 'timeouts', 'counter', 'Checkouts that found no free replica in time'),
+            ('face_model_replica_wait_seconds_total', 'wait_seconds_total', 'counter', 'Time spent waiting for a free replica'),
+            ('face_model_replica_wait_seconds_max', 'wait_seconds_max', 'gauge', 'Longest wait for a free replica'),
+        ):
+            metrics.append(f'# HELP {name} {help_text}')
+            metrics.append(f'# TYPE {name} {kind}')
+            metrics.append(f'{name} {replica_stats[key]}')
+            metrics.append('')
+
     # gRPC server status
     grpc_running = (
         hasattr(app.state, 'grpc_server') 
         and app.state.grpc_server is not None 
-        and app.state.grpc_server.server is not None
+        and app.state.grpc_server.is_running
     )
     metrics.append('# HELP grpc_server_running gRPC server status (1=running, 0=stopped)')
     metrics.append('# TYPE grpc_server_running gauge')
     metrics.append(f'grpc_server_running {1 if grpc_running else 0}')
     metrics.append('')
-    
+
+    # Inference admission control
+    admission = getattr(app.state.grpc_server, 'admission', None) if grpc_running else None
+    if admission is not None:
+        snapshot = admission.snapshot()
+        metrics.append('# HELP inference_in_flight Inference calls currently admitted')
+        metrics.append('# TYPE inference_in_flight gauge')
+        metrics.append(f'inference_in_flight {snapshot["in_flight"]}')
+        metrics.append('')
+        for name, key, kind, help_text in (
+            ('inference_queue_depth', 'queued', 'gauge', 'Requests waiting for an inference slot'),
+            ('inference_projected_wait_ms', 'projected_wait_ms', 'gauge', 'Projected queue wait for a new request'),
+            ('inference_admitted_total', 'admitted', 'counter', 'Requests admitted'),
+            ('inference_rejected_total', 'rejected', 'counter', 'Requests shed with RESOURCE_EXHAUSTED'),
+        ):
+            metrics.append(f'# HELP {name} {help_text}')
+            metrics.append(f'# TYPE {name} {kind}')
+            for lane, values in snapshot["lanes"].items():
+                metrics.append(f'{name}{{lane="{lane}"}} {values[key]}')
+            metrics.append('')
+
+    # Out-of-process inference workers
+    inference_pool = getattr(getattr(app.state, 'face_service', None), 'pool', None)
+    if inference_pool is not None:
+        pool_stats = inference_pool.stats()
+        metrics.append('# HELP inference_worker_outstanding Jobs queued or running per worker process')
+        metrics.append('# TYPE inference_worker_outstanding gauge')
+        for worker in pool_stats["workers"]:
+            metrics.append(f'inference_worker_outstanding{{worker="{worker["worker_id"]}"}} {worker["outstanding"]}')
+        metrics.append('')
+        metrics.append('# HELP inference_worker_restarts_total Worker processes restarted after dying')
+        metrics.append('# TYPE inference_worker_restarts_total counter')
+        for worker in pool_stats["workers"]:
+            metrics.append(f'inference_worker_restarts_total{{worker="{worker["worker_id"]}"}} {worker["restarts"]}')
+        metrics.append('')
+        metrics.append('# HELP inference_shm_free_slots Free shared-memory frame slots')
+        metrics.append('# TYPE inference_shm_free_slots gauge')
+        metrics.append(f'inference_shm_free_slots {pool_stats["shm_free_slots"]}')
+        metrics.append('')
+
+    # Pre-forked gRPC server processes
+    if grpc_running and app.state.grpc_server.mode == "prefork":
+        grpc_workers = app.state.grpc_server.stats()
+        metrics.append('# HELP grpc_worker_up Pre-forked gRPC worker serving (1=up, 0=down)')
+        metrics.append('# TYPE grpc_worker_up gauge')
+        for worker in grpc_workers:
+            metrics.append(f'grpc_worker_up{{worker="{worker["worker_id"]}"}} {1 if worker["alive"] and worker["ready"] else 0}')
+        metrics.append('')
+        metrics.append('# HELP grpc_worker_in_flight Inference calls admitted per worker (last heartbeat)')
+        metrics.append('# TYPE grpc_worker_in_flight gauge')
+        for worker in grpc_workers:
+            metrics.append(f'grpc_worker_in_flight{{worker="{worker["worker_id"]}"}} {worker["in_flight"]}')
+        metrics.append('')
+        metrics.append('# HELP grpc_worker_restarts_total Worker processes restarted after dying')
+        metrics.append('# TYPE grpc_worker_restarts_total counter')
+        for worker in grpc_workers:
+            metrics.append(f'grpc_worker_restarts_total{{worker="{worker["worker_id"]}"}} {worker["restarts"]}')
+        metrics.append('')
+
+    # Reused per-frame buffers (this process; worker processes keep their own)
+    buffer_stats = get_buffer_pool().stats()
+    for name, key, kind, help_text in (
+        ('frame_buffer_pool_hits_total', 'hits', 'counter', 'Buffers served from the pool'),
+        ('frame_buffer_pool_misses_total', 'misses', 'counter', 'Buffers allocated because none was free'),
+        ('frame_buffer_pool_evictions_total', 'evictions', 'counter', 'Free buffers dropped to stay within the budget'),
+        ('frame_buffer_pool_bytes', 'pooled_bytes', 'gauge', 'Bytes held in free buffers'),
+    ):
+        metrics.append(f'# HELP {name} {help_text}')
+        metrics.append(f'# TYPE {name} {kind}')
+        metrics.append(f'{name} {buffer_stats[key]}')
+        metrics.append('')
+
+    # Per-camera stream scheduling
+    video_stream = getattr(app.state.grpc_server, 'video_stream_servicer', None) if grpc_running else None
+    if video_stream is not None:
+        cameras = video_stream.scheduler.snapshot()
+        for name, key, help_text in (
+            ('stream_camera_queue_depth', 'queue_depth', 'Frames waiting for a detection turn'),
+            ('stream_camera_granted_fps', 'granted_fps', 'Detection turns granted per second'),
+            ('stream_camera_weight', 'weight', 'Scheduling weight (raised for recent activity)'),
+            ('stream_camera_avg_cost_ms', 'avg_cost_ms', 'Average detect+embed cost per turn'),
+            ('stream_camera_avg_wait_ms', 'avg_wait_ms', 'Average wait for a detection turn'),
+        ):
+            metrics.append(f'# HELP {name} {help_text}')
+            metrics.append(f'# TYPE {name} gauge')
+            for camera_id, values in cameras.items():
+                metrics.append(f'{name}{{camera_id="{escape_label_value(camera_id)}"}} {values[key]}')
+            metrics.append('')
+        metrics.append('# HELP stream_cameras_tracked Cameras with scheduler state')
+        metrics.append('# TYPE stream_cameras_tracked gauge')
+        metrics.append(f'stream_cameras_tracked {len(cameras)}')
+        metrics.append('')
+
     return "\n".join(metrics)
 
 
@@ -253,6 +392,11 @@ async def get_metrics():
 # Helper Functions
 # ============================================================================
 
+def escape_label_value(value: str) -> str:
+    """Escape a Prometheus label value (backslash, double quote, newline)"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
 def format_uptime(seconds: float) -> str:
     """Format uptime in human-readable format"""
     days, remainder = divmod(int(seconds), 86400)
@@ -5,7 +5,7 @@ Configuration management using Pydantic Settings
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal, Tuple
 from pathlib import Path
 import torch
 
@@ -42,8 +42,17 @@ class Settings(BaseSettings):
     # ========================================================================
     GRPC_HOST: str = "0.0.0.0"
     GRPC_PORT: int = 50051
-    GRPC_MAX_WORKERS: int = 10
+    GRPC_MAX_WORKERS: int = 10  # sync: minimum RPC threads (raised to GRPC_MAX_CONCURRENT_RPCS)
+    GRPC_MAX_CONCURRENT_RPCS: int = Field(default=100, ge=1)  # open streams + calls (sync), one thread each
     GRPC_MAX_MESSAGE_LENGTH: int = 100 * 1024 * 1024  # 100MB
+    # "sync": thread per RPC (each open stream pins a worker)
+    # "aio": asyncio server; only model calls use INFERENCE_EXECUTOR_WORKERS threads
+    GRPC_SERVER_MODE: Literal["sync", "aio"] = "sync"
+    GRPC_AIO_MAX_CONCURRENT_RPCS: int = Field(default=1000, ge=1)  # open streams + calls (aio)
+    INFERENCE_EXECUTOR_WORKERS: int = Field(default=8, ge=1, le=128)  # aio inference threads
+    # Pre-fork: N server processes on one port (SO_REUSEPORT), weights shared copy-on-write
+    GRPC_PREFORK_WORKERS: int = Field(default=0, ge=0, le=64)  # 0 = one in-process server
+    GRPC_PREFORK_HEARTBEAT_S: float = Field(default=2.0, gt=0.0, le=60.0)
     
     # ========================================================================
     # Object Detection Model Settings
@@ -53,6 +62,11 @@ class Settings(BaseSettings):
     DETECTION_MODEL_TYPE: Literal["yolo11n", "yolo11s", "yolo11m", "yolo11l", "yolov8s", "yolo11x", "yolo8n", "yolo8s"] = "yolov8s"
     DETECTION_MODEL_PATH: Path = Path("apps/ai/data/models/production/yolov8s.pt")  # Optional: custom model path
     #DETECTION_MODEL_PATH: Optional[Path] = None  # If None, download pretrained
+    # Inference backend: PyTorch (Ultralytics) or ONNX Runtime CPU over the exported .onnx
+    # (onnxruntime_int8 = the <stem>.int8.onnx written by quantize_models.py)
+    DETECTION_BACKEND: Literal["ultralytics", "onnxruntime", "onnxruntime_int8"] = "ultralytics"
+    DETECTION_ONNX_PATH: Optional[Path] = None  # None = DETECTION_MODEL_PATH with .onnx suffix
+    DETECTION_ONNX_THREADS: int = Field(default=0, ge=0, le=256)  # ORT intra-op; 0 = physical cores
     
     # Inference parameters
     DETECTION_CONFIDENCE: float = Field(default=0.25, ge=0.0, le=1.0)
@@ -91,11 +105,102 @@ class Settings(BaseSettings):
     # ========================================================================
     # Performance Settings
     # ========================================================================
-    BATCH_SIZE: int = 8
-    MAX_CONCURRENT_REQUESTS: int = 10
-    REQUEST_TIMEOUT: int = 30  # seconds
-    WARMUP_ITERATIONS: int = 5  # Model warmup on startup
-    
+    BATCH_SIZE: int = 8  # Max frames per batched YOLO forward pass
+    MAX_CONCURRENT_REQUESTS: int = 10  # in-flight inference calls (admission control)
+    REQUEST_TIMEOUT: int = 30  # seconds - upper bound on any queue-wait budget
+    WARMUP_ITERATIONS: int = 5  # Model warmup on startup (runs per shape bucket)
+    WARMUP_BACKGROUND: bool = True  # serve while warming; per-bucket readiness in the health registry
+    WARMUP_BATCH_BUCKETS: List[int] = [1, 2, 4, 8, 16, 32]  # YOLO (<= BATCH_SIZE) and FaceNet (<= FACE_EMBEDDING_BATCH_MAX_SIZE)
+    WARMUP_FRAME_SIZES: List[Tuple[int, int]] = [(640, 360), (640, 480), (1280, 720), (1920, 1080)]  # face detector (width, height)
+    WARMUP_PAD_TO_BUCKETS: bool = True  # pad batches / face detector inputs up to the next warmed bucket
+    IMAGE_MAX_SOURCE_PIXELS: int = Field(default=8192 * 8192, ge=1)  # rejected from the JPEG/PNG header
+    FRAME_BUFFER_POOL_MB: int = Field(default=256, ge=0, le=16384)  # reused per-frame arrays; 0 = off
+
+    # Startup CPU budget: cores split between gRPC / decode threads and inference (torch / ORT / OpenCV)
+    CPU_BUDGET_ENABLED: bool = True
+    CPU_IO_CORES: int = Field(default=0, ge=0, le=256)  # kept for I/O + decode; 0 = a quarter (min 1)
+    CPU_INFERENCE_CONCURRENCY: int = Field(default=0, ge=0, le=256)  # 0 = model executors: pool workers, else YOLO + face replicas / batchers
+    CPU_PIN_INFERENCE_WORKERS: bool = False  # pin worker / prefork processes to disjoint core sets (Linux)
+    CPU_INTRA_OP_THREADS: int = Field(default=0, ge=0, le=256)  # per model call; 0 = inference cores / concurrency (autotune sets it)
+
+    # Capacity autotuner (autotune.py or startup): detection model / input size / batch / threads for this host
+    AUTOTUNE_MODE: Literal["off", "cached", "run"] = "off"  # cached = reuse a profile only; run = benchmark if none
+    AUTOTUNE_TARGET_CAMERAS: int = Field(default=8, ge=1, le=1024)
+    AUTOTUNE_TARGET_FPS: float = Field(default=5.0, gt=0.0, le=120.0)  # per camera
+    AUTOTUNE_TARGET_P95_MS: float = Field(default=250.0, gt=0.0)  # per detection call
+    AUTOTUNE_MODELS: List[str] = ["yolo11n", "yolo11s", "yolov8s", "yolo11m"]  # smallest first; missing files skipped
+    AUTOTUNE_IMAGE_SIZES: List[int] = [320, 480, 640, 960, 1280]
+    AUTOTUNE_BATCH_SIZES: List[int] = [1, 2, 4, 8]
+    AUTOTUNE_THREADS: List[int] = []  # intra-op threads per call; [] = 1, 2, 4 ... inference cores / detection executors
+    AUTOTUNE_ITERATIONS: int = Field(default=10, ge=1, le=1000)  # timed batches per stream
+    AUTOTUNE_TIME_BUDGET_S: float = Field(default=600.0, gt=0.0)
+    AUTOTUNE_FRAME_WIDTH: int = Field(default=1920, ge=64, le=7680)  # synthetic camera frames
+    AUTOTUNE_FRAME_HEIGHT: int = Field(default=1080, ge=64, le=4320)
+
+    # Cross-request micro-batching in front of the FaceNet embedder
+    FACE_EMBEDDING_BATCHING_ENABLED: bool = True
+    FACE_EMBEDDING_BATCH_MAX_SIZE: int = Field(default=32, ge=1, le=256)
+    FACE_EMBEDDING_BATCH_MAX_WAIT_MS: float = Field(default=5.0, ge=0.0, le=100.0)
+
+    # FaceNet runtime: eager PyTorch, the ONNX export from export_facenet.py, or its INT8 quantization
+    FACE_EMBEDDER_BACKEND: Literal["pytorch", "onnxruntime", "onnxruntime_int8"] = "pytorch"
+    FACE_EMBEDDER_ONNX_PATH: Optional[Path] = None  # None = MODELS_DIR / facenet_vggface2.onnx
+    FACE_EMBEDDER_ONNX_THREADS: int = Field(default=0, ge=0, le=256)  # ORT intra-op; 0 = physical cores
+
+    # In-process model replicas: every request stage checks one out (0 = one shared set + batcher)
+    FACE_MODEL_REPLICAS: int = Field(default=0, ge=0, le=64)  # K; about cores / FACE_REPLICA_THREADS
+    FACE_REPLICA_THREADS: int = Field(default=0, ge=0, le=256)  # intra-op threads per replica; 0 = cpu_count / K
+
+    # Face detector: MTCNN (facenet-pytorch) or OpenCV YuNet (CPU, ONNX), per deployment or per camera
+    FACE_DETECTOR_BACKEND: Literal["mtcnn", "yunet"] = "mtcnn"
+    FACE_DETECTOR_CAMERA_BACKENDS: Dict[str, Literal["mtcnn", "yunet"]] = {}  # camera_id -> backend
+    FACE_DETECTOR_YUNET_PATH: Optional[Path] = None  # None = MODELS_DIR / face_detection_yunet_2023mar.onnx
+
+    # Person-box cascade (faces searched only in the upper bodies of YOLO person boxes)
+    FACE_CASCADE_UPPER_FRACTION: float = Field(default=0.5, ge=0.1, le=1.0)  # share of the person box height
+    FACE_CASCADE_MAX_COVERAGE: float = Field(default=0.5, ge=0.0, le=1.0)  # above this mosaic/frame area, scan full frame
+
+    # Two-resolution faces: detect on a small proxy, crop from the source decode
+    FACE_MULTISCALE_ENABLED: bool = False
+    FACE_DETECT_MAX_DIMENSION: int = Field(default=640, ge=160, le=4096)  # proxy long side for detection
+    FACE_DETECT_MIN_FACE_PX: int = Field(default=0, ge=0, le=1024)  # smallest source face to find; 0 = off
+    FACE_SOURCE_MAX_DIMENSION: int = Field(default=4096, ge=320, le=4096)  # decode size crops are cut from
+
+    # Cross-stream batched YOLO inference (batch size = BATCH_SIZE)
+    DETECTION_BATCHING_ENABLED: bool = True
+    DETECTION_BATCH_MAX_WAIT_MS: float = Field(default=5.0, ge=0.0, le=100.0)
+    DETECTION_DECODE_WORKERS: int = Field(default=4, ge=1, le=64)  # DetectObjectsBatch decode pool
+    FRAME_ANALYSIS_WORKERS: int = Field(default=4, ge=1, le=64)  # AnalyzeFrame object/waste threads
+
+    # StreamFrames: decode / detect / embed / serialize stage threads per stream
+    STREAM_PIPELINE_ENABLED: bool = True
+    STREAM_PIPELINE_QUEUE_SIZE: int = Field(default=2, ge=1, le=64)  # frames buffered between stages
+
+    # StreamFrames admission: latest-frame-wins mailbox + AIMD frame rate
+    STREAM_MAX_FPS: float = Field(default=30.0, gt=0.0, le=120.0)
+    STREAM_MIN_FPS: float = Field(default=1.0, gt=0.0, le=120.0)
+    STREAM_MAX_FRAME_AGE_MS: float = Field(default=500.0, ge=0.0)  # 0 disables the staleness check
+    STREAM_TARGET_LATENCY_MS: float = Field(default=200.0, gt=0.0)  # back off above this
+
+    # StreamFrames fair scheduling across cameras (deficit round robin)
+    STREAM_INFERENCE_SLOTS: int = Field(default=2, ge=1, le=64)  # concurrent detection turns
+    STREAM_SCHEDULER_QUANTUM_MS: float = Field(default=20.0, gt=0.0)
+    STREAM_ACTIVE_CAMERA_WEIGHT: float = Field(default=2.0, ge=1.0, le=10.0)  # faces seen recently
+    STREAM_CAMERA_IDLE_TTL_S: float = Field(default=60.0, gt=0.0)
+    STREAM_MAX_CAMERAS: int = Field(default=256, ge=1)
+
+    # Admission queue-wait budgets per priority lane (stream > unary > batch)
+    ADMISSION_STREAM_QUEUE_BUDGET_MS: float = Field(default=500.0, ge=0.0)
+    ADMISSION_UNARY_QUEUE_BUDGET_MS: float = Field(default=2000.0, ge=0.0)
+    ADMISSION_BATCH_QUEUE_BUDGET_MS: float = Field(default=10000.0, ge=0.0)
+    ADMISSION_AIO_WAIT_THREADS: int = Field(default=0, ge=0, le=1024)  # 0 = 2 x MAX_CONCURRENT_REQUESTS
+
+    # Out-of-process inference: model replicas in worker processes, frames via shared memory
+    INFERENCE_PROCESS_WORKERS: int = Field(default=0, ge=0, le=64)  # 0 = run models in-process
+    INFERENCE_THREADS_PER_WORKER: int = Field(default=0, ge=0, le=64)  # 0 = cpu_count / workers
+    INFERENCE_SHM_SLOTS: int = Field(default=32, ge=1, le=1024)  # frames in flight to workers
+    INFERENCE_SHM_SLOT_MB: float = Field(default=8.0, gt=0.0, le=128.0)  # larger frames are pickled
+
     # ========================================================================
     # Logging Settings
     # ========================================================================
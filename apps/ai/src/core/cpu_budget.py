@@ -0,0 +1,247 @@
+"""
+apps/ai/src/core/cpu_budget.py
+Startup CPU budget: how many cores go to I/O / decode and to inference.
+
+Every RPC thread that calls into torch gets torch's default intra-op pool
+(one thread per core), so GRPC_MAX_WORKERS concurrent calls oversubscribe
+the node many times over. The budget is computed once at startup:
+
+- Usable cores = scheduler affinity, capped by the cgroup CPU quota
+  (cgroup v2 cpu.max, or v1 cfs_quota_us / cfs_period_us)
+- CPU_IO_CORES stay with the gRPC / decode threads, the rest is split
+  evenly between the model calls that can run at once (replicas, worker
+  processes, or admitted requests)
+- The per-call share (or CPU_INTRA_OP_THREADS, e.g. from the autotune
+  profile) becomes torch intra-op threads, ORT intra_op_num_threads and
+  OpenCV threads; torch inter-op is 1 when calls already run in parallel
+- Optionally each inference worker process is pinned to its own core set
+
+The chosen layout is logged, kept in-process (get_cpu_layout) and reported
+on /metrics and /health/detailed.
+"""
+
+import math
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger("sssp.ai.cpu_budget")
+
+_CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+@dataclass(frozen=True)
+class CpuLayout:
+    cpus: Tuple[int, ...]  # CPU ids the process may run on
+    quota_cores: Optional[float]  # cgroup CPU quota; None = unlimited
+    cores: int  # usable cores (affinity capped by quota)
+    io_cores: int
+    inference_cores: int
+    inference_concurrency: int  # model calls that can run at once
+    intra_op_threads: int  # per model call (torch / ORT / OpenCV)
+    interop_threads: int
+    io_cpus: Tuple[int, ...]
+    inference_cpus: Tuple[int, ...]
+    pin_workers: bool = False
+
+    def worker_cpus(self, worker_id: int, num_workers: int) -> Tuple[int, ...]:
+        """Disjoint slice of inference_cpus for one of `num_workers` processes."""
+        cpus = self.inference_cpus
+        if num_workers >= len(cpus):
+            return (cpus[worker_id % len(cpus)],)
+        size = len(cpus) // num_workers
+        start = worker_id * size
+        end = len(cpus) if worker_id == num_workers - 1 else start + size
+        return cpus[start:end]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# ============================================================================
+# Detection
+# ============================================================================
+
+def available_cpus() -> Tuple[int, ...]:
+    """CPU ids this process may be scheduled on."""
+    if hasattr(os, "sched_getaffinity"):
+        return tuple(sorted(os.sched_getaffinity(0)))
+    return tuple(range(os.cpu_count() or 1))
+
+
+def read_cgroup_quota(root: Path = _CGROUP_ROOT) -> Optional[float]:
+    """CPU quota in cores from cgroup v2 / v1; None if unlimited or unknown."""
+    try:
+        cpu_max = root / "cpu.max"
+        if cpu_max.exists():  # v2: "<quota|max> <period>"
+            quota, _, period = cpu_max.read_text().strip().partition(" ")
+            if quota == "max":
+                return None
+            return int(quota) / int(period or 100000)
+
+        v1 = root / "cpu"
+        quota_file = v1 / "cpu.cfs_quota_us"
+        if quota_file.exists():  # v1: -1 = unlimited
+            quota_us = int(quota_file.read_text().strip())
+            if quota_us <= 0:
+                return None
+            return quota_us / int((v1 / "cpu.cfs_period_us").read_text().strip())
+    except (OSError, ValueError) as e:
+        logger.debug("cgroup_quota_unreadable", error=str(e))
+    return None
+
+
+# ============================================================================
+# Planning
+# ============================================================================
+
+def plan_cpu_layout(
+    cpus: Sequence[int],
+    quota_cores: Optional[float] = None,
+    io_cores: int = 0,
+    inference_concurrency: int = 1,
+    pin_workers: bool = False,
+    intra_op_threads: int = 0,
+) -> CpuLayout:
+    """
+    Split the usable cores between I/O and inference.
+
+    Args:
+        cpus: Usable CPU ids (available_cpus())
+        quota_cores: cgroup quota (read_cgroup_quota())
+        io_cores: Cores for gRPC / decode threads; 0 = a quarter (min 1)
+        inference_concurrency: Model calls that can run at once
+        pin_workers: Whether worker processes get pinned to worker_cpus()
+        intra_op_threads: Threads per model call; 0 = inference cores / concurrency
+    """
+    cpus = tuple(sorted(cpus)) or (0,)
+    cores = len(cpus)
+    if quota_cores is not None:
+        cores = max(1, min(cores, math.ceil(quota_cores)))
+
+    if cores == 1:
+        io, inference = 1, 1  # nothing to split; both share the core
+    else:
+        io = min(io_cores or max(1, cores // 4), cores - 1)
+        inference = cores - io
+
+    concurrency = max(1, inference_concurrency)
+    usable = cpus[:cores]
+    return CpuLayout(
+        cpus=cpus,
+        quota_cores=quota_cores,
+        cores=cores,
+        io_cores=io,
+        inference_cores=inference,
+        inference_concurrency=concurrency,
+        intra_op_threads=intra_op_threads or max(1, inference // concurrency),
+        interop_threads=1 if concurrency > 1 else min(2, inference),
+        io_cpus=usable[:io],
+        inference_cpus=usable[-inference:],
+        pin_workers=pin_workers,
+    )
+
+
+# ============================================================================
+# Applying
+# ============================================================================
+
+_layout: Optional[CpuLayout] = None
+_intra_op_threads = 0
+
+
+def limit_threads(intra_op: int, interop: int = 0) -> None:
+    """Cap torch / OpenCV threads of this process; ORT sessions built later read intra_op_threads()."""
+    global _intra_op_threads
+    _intra_op_threads = intra_op
+    try:
+        import torch
+        torch.set_num_threads(intra_op)
+        if interop:
+            try:
+                torch.set_num_interop_threads(interop)
+            except RuntimeError:  # only settable before the first inter-op work
+                logger.debug("torch_interop_threads_already_set")
+    except ImportError:
+        pass
+    try:
+        import cv2
+        cv2.setNumThreads(intra_op)
+    except ImportError:
+        pass
+
+
+def apply_cpu_layout(layout: CpuLayout) -> CpuLayout:
+    """Make `layout` this process's budget and log it."""
+    global _layout
+    limit_threads(layout.intra_op_threads, layout.interop_threads)
+    _layout = layout
+    logger.info(
+        "cpu_budget_applied",
+        cores=layout.cores,
+        quota_cores=layout.quota_cores,
+        io_cores=layout.io_cores,
+        inference_cores=layout.inference_cores,
+        inference_concurrency=layout.inference_concurrency,
+        intra_op_threads=layout.intra_op_threads,
+        interop_threads=layout.interop_threads,
+        pin_workers=layout.pin_workers,
+    )
+    return layout
+
+
+def get_cpu_layout() -> Optional[CpuLayout]:
+    return _layout
+
+
+def intra_op_threads() -> int:
+    """Budgeted intra-op threads per model call; 0 = no budget (runtime default)."""
+    return _intra_op_threads
+
+
+def inference_cores() -> int:
+    """Cores available to inference (all usable cores without a budget)."""
+    if _layout is not None:
+        return _layout.inference_cores
+    return len(available_cpus())
+
+
+def worker_cpu_sets(num_workers: int) -> Optional[List[Tuple[int, ...]]]:
+    """Per-worker core sets when CPU_PIN_INFERENCE_WORKERS is on; else None."""
+    if _layout is None or not _layout.pin_workers:
+        return None
+    return [_layout.worker_cpus(i, num_workers) for i in range(num_workers)]
+
+
+def pin_process(cpus: Sequence[int]) -> bool:
+    """Restrict this process to `cpus` (Linux); False where unsupported."""
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return False
+    try:
+        os.sched_setaffinity(0, set(cpus))
+    except OSError as e:
+        logger.warning("cpu_pinning_failed", cpus=list(cpus), error=str(e))
+        return False
+    return True
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = [
+    "CpuLayout",
+    "apply_cpu_layout",
+    "available_cpus",
+    "get_cpu_layout",
+    "inference_cores",
+    "intra_op_threads",
+    "limit_threads",
+    "pin_process",
+    "plan_cpu_layout",
+    "read_cgroup_quota",
+    "worker_cpu_sets",
+]
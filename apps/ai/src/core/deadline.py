@@ -0,0 +1,111 @@
+"""
+apps/ai/src/core/deadline.py
+Request deadlines for inference work.
+
+A Deadline is an absolute point on the monotonic clock, built from the gRPC
+caller's remaining time (and/or a server-side cap). Services check it before
+each stage: expired work is skipped outright, and optional stages are
+dropped when their estimated cost no longer fits the remaining budget.
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from src.core.exceptions import DeadlineExceededException
+
+
+class Deadline:
+    """Absolute deadline (monotonic clock). `Deadline()` never expires."""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: Optional[float] = None) -> None:
+        self.expires_at = expires_at
+
+    # =========================================================================
+    # CONSTRUCTORS
+    # =========================================================================
+
+    @classmethod
+    def after(cls, seconds: Optional[float]) -> "Deadline":
+        """Deadline `seconds` from now (None = no deadline)."""
+        if seconds is None:
+            return cls()
+        return cls(time.monotonic() + max(0.0, seconds))
+
+    @classmethod
+    def from_grpc_context(cls, context: Any, max_seconds: Optional[float] = None) -> "Deadline":
+        """
+        Deadline from `context.time_remaining()`, capped at `max_seconds`.
+        gRPC reports a huge remaining time when the caller set no deadline.
+        """
+        remaining = context.time_remaining() if context is not None else None
+        candidates = [s for s in (remaining, max_seconds) if s is not None]
+        return cls.after(min(candidates)) if candidates else cls()
+
+    @classmethod
+    def earliest(cls, *deadlines: Optional["Deadline"]) -> "Deadline":
+        """The tightest of several deadlines (None entries are ignored)."""
+        points = [d.expires_at for d in deadlines if d is not None and d.expires_at is not None]
+        return cls(min(points)) if points else cls()
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def remaining_ms(self) -> float:
+        if self.expires_at is None:
+            return math.inf
+        return max(0.0, (self.expires_at - time.monotonic()) * 1000.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def allows(self, cost_ms: float) -> bool:
+        """True if `cost_ms` of work still fits before the deadline."""
+        return self.remaining_ms() >= cost_ms
+
+    def check(self, stage: str) -> None:
+        """
+        Raises:
+            DeadlineExceededException: if the deadline has passed
+        """
+        if self.expired:
+            raise DeadlineExceededException(stage)
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining_ms={self.remaining_ms():.1f})"
+
+
+class StageCostTracker:
+    """EWMA of observed per-stage latency, used to decide what still fits."""
+
+    def __init__(self, alpha: float = 0.2) -> None:
+        self.alpha = alpha
+        self._costs: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, cost_ms: float) -> None:
+        with self._lock:
+            previous = self._costs.get(stage)
+            self._costs[stage] = (
+                cost_ms if previous is None else previous + self.alpha * (cost_ms - previous)
+            )
+
+    def estimate(self, stage: str, default: float = 0.0) -> float:
+        with self._lock:
+            return self._costs.get(stage, default)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {stage: round(ms, 2) for stage, ms in self._costs.items()}
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["Deadline", "StageCostTracker"]
@@ -144,6 +144,17 @@ class TimeoutException(AIServiceException):
         )
 
 
+class DeadlineExceededException(AIServiceException):
+    """Caller's deadline passed before (or while) the work could run"""
+    
+    def __init__(self, stage: str):
+        super().__init__(
+            message=f"Deadline exceeded before {stage}",
+            error_code="TIMEOUT",
+            details={"stage": stage}
+        )
+
+
 # ============================================================================
 # Export
 # ============================================================================
@@ -159,4 +170,5 @@ __all__ = [
     "PostprocessingException",
     "ResourceException",
     "TimeoutException",
+    "DeadlineExceededException",
 ]
\ No newline at end of file
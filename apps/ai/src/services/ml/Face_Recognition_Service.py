@@ -5,18 +5,45 @@ Optimized Face Recognition Service
 - Better memory management for batch operations
 - Optimized image decoding pipeline
 - Comprehensive metrics tracking
+- Cross-request embedding micro-batching
+- Separable detect / embed stages for pipelined streaming
+- Deadline-aware: expired work is skipped, optional stages dropped
+- Optional two-resolution faces: detect on a proxy, embed full-resolution crops
+- Optional pool of K model replicas, checked out per request stage
+- Shape-bucketed warmup; runtime batches / detector inputs padded to the warmed buckets
 """
 import time
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import threading
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from typing import List, Dict, Any, Iterator, Optional, Sequence
+from pathlib import Path
+from dataclasses import dataclass, field
 
 import cv2
 import numpy as np
 
+from src.core.config import settings
+from src.core.cpu_budget import inference_cores, intra_op_threads
+from src.core.deadline import Deadline, StageCostTracker
 from src.core.logging import get_logger
-from src.core.exceptions import InvalidImageException
+from src.core.exceptions import (
+    DeadlineExceededException,
+    InferenceException,
+    InvalidImageException,
+    ResourceException,
+)
+from src.services.ml.batching import DynamicBatcher
+from src.services.ml.face_detectors import build_face_detector
+from src.services.ml.multiscale import MultiScaleFaceDetector
+from src.services.ml.person_cascade import PersonFaceCascade
+from src.services.ml.replica_pool import ModelReplicaPool
+from src.services.ml.shape_buckets import BucketedFaceDetector, pad_batch
+from src.services.ml.warmup import ShapeWarmup, WarmupTask, embedder_tasks, face_detector_tasks
 from src.models.face.detector import FaceDetector, DetectionConfig, DetectedFace
 from src.models.face.embedder import FaceEmbedder, EmbedderConfig
+from src.services.ml.onnx_embedder import OnnxEmbedderConfig, OnnxFaceEmbedder
+from src.utils.image_decode import decode_image
 
 
 
@@ -32,12 +59,44 @@ class ImageValidationLimits:
     DEFAULT_RESIZE_DIMENSION: int = 1280
 
 
+@dataclass
+class FaceModels:
+    """One detector / embedder set (a replica when FACE_MODEL_REPLICAS > 0)."""
+    detector: Any
+    camera_detectors: Dict[str, Any]  # backend -> detector (default included)
+    embedder: Any
+    mosaic_detectors: Dict[str, Any] = field(default_factory=dict)  # backend -> detector without frame buckets
+
+    def detector_for(self, camera_id: str) -> Any:
+        """Detector for a camera: FACE_DETECTOR_CAMERA_BACKENDS override, else the default."""
+        backend = settings.FACE_DETECTOR_CAMERA_BACKENDS.get(camera_id)
+        return self.camera_detectors.get(backend, self.detector)
+
+    def mosaic_detector_for(self, camera_id: str) -> Any:
+        """detector_for() for person-cascade mosaics, whose sizes vary too much to pad to a bucket."""
+        backend = settings.FACE_DETECTOR_CAMERA_BACKENDS.get(camera_id, settings.FACE_DETECTOR_BACKEND)
+        return self.mosaic_detectors.get(backend) or self.detector_for(camera_id)
+
+
+@dataclass
+class FrameDetection:
+    """Output of the detect stage of process_frame (input to embed_frame)."""
+    faces: List[DetectedFace]
+    frame_id: int
+    camera_id: str
+    timer: "Timer"
+    image_width: int
+    image_height: int
+    skip_embedding: bool = False
+    frame: Optional[np.ndarray] = None  # kept when embed_frame cuts faces from it (no crops)
+
+
 class FaceRecognitionService:
     """
     Production-grade face recognition service.
     
     Features:
-    - Lazy model loading with warmup
+    - Lazy model loading with shape-bucketed warmup
     - Multi-face detection & embedding
     - Optimized batch processing
     - Quality assessment per face
@@ -46,9 +105,23 @@ class FaceRecognitionService:
 
     def __init__(self) -> None:
         self.detector: Optional[FaceDetector] = None
+        self._camera_detectors: Dict[str, Any] = {}  # backend -> detector (default included)
+        self._detection_cfg: Optional[DetectionConfig] = None
         self.embedder: Optional[FaceEmbedder] = None
+        self._embedding_batcher: Optional[DynamicBatcher] = None
+        self._models: Optional[FaceModels] = None
+        self._replicas: Optional[ModelReplicaPool[FaceModels]] = None
+        self._embed_buckets: List[int] = []  # crop batches are padded to these sizes
+        self._pad_crop: Optional[np.ndarray] = None
+        self._load_lock = threading.Lock()
+        self._frame_lock = threading.Lock()
         self._frame_counter: int = 0
         self._validation = ImageValidationLimits()
+        self._stage_costs = StageCostTracker()
+        self._person_cascade = PersonFaceCascade(
+            upper_fraction=settings.FACE_CASCADE_UPPER_FRACTION,
+            max_coverage=settings.FACE_CASCADE_MAX_COVERAGE,
+        )
         
         logger.info("face_recognition_service_initialized")
 
@@ -56,40 +129,61 @@ class FaceRecognitionService:
     # LIFECYCLE MANAGEMENT
     # =========================================================================
 
+    @property
+    def is_ready(self) -> bool:
+        """True once detector and embedder are loaded."""
+        return self.detector is not None and self.embedder is not None
+
+    def load_models(self) -> None:
+        """Load detector and embedder weights without running inference."""
+        self._ensure_models_loaded()
+
     def warmup(self) -> None:
-        """Warmup models with dummy data to eliminate cold start latency."""
+        """
+        Warm up every shape bucket inline to eliminate cold start latency.
+
+        Raises:
+            InferenceException: a bucket failed to run
+        """
         self._ensure_models_loaded()
-        
         logger.info("warming_up_models")
-        start = time.time()
-        
-        try:
-            # Warmup detector
-            dummy_image = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
-            _ = self.detector.detect_with_quality(
-                dummy_image,
-                confidence_threshold=0.7,
-                return_crops=True,
-            )
-            
-            # Warmup embedder
-            dummy_crop = np.random.randint(0, 255, (160, 160, 3), dtype=np.uint8)
-            _ = self.embedder.embed_batch([dummy_crop])
-            
-            elapsed = time.time() - start
-            logger.info(
-                "model_warmup_completed",
-                elapsed_ms=round(elapsed * 1000, 2),
-            )
-        except Exception as e:
-            logger.error("model_warmup_failed", error=str(e), exc_info=True)
-            raise
+        failed = ShapeWarmup(self.warmup_tasks(), iterations=settings.WARMUP_ITERATIONS).run()
+        if failed:
+            raise InferenceException("model warmup failed", {"buckets": failed})
+
+    def warmup_tasks(self) -> List[WarmupTask]:
+        """
+        Warmup tasks: face detectors per WARMUP_FRAME_SIZES entry, the embedder
+        per batch bucket (every replica and per-camera backend each time).
+        Run them with ShapeWarmup, e.g. in the background with a health registry;
+        each replica is checked out while it is warmed, so live requests keep
+        exclusive use of theirs.
+        """
+        self._ensure_models_loaded()
+
+        def detectors():
+            for models in self._each_replica():
+                yield from models.camera_detectors.values()
+
+        def embedders():
+            for models in self._each_replica():
+                yield models.embedder
+
+        return face_detector_tasks(detectors, settings.WARMUP_FRAME_SIZES) + embedder_tasks(
+            embedders, self._embedder_buckets() or [1], crop_size=self.embedder.config.image_size
+        )
 
     def cleanup(self) -> None:
         """Clean up resources on shutdown."""
         try:
-            if self.detector is not None and hasattr(self.detector, 'close'):
-                self.detector.close()
+            if self._embedding_batcher is not None:
+                self._embedding_batcher.close()
+                self._embedding_batcher = None
+
+            for models in self._all_models():
+                for detector in models.camera_detectors.values():
+                    if hasattr(detector, 'close'):
+                        detector.close()
             
             if self.embedder is not None:
                 # Clear CUDA cache if using GPU
@@ -116,6 +210,7 @@ class FaceRecognitionService:
         max_faces: int = 10,
         include_crops: bool = False,
         max_image_dimension: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Dict[str, Any]:
         """
         Detect faces only (no embeddings).
@@ -126,44 +221,56 @@ class FaceRecognitionService:
             max_faces: Maximum number of faces to return
             include_crops: Whether to include cropped face images
             max_image_dimension: Auto-resize if image exceeds this
+            deadline: Caller deadline; crop encoding is dropped if it won't fit
             
         Returns:
-            Dict with keys: success, faces, total_faces, time_ms, metrics
+            Dict with keys: success, faces, total_faces, time_ms, metrics,
+            partial, skipped_stages
+            
+        Raises:
+            DeadlineExceededException: deadline passed before decode/detection
         """
         self._ensure_models_loaded()
         timer = Timer()
+        skipped: List[str] = []
+        self._check_deadline(deadline, "decode")
 
         # Decode + optional resize
         with timer.measure("decode"):
             image = self._decode_and_resize_image(
                 image_bytes=image_bytes,
-                max_dimension=max_image_dimension or self._validation.DEFAULT_RESIZE_DIMENSION,
+                max_dimension=max_image_dimension or self._default_decode_dimension(),
             )
         
         self._validate_image(image)
+        self._check_deadline(deadline, "detect")
+
+        # Optional: crop extraction + JPEG encoding
+        if include_crops and not self._fits(deadline, "detect", "crop_encode"):
+            include_crops = False
+            skipped.append("crop_encoding")
 
         # Detection
-        with timer.measure("detect"):
-            detected_faces = self.detector.detect_with_quality(
+        with self._checkout(deadline, "detect") as models, timer.measure("detect"):
+            detected_faces = models.detector.detect_with_quality(
                 image,
                 confidence_threshold=confidence_threshold,
                 return_crops=include_crops,
             )
+        self._stage_costs.record("detect", timer.get("detect"))
 
         # Limit results
         if max_faces and len(detected_faces) > max_faces:
             detected_faces = detected_faces[:max_faces]
 
         # Map to response format
-        faces = [
-            self._map_detected_face(face, include_crop=include_crops)
-            for face in detected_faces
-        ]
+        faces = self._map_faces(detected_faces, include_crops=include_crops)
 
         logger.info(
             "detect_faces_completed",
             total_faces=len(faces),
             time_ms=timer.total_ms(),
+            skipped_stages=skipped or None,
         )
 
         return {
@@ -176,6 +283,8 @@ class FaceRecognitionService:
                 image_shape=image.shape,
                 faces_detected=len(faces),
             ),
+            "partial": bool(skipped),
+            "skipped_stages": skipped,
         }
 
     def extract_embeddings(
@@ -186,6 +295,7 @@ class FaceRecognitionService:
         max_faces: int = 10,
         include_crops: bool = False,
         max_image_dimension: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Dict[str, Any]:
         """
         Detect faces and compute embeddings for each.
@@ -197,29 +307,56 @@ class FaceRecognitionService:
             max_faces: Maximum number of faces to process
             include_crops: Whether to include cropped face images
             max_image_dimension: Auto-resize if image exceeds this
+            deadline: Caller deadline; embedding / crop encoding are dropped
+                (partial result) if their estimated cost won't fit
             
         Returns:
-            Dict with keys: success, face_detected, faces, camera_id, time_ms, metrics
+            Dict with keys: success, face_detected, faces, camera_id, time_ms,
+            metrics, partial, skipped_stages
+            
+        Raises:
+            DeadlineExceededException: deadline passed before decode/detection
         """
         self._ensure_models_loaded()
         timer = Timer()
+        skipped: List[str] = []
+        self._check_deadline(deadline, "decode")
 
         # Decode + resize
         with timer.measure("decode"):
             image = self._decode_and_resize_image(
                 image_bytes=image_bytes,
-                max_dimension=max_image_dimension or self._validation.DEFAULT_RESIZE_DIMENSION,
+                max_dimension=max_image_dimension or self._default_decode_dimension(),
             )
         
         self._validate_image(image)
-
-        # Detection
-        with timer.measure("detect"):
-            detected_faces = self.detector.detect_with_quality(
-                image,
-                confidence_threshold=confidence_threshold,
-                return_crops=True,  # Always need crops for embeddings
-            )
+        self._check_deadline(deadline, "detect")
+
+        embeddings: Optional[List[np.ndarray]] = None
+        with self._checkout(deadline, "detect") as models:
+            # Detection
+            with timer.measure("detect"):
+                from_boxes = self._embeds_boxes(models)
+                detected_faces = models.detector_for(camera_id).detect_with_quality(
+                    image,
+                    confidence_threshold=confidence_threshold,
+                    return_crops=include_crops or not from_boxes,  # crops feed the embedder otherwise
+                )
+            self._stage_costs.record("detect", timer.get("detect"))
+
+            # Limit faces
+            if max_faces and len(detected_faces) > max_faces:
+                detected_faces = detected_faces[:max_faces]
+
+            # Optional stages that no longer fit the budget are dropped
+            if detected_faces and self._fits(deadline, "embed"):
+                with timer.measure("embed"):
+                    embeddings = self._extract_embeddings_batch(
+                        detected_faces, models, frame=image if from_boxes else None
+                    )
+                self._stage_costs.record("embed", timer.get("embed"))
+            elif detected_faces:
+                skipped.append("embedding")
 
         # No faces found
         if not detected_faces:
@@ -228,27 +365,22 @@ class FaceRecognitionService:
                 camera_id=camera_id,
                 timer=timer,
                 image_shape=image.shape,
+                skipped_stages=skipped,
             )
 
-        # Limit faces
-        if max_faces and len(detected_faces) > max_faces:
-            detected_faces = detected_faces[:max_faces]
-
-        # Extract embeddings
-        with timer.measure("embed"):
-            embeddings = self._extract_embeddings_batch(detected_faces)
+        if include_crops and not self._fits(deadline, "crop_encode"):
+            include_crops = False
+            skipped.append("crop_encoding")
 
         # Map results
-        faces = [
-            self._map_face_with_embedding(face, emb, include_crop=include_crops)
-            for face, emb in zip(detected_faces, embeddings)
-        ]
+        faces = self._map_faces(detected_faces, embeddings, include_crops=include_crops)
 
         logger.info(
             "extract_embeddings_completed",
             camera_id=camera_id,
             faces=len(faces),
             time_ms=timer.total_ms(),
+            skipped_stages=skipped or None,
         )
 
         return {
@@ -262,6 +394,8 @@ class FaceRecognitionService:
                 image_shape=image.shape,
                 faces_detected=len(faces),
             ),
+            "partial": bool(skipped),
+            "skipped_stages": skipped,
         }
 
     def process_frame(
@@ -271,11 +405,14 @@ class FaceRecognitionService:
         confidence_threshold: float = 0.7,
         max_faces: int = 10,
         skip_embedding: bool = False,
+        deadline: Optional[Deadline] = None,
+        person_boxes: Optional[Sequence[Sequence[float]]] = None,
     ) -> Dict[str, Any]:
         """
         Process a single video frame (already decoded np.ndarray).
         
         Optimized for streaming pipelines - no image decoding overhead.
+        Equivalent to embed_frame(detect_frame(...)).
         
         Args:
             frame: BGR OpenCV image (np.ndarray)
@@ -283,76 +420,171 @@ class FaceRecognitionService:
             confidence_threshold: Minimum detection confidence
             max_faces: Maximum faces to process
             skip_embedding: If True, only detect faces (faster)
+            deadline: Caller deadline; embedding is dropped if it won't fit
+            person_boxes: YOLO person boxes (x1, y1, x2, y2) for this frame; if
+                given, faces are only searched in their upper bodies
             
         Returns:
-            Dict with keys: success, faces, frame_id, camera_id, time_ms, metrics
+            Dict with keys: success, faces, frame_id, camera_id, time_ms, metrics,
+            partial, skipped_stages
+        """
+        detection = self.detect_frame(
+            frame=frame,
+            camera_id=camera_id,
+            confidence_threshold=confidence_threshold,
+            max_faces=max_faces,
+            skip_embedding=skip_embedding,
+            deadline=deadline,
+            person_boxes=person_boxes,
+        )
+        return self.embed_frame(detection, deadline=deadline)
+
+    def detect_frame(
+        self,
+        frame: np.ndarray,
+        camera_id: str = "unknown",
+        confidence_threshold: float = 0.7,
+        max_faces: int = 10,
+        skip_embedding: bool = False,
+        deadline: Optional[Deadline] = None,
+        person_boxes: Optional[Sequence[Sequence[float]]] = None,
+    ) -> "FrameDetection":
+        """
+        Detect stage of process_frame.
+        
+        Split out so streaming pipelines can run detection of frame k+1
+        while frame k is still being embedded.
+        
+        With `person_boxes` (YOLO person detections of the same frame) the
+        face detector only runs on their upper bodies, packed into one
+        mosaic (PersonFaceCascade); no persons means no faces.
+        
+        Raises:
+            DeadlineExceededException: deadline passed before detection
         """
         self._ensure_models_loaded()
+        self._check_deadline(deadline, "detect")
         timer = Timer()
-        self._frame_counter += 1
+        with self._frame_lock:
+            self._frame_counter += 1
+            frame_id = self._frame_counter
 
         h, w = frame.shape[:2]
 
-        # Detection
-        with timer.measure("detect"):
-            detected_faces = self.detector.detect_with_quality(
-                frame,
-                confidence_threshold=confidence_threshold,
-                return_crops=not skip_embedding,
-            )
+        with self._checkout(deadline, "detect") as models:
+            detector = models.detector_for(camera_id)
+            # The embedder can cut faces from the frame itself: no crops needed
+            from_boxes = not skip_embedding and self._embeds_boxes(models)
+            return_crops = not skip_embedding and not from_boxes
+            if person_boxes is not None:
+                with timer.measure("detect"):
+                    detected_faces, _ = self._person_cascade.detect(
+                        detector,
+                        frame,
+                        person_boxes,
+                        confidence_threshold=confidence_threshold,
+                        return_crops=return_crops,
+                        mosaic_detector=models.mosaic_detector_for(camera_id),
+                    )
+                self._stage_costs.record("detect_cascade", timer.get("detect"))
+            else:
+                with timer.measure("detect"):
+                    detected_faces = detector.detect_with_quality(
+                        frame,
+                        confidence_threshold=confidence_threshold,
+                        return_crops=return_crops,
+                    )
+                self._stage_costs.record("detect", timer.get("detect"))
+
+        # Limit faces
+        if max_faces and len(detected_faces) > max_faces:
+            detected_faces = detected_faces[:max_faces]
+
+        return FrameDetection(
+            faces=detected_faces,
+            frame_id=frame_id,
+            camera_id=camera_id,
+            timer=timer,
+            image_width=w,
+            image_height=h,
+            skip_embedding=skip_embedding,
+            frame=frame if from_boxes else None,
+        )
+
+    def embed_frame(
+        self,
+        detection: "FrameDetection",
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        """
+        Embed stage of process_frame. Embedding is dropped (partial result)
+        if its estimated cost no longer fits the deadline.
+        
+        Returns:
+            Dict with keys: success, faces, frame_id, camera_id, time_ms, metrics,
+            partial, skipped_stages
+        """
+        timer = detection.timer
+        detected_faces = detection.faces
+        skipped: List[str] = []
 
         # No faces
         if not detected_faces:
             logger.debug(
                 "process_frame_no_faces",
-                camera_id=camera_id,
-                frame_id=self._frame_counter,
+                camera_id=detection.camera_id,
+                frame_id=detection.frame_id,
             )
-            return self._build_frame_response(
-                faces=[],
-                frame_id=self._frame_counter,
-                camera_id=camera_id,
-                timer=timer,
-                image_width=w,
-                image_height=h,
-            )
-
-        # Limit faces
-        if max_faces and len(detected_faces) > max_faces:
-            detected_faces = detected_faces[:max_faces]
-
-        # Process faces
-        if skip_embedding:
+            faces: List[Dict[str, Any]] = []
+        elif detection.skip_embedding:
             # Detection only (fast path)
-            faces = [
-                self._map_detected_face(face, include_crop=False)
-                for face in detected_faces
-            ]
+            faces = self._map_faces(detected_faces)
+        elif not self._fits(deadline, "embed"):
+            # Out of budget: detection-only partial result
+            skipped.append("embedding")
+            faces = self._map_faces(detected_faces)
         else:
             # Detection + embeddings
-            with timer.measure("embed"):
-                embeddings = self._extract_embeddings_batch(detected_faces)
+            with self._checkout(deadline, "embed") as models, timer.measure("embed"):
+                embeddings = self._extract_embeddings_batch(detected_faces, models, frame=detection.frame)
+            self._stage_costs.record("embed", timer.get("embed"))
             
-            faces = [
-                self._map_face_with_embedding(face, emb, include_crop=False)
-                for face, emb in zip(detected_faces, embeddings)
-            ]
+            faces = self._map_faces(detected_faces, embeddings)
 
-        logger.debug(
-            "process_frame_completed",
-            camera_id=camera_id,
-            frame_id=self._frame_counter,
-            faces=len(faces),
-            time_ms=timer.total_ms(),
-        )
+        if faces:
+            logger.debug(
+                "process_frame_completed",
+                camera_id=detection.camera_id,
+                frame_id=detection.frame_id,
+                faces=len(faces),
+                time_ms=timer.total_ms(),
+                skipped_stages=skipped or None,
+            )
 
         return self._build_frame_response(
             faces=faces,
-            frame_id=self._frame_counter,
-            camera_id=camera_id,
+            frame_id=detection.frame_id,
+            camera_id=detection.camera_id,
             timer=timer,
-            image_width=w,
-            image_height=h,
+            image_width=detection.image_width,
+            image_height=detection.image_height,
+            skipped_stages=skipped,
+        )
+
+    def detection_only_frame(
+        self,
+        detection: "FrameDetection",
+        skipped_stages: Sequence[str],
+    ) -> Dict[str, Any]:
+        """embed_frame-shaped partial result for a frame whose embedding was skipped."""
+        return self._build_frame_response(
+            faces=self._map_faces(detection.faces),
+            frame_id=detection.frame_id,
+            camera_id=detection.camera_id,
+            timer=detection.timer,
+            image_width=detection.image_width,
+            image_height=detection.image_height,
+            skipped_stages=list(skipped_stages),
         )
 
     def get_model_info(self) -> Dict[str, Any]:
@@ -362,19 +594,28 @@ class FaceRecognitionService:
         info = {
             "model_name": "FaceNet (InceptionResnetV1)",
             "model_version": "vggface2",
+            "runtime": settings.FACE_EMBEDDER_BACKEND,
             "device": self.embedder.config.device,
             "model_size_mb": 90.0,
             "input_size": self.embedder.config.image_size,
             "embedding_dim": 512,
             "total_faces_enrolled": 0,
             "is_ready": True,
-            "detector_type": "MTCNN",
+            "detector_type": {"mtcnn": "MTCNN", "yunet": "YuNet"}[settings.FACE_DETECTOR_BACKEND],
             "detector_config": {
-                "min_face_size": self.detector.config.min_face_size,
-                "confidence_threshold": float(self.detector.config.thresholds[2]),
-                "max_faces": self.detector.config.max_faces,
-                "keep_all": self.detector.config.keep_all,
+                "min_face_size": self._detection_cfg.min_face_size,
+                "confidence_threshold": float(self._detection_cfg.thresholds[2]),
+                "max_faces": self._detection_cfg.max_faces,
+                "keep_all": self._detection_cfg.keep_all,
             },
+            "camera_detectors": dict(settings.FACE_DETECTOR_CAMERA_BACKENDS),
+            "detect_max_dimension": (
+                settings.FACE_DETECT_MAX_DIMENSION if settings.FACE_MULTISCALE_ENABLED else None
+            ),
+            "model_replicas": self._replicas.size if self._replicas is not None else 0,
+            "threads_per_replica": (
+                self._replicas.threads_per_replica if self._replicas is not None else None
+            ),
         }
 
         logger.info("get_model_info", **info)
@@ -389,6 +630,13 @@ class FaceRecognitionService:
         if self.detector is not None and self.embedder is not None:
             return
 
+        with self._load_lock:
+            if self.detector is not None and self.embedder is not None:
+                return
+            self._load_models()
+
+    def _load_models(self) -> None:
+        """Build the model set(s) and the shared embedding batcher."""
         # Detector config
         detection_cfg = DetectionConfig(
             min_face_size=40,
@@ -396,23 +644,201 @@ class FaceRecognitionService:
             quality_threshold=0.3,
             keep_all=True,
         )
-        self.detector = FaceDetector(detection_cfg)
+        self._detection_cfg = detection_cfg
+
+        replicas = settings.FACE_MODEL_REPLICAS
+        if replicas > 0:
+            # K exclusive replicas, each with its own intra-op thread budget
+            threads = settings.FACE_REPLICA_THREADS or max(1, inference_cores() // replicas)
+            self._replicas = ModelReplicaPool(
+                [self._build_models(detection_cfg, threads) for _ in range(replicas)],
+                threads_per_replica=threads,
+                name="face_models",
+            )
+            models = self._replicas.replicas[0]
+        else:
+            models = self._build_models(detection_cfg)
+
+        # Crop batches are padded to the warmed batch buckets
+        if settings.WARMUP_PAD_TO_BUCKETS:
+            self._embed_buckets = self._embedder_buckets()
+            size = models.embedder.config.image_size
+            self._pad_crop = np.full((size, size, 3), 128, dtype=np.uint8)
+
+        # One queue shared by every RPC thread so concurrent calls
+        # (ExtractEmbeddings / ProcessFrame / StreamFrames) share a forward pass.
+        # Replicas embed their own request's faces instead.
+        if settings.FACE_EMBEDDING_BATCHING_ENABLED and self._replicas is None:
+            self._embedding_batcher = DynamicBatcher(
+                batch_fn=partial(self._embed_padded, models.embedder),
+                max_batch_size=settings.FACE_EMBEDDING_BATCH_MAX_SIZE,
+                max_wait_ms=settings.FACE_EMBEDDING_BATCH_MAX_WAIT_MS,
+                name="face_embedder",
+            )
+        self._models = models
+        self._camera_detectors = models.camera_detectors
+        self.detector = models.detector
+        self.embedder = models.embedder
+
+        logger.info(
+            "face_models_loaded",
+            detector=settings.FACE_DETECTOR_BACKEND,
+            camera_detectors=len(settings.FACE_DETECTOR_CAMERA_BACKENDS),
+            embedder="FaceNet",
+            embedder_backend=settings.FACE_EMBEDDER_BACKEND,
+            device=self.embedder.config.device,
+            embedding_batching=self._embedding_batcher is not None,
+            multiscale=settings.FACE_MULTISCALE_ENABLED,
+            replicas=replicas,
+            threads_per_replica=self._replicas.threads_per_replica if self._replicas else None,
+        )
+
+    def _build_models(self, detection_cfg: DetectionConfig, threads: int = 0) -> FaceModels:
+        """One detector set (default + per-camera backends) and one embedder."""
+        detector = build_face_detector(settings.FACE_DETECTOR_BACKEND, detection_cfg)
+        camera_detectors = {settings.FACE_DETECTOR_BACKEND: detector}
+        for backend in set(settings.FACE_DETECTOR_CAMERA_BACKENDS.values()):
+            if backend not in camera_detectors:
+                camera_detectors[backend] = build_face_detector(backend, detection_cfg)
+
+        # Detector inputs padded to the warmed frame sizes (inside the multiscale proxy);
+        # person-cascade mosaics keep the unpadded backends
+        mosaic_detectors = camera_detectors
+        if settings.WARMUP_PAD_TO_BUCKETS:
+            camera_detectors = {
+                backend: BucketedFaceDetector(backend_detector, settings.WARMUP_FRAME_SIZES)
+                for backend, backend_detector in camera_detectors.items()
+            }
+            detector = camera_detectors[settings.FACE_DETECTOR_BACKEND]
+
+        # Detect on a small proxy, crop from the full-resolution frame
+        if settings.FACE_MULTISCALE_ENABLED:
+            def multiscale(backend_detector: Any) -> MultiScaleFaceDetector:
+                return MultiScaleFaceDetector(
+                    backend_detector,
+                    max_dimension=settings.FACE_DETECT_MAX_DIMENSION,
+                    min_face_size=settings.FACE_DETECT_MIN_FACE_PX,
+                    detector_min_face=detection_cfg.min_face_size,
+                )
+
+            unpadded = mosaic_detectors is camera_detectors
+            camera_detectors = {backend: multiscale(d) for backend, d in camera_detectors.items()}
+            mosaic_detectors = camera_detectors if unpadded else {
+                backend: multiscale(d) for backend, d in mosaic_detectors.items()
+            }
+            detector = camera_detectors[settings.FACE_DETECTOR_BACKEND]
+
+        return FaceModels(
+            detector=detector,
+            camera_detectors=camera_detectors,
+            embedder=self._build_embedder(threads),
+            mosaic_detectors=mosaic_detectors,
+        )
+
+    @staticmethod
+    def _embedder_buckets() -> List[int]:
+        """Crop batch buckets up to the largest embedder batch (FACE_EMBEDDING_BATCH_MAX_SIZE)."""
+        return sorted(b for b in set(settings.WARMUP_BATCH_BUCKETS) if b <= settings.FACE_EMBEDDING_BATCH_MAX_SIZE)
+
+    def _all_models(self) -> List[FaceModels]:
+        if self._replicas is not None:
+            return self._replicas.replicas
+        return [self._models] if self._models is not None else []
+
+    def _each_replica(self) -> Iterator[FaceModels]:
+        """Every model set in turn, each checked out like a request stage (warmup)."""
+        if self._replicas is None:
+            yield from self._all_models()
+            return
+        yield from self._replicas.checkout_each(timeout=settings.REQUEST_TIMEOUT)
+
+    @contextmanager
+    def _checkout(self, deadline: Optional[Deadline] = None, stage: str = "inference") -> Iterator[FaceModels]:
+        """
+        A replica for one request stage (the shared set without replicas).
+        Waits until the caller's deadline, REQUEST_TIMEOUT at most.
+        
+        Raises:
+            DeadlineExceededException: the deadline ran out while waiting for a replica
+            ResourceException: no replica came free within REQUEST_TIMEOUT
+        """
+        if self._replicas is None:
+            yield self._models
+            return
+
+        remaining_s = deadline.remaining_ms() / 1000.0 if deadline is not None else float("inf")
+        timeout = min(remaining_s, settings.REQUEST_TIMEOUT)
+        with ExitStack() as stack:
+            try:
+                models = stack.enter_context(self._replicas.checkout(timeout=timeout))
+            except ResourceException:
+                if remaining_s <= settings.REQUEST_TIMEOUT:
+                    raise DeadlineExceededException(stage) from None
+                raise
+            yield models
+
+    def replica_stats(self) -> Optional[Dict[str, Any]]:
+        """ModelReplicaPool.stats(), or None when FACE_MODEL_REPLICAS is 0."""
+        return self._replicas.stats() if self._replicas is not None else None
+
+    @staticmethod
+    def _build_embedder(threads: int = 0) -> Any:
+        """FaceNet on the configured runtime (FACE_EMBEDDER_BACKEND); `threads` = replica budget."""
+        if settings.FACE_EMBEDDER_BACKEND.startswith("onnxruntime"):
+            model_path = Path(
+                settings.FACE_EMBEDDER_ONNX_PATH or settings.MODELS_DIR / "facenet_vggface2.onnx"
+            )
+            if settings.FACE_EMBEDDER_BACKEND == "onnxruntime_int8":
+                model_path = model_path.with_suffix(".int8.onnx")  # from quantize_models.py
+            return OnnxFaceEmbedder(OnnxEmbedderConfig(
+                model_path=model_path,
+                input_color_space="rgb",
+                normalize_l2=True,
+                intra_op_threads=settings.FACE_EMBEDDER_ONNX_THREADS or threads or intra_op_threads(),
+            ))
 
-        # Embedder config
         embedder_cfg = EmbedderConfig(
             input_color_space="rgb",
             pretrained="vggface2",
             normalize_l2=True,
-            batch_size=32,  # GPU: 32, CPU: 16
+            batch_size=settings.FACE_EMBEDDING_BATCH_MAX_SIZE,  # GPU: 32, CPU: 16
         )
-        self.embedder = FaceEmbedder(embedder_cfg)
+        return FaceEmbedder(embedder_cfg)
 
-        logger.info(
-            "face_models_loaded",
-            detector="MTCNN",
-            embedder="FaceNet",
-            device=self.embedder.config.device,
-        )
+    @staticmethod
+    def _check_deadline(deadline: Optional[Deadline], stage: str) -> None:
+        """Skip the rest of the work once the caller's deadline has passed."""
+        if deadline is not None:
+            deadline.check(stage)
+
+    def _fits(self, deadline: Optional[Deadline], *stages: str) -> bool:
+        """True if the estimated cost of `stages` fits in the remaining budget."""
+        if deadline is None:
+            return True
+        return deadline.allows(sum(self._stage_costs.estimate(stage) for stage in stages))
+
+    def _map_faces(
+        self,
+        detected_faces: List[DetectedFace],
+        embeddings: Optional[List[np.ndarray]] = None,
+        include_crops: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Map detections (+ embeddings) to dicts, tracking crop encoding cost."""
+        start = time.perf_counter()
+        if embeddings is None:
+            faces = [
+                self._map_detected_face(face, include_crop=include_crops)
+                for face in detected_faces
+            ]
+        else:
+            faces = [
+                self._map_face_with_embedding(face, emb, include_crop=include_crops)
+                for face, emb in zip(detected_faces, embeddings)
+            ]
+
+        if include_crops:
+            self._stage_costs.record("crop_encode", (time.perf_counter() - start) * 1000.0)
+        return faces
 
     def _decode_and_resize_image(
         self,
@@ -420,39 +846,31 @@ class FaceRecognitionService:
         max_dimension: int,
     ) -> np.ndarray:
         """
-        Decode image bytes and optionally resize.
+        Decode image bytes, shrunk to max_dimension.
+        
+        Size limits are checked from the JPEG/PNG header before decoding;
+        large JPEGs are decoded at reduced scale (see utils.image_decode).
         
         Raises:
             InvalidImageException: If decoding fails or image is invalid
         """
-        # Decode
-        np_arr = np.frombuffer(image_bytes, np.uint8)
-        image = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
-
-        if image is None:
-            raise InvalidImageException("Could not decode image bytes")
-
-        h, w = image.shape[:2]
-
-        # Skip resize if not needed
-        if max_dimension <= 0 or max(h, w) <= max_dimension:
-            return image
-
-        # Resize
-        scale = float(max_dimension) / float(max(h, w))
-        new_w = max(1, int(round(w * scale)))
-        new_h = max(1, int(round(h * scale)))
-
-        logger.debug(
-            "image_resized",
-            orig_w=w,
-            orig_h=h,
-            new_w=new_w,
-            new_h=new_h,
-            scale=round(scale, 3),
+        return decode_image(
+            image_bytes,
+            max_dimension=max_dimension,
+            min_dimension=self._validation.MIN_DIMENSION,
+            max_pixels=self._validation.MAX_PIXELS,
+            max_source_pixels=settings.IMAGE_MAX_SOURCE_PIXELS,
         )
 
-        return cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_AREA)
+    def _default_decode_dimension(self) -> int:
+        """
+        Decode size when the caller gives none. With FACE_MULTISCALE_ENABLED
+        the detector shrinks its own proxy, so the decode keeps the source
+        resolution for the crops.
+        """
+        if settings.FACE_MULTISCALE_ENABLED:
+            return settings.FACE_SOURCE_MAX_DIMENSION
+        return self._validation.DEFAULT_RESIZE_DIMENSION
 
     def _validate_image(self, image: np.ndarray) -> None:
         """
@@ -478,20 +896,28 @@ class FaceRecognitionService:
     def _extract_embeddings_batch(
         self,
         detected_faces: List[DetectedFace],
+        models: FaceModels,
+        frame: Optional[np.ndarray] = None,
     ) -> List[np.ndarray]:
         """
         Extract embeddings for all faces in a single batch.
         
+        With `frame` (see _embeds_boxes) faces are embedded straight from
+        their bbox regions of it instead of from crops.
+        
         Returns:
             List of embeddings (same length as input)
         """
+        if frame is not None:
+            return self._embed_boxes(models.embedder, frame, [f.bbox for f in detected_faces])
+
         crops = [f.crop for f in detected_faces if f.crop is not None]
         
         if not crops:
             logger.warning("no_valid_crops_for_embedding")
             return [np.zeros(512) for _ in detected_faces]  # Return zero vectors
         
-        embeddings = self.embedder.embed_batch(crops)
+        embeddings = self._embed_crops(crops, models)
         
         # Validate count
         if len(embeddings) != len(crops):
@@ -506,6 +932,36 @@ class FaceRecognitionService:
         
         return embeddings
 
+    def _embed_crops(self, crops: List[np.ndarray], models: FaceModels) -> List[np.ndarray]:
+        """
+        Embed crops through the shared batcher (if enabled).
+        Each caller gets back exactly its own slice of the merged batch.
+        """
+        if self._embedding_batcher is None:
+            return self._embed_padded(models.embedder, crops)
+        return self._embedding_batcher.run(crops)
+
+    def _embed_padded(self, embedder: Any, crops: List[np.ndarray]) -> List[np.ndarray]:
+        """embed_batch() on crops padded with grey filler up to the next batch bucket."""
+        if not self._embed_buckets:
+            return embedder.embed_batch(crops)
+        return list(embedder.embed_batch(pad_batch(crops, self._embed_buckets, self._pad_crop))[:len(crops)])
+
+    def _embeds_boxes(self, models: FaceModels) -> bool:
+        """
+        Whether faces are embedded from (x, y, w, h) regions of the BGR frame
+        (embed_boxes: no per-face crop copies). Needs an embedder that
+        supports it (ONNX) and no shared batcher, which merges crops from
+        different frames.
+        """
+        return self._embedding_batcher is None and hasattr(models.embedder, "embed_boxes")
+
+    def _embed_boxes(self, embedder: Any, frame: np.ndarray, boxes: List[Any]) -> List[np.ndarray]:
+        """embed_boxes() padded with empty boxes (grey slots) up to the next batch bucket."""
+        if not self._embed_buckets:
+            return embedder.embed_boxes(frame, boxes)
+        return list(embedder.embed_boxes(frame, pad_batch(boxes, self._embed_buckets, (0, 0, 0, 0)))[:len(boxes)])
+
     # =========================================================================
     # RESPONSE BUILDERS
     # =========================================================================
@@ -594,6 +1050,7 @@ class FaceRecognitionService:
         camera_id: str,
         timer: 'Timer',
         image_shape: tuple,
+        skipped_stages: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Build response when no faces detected."""
         return {
@@ -607,6 +1064,8 @@ class FaceRecognitionService:
                 image_shape=image_shape,
                 faces_detected=0,
             ),
+            "partial": bool(skipped_stages),
+            "skipped_stages": list(skipped_stages or []),
         }
 
     def _build_frame_response(
@@ -617,6 +1076,7 @@ class FaceRecognitionService:
         timer: 'Timer',
         image_width: int,
         image_height: int,
+        skipped_stages: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Build process_frame response."""
         # Set face IDs
@@ -638,6 +1098,8 @@ class FaceRecognitionService:
                 "image_height": image_height,
                 "faces_detected": len(faces),
             },
+            "partial": bool(skipped_stages),
+            "skipped_stages": list(skipped_stages or []),
         }
 
 
@@ -0,0 +1,560 @@
+"""
+apps/ai/src/services/ml/autotune.py
+Capacity autotuner: pick detection model, input size, batch size and threads for this host.
+
+- Candidates are the grid of AUTOTUNE_MODELS x AUTOTUNE_IMAGE_SIZES x
+  AUTOTUNE_BATCH_SIZES x AUTOTUNE_THREADS; model files missing from
+  MODELS_DIR are skipped (no downloads at startup)
+- Each candidate is warmed up, then run on synthetic frames from one stream
+  per detection executor the deployment will have (a pre-forked server or
+  pool worker each, else the single in-process batcher thread), every
+  stream with its own predictor as in production; p95 is per batch call (a
+  frame waits for its whole batch), throughput is frames/s over all streams
+- Thread options go up to the cores each executor gets
+- Larger image sizes / batches are skipped once a smaller one already
+  misses the p95 target (latency only grows with either)
+- Choice: among candidates that reach cameras x FPS within the p95 target,
+  the largest model, then the largest input, then the lowest p95; with no
+  feasible candidate, the highest throughput within p95 (else overall)
+- The chosen settings are cached as JSON in CACHE_DIR together with a host
+  fingerprint; later starts with the same host, target and search space
+  reuse the profile instead of benchmarking again
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import structlog
+
+from src.core.cpu_budget import available_cpus, plan_cpu_layout, read_cgroup_quota
+
+logger = structlog.get_logger("sssp.ai.autotune")
+
+PROFILE_FILENAME = "autotune_profile.json"
+PROFILE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Candidate:
+    model: str  # DETECTION_MODEL_TYPE
+    model_path: str
+    image_size: int
+    batch_size: int
+    threads: int  # intra-op threads per model call
+
+
+@dataclass(frozen=True)
+class AutotuneTarget:
+    cameras: int
+    fps: float  # per camera
+    p95_ms: float
+
+    @property
+    def required_fps(self) -> float:
+        return self.cameras * self.fps
+
+
+@dataclass
+class Measurement:
+    candidate: Candidate
+    streams: int  # concurrent callers, one predictor each (detection executors)
+    throughput_fps: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    error: Optional[str] = None
+
+    def meets(self, target: AutotuneTarget) -> bool:
+        return (
+            self.error is None
+            and self.p95_ms <= target.p95_ms
+            and self.throughput_fps >= target.required_fps
+        )
+
+
+@dataclass
+class AutotuneProfile:
+    fingerprint: str
+    host: Dict[str, Any]
+    target: Dict[str, Any]
+    chosen: Dict[str, Any]  # Measurement of the chosen candidate
+    meets_target: bool
+    settings: Dict[str, Any]  # Settings overrides
+    measurements: List[Dict[str, Any]] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    version: int = PROFILE_VERSION
+
+
+# A predictor runs one batch of BGR frames through the candidate's model
+Predictor = Callable[[List[np.ndarray]], Any]
+PredictorFactory = Callable[[Candidate], Predictor]
+
+
+# ============================================================================
+# Host + search space
+# ============================================================================
+
+def host_info(io_cores: int = 0) -> Dict[str, Any]:
+    """What the measurements depend on: CPU model, usable cores, quota, runtimes."""
+    cpu_model = platform.processor()
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpu_model = next(
+                (line.split(":", 1)[1].strip() for line in f if line.startswith("model name")),
+                cpu_model,
+            )
+    except OSError:
+        pass
+
+    layout = plan_cpu_layout(available_cpus(), read_cgroup_quota(), io_cores=io_cores)
+    versions = {}
+    for package in ("torch", "onnxruntime", "ultralytics", "opencv-python", "opencv-python-headless"):
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            pass
+    return {
+        "machine": platform.machine(),
+        "cpu_model": cpu_model,
+        "cores": layout.cores,
+        "quota_cores": layout.quota_cores,
+        "inference_cores": layout.inference_cores,
+        "runtimes": versions,
+    }
+
+
+def fingerprint(host: Dict[str, Any], target: AutotuneTarget, search: Dict[str, Any]) -> str:
+    """Stable hash of everything a cached profile must match."""
+    blob = json.dumps({"host": host, "target": asdict(target), "search": search}, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+def default_thread_options(inference_cores: int) -> List[int]:
+    """1, 2, 4, ... up to the inference cores (and the cores themselves)."""
+    options, threads = [], 1
+    while threads < inference_cores:
+        options.append(threads)
+        threads *= 2
+    options.append(max(1, inference_cores))
+    return options
+
+
+def candidate_grid(
+    models: Dict[str, str],
+    image_sizes: Sequence[int],
+    batch_sizes: Sequence[int],
+    thread_options: Sequence[int],
+) -> List[Candidate]:
+    """models: type -> file, smallest first (the order is also the quality rank)."""
+    return [
+        Candidate(model, path, size, batch, threads)
+        for model, path in models.items()
+        for threads in sorted(set(thread_options))
+        for size in sorted(set(image_sizes))
+        for batch in sorted(set(batch_sizes))
+    ]
+
+
+# ============================================================================
+# Measuring
+# ============================================================================
+
+def synthetic_frames(count: int, height: int = 1080, width: int = 1920, seed: int = 0) -> List[np.ndarray]:
+    """Noise frames with a few flat blocks, so NMS and letterboxing see realistic work."""
+    rng = np.random.default_rng(seed)
+    block_h, block_w = max(1, height // 16), max(1, width // 20)
+    frames = []
+    for _ in range(count):
+        frame = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        for _ in range(8):
+            y, x = int(rng.integers(0, height - block_h + 1)), int(rng.integers(0, width - block_w + 1))
+            frame[y:y + block_h, x:x + block_w] = rng.integers(0, 256, 3, dtype=np.uint8)
+        frames.append(frame)
+    return frames
+
+
+def _set_torch_threads(threads: int) -> None:
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(threads)
+
+
+def measure(
+    predictors: Sequence[Predictor],
+    candidate: Candidate,
+    frames: Sequence[np.ndarray],
+    iterations: int = 10,
+    warmup_iterations: int = 2,
+) -> Measurement:
+    """Run one caller per predictor, concurrently, for `iterations` batches each."""
+    batch = [frames[i % len(frames)] for i in range(candidate.batch_size)]
+    result = Measurement(candidate=candidate, streams=len(predictors))
+    try:
+        _set_torch_threads(candidate.threads)
+        for predictor in predictors:
+            for _ in range(warmup_iterations):
+                predictor(batch)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+        return result
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+
+    def stream(predictor: Predictor) -> None:
+        _set_torch_threads(candidate.threads)
+        local = []
+        try:
+            for _ in range(iterations):
+                start = time.perf_counter()
+                predictor(batch)
+                local.append((time.perf_counter() - start) * 1000.0)
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+        with lock:
+            latencies.extend(local)
+
+    threads = [
+        threading.Thread(target=stream, args=(predictor,), name=f"autotune-{i}")
+        for i, predictor in enumerate(predictors)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+
+    if errors or not latencies:
+        result.error = errors[0] if errors else "no batches completed"
+        return result
+    result.throughput_fps = round(len(latencies) * candidate.batch_size / wall, 2)
+    result.p50_ms = round(float(np.percentile(latencies, 50)), 2)
+    result.p95_ms = round(float(np.percentile(latencies, 95)), 2)
+    return result
+
+
+def benchmark(
+    candidates: Sequence[Candidate],
+    predictor_factory: PredictorFactory,
+    target: AutotuneTarget,
+    streams: int,
+    frames: Sequence[np.ndarray],
+    iterations: int = 10,
+    warmup_iterations: int = 2,
+    time_budget_s: float = 600.0,
+) -> List[Measurement]:
+    """
+    Measure the candidates, skipping ones that cannot beat an already-missed p95.
+
+    `streams` is the number of detection executors; each stream gets its own
+    predictor (models such as Ultralytics YOLO are not safe to share).
+    """
+    deadline = time.monotonic() + time_budget_s
+    streams = max(1, streams)
+    loaded: Optional[tuple] = None  # one model (per stream) in memory at a time (grid order keeps it loaded)
+    predictors: List[Predictor] = []
+    too_slow: List[Candidate] = []
+    results: List[Measurement] = []
+
+    for candidate in candidates:
+        if time.monotonic() > deadline:
+            logger.warning("autotune_time_budget_exhausted", measured=len(results), total=len(candidates))
+            break
+        if any(
+            c.model == candidate.model and c.threads == candidate.threads
+            and c.image_size <= candidate.image_size and c.batch_size <= candidate.batch_size
+            for c in too_slow
+        ):
+            continue
+
+        key = (candidate.model, candidate.model_path, candidate.image_size, candidate.threads)
+        try:
+            if key != loaded:
+                predictors, loaded = [], None
+                predictors = [predictor_factory(candidate) for _ in range(streams)]
+                loaded = key
+        except Exception as e:
+            results.append(Measurement(candidate, streams=0, error=f"{type(e).__name__}: {e}"))
+            too_slow.append(candidate)
+            continue
+
+        result = measure(predictors, candidate, frames, iterations, warmup_iterations)
+        results.append(result)
+        logger.info("autotune_measured", **asdict(candidate), streams=streams, fps=result.throughput_fps,
+                    p95_ms=result.p95_ms, error=result.error)
+        if result.error is not None or result.p95_ms > target.p95_ms:
+            too_slow.append(candidate)
+    return results
+
+
+# ============================================================================
+# Choosing + caching
+# ============================================================================
+
+def choose(measurements: Sequence[Measurement], target: AutotuneTarget, models: Sequence[str]) -> Optional[Measurement]:
+    """Best candidate for the target (see module docstring); None if nothing ran."""
+    ok = [m for m in measurements if m.error is None]
+    if not ok:
+        return None
+    rank = {model: i for i, model in enumerate(models)}
+    feasible = [m for m in ok if m.meets(target)]
+    if feasible:
+        return max(feasible, key=lambda m: (rank.get(m.candidate.model, -1), m.candidate.image_size, -m.p95_ms))
+    within_latency = [m for m in ok if m.p95_ms <= target.p95_ms] or ok
+    return max(within_latency, key=lambda m: (m.throughput_fps, -m.p95_ms))
+
+
+def profile_settings(chosen: Measurement, backend: str) -> Dict[str, Any]:
+    """Settings overrides for the chosen measurement."""
+    c = chosen.candidate
+    overrides: Dict[str, Any] = {
+        "DETECTION_MODEL_TYPE": c.model,
+        "DETECTION_MODEL_PATH": c.model_path,
+        "DETECTION_IMAGE_SIZE": c.image_size,
+        "BATCH_SIZE": c.batch_size,
+        # CPU_INFERENCE_CONCURRENCY is left to the lifespan, which counts every
+        # model executor (face replicas / batchers too), not just detection;
+        # RPC threads follow the open streams (GRPC_MAX_CONCURRENT_RPCS), which
+        # were not benchmarked
+    }
+    if backend.startswith("onnxruntime"):
+        overrides["DETECTION_ONNX_PATH"] = c.model_path
+        overrides["DETECTION_ONNX_THREADS"] = c.threads
+    else:
+        # torch threads are per process: the CPU budget applies them (and pool /
+        # pre-forked workers inherit them) instead of inference cores / concurrency
+        overrides["CPU_INTRA_OP_THREADS"] = c.threads
+    return overrides
+
+
+def save_profile(path: Path, profile: AutotuneProfile) -> None:
+    """Atomic write (a crash never leaves a half-written profile behind)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(asdict(profile), indent=2, default=str))
+    os.replace(tmp, path)
+
+
+def load_profile(path: Path, expected_fingerprint: Optional[str] = None) -> Optional[AutotuneProfile]:
+    """Cached profile, or None if missing, unreadable, outdated or for another host/target."""
+    try:
+        data = json.loads(Path(path).read_text())
+        profile = AutotuneProfile(**data)
+    except (OSError, ValueError, TypeError):
+        return None
+    if profile.version != PROFILE_VERSION:
+        return None
+    if expected_fingerprint is not None and profile.fingerprint != expected_fingerprint:
+        logger.info("autotune_profile_stale", path=str(path))
+        return None
+    return profile
+
+
+def apply_profile(target_settings: Any, profile: AutotuneProfile) -> None:
+    """Copy the profile's overrides onto the settings object (before models load)."""
+    for name, value in profile.settings.items():
+        if name in ("DETECTION_MODEL_PATH", "DETECTION_ONNX_PATH"):
+            value = Path(value)
+        setattr(target_settings, name, value)
+    logger.info("autotune_profile_applied", meets_target=profile.meets_target, **profile.settings)
+
+
+def tune(
+    candidates: Sequence[Candidate],
+    predictor_factory: PredictorFactory,
+    target: AutotuneTarget,
+    models: Sequence[str],
+    backend: str,
+    host: Dict[str, Any],
+    profile_fingerprint: str,
+    frames: Sequence[np.ndarray],
+    iterations: int = 10,
+    warmup_iterations: int = 2,
+    time_budget_s: float = 600.0,
+    streams: int = 1,
+) -> Optional[AutotuneProfile]:
+    """Benchmark, choose and build the profile (not saved)."""
+    start = time.perf_counter()
+    measurements = benchmark(
+        candidates, predictor_factory, target, streams, frames,
+        iterations=iterations, warmup_iterations=warmup_iterations, time_budget_s=time_budget_s,
+    )
+    chosen = choose(measurements, target, models)
+    if chosen is None:
+        logger.error("autotune_no_candidate_ran", candidates=len(candidates))
+        return None
+
+    profile = AutotuneProfile(
+        fingerprint=profile_fingerprint,
+        host=host,
+        target=asdict(target),
+        chosen=asdict(chosen),
+        meets_target=chosen.meets(target),
+        settings=profile_settings(chosen, backend),
+        measurements=[asdict(m) for m in measurements],
+    )
+    logger.info(
+        "autotune_completed",
+        measured=len(measurements),
+        meets_target=profile.meets_target,
+        elapsed_s=round(time.perf_counter() - start, 1),
+        **profile.settings,
+    )
+    return profile
+
+
+# ============================================================================
+# Settings glue (lifespan + autotune.py CLI)
+# ============================================================================
+
+def model_files(settings: Any) -> Dict[str, str]:
+    """AUTOTUNE_MODELS that exist on disk for the configured backend, smallest first."""
+    suffix = {"onnxruntime": ".onnx", "onnxruntime_int8": ".int8.onnx"}.get(settings.DETECTION_BACKEND, ".pt")
+    found = {}
+    for model in settings.AUTOTUNE_MODELS:
+        path = Path(settings.MODELS_DIR) / f"{model}{suffix}"
+        if model == settings.DETECTION_MODEL_TYPE and not path.exists():
+            configured = Path(settings.get_model_path())
+            path = configured if suffix == ".pt" else configured.with_suffix(suffix)
+        if path.exists():
+            found[model] = str(path)
+        else:
+            logger.info("autotune_model_missing", model=model, path=str(path))
+    return found
+
+
+def detection_executors(settings: Any) -> int:
+    """Detection models serving at once: one per pre-forked server or pool worker, else the in-process batcher."""
+    if settings.GRPC_PREFORK_WORKERS > 0:
+        return settings.GRPC_PREFORK_WORKERS
+    return max(1, settings.INFERENCE_PROCESS_WORKERS)
+
+
+def yolo_predictor_factory(settings: Any) -> PredictorFactory:
+    """Predictors on the configured DETECTION_BACKEND."""
+    def factory(candidate: Candidate) -> Predictor:
+        if settings.DETECTION_BACKEND.startswith("onnxruntime"):
+            from src.services.ml.detection_batching import DetectionParams
+            from src.services.ml.onnx_detector import OnnxYoloDetector
+
+            detector = OnnxYoloDetector(
+                Path(candidate.model_path),
+                image_size=candidate.image_size,
+                intra_op_threads=candidate.threads,
+            )
+            params = DetectionParams(
+                conf_threshold=settings.DETECTION_CONFIDENCE,
+                iou_threshold=settings.DETECTION_IOU_THRESHOLD,
+            )
+            return lambda frames: detector.predict_batch(frames, [params] * len(frames))
+
+        from ultralytics import YOLO
+
+        model = YOLO(candidate.model_path)
+        device = settings.DETECTION_DEVICE
+        return lambda frames: model.predict(
+            frames, imgsz=candidate.image_size, device=device, conf=settings.DETECTION_CONFIDENCE, verbose=False
+        )
+    return factory
+
+
+def autotune_from_settings(force: bool = False, run: bool = True) -> Optional[AutotuneProfile]:
+    """
+    The cached profile for this host and target, else (if `run`) a fresh one
+    that is written to CACHE_DIR / autotune_profile.json.
+    """
+    from src.core.config import settings
+
+    target = AutotuneTarget(
+        cameras=settings.AUTOTUNE_TARGET_CAMERAS,
+        fps=settings.AUTOTUNE_TARGET_FPS,
+        p95_ms=settings.AUTOTUNE_TARGET_P95_MS,
+    )
+    host = host_info(io_cores=settings.CPU_IO_CORES)
+    executors = detection_executors(settings)
+    threads = settings.AUTOTUNE_THREADS or default_thread_options(
+        max(1, host["inference_cores"] // executors)
+    )
+    models = model_files(settings)
+    search = {
+        "backend": settings.DETECTION_BACKEND,
+        "device": settings.DETECTION_DEVICE,
+        "executors": executors,
+        "models": models,
+        "image_sizes": sorted(settings.AUTOTUNE_IMAGE_SIZES),
+        "batch_sizes": sorted(settings.AUTOTUNE_BATCH_SIZES),
+        "threads": sorted(threads),
+    }
+    key = fingerprint(host, target, search)
+    path = Path(settings.CACHE_DIR) / PROFILE_FILENAME
+
+    if not force:
+        cached = load_profile(path, key)
+        if cached is not None:
+            logger.info("autotune_profile_reused", path=str(path), created_at=cached.created_at)
+            return cached
+    if not run:
+        logger.info("autotune_profile_missing", path=str(path))
+        return None
+    if not models:
+        logger.warning("autotune_skipped_no_models", models=settings.AUTOTUNE_MODELS)
+        return None
+
+    frames = synthetic_frames(4, settings.AUTOTUNE_FRAME_HEIGHT, settings.AUTOTUNE_FRAME_WIDTH)
+    profile = tune(
+        candidate_grid(models, settings.AUTOTUNE_IMAGE_SIZES, settings.AUTOTUNE_BATCH_SIZES, threads),
+        yolo_predictor_factory(settings),
+        target,
+        list(models),
+        settings.DETECTION_BACKEND,
+        host,
+        key,
+        frames,
+        iterations=settings.AUTOTUNE_ITERATIONS,
+        warmup_iterations=settings.WARMUP_ITERATIONS,
+        time_budget_s=settings.AUTOTUNE_TIME_BUDGET_S,
+        streams=executors,
+    )
+    if profile is not None:
+        save_profile(path, profile)
+        logger.info("autotune_profile_saved", path=str(path))
+    return profile
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = [
+    "AutotuneProfile",
+    "AutotuneTarget",
+    "Candidate",
+    "Measurement",
+    "apply_profile",
+    "autotune_from_settings",
+    "benchmark",
+    "candidate_grid",
+    "choose",
+    "default_thread_options",
+    "detection_executors",
+    "fingerprint",
+    "host_info",
+    "load_profile",
+    "measure",
+    "profile_settings",
+    "save_profile",
+    "synthetic_frames",
+    "tune",
+]
@@ -0,0 +1,258 @@
+"""
+apps/ai/src/services/ml/batching.py
+Cross-request dynamic micro-batching.
+
+Concurrent callers submit small lists of items (e.g. face crops). A single
+worker thread merges them into one model call, bounded by a maximum batch
+size and a maximum wait, then hands each caller back its own slice.
+
+Worker threads do not survive fork(); batchers restart theirs in the child
+so pre-forked server processes can keep using a batcher built before the fork.
+"""
+
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Generic, List, Optional, Sequence, TypeVar
+
+import structlog
+
+logger = structlog.get_logger("sssp.ai.batching")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class _PendingRequest(Generic[T]):
+    """Items submitted by one caller, plus the future it waits on."""
+    items: List[T]
+    future: Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class BatcherStats:
+    """Counters exposed for logging / metrics."""
+    batches: int = 0
+    items: int = 0
+    requests: int = 0
+    max_batch_seen: int = 0
+    total_queue_wait_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "requests": self.requests,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "max_batch_seen": self.max_batch_seen,
+            "avg_queue_wait_ms": (
+                round(self.total_queue_wait_ms / self.requests, 3) if self.requests else 0.0
+            ),
+        }
+
+
+class DynamicBatcher(Generic[T, R]):
+    """
+    Shared batching queue in front of a batch-capable model call.
+
+    - `batch_fn(items) -> results` must return one result per item, in order
+    - A batch is flushed when it reaches `max_batch_size` items or when the
+      oldest request has waited `max_wait_ms`
+    - Requests larger than `max_batch_size` are split into several model calls
+    - If `batch_fn` raises, every caller in that batch receives the exception
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[T]], Sequence[R]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "batcher",
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+
+        self._batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max(0.0, max_wait_ms) / 1000.0
+        self.name = name
+
+        self._queue: Deque[_PendingRequest[T]] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self.stats = BatcherStats()
+
+        self._worker = self._start_worker()
+        _live_batchers.add(self)
+
+        logger.info(
+            "dynamic_batcher_started",
+            batcher=name,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+        )
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def submit(self, items: Sequence[T]) -> Future:
+        """Queue items for batched execution. Future resolves to List[R]."""
+        future: Future = Future()
+        items = list(items)
+
+        if not items:
+            future.set_result([])
+            return future
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"Batcher '{self.name}' is closed")
+            self._queue.append(_PendingRequest(items=items, future=future))
+            self._cond.notify()
+
+        return future
+
+    def run(self, items: Sequence[T], timeout: Optional[float] = None) -> List[R]:
+        """Submit and block until this caller's results are ready."""
+        return self.submit(items).result(timeout=timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop accepting work, drain what is queued, stop the worker."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+
+        self._worker.join(timeout=timeout)
+        logger.info("dynamic_batcher_stopped", batcher=self.name, **self.stats.to_dict())
+
+    @property
+    def queue_depth(self) -> int:
+        with self._cond:
+            return sum(len(r.items) for r in self._queue)
+
+    # =========================================================================
+    # WORKER
+    # =========================================================================
+
+    def _start_worker(self) -> threading.Thread:
+        worker = threading.Thread(
+            target=self._run,
+            name=f"{self.name}-worker",
+            daemon=True,
+        )
+        worker.start()
+        return worker
+
+    def _reset_after_fork(self) -> None:
+        """Child side of fork(): parent callers never wait here, start clean."""
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self.stats = BatcherStats()
+        if not self._closed:
+            self._worker = self._start_worker()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect_batch()
+            if batch is None:
+                return
+            self._execute(batch)
+
+    def _collect_batch(self) -> Optional[List[_PendingRequest[T]]]:
+        """
+        Block for the first request, then keep merging until the batch is full
+        or the first request's wait budget is used up.
+        """
+        with self._cond:
+            while not self._queue:
+                if self._closed:
+                    return None
+                self._cond.wait()
+
+            first = self._queue.popleft()
+            batch = [first]
+            size = len(first.items)
+            flush_at = first.enqueued_at + self.max_wait_s
+
+            while size < self.max_batch_size:
+                if self._queue:
+                    nxt = self._queue[0]
+                    # Never split a caller across batches: leave it for the next one
+                    if size + len(nxt.items) > self.max_batch_size:
+                        break
+                    self._queue.popleft()
+                    batch.append(nxt)
+                    size += len(nxt.items)
+                    continue
+
+                remaining = flush_at - time.perf_counter()
+                if remaining <= 0 or self._closed:
+                    break
+                self._cond.wait(timeout=remaining)
+
+            return batch
+
+    def _execute(self, batch: List[_PendingRequest[T]]) -> None:
+        now = time.perf_counter()
+        items: List[T] = [item for req in batch for item in req.items]
+
+        try:
+            results: List[R] = []
+            for start in range(0, len(items), self.max_batch_size):
+                chunk = items[start:start + self.max_batch_size]
+                chunk_results = list(self._batch_fn(chunk))
+                if len(chunk_results) != len(chunk):
+                    raise RuntimeError(
+                        f"batch_fn returned {len(chunk_results)} results for {len(chunk)} items"
+                    )
+                results.extend(chunk_results)
+        except BaseException as e:
+            logger.error("dynamic_batch_failed", batcher=self.name, error=str(e), exc_info=True)
+            for req in batch:
+                if not req.future.done():
+                    req.future.set_exception(e)
+            return
+
+        offset = 0
+        for req in batch:
+            n = len(req.items)
+            req.future.set_result(results[offset:offset + n])
+            offset += n
+            self.stats.total_queue_wait_ms += (now - req.enqueued_at) * 1000.0
+
+        self.stats.batches += 1
+        self.stats.items += len(items)
+        self.stats.requests += len(batch)
+        self.stats.max_batch_seen = max(self.stats.max_batch_seen, len(items))
+
+
+# ============================================================================
+# Fork safety
+# ============================================================================
+
+_live_batchers: "weakref.WeakSet[DynamicBatcher]" = weakref.WeakSet()
+
+
+def _restart_batchers_after_fork() -> None:
+    for batcher in list(_live_batchers):
+        batcher._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_batchers_after_fork)
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["DynamicBatcher", "BatcherStats"]
@@ -0,0 +1,96 @@
+"""
+apps/ai/src/services/ml/crop_batch.py
+Batched crop -> resize -> standardize into one NCHW float32 tensor.
+
+- Crops are views of the frame (no copies); each is resized straight into
+  its slot of a uint8 (n, s, s, 3) staging batch (cv2 `dst=`)
+- Colour order, HWC -> CHW and fixed_image_standardization ((x - 127.5) / 128)
+  are one strided ufunc pass over the whole batch into the (n, 3, s, s)
+  output, instead of a cvtColor / astype / transpose per face
+- Staging and output come from the frame buffer pool; the output belongs to
+  the caller, who may release() it once the model has consumed it
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from src.utils.buffer_pool import get_buffer_pool
+
+Box = Tuple[float, float, float, float]  # (x, y, w, h), source pixels
+
+# (x - 127.5) / 128 == x * 2**-7 - 127.5 * 2**-7, exact in float32
+_SCALE = np.float32(1.0 / 128.0)
+_OFFSET = np.float32(127.5 / 128.0)
+
+
+def crop_views(frame: np.ndarray, boxes: Sequence[Box]) -> list:
+    """(x, y, w, h) boxes -> views of `frame`, clipped to its bounds (may be empty)."""
+    height, width = frame.shape[:2]
+    views = []
+    for x, y, w, h in boxes:
+        x1, y1 = max(int(round(x)), 0), max(int(round(y)), 0)
+        x2, y2 = min(int(round(x + w)), width), min(int(round(y + h)), height)
+        views.append(frame[y1:max(y1, y2), x1:max(x1, x2)])
+    return views
+
+
+def preprocess_crops(
+    crops: Sequence[np.ndarray],
+    size: int = 160,
+    color_space: str = "rgb",
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Resize and standardize crops into one (n, 3, size, size) RGB float32 batch.
+
+    Args:
+        crops: HWC uint8 images (views are fine), any size
+        size: Model input side
+        color_space: Channel order of the crops ("rgb" | "bgr")
+        out: Destination batch; a new array when None
+
+    Empty crops leave a mid-grey slot.
+    """
+    n = len(crops)
+    if out is None:
+        out = np.empty((n, 3, size, size), dtype=np.float32)
+    elif out.shape != (n, 3, size, size) or out.dtype != np.float32:
+        raise ValueError(f"out must be float32 {(n, 3, size, size)}, got {out.dtype} {out.shape}")
+
+    pool = get_buffer_pool()
+    staging = pool.acquire((n, size, size, 3), np.uint8)
+    try:
+        for slot, crop in zip(staging, crops):
+            if crop.size == 0:
+                slot.fill(128)
+            elif crop.shape[:2] == (size, size):
+                slot[...] = crop
+            else:
+                cv2.resize(crop, (size, size), dst=slot, interpolation=cv2.INTER_LINEAR)
+
+        src = staging[..., ::-1] if color_space == "bgr" else staging
+        np.multiply(src.transpose(0, 3, 1, 2), _SCALE, out=out, casting="unsafe")
+        np.subtract(out, _OFFSET, out=out)
+    finally:
+        pool.release(staging)
+    return out
+
+
+def preprocess_boxes(
+    frame: np.ndarray,
+    boxes: Sequence[Box],
+    size: int = 160,
+    color_space: str = "bgr",
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """preprocess_crops() on (x, y, w, h) regions of a decoded frame (BGR by default)."""
+    return preprocess_crops(crop_views(frame, boxes), size, color_space, out=out)
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["crop_views", "preprocess_boxes", "preprocess_crops"]
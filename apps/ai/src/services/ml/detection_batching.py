@@ -0,0 +1,323 @@
+"""
+apps/ai/src/services/ml/detection_batching.py
+Cross-stream batched YOLO inference.
+
+Letterboxed frames from concurrent requests/streams are stacked into one
+tensor and run through a single forward pass. NMS is then applied per image
+with that caller's own confidence / IoU / class / max_det settings, so
+requests with different thresholds still share the expensive part.
+
+With `batch_buckets`, a forward pass is padded with blank frames up to the
+next bucket size (the batch sizes warmup ran), so the model only ever sees
+those batch shapes.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+from src.schemas.detection import BoundingBox, Detection, ImageMetadata
+from src.services.ml.batching import DynamicBatcher
+from src.services.ml.shape_buckets import batch_bucket
+
+logger = structlog.get_logger("sssp.ai.detection_batching")
+
+# (detections, image_metadata, metrics) - same contract as detector.predict()
+PredictResult = Tuple[List[Detection], ImageMetadata, Dict[str, float]]
+
+
+@dataclass
+class DetectionParams:
+    """Per-request post-processing settings."""
+    conf_threshold: float = 0.25
+    iou_threshold: float = 0.45
+    target_classes: Optional[List[str]] = None
+    max_detections: int = 300
+
+
+@dataclass
+class _DetectionJob:
+    image: np.ndarray
+    params: DetectionParams
+
+
+class BatchedYoloEngine:
+    """
+    Batching inference engine in front of the YOLO detector.
+
+    Backend resolution (first match wins):
+    1. detector.predict_batch(images, params)      - backends with native batching
+    2. Ultralytics YOLO at detector.model          - letterbox + one forward + per-image NMS
+    3. detector.predict(...) per image             - fallback, still serialized on one worker
+    """
+
+    def __init__(
+        self,
+        detector: Any,
+        image_size: int = 640,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 5.0,
+        batch_buckets: Sequence[int] = (),
+    ) -> None:
+        self.detector = detector
+        self.image_size = image_size
+        self.max_batch_size = max_batch_size
+        self.batch_buckets = sorted(b for b in set(batch_buckets) if b <= max_batch_size)
+
+        self._native_batch = getattr(detector, "predict_batch", None)
+        self._yolo = getattr(detector, "model", None)
+        self._net = getattr(self._yolo, "model", None)
+        self._names: Dict[int, str] = dict(
+            getattr(self._yolo, "names", None) or getattr(self._net, "names", None) or {}
+        )
+        self._name_to_id = {name: idx for idx, name in self._names.items()}
+        self._stride = self._resolve_stride()
+        self._padding_image: Optional[np.ndarray] = None
+
+        if self._native_batch is not None:
+            self.mode = "native"
+        elif self._net is not None and hasattr(self._net, "parameters"):
+            self.mode = "ultralytics"
+        else:
+            self.mode = "sequential"
+
+        self._batcher: DynamicBatcher[_DetectionJob, PredictResult] = DynamicBatcher(
+            batch_fn=self._infer_jobs,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name="yolo_detector",
+        )
+
+        logger.info(
+            "batched_yolo_engine_initialized",
+            mode=self.mode,
+            image_size=image_size,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            batch_buckets=self.batch_buckets or None,
+        )
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def predict(
+        self,
+        image: np.ndarray,
+        conf_threshold: float = 0.25,
+        iou_threshold: float = 0.45,
+        target_classes: Optional[List[str]] = None,
+        max_detections: int = 300,
+    ) -> PredictResult:
+        """Drop-in replacement for detector.predict() that joins the shared batch."""
+        params = DetectionParams(
+            conf_threshold=conf_threshold,
+            iou_threshold=iou_threshold,
+            target_classes=target_classes,
+            max_detections=max_detections,
+        )
+        return self._batcher.run([_DetectionJob(image=image, params=params)])[0]
+
+    def predict_batch(
+        self,
+        images: Sequence[np.ndarray],
+        params: Sequence[DetectionParams],
+    ) -> List[PredictResult]:
+        """Run a caller-assembled batch directly (bypasses the shared queue)."""
+        jobs = [_DetectionJob(image=img, params=p) for img, p in zip(images, params)]
+        results: List[PredictResult] = []
+        for start in range(0, len(jobs), self.max_batch_size):
+            results.extend(self._infer_jobs(jobs[start:start + self.max_batch_size]))
+        return results
+
+    def close(self) -> None:
+        self._batcher.close()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {"mode": self.mode, **self._batcher.stats.to_dict()}
+
+    # =========================================================================
+    # INFERENCE
+    # =========================================================================
+
+    def _infer_jobs(self, jobs: List[_DetectionJob]) -> List[PredictResult]:
+        n = len(jobs)
+        bucket = batch_bucket(n, self.batch_buckets)
+        if self.mode == "sequential" or bucket == n:
+            return self._infer_batch(jobs)
+        return self._infer_batch(jobs + [self._padding_job()] * (bucket - n))[:n]
+
+    def _infer_batch(self, jobs: List[_DetectionJob]) -> List[PredictResult]:
+        if self.mode == "native":
+            return list(self._native_batch([j.image for j in jobs], [j.params for j in jobs]))
+
+        if self.mode == "ultralytics":
+            return self._infer_ultralytics(jobs)
+
+        return [
+            self.detector.predict(
+                image=j.image,
+                conf_threshold=j.params.conf_threshold,
+                iou_threshold=j.params.iou_threshold,
+                target_classes=j.params.target_classes,
+                max_detections=j.params.max_detections,
+            )
+            for j in jobs
+        ]
+
+    def _infer_ultralytics(self, jobs: List[_DetectionJob]) -> List[PredictResult]:
+        import torch
+        from ultralytics.data.augment import LetterBox
+        from ultralytics.utils import ops
+
+        t0 = time.perf_counter()
+
+        # Preprocess: letterbox every frame to the same square so they stack
+        letterbox = LetterBox(new_shape=(self.image_size, self.image_size), auto=False, stride=self._stride)
+        batch = np.stack([letterbox(image=j.image) for j in jobs])
+        batch = np.ascontiguousarray(batch[..., ::-1].transpose(0, 3, 1, 2))  # BGR->RGB, BHWC->BCHW
+
+        param = next(self._net.parameters())
+        tensor = torch.from_numpy(batch).to(param.device)
+        tensor = tensor.half() if param.dtype == torch.float16 else tensor.float()
+        tensor /= 255.0
+
+        t1 = time.perf_counter()
+
+        # Single forward pass for the whole batch
+        with torch.inference_mode():
+            preds = self._net(tensor)
+        if isinstance(preds, (list, tuple)):
+            preds = preds[0]
+
+        t2 = time.perf_counter()
+
+        # Per-image NMS with each caller's own thresholds
+        results: List[PredictResult] = []
+        for i, job in enumerate(jobs):
+            classes = self._class_ids(job.params.target_classes)
+            if classes is not None and not classes:
+                out = preds.new_zeros((0, 6))
+            else:
+                out = ops.non_max_suppression(
+                    preds[i:i + 1],
+                    conf_thres=job.params.conf_threshold,
+                    iou_thres=job.params.iou_threshold,
+                    classes=classes,
+                    max_det=job.params.max_detections,
+                )[0]
+            if len(out):
+                out[:, :4] = ops.scale_boxes(tensor.shape[2:], out[:, :4], job.image.shape)
+            results.append(out.cpu().numpy())
+
+        t3 = time.perf_counter()
+
+        metrics = {
+            "preprocessing_time_ms": round((t1 - t0) * 1000.0, 2),
+            "inference_time_ms": round((t2 - t1) * 1000.0, 2),
+            "postprocessing_time_ms": round((t3 - t2) * 1000.0, 2),
+            "total_time_ms": round((t3 - t0) * 1000.0, 2),
+            "batch_size": len(jobs),
+        }
+
+        return [
+            (self._to_detections(out, job.image.shape), self._image_metadata(job.image), dict(metrics))
+            for out, job in zip(results, jobs)
+        ]
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+
+    def _padding_job(self) -> _DetectionJob:
+        """Blank letterbox-grey frame; a confidence of 1.0 keeps its NMS empty."""
+        if self._padding_image is None:
+            self._padding_image = np.full((self.image_size, self.image_size, 3), 114, dtype=np.uint8)
+        return _DetectionJob(image=self._padding_image, params=DetectionParams(conf_threshold=1.0))
+
+    def _resolve_stride(self) -> int:
+        stride = getattr(self._net, "stride", None)
+        try:
+            return int(max(stride)) if stride is not None else 32
+        except TypeError:
+            return int(stride)
+
+    def _class_ids(self, target_classes: Optional[List[str]]) -> Optional[List[int]]:
+        """Map class names to model ids. None means 'all classes'."""
+        if not target_classes:
+            return None
+        return [self._name_to_id[c] for c in target_classes if c in self._name_to_id]
+
+    def _to_detections(self, out: np.ndarray, shape: Tuple[int, ...]) -> List[Detection]:
+        h, w = shape[:2]
+        detections: List[Detection] = []
+        for x1, y1, x2, y2, conf, cls in out:
+            class_id = int(cls)
+            detections.append(
+                Detection(
+                    class_name=self._names.get(class_id, str(class_id)),
+                    class_id=class_id,
+                    confidence=float(conf),
+                    bbox=BoundingBox(
+                        x1=float(x1),
+                        y1=float(y1),
+                        x2=float(x2),
+                        y2=float(y2),
+                        x1_norm=float(x1) / w,
+                        y1_norm=float(y1) / h,
+                        x2_norm=float(x2) / w,
+                        y2_norm=float(y2) / h,
+                    ),
+                    area=float((x2 - x1) * (y2 - y1)),
+                )
+            )
+        return detections
+
+    @staticmethod
+    def _image_metadata(image: np.ndarray) -> ImageMetadata:
+        h, w = image.shape[:2]
+        channels = image.shape[2] if image.ndim == 3 else 1
+        return ImageMetadata(width=w, height=h, channels=channels)
+
+
+# ============================================================================
+# Shared engine (one per detector, shared by REST + gRPC)
+# ============================================================================
+
+_engine: Optional[BatchedYoloEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_detection_engine(
+    detector: Any,
+    image_size: int,
+    max_batch_size: int,
+    max_wait_ms: float,
+    batch_buckets: Sequence[int] = (),
+) -> BatchedYoloEngine:
+    """Get or create the process-wide batching engine for `detector`."""
+    global _engine
+    with _engine_lock:
+        if _engine is None or _engine.detector is not detector:
+            if _engine is not None:
+                _engine.close()
+            _engine = BatchedYoloEngine(
+                detector,
+                image_size=image_size,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+                batch_buckets=batch_buckets,
+            )
+        return _engine
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["BatchedYoloEngine", "DetectionParams", "get_detection_engine"]
@@ -0,0 +1,76 @@
+"""
+apps/ai/src/services/ml/detector_backends.py
+Detector backend selection (DETECTION_BACKEND).
+
+- ultralytics: the PyTorch YOLO from model_loader (default)
+- onnxruntime: OnnxYoloDetector over the exported .onnx weights
+  (DETECTION_ONNX_PATH, or DETECTION_MODEL_PATH with an .onnx suffix)
+- onnxruntime_int8: the same detector over the static INT8 model written
+  next to it by quantize_models.py (<stem>.int8.onnx)
+
+Both expose the detector.predict() contract, so ObjectDetectionService and
+BatchedYoloEngine work the same whichever one is selected.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from src.core.config import settings
+from src.core.cpu_budget import intra_op_threads
+from src.core.logging import get_logger
+from src.models.object.model_loader import get_detector
+
+logger = get_logger("detector_backends")
+
+_onnx_detector: Optional[Any] = None
+_onnx_lock = threading.Lock()
+
+
+def onnx_model_path() -> Path:
+    """Where the ONNX backend loads its weights from."""
+    if settings.DETECTION_ONNX_PATH is not None:
+        path = Path(settings.DETECTION_ONNX_PATH)
+    else:
+        path = Path(settings.get_model_path()).with_suffix(".onnx")
+    if settings.DETECTION_BACKEND == "onnxruntime_int8":
+        path = path.with_suffix(".int8.onnx")
+    return path
+
+
+def get_detector_backend() -> Any:
+    """Process-wide detector for the configured backend (loaded on first use)."""
+    if not settings.DETECTION_BACKEND.startswith("onnxruntime"):
+        return get_detector()
+
+    global _onnx_detector
+    with _onnx_lock:
+        if _onnx_detector is None:
+            from src.services.ml.onnx_detector import OnnxYoloDetector
+
+            _onnx_detector = OnnxYoloDetector(
+                onnx_model_path(),
+                image_size=settings.DETECTION_IMAGE_SIZE,
+                intra_op_threads=settings.DETECTION_ONNX_THREADS or intra_op_threads(),
+            )
+            logger.info("detector_backend_loaded", backend=settings.DETECTION_BACKEND)
+        return _onnx_detector
+
+
+def _drop_onnx_session_after_fork() -> None:
+    # ORT's intra-op thread pool does not survive fork(); children build their own session
+    global _onnx_detector, _onnx_lock
+    _onnx_detector = None
+    _onnx_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_drop_onnx_session_after_fork)
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["get_detector_backend", "onnx_model_path"]
@@ -0,0 +1,280 @@
+"""
+apps/ai/src/services/ml/face_detectors.py
+Face detector registry (FACE_DETECTOR_BACKEND / FACE_DETECTOR_CAMERA_BACKENDS).
+
+- mtcnn: facenet-pytorch MTCNN via src.models.face.detector.FaceDetector (default)
+- yunet: OpenCV's FaceDetectorYN over the YuNet ONNX model; a single-stage
+  CPU detector, roughly an order of magnitude cheaper than MTCNN's
+  three-stage cascade + image pyramid on 1080p frames
+
+Every backend implements `detect_with_quality(image_bgr, confidence_threshold,
+return_crops)` and returns DetectedFace-shaped records (bbox as (x, y, w, h),
+confidence, 5-point landmarks, quality, RGB crop), so FaceRecognitionService
+and the embedder do not care which one produced a face.
+"""
+
+import threading
+from dataclasses import dataclass, is_dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+import structlog
+
+from src.core.exceptions import ModelLoadException
+
+logger = structlog.get_logger("sssp.ai.face_detectors")
+
+YUNET_MODEL_NAME = "face_detection_yunet_2023mar.onnx"
+
+_SHARPNESS_SCALE = 500.0  # Laplacian variance that counts as fully sharp
+_SIZE_SCALE = 112.0  # face side (px) above which size no longer limits quality
+
+
+# ============================================================================
+# Records
+# ============================================================================
+
+@dataclass
+class FaceQuality:
+    overall_score: float
+    sharpness: float
+    brightness: float
+    face_size_pixels: int
+
+
+@dataclass
+class YuNetFace:
+    """Same fields as src.models.face.detector.DetectedFace."""
+    bbox: tuple  # (x, y, w, h) in frame pixels
+    confidence: float
+    landmarks: np.ndarray  # (5, 2): right eye, left eye, nose, right / left mouth corner
+    quality: FaceQuality
+    crop: Optional[np.ndarray] = None  # RGB, like the MTCNN detector's crops
+
+
+def assess_quality(face_bgr: np.ndarray) -> FaceQuality:
+    """Sharpness (Laplacian variance), brightness and size, each scaled to [0, 1]."""
+    h, w = face_bgr.shape[:2]
+    gray = cv2.cvtColor(face_bgr, cv2.COLOR_BGR2GRAY)
+    sharpness = min(float(cv2.Laplacian(gray, cv2.CV_64F).var()) / _SHARPNESS_SCALE, 1.0)
+    brightness = float(gray.mean()) / 255.0
+    size = min(w, h)
+
+    exposure = 1.0 - abs(brightness - 0.5) * 2.0
+    overall = 0.4 * sharpness + 0.3 * min(size / _SIZE_SCALE, 1.0) + 0.3 * exposure
+    return FaceQuality(
+        overall_score=round(overall, 4),
+        sharpness=round(sharpness, 4),
+        brightness=round(brightness, 4),
+        face_size_pixels=int(size),
+    )
+
+
+# ============================================================================
+# YuNet
+# ============================================================================
+
+def faces_from_yunet(
+    raw: Optional[np.ndarray],
+    image: np.ndarray,
+    min_face_size: int = 40,
+    max_faces: int = 10,
+    quality_threshold: float = 0.0,
+    return_crops: bool = True,
+) -> List[YuNetFace]:
+    """
+    Convert FaceDetectorYN rows (x, y, w, h, 10 landmark coords, score) into
+    face records: clipped to the frame, size / quality filtered, best first.
+    """
+    if raw is None or len(raw) == 0:
+        return []
+
+    height, width = image.shape[:2]
+    faces: List[YuNetFace] = []
+    for row in raw[np.argsort(-raw[:, 14])]:
+        x1, y1 = max(int(row[0]), 0), max(int(row[1]), 0)
+        x2, y2 = min(int(row[0] + row[2]), width), min(int(row[1] + row[3]), height)
+        if min(x2 - x1, y2 - y1) < min_face_size:
+            continue
+
+        region = image[y1:y2, x1:x2]
+        quality = assess_quality(region)
+        if quality.overall_score < quality_threshold:
+            continue
+
+        faces.append(YuNetFace(
+            bbox=(x1, y1, x2 - x1, y2 - y1),
+            confidence=float(row[14]),
+            landmarks=row[4:14].reshape(5, 2).astype(np.float32),
+            quality=quality,
+            crop=cv2.cvtColor(region, cv2.COLOR_BGR2RGB) if return_crops else None,
+        ))
+        if len(faces) >= max_faces:
+            break
+    return faces
+
+
+class YuNetFaceDetector:
+    """
+    OpenCV YuNet face detector.
+
+    cv2.FaceDetectorYN keeps the input size and thresholds as state, so each
+    RPC thread gets its own instance (the model is ~230 KB).
+    """
+
+    backend = "yunet"
+
+    def __init__(
+        self,
+        model_path: Path,
+        min_face_size: int = 40,
+        max_faces: int = 10,
+        quality_threshold: float = 0.0,
+        keep_all: bool = True,
+        nms_threshold: float = 0.3,
+    ) -> None:
+        if not hasattr(cv2, "FaceDetectorYN"):
+            raise ModelLoadException(str(model_path), "OpenCV >= 4.5.4 is required for YuNet")
+        if not Path(model_path).exists():
+            raise ModelLoadException(
+                str(model_path), "YuNet model not found (download face_detection_yunet_2023mar.onnx)"
+            )
+
+        self.model_path = Path(model_path)
+        self.min_face_size = min_face_size
+        self.max_faces = max_faces if keep_all else 1
+        self.quality_threshold = quality_threshold
+        self.nms_threshold = nms_threshold
+        self._local = threading.local()
+        self._create()  # fail at load time, not on the first frame
+
+        logger.info("yunet_detector_loaded", model_path=str(model_path))
+
+    def detect_with_quality(
+        self,
+        image: np.ndarray,
+        confidence_threshold: float = 0.7,
+        return_crops: bool = True,
+    ) -> List[YuNetFace]:
+        detector = getattr(self._local, "detector", None) or self._create()
+        height, width = image.shape[:2]
+        detector.setInputSize((width, height))
+        detector.setScoreThreshold(confidence_threshold)
+        _, raw = detector.detect(image)
+        return faces_from_yunet(
+            raw,
+            image,
+            min_face_size=self.min_face_size,
+            max_faces=self.max_faces,
+            quality_threshold=self.quality_threshold,
+            return_crops=return_crops,
+        )
+
+    def close(self) -> None:
+        self._local = threading.local()
+
+    def _create(self) -> Any:
+        detector = cv2.FaceDetectorYN.create(
+            str(self.model_path), "", (320, 320), 0.7, self.nms_threshold, 5000
+        )
+        self._local.detector = detector
+        return detector
+
+
+# ============================================================================
+# Wrappers
+# ============================================================================
+
+def replace_fields(record: Any, changes: Dict[str, Any]) -> Any:
+    """`record` (a face / quality record) with `changes`: a copy for dataclasses, updated in place otherwise."""
+    if is_dataclass(record):
+        return replace(record, **changes)
+    for key, value in changes.items():
+        setattr(record, key, value)
+    return record
+
+
+class FaceDetectorWrapper:
+    """Base for detectors that wrap a backend (same detect_with_quality interface); close() is passed on."""
+
+    def __init__(self, detector: Any) -> None:
+        self.detector = detector
+
+    def close(self) -> None:
+        close = getattr(self.detector, "close", None)
+        if close is not None:
+            close()
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+FaceDetectorFactory = Callable[[Any], Any]  # DetectionConfig -> detector
+
+_FACE_DETECTORS: Dict[str, FaceDetectorFactory] = {}
+
+
+def register_face_detector(name: str) -> Callable[[FaceDetectorFactory], FaceDetectorFactory]:
+    def decorator(factory: FaceDetectorFactory) -> FaceDetectorFactory:
+        _FACE_DETECTORS[name] = factory
+        return factory
+    return decorator
+
+
+def available_face_detectors() -> List[str]:
+    return sorted(_FACE_DETECTORS)
+
+
+def build_face_detector(name: str, config: Any) -> Any:
+    """Instantiate the `name` backend from a DetectionConfig."""
+    try:
+        factory = _FACE_DETECTORS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown face detector '{name}' (available: {', '.join(available_face_detectors())})"
+        )
+    detector = factory(config)
+    logger.info("face_detector_built", backend=name)
+    return detector
+
+
+@register_face_detector("mtcnn")
+def _mtcnn(config: Any) -> Any:
+    from src.models.face.detector import FaceDetector
+
+    return FaceDetector(config)
+
+
+@register_face_detector("yunet")
+def _yunet(config: Any) -> YuNetFaceDetector:
+    from src.core.config import settings
+
+    return YuNetFaceDetector(
+        settings.FACE_DETECTOR_YUNET_PATH or settings.MODELS_DIR / YUNET_MODEL_NAME,
+        min_face_size=config.min_face_size,
+        max_faces=config.max_faces,
+        quality_threshold=config.quality_threshold,
+        keep_all=config.keep_all,
+    )
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = [
+    "FaceDetectorWrapper",
+    "FaceQuality",
+    "YUNET_MODEL_NAME",
+    "YuNetFace",
+    "YuNetFaceDetector",
+    "assess_quality",
+    "available_face_detectors",
+    "build_face_detector",
+    "faces_from_yunet",
+    "register_face_detector",
+    "replace_fields",
+]
@@ -0,0 +1,210 @@
+"""
+apps/ai/src/services/ml/frame_analysis.py
+Frame Analysis Service - one decode, several analyzers
+
+- The JPEG/PNG is decoded once; every analyzer reads the same BGR buffer
+- objects / waste run on a small thread pool (and join the cross-request
+  YOLO batch), faces run on the calling thread at the same time
+- faces_in_persons: faces are searched only inside the person boxes
+  (PersonFaceCascade), so they wait for the object results
+- A failing analyzer does not fail the frame; it is reported in
+  failed_analyzers and the others are still returned
+"""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.core.config import settings
+from src.core.deadline import Deadline
+from src.core.exceptions import DeadlineExceededException, InvalidImageException
+from src.core.logging import get_logger
+from src.schemas.detection import DetectRequest, DetectResponse
+from src.services.ml.object_detection import ObjectDetectionService
+from src.services.ml.person_cascade import person_boxes
+from src.utils.image_decode import decode_image
+
+logger = get_logger("frame_analysis_service")
+
+ANALYZERS = ("objects", "waste", "faces", "face_embeddings")
+DEFAULT_ANALYZERS = ("objects", "face_embeddings")
+
+
+class FrameAnalysisService:
+    """
+    Runs object, waste and face analyzers on one decoded frame.
+
+    Works with the in-process services and with their worker-pool facades
+    (RemoteObjectDetectionService / RemoteFaceService).
+    """
+
+    def __init__(self, face_service: Any, detection_service: Any, max_workers: int = 4) -> None:
+        self.face_service = face_service
+        self.detection_service = detection_service
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="frame-analysis")
+        logger.info("frame_analysis_service_initialized", max_workers=max_workers)
+
+    def analyze_frame(
+        self,
+        image_bytes: bytes,
+        analyzers: Sequence[str] = DEFAULT_ANALYZERS,
+        camera_id: str = "unknown",
+        request_id: Optional[str] = None,
+        timestamp: Optional[int] = None,
+        object_confidence_threshold: Optional[float] = None,
+        iou_threshold: Optional[float] = None,
+        target_classes: Optional[List[str]] = None,
+        max_detections: Optional[int] = None,
+        face_confidence_threshold: float = 0.7,
+        max_faces: int = 10,
+        faces_in_persons_only: bool = False,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        """
+        Decode once and run `analyzers` on the frame.
+
+        Returns:
+            Dict with keys: success, error_message, camera_id, request_id,
+            timestamp, image (width/height/channels), objects, waste
+            (DetectResponse or None), faces (process_frame result or None),
+            decode_ms, time_ms, partial, skipped_stages, failed_analyzers
+        """
+        start = time.perf_counter()
+        analyzers = [a for a in ANALYZERS if a in set(analyzers or DEFAULT_ANALYZERS)]
+        result: Dict[str, Any] = {
+            "success": False,
+            "error_message": "",
+            "camera_id": camera_id,
+            "request_id": request_id,
+            "timestamp": timestamp or int(time.time() * 1000),
+            "objects": None,
+            "waste": None,
+            "faces": None,
+            "skipped_stages": [],
+            "failed_analyzers": [],
+        }
+
+        try:
+            if deadline is not None:
+                deadline.check("decode")
+            frame = self._decode(image_bytes)
+        except (DeadlineExceededException, InvalidImageException) as e:
+            logger.warning("frame_analysis_decode_failed", camera_id=camera_id, error=e.message)
+            result["error_message"] = e.message
+            return result
+
+        decode_ms = (time.perf_counter() - start) * 1000.0
+        h, w = frame.shape[:2]
+        result.update(
+            success=True,
+            image={"width": w, "height": h, "channels": frame.shape[2] if frame.ndim == 3 else 1},
+            decode_ms=round(decode_ms, 2),
+        )
+
+        base_request = DetectRequest(
+            image=b"",  # already decoded
+            confidence_threshold=object_confidence_threshold or settings.DETECTION_CONFIDENCE,
+            iou_threshold=iou_threshold or settings.DETECTION_IOU_THRESHOLD,
+            target_classes=list(target_classes or []),
+            camera_id=camera_id,
+            timestamp=result["timestamp"],
+            request_id=request_id,
+            max_detections=max_detections or settings.DETECTION_MAX_DETECTIONS,
+        )
+
+        # Object analyzers on the pool; they batch with other callers' YOLO work
+        futures: Dict[str, Future] = {}
+        if "objects" in analyzers:
+            futures["objects"] = self._submit(frame, base_request, deadline)
+        if "waste" in analyzers:
+            waste_request = ObjectDetectionService.waste_request(base_request.model_copy())
+            futures["waste"] = self._submit(frame, waste_request, deadline)
+
+        persons: Optional[List[List[float]]] = None
+        if faces_in_persons_only and ({"faces", "face_embeddings"} & set(analyzers)):
+            person_future = futures.get("objects")
+            if person_future is None or (target_classes and "person" not in target_classes):
+                person_request = base_request.model_copy(update={"target_classes": ["person"]})
+                person_future = self._submit(frame, person_request, deadline)
+            # A shared objects future records its own failure when collected below
+            shared = person_future is futures.get("objects")
+            person_response = self._collect("persons", person_future, None if shared else result)
+            if person_response is not None and person_response.success:
+                persons = person_boxes(person_response.detections)
+            # otherwise persons stays None: full-frame face scan rather than "no person"
+
+        # Faces on this thread, overlapping the YOLO work
+        if "faces" in analyzers or "face_embeddings" in analyzers:
+            try:
+                result["faces"] = self.face_service.process_frame(
+                    frame=frame,
+                    camera_id=camera_id,
+                    confidence_threshold=face_confidence_threshold,
+                    max_faces=max_faces,
+                    skip_embedding="face_embeddings" not in analyzers,
+                    deadline=deadline,
+                    person_boxes=persons,
+                )
+                result["skipped_stages"].extend(result["faces"].get("skipped_stages") or [])
+            except DeadlineExceededException:
+                result["skipped_stages"].append("faces")
+            except Exception as e:
+                logger.error("frame_analysis_faces_failed", camera_id=camera_id, error=str(e), exc_info=True)
+                result["failed_analyzers"].append(f"faces: {e}")
+
+        for name, future in futures.items():
+            result[name] = self._collect(name, future, result)
+
+        result["partial"] = bool(result["skipped_stages"] or result["failed_analyzers"])
+        result["time_ms"] = round((time.perf_counter() - start) * 1000.0, 2)
+
+        logger.info(
+            "frame_analysis_completed",
+            camera_id=camera_id,
+            analyzers=analyzers,
+            objects=result["objects"].total_objects if result["objects"] is not None else None,
+            faces=len(result["faces"]["faces"]) if result["faces"] is not None else None,
+            cascade=persons is not None,
+            decode_ms=result["decode_ms"],
+            time_ms=result["time_ms"],
+            partial=result["partial"],
+        )
+        return result
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+
+    @staticmethod
+    def _decode(image_bytes: bytes) -> np.ndarray:
+        # Full size: object boxes are reported in source pixels
+        return decode_image(image_bytes, max_source_pixels=settings.IMAGE_MAX_SOURCE_PIXELS)
+
+    def _submit(self, frame: np.ndarray, request: DetectRequest, deadline: Optional[Deadline]) -> Future:
+        return self._pool.submit(self.detection_service.detect_decoded, frame, request, deadline)
+
+    @staticmethod
+    def _collect(name: str, future: Future, result: Optional[Dict[str, Any]]) -> Optional[DetectResponse]:
+        """Wait for an object analyzer; failures are recorded in `result` (if given), not raised."""
+        try:
+            response = future.result()
+        except Exception as e:
+            if result is not None:
+                logger.error("frame_analysis_analyzer_failed", analyzer=name, error=str(e), exc_info=True)
+                result["failed_analyzers"].append(f"{name}: {e}")
+            return None
+        if not response.success and result is not None:
+            result["failed_analyzers"].append(f"{name}: {response.error_message}")
+        return response
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["ANALYZERS", "DEFAULT_ANALYZERS", "FrameAnalysisService"]
@@ -0,0 +1,120 @@
+"""
+apps/ai/src/services/ml/multiscale.py
+Two-resolution face detection: find faces on a small proxy, crop them from the source.
+
+- The frame is shrunk (INTER_AREA) so its long side is FACE_DETECT_MAX_DIMENSION
+  and the face detector runs on the proxy without crops
+- FACE_DETECT_MIN_FACE_PX keeps the proxy large enough that a face of that
+  size (in source pixels) is still >= the detector's min_face_size
+- Boxes and landmarks are scaled back to the source and crops are cut from
+  the full-resolution decode, so the embedder sees every source pixel of
+  distant faces
+
+Detection cost follows the proxy size, embedding quality the source size.
+"""
+
+from typing import Any, List, Tuple
+
+import cv2
+import numpy as np
+import structlog
+
+from src.services.ml.face_detectors import FaceDetectorWrapper, replace_fields
+from src.utils.buffer_pool import get_buffer_pool
+
+logger = structlog.get_logger("sssp.ai.multiscale")
+
+
+def proxy_scale(
+    shape: Tuple[int, ...],
+    max_dimension: int,
+    detector_min_face: int = 40,
+    min_face_size: int = 0,
+) -> float:
+    """
+    Source -> proxy scale factor (<= 1.0).
+
+    Args:
+        shape: Source image shape
+        max_dimension: Long side of the proxy
+        detector_min_face: Smallest face (proxy px) the detector reports
+        min_face_size: Smallest face (source px) that must still be found; 0 = no floor
+    """
+    height, width = shape[:2]
+    scale = float(max_dimension) / float(max(height, width))
+    if min_face_size > 0:
+        scale = max(scale, float(detector_min_face) / float(min_face_size))
+    return min(scale, 1.0)
+
+
+def rescale_face(face: Any, image: np.ndarray, sx: float, sy: float, return_crop: bool) -> Any:
+    """Proxy-space face -> source-space face, crop (RGB) cut from `image`."""
+    height, width = image.shape[:2]
+    x, y, w, h = face.bbox
+    x1, y1 = max(int(round(x * sx)), 0), max(int(round(y * sy)), 0)
+    x2, y2 = min(int(round((x + w) * sx)), width), min(int(round((y + h) * sy)), height)
+
+    changes = {"bbox": (x1, y1, x2 - x1, y2 - y1)}
+    landmarks = getattr(face, "landmarks", None)
+    if landmarks is not None:
+        changes["landmarks"] = np.asarray(landmarks, dtype=np.float32) * np.array([sx, sy], dtype=np.float32)
+    if return_crop and x2 > x1 and y2 > y1:
+        changes["crop"] = cv2.cvtColor(image[y1:y2, x1:x2], cv2.COLOR_BGR2RGB)
+    elif hasattr(face, "crop"):
+        changes["crop"] = None  # never hand out views of the (pooled) proxy
+
+    quality = getattr(face, "quality", None)
+    if quality is not None:
+        changes["quality"] = replace_fields(quality, {"face_size_pixels": int(min(x2 - x1, y2 - y1))})
+    return replace_fields(face, changes)
+
+
+class MultiScaleFaceDetector(FaceDetectorWrapper):
+    """
+    Wraps any face detector backend (same detect_with_quality interface).
+
+    Images already smaller than the proxy are passed straight through.
+    """
+
+    def __init__(
+        self,
+        detector: Any,
+        max_dimension: int = 640,
+        min_face_size: int = 0,
+        detector_min_face: int = 40,
+    ) -> None:
+        super().__init__(detector)
+        self.max_dimension = max_dimension
+        self.min_face_size = min_face_size
+        self.detector_min_face = detector_min_face
+
+    def detect_with_quality(
+        self,
+        image: np.ndarray,
+        confidence_threshold: float = 0.7,
+        return_crops: bool = True,
+    ) -> List[Any]:
+        scale = proxy_scale(image.shape, self.max_dimension, self.detector_min_face, self.min_face_size)
+        if scale >= 1.0:
+            return self.detector.detect_with_quality(
+                image, confidence_threshold=confidence_threshold, return_crops=return_crops
+            )
+
+        height, width = image.shape[:2]
+        proxy_w, proxy_h = max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+        # The proxy only lives for the detector call: reuse a pooled buffer
+        with get_buffer_pool().borrow((proxy_h, proxy_w) + image.shape[2:], image.dtype) as proxy:
+            cv2.resize(image, (proxy_w, proxy_h), dst=proxy, interpolation=cv2.INTER_AREA)
+            faces = self.detector.detect_with_quality(
+                proxy, confidence_threshold=confidence_threshold, return_crops=False
+            )
+        sx, sy = width / float(proxy_w), height / float(proxy_h)
+        logger.debug("multiscale_detect", source=(width, height), proxy=(proxy_w, proxy_h), faces=len(faces))
+        return [rescale_face(face, image, sx, sy, return_crops) for face in faces]
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["MultiScaleFaceDetector", "proxy_scale", "rescale_face"]
@@ -3,13 +3,21 @@ apps/ai/src/services/ml/object_detection.py
 Object Detection Service - Business Logic Layer
 """
 
+import threading
 import time
-from typing import List, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator, List, Optional, Tuple
 import numpy as np
-import cv2
 
+from src.core.config import settings
 from src.core.logging import get_logger, LogContext
-from src.core.exceptions import InvalidImageException, InferenceException
+from src.core.deadline import Deadline
+from src.core.exceptions import (
+    DeadlineExceededException,
+    InvalidImageException,
+    InferenceException,
+)
+from src.utils.image_decode import decode_image
 from src.schemas.detection import (
     DetectRequest,
     DetectResponse,
@@ -18,7 +26,13 @@ from src.schemas.detection import (
     Detection,
     ImageMetadata,
 )
-from src.models.object.model_loader import get_detector
+from src.services.ml.detector_backends import get_detector_backend
+from src.services.ml.detection_batching import (
+    BatchedYoloEngine,
+    DetectionParams,
+    get_detection_engine,
+)
+from src.services.ml.warmup import WarmupTask, detection_tasks
 
 
 logger = get_logger("object_detection_service")
@@ -33,12 +47,41 @@ class ObjectDetectionService:
     def __init__(self):
         """Initialize detection service"""
         self.detector = None
+        self.engine: Optional[BatchedYoloEngine] = None
+        self._decode_pool: Optional[ThreadPoolExecutor] = None
+        self._decode_pool_lock = threading.Lock()
         logger.info("object_detection_service_initialized")
     
     def _ensure_detector_loaded(self):
         """Ensure YOLO detector is loaded"""
         if self.detector is None:
-            self.detector = get_detector()
+            self.detector = get_detector_backend()
+            if settings.DETECTION_BATCHING_ENABLED:
+                # Shared across service instances so REST + gRPC callers batch together
+                self.engine = get_detection_engine(
+                    self.detector,
+                    image_size=settings.DETECTION_IMAGE_SIZE,
+                    max_batch_size=settings.BATCH_SIZE,
+                    max_wait_ms=settings.DETECTION_BATCH_MAX_WAIT_MS,
+                    batch_buckets=settings.WARMUP_BATCH_BUCKETS if settings.WARMUP_PAD_TO_BUCKETS else (),
+                )
+
+    def warmup_tasks(self) -> List[WarmupTask]:
+        """YOLO warmup per batch bucket (<= BATCH_SIZE), through the engine when batching"""
+        self._ensure_detector_loaded()
+        buckets = [b for b in settings.WARMUP_BATCH_BUCKETS if b <= settings.BATCH_SIZE] or [1]
+        return detection_tasks(self.engine or self.detector, buckets, settings.WARMUP_FRAME_SIZES)
+    
+    def _predict(self, image: np.ndarray, request: DetectRequest):
+        """Run detection, through the batching engine when enabled"""
+        predictor = self.engine or self.detector
+        return predictor.predict(
+            image=image,
+            conf_threshold=request.confidence_threshold,
+            iou_threshold=request.iou_threshold,
+            target_classes=request.target_classes or None,
+            max_detections=request.max_detections
+        )
     
     def _decode_image(self, image_bytes: bytes) -> np.ndarray:
         """
@@ -54,35 +97,69 @@ class ObjectDetectionService:
             InvalidImageException: If decoding fails
         """
         try:
-            # Convert bytes to numpy array
-            nparr = np.frombuffer(image_bytes, np.uint8)
-            
-            # Decode image
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            
-            if image is None:
-                raise InvalidImageException("Could not decode image bytes")
-            
-            return image
+            # Header checked before decoding; YOLO boxes are reported in
+            # source pixels, so the image is decoded at full size
+            return decode_image(image_bytes, max_source_pixels=settings.IMAGE_MAX_SOURCE_PIXELS)
             
+        except InvalidImageException:
+            raise
         except Exception as e:
             logger.error("image_decode_failed", error=str(e))
             raise InvalidImageException(f"Failed to decode image: {str(e)}")
     
-    def detect_objects(self, request: DetectRequest) -> DetectResponse:
+    @staticmethod
+    def _build_response(
+        request: DetectRequest,
+        detections: List[Detection],
+        image_metadata: ImageMetadata,
+        metrics: dict,
+    ) -> DetectResponse:
+        """Apply exclude_classes and wrap detector output in a DetectResponse"""
+        # Filter by exclude_classes
+        if request.exclude_classes:
+            detections = [
+                d for d in detections 
+                if d.class_name not in request.exclude_classes
+            ]
+        
+        return DetectResponse(
+            success=True,
+            detections=detections,
+            total_objects=len(detections),
+            inference_time_ms=metrics["inference_time_ms"],
+            preprocessing_time_ms=metrics["preprocessing_time_ms"],
+            postprocessing_time_ms=metrics["postprocessing_time_ms"],
+            total_time_ms=metrics["total_time_ms"],
+            request_id=request.request_id,
+            timestamp=request.timestamp or int(time.time() * 1000),
+            image_metadata=image_metadata
+        )
+    
+    @staticmethod
+    def _build_error_response(request: DetectRequest, error_message: str) -> DetectResponse:
+        """Failed DetectResponse correlated to the request"""
+        return DetectResponse(
+            success=False,
+            error_message=error_message,
+            request_id=request.request_id,
+            timestamp=int(time.time() * 1000)
+        )
+    
+    def detect_objects(
+        self,
+        request: DetectRequest,
+        deadline: Optional[Deadline] = None,
+    ) -> DetectResponse:
         """
         Detect objects in image
         
         Args:
             request: Detection request
+            deadline: Caller deadline; checked before decode and inference
         
         Returns:
             Detection response
         """
-        # Ensure detector is loaded
-        self._ensure_detector_loaded()
-        
-        # Add request context to logs
         with LogContext(
             request_id=request.request_id,
             camera_id=request.camera_id
@@ -95,54 +172,73 @@ class ObjectDetectionService:
                 )
                 
                 # Decode image
+                if deadline is not None:
+                    deadline.check("decode")
                 image = self._decode_image(request.image)
                 
-                # Run detection
-                detections, image_metadata, metrics = self.detector.predict(
-                    image=image,
-                    conf_threshold=request.confidence_threshold,
-                    iou_threshold=request.iou_threshold,
-                    target_classes=request.target_classes or None,
-                    max_detections=request.max_detections
+            except DeadlineExceededException as e:
+                logger.warning("detection_deadline_exceeded", stage=e.details.get("stage"))
+                return self._build_error_response(request, e.message)
+            
+            except InvalidImageException as e:
+                logger.error("invalid_image", error=str(e))
+                return DetectResponse(
+                    success=False,
+                    error_message=f"Invalid image: {str(e)}",
+                    request_id=request.request_id,
+                    timestamp=int(time.time() * 1000)
                 )
-                
-                # Filter by exclude_classes
-                if request.exclude_classes:
-                    detections = [
-                        d for d in detections 
-                        if d.class_name not in request.exclude_classes
-                    ]
+            
+            return self.detect_decoded(image, request, deadline=deadline)
+    
+    def detect_decoded(
+        self,
+        image: np.ndarray,
+        request: DetectRequest,
+        deadline: Optional[Deadline] = None,
+    ) -> DetectResponse:
+        """
+        Detect objects in an already-decoded BGR image (request.image is ignored)
+        
+        Lets callers that decode a frame once for several analyzers skip
+        the second decode.
+        
+        Args:
+            image: BGR image
+            request: Detection request (thresholds, classes, metadata)
+            deadline: Caller deadline; checked before inference
+        
+        Returns:
+            Detection response
+        """
+        # Ensure detector is loaded
+        self._ensure_detector_loaded()
+        
+        # Add request context to logs
+        with LogContext(
+            request_id=request.request_id,
+            camera_id=request.camera_id
+        ):
+            try:
+                # Run detection
+                if deadline is not None:
+                    deadline.check("inference")
+                detections, image_metadata, metrics = self._predict(image, request)
                 
                 # Create response
-                response = DetectResponse(
-                    success=True,
-                    detections=detections,
-                    total_objects=len(detections),
-                    inference_time_ms=metrics["inference_time_ms"],
-                    preprocessing_time_ms=metrics["preprocessing_time_ms"],
-                    postprocessing_time_ms=metrics["postprocessing_time_ms"],
-                    total_time_ms=metrics["total_time_ms"],
-                    request_id=request.request_id,
-                    timestamp=request.timestamp or int(time.time() * 1000),
-                    image_metadata=image_metadata
-                )
+                response = self._build_response(request, detections, image_metadata, metrics)
                 
                 logger.info(
                     "detection_completed",
-                    num_detections=len(detections),
+                    num_detections=response.total_objects,
                     total_time_ms=metrics["total_time_ms"]
                 )
                 
                 return response
                 
-            except InvalidImageException as e:
-                logger.error("invalid_image", error=str(e))
-                return DetectResponse(
-                    success=False,
-                    error_message=f"Invalid image: {str(e)}",
-                    request_id=request.request_id,
-                    timestamp=int(time.time() * 1000)
-                )
+            except DeadlineExceededException as e:
+                logger.warning("detection_deadline_exceeded", stage=e.details.get("stage"))
+                return self._build_error_response(request, e.message)
             
             except InferenceException as e:
                 logger.error("inference_failed", error=str(e))
@@ -162,26 +258,38 @@ class ObjectDetectionService:
                     timestamp=int(time.time() * 1000)
                 )
     
-    def detect_waste(self, request: DetectRequest) -> DetectResponse:
+    def detect_waste(
+        self,
+        request: DetectRequest,
+        deadline: Optional[Deadline] = None,
+    ) -> DetectResponse:
         """
         Detect waste/trash specifically
         
         Args:
             request: Detection request
+            deadline: Caller deadline, passed through to detect_objects
         
         Returns:
             Detection response with waste objects only
         """
+        logger.info("waste_detection_request", camera_id=request.camera_id)
+        return self.detect_objects(self.waste_request(request), deadline=deadline)
+    
+    @staticmethod
+    def waste_request(request: DetectRequest) -> DetectRequest:
+        """
+        Waste variant of a request: waste classes only, confidence capped
+        at WASTE_CONFIDENCE
+        """
         # Override target_classes with waste classes
-        from .core.config import settings
         request.target_classes = settings.WASTE_CLASSES
         
         # Lower confidence threshold for waste
         if request.confidence_threshold > settings.WASTE_CONFIDENCE:
             request.confidence_threshold = settings.WASTE_CONFIDENCE
         
-        logger.info("waste_detection_request", camera_id=request.camera_id)
-        return self.detect_objects(request)
+        return request
     
     def detect_vandalism(self, request: DetectRequest) -> DetectResponse:
         """
@@ -200,12 +308,18 @@ class ObjectDetectionService:
         logger.info("vandalism_detection_request", camera_id=request.camera_id)
         return self.detect_objects(request)
     
-    def detect_batch(self, request: DetectBatchRequest) -> DetectBatchResponse:
+    def detect_batch(
+        self,
+        request: DetectBatchRequest,
+        deadline: Optional[Deadline] = None,
+    ) -> DetectBatchResponse:
         """
         Detect objects in batch of images
         
         Args:
             request: Batch detection request
+            deadline: Caller deadline for the whole batch; images not run
+                by then come back as "Deadline exceeded" errors
         
         Returns:
             Batch detection response
@@ -217,13 +331,14 @@ class ObjectDetectionService:
         )
         
         start_time = time.time()
-        responses = []
         
-        # Process each request
-        # TODO: Implement parallel processing if request.parallel_processing=True
-        for req in request.requests:
-            response = self.detect_objects(req)
-            responses.append(response)
+        if request.parallel_processing and len(request.requests) > 1:
+            # Parallel decode + batched forward passes, restored to request order
+            responses: List[Optional[DetectResponse]] = [None] * len(request.requests)
+            for index, response in self.iter_detect_batch(request, deadline=deadline):
+                responses[index] = response
+        else:
+            responses = [self.detect_objects(req, deadline=deadline) for req in request.requests]
         
         total_time = (time.time() - start_time) * 1000
         
@@ -241,6 +356,127 @@ class ObjectDetectionService:
         )
         
         return batch_response
+    
+    def iter_detect_batch(
+        self,
+        request: DetectBatchRequest,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[Tuple[int, DetectResponse]]:
+        """
+        Detect objects in a batch, yielding (request_index, response) as soon
+        as each image finishes.
+        
+        - JPEG/PNG decoding runs in a thread pool (cv2 releases the GIL)
+        - Whatever has been decoded is run through one batched forward pass,
+          so a slow (e.g. 4K) decode does not hold up the rest of the batch
+        - Once `deadline` passes, queued decodes are cancelled and the
+          remaining images get "Deadline exceeded" errors without inference
+        
+        Args:
+            request: Batch detection request
+            deadline: Caller deadline for the whole batch
+        
+        Yields:
+            (index into request.requests, DetectResponse) in completion order
+        """
+        self._ensure_detector_loaded()
+        requests = request.requests
+        decode_pool = self._get_decode_pool()
+        
+        pending = {
+            decode_pool.submit(self._decode_image, req.image): index
+            for index, req in enumerate(requests)
+        }
+        
+        while pending:
+            # Wake up at the deadline even if no decode finishes by then
+            remaining_ms = deadline.remaining_ms() if deadline is not None else float("inf")
+            timeout = None if remaining_ms == float("inf") else remaining_ms / 1000.0
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            
+            decoded: List[Tuple[int, np.ndarray]] = []
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    decoded.append((index, future.result()))
+                except InvalidImageException as e:
+                    logger.error("invalid_image", error=str(e), batch_index=index)
+                    yield index, self._build_error_response(
+                        requests[index], f"Invalid image: {str(e)}"
+                    )
+            
+            # Forward pass over everything decoded so far (chunked to BATCH_SIZE)
+            for start in range(0, len(decoded), settings.BATCH_SIZE):
+                chunk = decoded[start:start + settings.BATCH_SIZE]
+                if deadline is not None and deadline.expired:
+                    yield from self._expire(requests, [index for index, _ in chunk], "inference")
+                    continue
+                yield from self._detect_decoded(requests, chunk)
+            
+            if deadline is not None and deadline.expired and pending:
+                for future in pending:
+                    future.cancel()
+                yield from self._expire(requests, list(pending.values()), "decode")
+                return
+    
+    def _expire(
+        self,
+        requests: List[DetectRequest],
+        indices: List[int],
+        stage: str,
+    ) -> Iterator[Tuple[int, DetectResponse]]:
+        """Error responses for batch items skipped because the deadline passed"""
+        logger.warning("batch_deadline_exceeded", stage=stage, skipped=len(indices))
+        message = DeadlineExceededException(stage).message
+        for index in indices:
+            yield index, self._build_error_response(requests[index], message)
+    
+    def _detect_decoded(
+        self,
+        requests: List[DetectRequest],
+        decoded: List[Tuple[int, np.ndarray]],
+    ) -> Iterator[Tuple[int, DetectResponse]]:
+        """Run one batched forward pass over already-decoded images"""
+        try:
+            if self.engine is not None:
+                results = self.engine.predict_batch(
+                    [image for _, image in decoded],
+                    [self._detection_params(requests[index]) for index, _ in decoded],
+                )
+            else:
+                results = [self._predict(image, requests[index]) for index, image in decoded]
+        except Exception as e:
+            logger.error("batch_inference_failed", error=str(e), exc_info=True)
+            for index, _ in decoded:
+                yield index, self._build_error_response(
+                    requests[index], f"Inference failed: {str(e)}"
+                )
+            return
+        
+        for (index, _), (detections, image_metadata, metrics) in zip(decoded, results):
+            yield index, self._build_response(
+                requests[index], detections, image_metadata, metrics
+            )
+    
+    @staticmethod
+    def _detection_params(request: DetectRequest) -> DetectionParams:
+        return DetectionParams(
+            conf_threshold=request.confidence_threshold,
+            iou_threshold=request.iou_threshold,
+            target_classes=request.target_classes or None,
+            max_detections=request.max_detections,
+        )
+    
+    def _get_decode_pool(self) -> ThreadPoolExecutor:
+        """Lazily create the JPEG/PNG decode thread pool"""
+        if self._decode_pool is None:
+            with self._decode_pool_lock:
+                if self._decode_pool is None:  # concurrent first batches build one pool
+                    self._decode_pool = ThreadPoolExecutor(
+                        max_workers=settings.DETECTION_DECODE_WORKERS,
+                        thread_name_prefix="detect-decode",
+                    )
+        return self._decode_pool
 
 
 # ============================================================================
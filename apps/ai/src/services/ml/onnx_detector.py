@@ -0,0 +1,328 @@
+"""
+apps/ai/src/services/ml/onnx_detector.py
+ONNX Runtime (CPU) backend for Ultralytics-exported YOLO detectors.
+
+Same contract as the Ultralytics detector (`predict()` returns
+(detections, image_metadata, metrics)) plus `predict_batch()`, so
+BatchedYoloEngine runs it in its native mode:
+- letterbox to the model's square input (114 padding, like Ultralytics),
+  into pooled canvases / input tensors (utils.buffer_pool)
+- one session.run per batch (per image for models exported with batch=1)
+- vectorized NumPy post-processing: confidence / class filter,
+  class-aware NMS, rescale to the original frame
+"""
+
+import ast
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+import structlog
+
+from src.core.exceptions import ModelLoadException
+from src.schemas.detection import BoundingBox, Detection, ImageMetadata
+from src.services.ml.detection_batching import DetectionParams, PredictResult
+from src.utils.buffer_pool import get_buffer_pool
+
+logger = structlog.get_logger("sssp.ai.onnx_detector")
+
+LETTERBOX_FILL = 114
+_MAX_WH = 7680.0  # class offset for batched NMS; larger than any box coordinate
+_INV_255 = np.float32(1.0 / 255.0)  # float32 scalar keeps the ufunc loop in float32
+
+
+# ============================================================================
+# Pre / post-processing
+# ============================================================================
+
+def letterbox(
+    image: np.ndarray,
+    size: int,
+    out: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, float, Tuple[float, float]]:
+    """
+    Resize keeping aspect ratio and pad to size x size. Returns (image, gain, (pad_x, pad_y)).
+    `out` (size, size, 3) uint8 is filled in place; the resize writes straight into it.
+    """
+    h, w = image.shape[:2]
+    gain = min(size / h, size / w)
+    new_w, new_h = int(round(w * gain)), int(round(h * gain))
+    pad_x, pad_y = (size - new_w) / 2, (size - new_h) / 2
+
+    top, left = int(round(pad_y - 0.1)), int(round(pad_x - 0.1))
+    canvas = out if out is not None else np.empty((size, size, 3), dtype=np.uint8)
+    canvas[...] = LETTERBOX_FILL
+    roi = canvas[top:top + new_h, left:left + new_w]
+    if (new_w, new_h) != (w, h):
+        cv2.resize(image, (new_w, new_h), dst=roi, interpolation=cv2.INTER_LINEAR)
+    else:
+        roi[...] = image
+    return canvas, gain, (left, top)
+
+
+def to_model_input(canvases: Sequence[np.ndarray], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Letterboxed BGR uint8 canvases -> (n, 3, s, s) float32 RGB in [0, 1].
+    BGR->RGB, HWC->CHW, cast and scale are one ufunc pass per canvas into `out`.
+    """
+    size = canvases[0].shape[0]
+    batch = out if out is not None else np.empty((len(canvases), 3, size, size), dtype=np.float32)
+    for i, canvas in enumerate(canvases):
+        np.multiply(canvas[..., ::-1].transpose(2, 0, 1), _INV_255, out=batch[i], casting="unsafe")
+    return batch
+
+
+def nms(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """Greedy NMS over xyxy boxes; returns kept indices, highest score first."""
+    x1, y1, x2, y2 = boxes.T
+    areas = (x2 - x1).clip(0) * (y2 - y1).clip(0)
+    order = scores.argsort()[::-1]
+    keep: List[int] = []
+
+    while order.size:
+        i = order[0]
+        keep.append(i)
+        rest = order[1:]
+        iw = (np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest])).clip(0)
+        ih = (np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest])).clip(0)
+        inter = iw * ih
+        iou = inter / (areas[i] + areas[rest] - inter + 1e-9)
+        order = rest[iou <= iou_threshold]
+
+    return np.asarray(keep, dtype=np.int64)
+
+
+def postprocess(
+    pred: np.ndarray,
+    conf_threshold: float,
+    iou_threshold: float,
+    class_ids: Optional[Sequence[int]],
+    max_detections: int,
+) -> np.ndarray:
+    """
+    Decode one YOLOv8-style output of shape (4 + num_classes, num_anchors)
+    (cx, cy, w, h, class scores) into an (n, 6) array of
+    x1, y1, x2, y2, confidence, class_id in model-input pixels.
+    """
+    pred = pred.T
+    scores = pred[:, 4:]
+    if class_ids is not None:
+        masked = np.zeros_like(scores)
+        masked[:, class_ids] = scores[:, class_ids]
+        scores = masked
+
+    cls = scores.argmax(axis=1)
+    conf = scores[np.arange(len(scores)), cls]
+    keep = conf > conf_threshold
+    if not keep.any():
+        return np.zeros((0, 6), dtype=np.float32)
+
+    xywh, conf, cls = pred[keep, :4], conf[keep], cls[keep]
+    boxes = np.empty_like(xywh)
+    boxes[:, :2] = xywh[:, :2] - xywh[:, 2:] / 2
+    boxes[:, 2:] = xywh[:, :2] + xywh[:, 2:] / 2
+
+    # Offset boxes per class so one NMS pass never suppresses across classes
+    kept = nms(boxes + cls[:, None] * _MAX_WH, conf, iou_threshold)[:max_detections]
+    return np.concatenate(
+        [boxes[kept], conf[kept, None], cls[kept, None].astype(np.float32)], axis=1
+    ).astype(np.float32)
+
+
+def _parse_names(raw: Optional[str]) -> Dict[int, str]:
+    """Ultralytics stores class names as a Python dict literal in the ONNX metadata."""
+    if not raw:
+        return {}
+    try:
+        return {int(k): str(v) for k, v in ast.literal_eval(raw).items()}
+    except (ValueError, SyntaxError, AttributeError):
+        return {}
+
+
+# ============================================================================
+# Detector
+# ============================================================================
+
+class OnnxYoloDetector:
+    """YOLO detector running an exported .onnx model on ONNX Runtime's CPU provider."""
+
+    backend = "onnxruntime"
+
+    def __init__(
+        self,
+        model_path: Path,
+        image_size: int = 640,
+        intra_op_threads: int = 0,
+        names: Optional[Dict[int, str]] = None,
+    ) -> None:
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise ModelLoadException(str(model_path), f"onnxruntime is not installed ({e})")
+
+        if not Path(model_path).exists():
+            raise ModelLoadException(str(model_path), "ONNX file not found (run export_model.py)")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.intra_op_num_threads = intra_op_threads  # 0 = ORT default (physical cores)
+        options.inter_op_num_threads = 1
+
+        start = time.perf_counter()
+        self.session = ort.InferenceSession(
+            str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        model_input = self.session.get_inputs()[0]
+        self._input_name = model_input.name
+
+        batch_dim, _, height, _ = model_input.shape
+        self.image_size = height if isinstance(height, int) else image_size
+        self.dynamic_batch = not isinstance(batch_dim, int)
+        self.names: Dict[int, str] = names or _parse_names(
+            self.session.get_modelmeta().custom_metadata_map.get("names")
+        )
+        self._name_to_id = {name: idx for idx, name in self.names.items()}
+        self.model_path = Path(model_path)
+
+        logger.info(
+            "onnx_detector_loaded",
+            model_path=str(model_path),
+            image_size=self.image_size,
+            dynamic_batch=self.dynamic_batch,
+            classes=len(self.names),
+            intra_op_threads=intra_op_threads,
+            load_ms=round((time.perf_counter() - start) * 1000.0, 2),
+        )
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def predict(
+        self,
+        image: np.ndarray,
+        conf_threshold: float = 0.25,
+        iou_threshold: float = 0.45,
+        target_classes: Optional[List[str]] = None,
+        max_detections: int = 300,
+    ) -> PredictResult:
+        params = DetectionParams(
+            conf_threshold=conf_threshold,
+            iou_threshold=iou_threshold,
+            target_classes=target_classes,
+            max_detections=max_detections,
+        )
+        return self.predict_batch([image], [params])[0]
+
+    def predict_batch(
+        self,
+        images: Sequence[np.ndarray],
+        params: Sequence[DetectionParams],
+    ) -> List[PredictResult]:
+        t0 = time.perf_counter()
+
+        # Canvases and the input tensor come from the frame buffer pool
+        pool = get_buffer_pool()
+        size = self.image_size
+        letterboxed = [letterbox(image, size, out=pool.acquire((size, size, 3))) for image in images]
+        batch = to_model_input(
+            [canvas for canvas, _, _ in letterboxed],
+            out=pool.acquire((len(images), 3, size, size), np.float32),
+        )
+        for canvas, _, _ in letterboxed:
+            pool.release(canvas)
+
+        t1 = time.perf_counter()
+
+        if self.dynamic_batch:
+            preds = self.session.run(None, {self._input_name: batch})[0]
+        else:
+            preds = np.concatenate([
+                self.session.run(None, {self._input_name: batch[i:i + 1]})[0]
+                for i in range(len(batch))
+            ])
+
+        pool.release(batch)
+        t2 = time.perf_counter()
+
+        outputs = []
+        for pred, p, (_, gain, (pad_x, pad_y)), image in zip(preds, params, letterboxed, images):
+            class_ids = self._class_ids(p.target_classes)
+            if class_ids is not None and not class_ids:
+                outputs.append(np.zeros((0, 6), dtype=np.float32))
+                continue
+            out = postprocess(pred, p.conf_threshold, p.iou_threshold, class_ids, p.max_detections)
+            out[:, [0, 2]] = ((out[:, [0, 2]] - pad_x) / gain).clip(0, image.shape[1])
+            out[:, [1, 3]] = ((out[:, [1, 3]] - pad_y) / gain).clip(0, image.shape[0])
+            outputs.append(out)
+
+        t3 = time.perf_counter()
+
+        metrics = {
+            "preprocessing_time_ms": round((t1 - t0) * 1000.0, 2),
+            "inference_time_ms": round((t2 - t1) * 1000.0, 2),
+            "postprocessing_time_ms": round((t3 - t2) * 1000.0, 2),
+            "total_time_ms": round((t3 - t0) * 1000.0, 2),
+            "batch_size": len(images),
+        }
+        return [
+            (self._to_detections(out, image.shape), self._image_metadata(image), dict(metrics))
+            for out, image in zip(outputs, images)
+        ]
+
+    def get_model_info(self) -> Dict[str, object]:
+        return {
+            "backend": self.backend,
+            "model_path": str(self.model_path),
+            "image_size": self.image_size,
+            "num_classes": len(self.names),
+            "dynamic_batch": self.dynamic_batch,
+        }
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+
+    def _class_ids(self, target_classes: Optional[List[str]]) -> Optional[List[int]]:
+        """Map class names to model ids. None means 'all classes'."""
+        if not target_classes:
+            return None
+        return [self._name_to_id[c] for c in target_classes if c in self._name_to_id]
+
+    def _to_detections(self, out: np.ndarray, shape: Tuple[int, ...]) -> List[Detection]:
+        h, w = shape[:2]
+        return [
+            Detection(
+                class_name=self.names.get(int(cls), str(int(cls))),
+                class_id=int(cls),
+                confidence=float(conf),
+                bbox=BoundingBox(
+                    x1=float(x1),
+                    y1=float(y1),
+                    x2=float(x2),
+                    y2=float(y2),
+                    x1_norm=float(x1) / w,
+                    y1_norm=float(y1) / h,
+                    x2_norm=float(x2) / w,
+                    y2_norm=float(y2) / h,
+                ),
+                area=float((x2 - x1) * (y2 - y1)),
+            )
+            for x1, y1, x2, y2, conf, cls in out
+        ]
+
+    @staticmethod
+    def _image_metadata(image: np.ndarray) -> ImageMetadata:
+        h, w = image.shape[:2]
+        channels = image.shape[2] if image.ndim == 3 else 1
+        return ImageMetadata(width=w, height=h, channels=channels)
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["OnnxYoloDetector", "letterbox", "nms", "postprocess", "to_model_input"]
@@ -0,0 +1,127 @@
+"""
+apps/ai/src/services/ml/onnx_embedder.py
+ONNX Runtime (CPU) runtime for the exported FaceNet embedder.
+
+Drop-in for FaceEmbedder where FaceRecognitionService uses it:
+`embed_batch(crops) -> List[np.ndarray]` plus `config.device` /
+`config.image_size`. The model comes from export_facenet.py
+(InceptionResnetV1 / vggface2, dynamic batch axis); preprocessing matches
+facenet-pytorch's fixed_image_standardization, (x - 127.5) / 128, done
+batch-wide by crop_batch into a pooled input tensor.
+"""
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Sequence
+
+import numpy as np
+import structlog
+
+from src.core.exceptions import ModelLoadException
+from src.services.ml.crop_batch import Box, preprocess_boxes, preprocess_crops
+from src.utils.buffer_pool import get_buffer_pool
+
+logger = structlog.get_logger("sssp.ai.onnx_embedder")
+
+EMBEDDING_DIM = 512
+
+
+@dataclass
+class OnnxEmbedderConfig:
+    model_path: Path
+    image_size: int = 160
+    input_color_space: str = "rgb"  # color order of the crops handed to embed_batch
+    normalize_l2: bool = True
+    intra_op_threads: int = 0  # 0 = ORT default (physical cores)
+    device: str = "cpu"
+
+
+def cosine_agreement(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """Row-wise cosine similarity between two (n, dim) embedding matrices."""
+    reference = reference / np.linalg.norm(reference, axis=1, keepdims=True).clip(1e-12)
+    candidate = candidate / np.linalg.norm(candidate, axis=1, keepdims=True).clip(1e-12)
+    return (reference * candidate).sum(axis=1)
+
+
+class OnnxFaceEmbedder:
+    """FaceNet embeddings from an ONNX Runtime CPU session."""
+
+    backend = "onnxruntime"
+
+    def __init__(self, config: OnnxEmbedderConfig) -> None:
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise ModelLoadException(str(config.model_path), f"onnxruntime is not installed ({e})")
+
+        if not Path(config.model_path).exists():
+            raise ModelLoadException(
+                str(config.model_path), "ONNX file not found (run export_facenet.py)"
+            )
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.intra_op_num_threads = config.intra_op_threads
+        options.inter_op_num_threads = 1
+
+        start = time.perf_counter()
+        self.session = ort.InferenceSession(
+            str(config.model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._input_name = self.session.get_inputs()[0].name
+        self.config = config
+
+        logger.info(
+            "onnx_embedder_loaded",
+            model_path=str(config.model_path),
+            intra_op_threads=config.intra_op_threads,
+            load_ms=round((time.perf_counter() - start) * 1000.0, 2),
+        )
+
+    def embed_batch(self, crops: Sequence[np.ndarray]) -> List[np.ndarray]:
+        if not crops:
+            return []
+
+        size = self.config.image_size
+        pool = get_buffer_pool()
+        batch = pool.acquire((len(crops), 3, size, size), np.float32)
+        try:
+            preprocess_crops(crops, size, self.config.input_color_space, out=batch)
+            return self._run(batch)
+        finally:
+            pool.release(batch)
+
+    def embed_boxes(self, frame: np.ndarray, boxes: Sequence[Box]) -> List[np.ndarray]:
+        """Embed (x, y, w, h) regions of a BGR frame without materializing crops."""
+        if not len(boxes):
+            return []
+
+        size = self.config.image_size
+        pool = get_buffer_pool()
+        batch = pool.acquire((len(boxes), 3, size, size), np.float32)
+        try:
+            preprocess_boxes(frame, boxes, size, "bgr", out=batch)
+            return self._run(batch)
+        finally:
+            pool.release(batch)
+
+    def _run(self, batch: np.ndarray) -> List[np.ndarray]:
+        embeddings = self.session.run(None, {self._input_name: batch})[0]
+        if self.config.normalize_l2:
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True).clip(1e-12)
+        return list(embeddings)
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = [
+    "EMBEDDING_DIM",
+    "OnnxEmbedderConfig",
+    "OnnxFaceEmbedder",
+    "cosine_agreement",
+    "preprocess_crops",
+]
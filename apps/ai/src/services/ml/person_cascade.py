@@ -0,0 +1,243 @@
+"""
+apps/ai/src/services/ml/person_cascade.py
+Person-box cascade: face detection restricted to YOLO `person` detections.
+
+- Each person box is cut down to its upper body (head + shoulders) with a
+  small margin; overlapping regions are merged so no face is seen twice
+- All regions are packed, at native scale, into one mosaic with blank
+  gutters between tiles, and the face detector runs once on the mosaic
+- Face boxes / landmarks are shifted back from mosaic to frame coordinates;
+  faces centred in a gutter are discarded. The detector runs on the mosaic
+  without crops; crops are cut from the frame afterwards
+
+Native scale keeps min_face_size meaning the same thing as on the full
+frame. When the regions cover most of the frame (crowds) the mosaic saves
+nothing, so the full frame is scanned instead.
+"""
+
+import dataclasses
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+from src.services.ml.face_detectors import replace_fields
+from src.services.ml.multiscale import rescale_face
+
+logger = structlog.get_logger("sssp.ai.person_cascade")
+
+Region = Tuple[int, int, int, int]  # x1, y1, x2, y2 in frame pixels
+
+
+@dataclass
+class CascadeStats:
+    mode: str  # "cascade" | "full_frame" | "no_person"
+    persons: int = 0
+    regions: int = 0
+    coverage: float = 0.0  # mosaic pixels / frame pixels
+    detect_ms: float = 0.0
+
+
+# ============================================================================
+# Regions + mosaic
+# ============================================================================
+
+def person_boxes(detections: Sequence[Any], class_name: str = "person") -> List[List[float]]:
+    """xyxy boxes of the `class_name` detections from ObjectDetectionService."""
+    return [d.bbox.to_xyxy() for d in detections if d.class_name == class_name]
+
+
+def upper_body_regions(
+    boxes: Sequence[Sequence[float]],
+    frame_shape: Tuple[int, ...],
+    upper_fraction: float = 0.5,
+    margin: float = 0.15,
+) -> List[Region]:
+    """Upper part of each person box, widened by `margin`, clipped and merged where overlapping."""
+    height, width = frame_shape[:2]
+    regions: List[Region] = []
+    for x1, y1, x2, y2 in boxes:
+        w, h = x2 - x1, y2 - y1
+        if w <= 0 or h <= 0:
+            continue
+        region = (
+            max(int(x1 - margin * w), 0),
+            max(int(y1 - margin * w), 0),  # heads can poke out of the top of the box
+            min(int(np.ceil(x2 + margin * w)), width),
+            min(int(np.ceil(y1 + upper_fraction * h)), height),
+        )
+        if region[2] > region[0] and region[3] > region[1]:
+            regions.append(region)
+    return merge_regions(regions)
+
+
+def merge_regions(regions: Sequence[Region]) -> List[Region]:
+    """Replace overlapping regions by their bounding box until none overlap."""
+    merged = list(regions)
+    changed = True
+    while changed:
+        changed = False
+        out: List[Region] = []
+        for r in merged:
+            for i, o in enumerate(out):
+                if r[0] < o[2] and o[0] < r[2] and r[1] < o[3] and o[1] < r[3]:
+                    out[i] = (min(r[0], o[0]), min(r[1], o[1]), max(r[2], o[2]), max(r[3], o[3]))
+                    changed = True
+                    break
+            else:
+                out.append(r)
+        merged = out
+    return merged
+
+
+def pack_regions(
+    regions: Sequence[Region],
+    max_width: int = 1280,
+    gap: int = 16,
+) -> Tuple[List[Tuple[int, int]], Tuple[int, int]]:
+    """
+    Shelf-pack regions (tallest first) into rows at most `max_width` wide.
+    Returns the top-left mosaic position of each region and the mosaic (width, height).
+    """
+    order = sorted(range(len(regions)), key=lambda i: regions[i][3] - regions[i][1], reverse=True)
+    positions: List[Tuple[int, int]] = [(0, 0)] * len(regions)
+    x = y = shelf_height = mosaic_width = 0
+
+    for i in order:
+        w = regions[i][2] - regions[i][0]
+        h = regions[i][3] - regions[i][1]
+        if x > 0 and x + w > max_width:
+            x, y = 0, y + shelf_height + gap
+            shelf_height = 0
+        positions[i] = (x, y)
+        x += w + gap
+        shelf_height = max(shelf_height, h)
+        mosaic_width = max(mosaic_width, x - gap)
+
+    return positions, (mosaic_width, y + shelf_height)
+
+
+def build_mosaic(
+    frame: np.ndarray,
+    regions: Sequence[Region],
+    positions: Sequence[Tuple[int, int]],
+    size: Tuple[int, int],
+) -> np.ndarray:
+    mosaic = np.zeros((size[1], size[0]) + frame.shape[2:], dtype=frame.dtype)
+    for (x1, y1, x2, y2), (mx, my) in zip(regions, positions):
+        mosaic[my:my + y2 - y1, mx:mx + x2 - x1] = frame[y1:y2, x1:x2]
+    return mosaic
+
+
+def map_faces_to_frame(
+    faces: Sequence[Any],
+    regions: Sequence[Region],
+    positions: Sequence[Tuple[int, int]],
+) -> List[Any]:
+    """Shift mosaic-space faces (bbox x, y, w, h + landmarks) back to the frame."""
+    mapped = []
+    for face in faces:
+        x, y, w, h = face.bbox
+        cx, cy = x + w / 2.0, y + h / 2.0
+        for (x1, y1, x2, y2), (mx, my) in zip(regions, positions):
+            if mx <= cx < mx + (x2 - x1) and my <= cy < my + (y2 - y1):
+                dx, dy = x1 - mx, y1 - my
+                changes = {"bbox": (x + dx, y + dy, w, h)}
+                landmarks = getattr(face, "landmarks", None)
+                if landmarks is not None:
+                    changes["landmarks"] = np.asarray(landmarks) + np.array([dx, dy], dtype=np.float32)
+                mapped.append(replace_fields(face, changes))
+                break
+    return mapped
+
+
+# ============================================================================
+# Cascade
+# ============================================================================
+
+class PersonFaceCascade:
+    """Runs a face detector only where YOLO found people."""
+
+    def __init__(
+        self,
+        upper_fraction: float = 0.5,
+        margin: float = 0.15,
+        max_coverage: float = 0.5,
+        max_width: int = 1280,
+        gap: int = 16,
+    ) -> None:
+        self.upper_fraction = upper_fraction
+        self.margin = margin
+        self.max_coverage = max_coverage
+        self.max_width = max_width
+        self.gap = gap
+
+    def detect(
+        self,
+        detector: Any,
+        frame: np.ndarray,
+        boxes: Sequence[Sequence[float]],
+        confidence_threshold: float = 0.7,
+        return_crops: bool = True,
+        mosaic_detector: Optional[Any] = None,
+    ) -> Tuple[List[Any], CascadeStats]:
+        """
+        Faces (frame coordinates, best first) inside the upper bodies of `boxes`.
+
+        `mosaic_detector` (default `detector`) runs on the mosaic; the full
+        frame fallback always uses `detector`.
+        """
+        regions = upper_body_regions(boxes, frame.shape, self.upper_fraction, self.margin)
+        if not regions:
+            return [], CascadeStats(mode="no_person", persons=len(boxes))
+
+        widest = max(r[2] - r[0] for r in regions)
+        positions, size = pack_regions(regions, max(self.max_width, widest), self.gap)
+        coverage = size[0] * size[1] / float(frame.shape[0] * frame.shape[1])
+
+        start = time.perf_counter()
+        if coverage >= self.max_coverage:
+            faces = detector.detect_with_quality(
+                frame, confidence_threshold=confidence_threshold, return_crops=return_crops
+            )
+            mode = "full_frame"
+        else:
+            mosaic = build_mosaic(frame, regions, positions, size)
+            faces = map_faces_to_frame(
+                (mosaic_detector or detector).detect_with_quality(
+                    mosaic, confidence_threshold=confidence_threshold, return_crops=False
+                ),
+                regions,
+                positions,
+            )
+            # Frame coordinates now: clip and cut crops (RGB) from the frame
+            faces = [rescale_face(face, frame, 1.0, 1.0, return_crops) for face in faces]
+            mode = "cascade"
+
+        stats = CascadeStats(
+            mode=mode,
+            persons=len(boxes),
+            regions=len(regions),
+            coverage=round(coverage, 4),
+            detect_ms=round((time.perf_counter() - start) * 1000.0, 2),
+        )
+        logger.debug("person_cascade_detect", faces=len(faces), **dataclasses.asdict(stats))
+        return list(faces), stats
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = [
+    "CascadeStats",
+    "PersonFaceCascade",
+    "build_mosaic",
+    "map_faces_to_frame",
+    "merge_regions",
+    "pack_regions",
+    "person_boxes",
+    "upper_body_regions",
+]
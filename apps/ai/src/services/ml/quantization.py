@@ -0,0 +1,199 @@
+"""
+apps/ai/src/services/ml/quantization.py
+Static INT8 post-training quantization for the ONNX models (offline tooling).
+
+- Calibration data comes from a sample of real frames: letterboxed frames
+  for YOLO, face crops for FaceNet, preprocessed exactly as at serving time
+- Models are rewritten in QDQ format (int8 weights per channel, int8
+  activations) so ONNX Runtime's CPU kernels run them in integer arithmetic
+- The YOLO Detect head stays in float: box decoding is where int8 rounding
+  hurts mAP most and it is a small share of the compute
+
+Serving never imports this module; it needs onnx + onnxruntime.quantization.
+"""
+
+import random
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+import cv2
+import numpy as np
+import onnx
+from onnxruntime.quantization import (
+    CalibrationDataReader,
+    CalibrationMethod,
+    QuantFormat,
+    QuantType,
+    quantize_static,
+)
+from onnxruntime.quantization.shape_inference import quant_pre_process
+
+import structlog
+
+logger = structlog.get_logger("sssp.ai.quantization")
+
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+# ============================================================================
+# Calibration data
+# ============================================================================
+
+def sample_frames(source: Path, count: int = 200, seed: int = 0) -> List[np.ndarray]:
+    """
+    Uniform random sample of BGR frames from a directory of images (searched
+    recursively) or from a video file.
+    """
+    source = Path(source)
+    rng = random.Random(seed)
+
+    if source.is_dir():
+        paths = sorted(p for p in source.rglob("*") if p.suffix.lower() in IMAGE_SUFFIXES)
+        paths = rng.sample(paths, min(count, len(paths)))
+        frames = [cv2.imread(str(p)) for p in paths]
+        return [f for f in frames if f is not None]
+
+    capture = cv2.VideoCapture(str(source))
+    total = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+    indices = sorted(rng.sample(range(total), min(count, total))) if total > 0 else []
+    frames = []
+    for index in indices:
+        capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+        ok, frame = capture.read()
+        if ok:
+            frames.append(frame)
+    capture.release()
+    return frames
+
+
+class BatchCalibrationReader(CalibrationDataReader):
+    """Feeds preprocessed samples to the calibrator one batch at a time."""
+
+    def __init__(
+        self,
+        input_name: str,
+        samples: Sequence[np.ndarray],
+        preprocess: Callable[[Sequence[np.ndarray]], np.ndarray],
+        batch_size: int = 1,
+    ) -> None:
+        self.input_name = input_name
+        self._batches = [
+            preprocess(samples[i:i + batch_size]) for i in range(0, len(samples), batch_size)
+        ]
+        self._iter: Optional[Iterator[np.ndarray]] = None
+        self.rewind()
+
+    def get_next(self) -> Optional[Dict[str, np.ndarray]]:
+        batch = next(self._iter, None)
+        return None if batch is None else {self.input_name: batch}
+
+    def rewind(self) -> None:
+        self._iter = iter(self._batches)
+
+    def __len__(self) -> int:
+        return len(self._batches)
+
+
+# ============================================================================
+# Quantization
+# ============================================================================
+
+def yolo_head_nodes(model_path: Path) -> List[str]:
+    """Nodes of the last Ultralytics module (the Detect head: DFL + box decoding)."""
+    model = onnx.load(str(model_path), load_external_data=False)
+    module_of = {
+        node.name: int(match.group(1))
+        for node in model.graph.node
+        if (match := re.match(r"/model\.(\d+)/", node.name))
+    }
+    if not module_of:
+        return []
+    head = max(module_of.values())
+    return [name for name, module in module_of.items() if module == head]
+
+
+def quantize_int8(
+    model_fp32: Path,
+    model_int8: Path,
+    reader: BatchCalibrationReader,
+    nodes_to_exclude: Optional[List[str]] = None,
+    calibrate_method: CalibrationMethod = CalibrationMethod.MinMax,
+) -> Path:
+    """Pre-process (shape inference + graph optimisation) and write a QDQ INT8 model."""
+    model_int8 = Path(model_int8)
+    prepared = model_int8.with_suffix(".prep.onnx")
+    start = time.perf_counter()
+
+    quant_pre_process(str(model_fp32), str(prepared))
+    try:
+        quantize_static(
+            str(prepared),
+            str(model_int8),
+            reader,
+            quant_format=QuantFormat.QDQ,
+            per_channel=True,
+            activation_type=QuantType.QInt8,
+            weight_type=QuantType.QInt8,
+            nodes_to_exclude=nodes_to_exclude or [],
+            calibrate_method=calibrate_method,
+            extra_options={"ActivationSymmetric": False, "WeightSymmetric": True},
+        )
+    finally:
+        prepared.unlink(missing_ok=True)
+
+    logger.info(
+        "model_quantized",
+        model_fp32=str(model_fp32),
+        model_int8=str(model_int8),
+        calibration_batches=len(reader),
+        excluded_nodes=len(nodes_to_exclude or []),
+        elapsed_s=round(time.perf_counter() - start, 1),
+        size_mb_fp32=round(Path(model_fp32).stat().st_size / 2**20, 1),
+        size_mb_int8=round(model_int8.stat().st_size / 2**20, 1),
+    )
+    return model_int8
+
+
+# ============================================================================
+# Reporting
+# ============================================================================
+
+def measure_latency_ms(run: Callable[[], object], iterations: int = 20, warmup: int = 3) -> float:
+    """Median wall time of `run()` in milliseconds."""
+    for _ in range(warmup):
+        run()
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return float(np.median(timings))
+
+
+def similarity_drift(reference: np.ndarray, candidate: np.ndarray) -> float:
+    """
+    Largest change in any pairwise cosine similarity between the two
+    embedding sets: how far a verification score can move after quantization.
+    """
+    def normalized(x: np.ndarray) -> np.ndarray:
+        return x / np.linalg.norm(x, axis=1, keepdims=True).clip(1e-12)
+
+    ref, cand = normalized(reference), normalized(candidate)
+    return float(np.abs(ref @ ref.T - cand @ cand.T).max())
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = [
+    "IMAGE_SUFFIXES",
+    "BatchCalibrationReader",
+    "measure_latency_ms",
+    "quantize_int8",
+    "sample_frames",
+    "similarity_drift",
+    "yolo_head_nodes",
+]
@@ -0,0 +1,146 @@
+"""
+apps/ai/src/services/ml/replica_pool.py
+Pool of in-process model replicas with checkout semantics.
+
+One detector / embedder pair shared by every RPC thread serializes inside
+torch (or fights over one intra-op thread pool). The pool holds K replicas;
+a request checks one out, uses it exclusively and returns it.
+
+- Checkout blocks (bounded by `timeout`) while all K replicas are busy; the
+  wait is accounted for metrics
+- Each replica has an intra-op thread budget: ONNX Runtime sessions are
+  built with it, and torch's (OpenMP, per calling thread) count is set in
+  the checking-out thread, so K replicas use about K * threads cores
+- Utilization = busy replica-seconds / (K * wall seconds since start)
+"""
+
+import queue
+import sys
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, TypeVar
+
+import structlog
+
+from src.core.exceptions import ResourceException
+
+logger = structlog.get_logger("sssp.ai.replica_pool")
+
+T = TypeVar("T")
+
+
+class ModelReplicaPool(Generic[T]):
+    """K interchangeable model replicas, each used by one request at a time."""
+
+    def __init__(self, replicas: Sequence[T], threads_per_replica: int = 0, name: str = "models") -> None:
+        if not replicas:
+            raise ValueError("ModelReplicaPool needs at least one replica")
+        self.name = name
+        self.threads_per_replica = threads_per_replica
+        self._replicas: List[T] = list(replicas)
+        self._free: "queue.LifoQueue[T]" = queue.LifoQueue()  # last returned = warmest caches
+        for replica in self._replicas:
+            self._free.put(replica)
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started = time.monotonic()
+        self._in_use = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_s_total = 0.0
+        self._wait_s_max = 0.0
+        self._busy_s_total = 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self._replicas)
+
+    @property
+    def replicas(self) -> List[T]:
+        return list(self._replicas)
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[T]:
+        """
+        Exclusive use of one replica for the with-block.
+
+        Raises:
+            ResourceException: no replica came free within `timeout` seconds
+        """
+        start = time.monotonic()
+        try:
+            replica = self._free.get(timeout=timeout)
+        except queue.Empty:
+            with self._lock:
+                self._timeouts += 1
+            raise ResourceException(self.name, f"no model replica free within {timeout}s")
+
+        acquired = time.monotonic()
+        waited = acquired - start
+        with self._lock:
+            self._in_use += 1
+            self._checkouts += 1
+            self._wait_s_total += waited
+            self._wait_s_max = max(self._wait_s_max, waited)
+        try:
+            self._apply_thread_budget()
+            yield replica
+        finally:
+            with self._lock:
+                self._in_use -= 1
+                self._busy_s_total += time.monotonic() - acquired
+            self._free.put(replica)
+
+    def checkout_each(self, timeout: Optional[float] = None) -> Iterator[T]:
+        """
+        Exclusive use of every replica in turn, one at a time (e.g. warmup
+        while the pool already serves traffic). Replicas already visited are
+        held aside only until the next unvisited one comes free.
+
+        Raises:
+            ResourceException: a replica did not come free within `timeout` seconds
+        """
+        pending = {id(replica) for replica in self._replicas}
+        while pending:
+            with ExitStack() as lease:
+                with ExitStack() as aside:
+                    replica = lease.enter_context(self.checkout(timeout))
+                    while id(replica) not in pending:
+                        aside.enter_context(lease.pop_all())
+                        replica = lease.enter_context(self.checkout(timeout))
+                pending.discard(id(replica))
+                yield replica
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = max(time.monotonic() - self._started, 1e-9)
+            return {
+                "replicas": self.size,
+                "threads_per_replica": self.threads_per_replica,
+                "in_use": self._in_use,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "wait_seconds_total": round(self._wait_s_total, 6),
+                "wait_seconds_max": round(self._wait_s_max, 6),
+                "busy_seconds_total": round(self._busy_s_total, 6),
+                "utilization": round(min(self._busy_s_total / (elapsed * self.size), 1.0), 4),
+            }
+
+    def _apply_thread_budget(self) -> None:
+        """torch intra-op threads for this thread (once per thread; torch only if loaded)."""
+        threads = self.threads_per_replica
+        if threads <= 0 or getattr(self._local, "threads", None) == threads:
+            return
+        torch = sys.modules.get("torch")
+        if torch is not None:
+            torch.set_num_threads(threads)
+        self._local.threads = threads
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["ModelReplicaPool"]
@@ -0,0 +1,113 @@
+"""
+apps/ai/src/services/ml/shape_buckets.py
+Pad model inputs up to a fixed set of shapes (the ones warmup ran).
+
+Every new input shape costs the runtimes a slow first call (allocator
+growth, oneDNN / ORT kernel selection, MTCNN pyramid buffers). Inputs are
+therefore rounded up to a bucket:
+
+- Batches (YOLO frames, FaceNet crops) grow to the next WARMUP_BATCH_BUCKETS
+  size with filler items whose outputs are dropped; batches above the
+  largest bucket are left alone
+- Face detector inputs are zero-padded (bottom / right, so coordinates do not
+  move) to the smallest WARMUP_FRAME_SIZES entry that contains them; boxes are
+  clipped back to the real image and crops are cut from it. Images whose
+  bucket is more than MAX_PAD_RATIO times their area are left alone, and
+  person-cascade mosaics (arbitrary sizes) bypass the wrapper entirely
+
+Padding costs at most one bucket step of extra work per call.
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+from src.services.ml.face_detectors import FaceDetectorWrapper
+from src.services.ml.multiscale import rescale_face
+from src.utils.buffer_pool import get_buffer_pool
+
+logger = structlog.get_logger("sssp.ai.shape_buckets")
+
+FrameSize = Tuple[int, int]  # (width, height)
+
+MAX_PAD_RATIO = 1.25  # bucket area / image area above which an image is not padded
+
+
+def batch_bucket(n: int, buckets: Sequence[int]) -> int:
+    """Smallest bucket >= n; n itself above the largest bucket (or with no buckets)."""
+    return min((b for b in buckets if b >= n), default=n)
+
+
+def pad_batch(items: Sequence[Any], buckets: Sequence[int], filler: Any) -> List[Any]:
+    """`items` followed by `filler` up to batch_bucket(len(items)); the caller keeps the first len(items) results."""
+    padding = batch_bucket(len(items), buckets) - len(items)
+    return list(items) + [filler] * padding
+
+
+def frame_bucket(
+    shape: Tuple[int, ...],
+    sizes: Sequence[FrameSize],
+    max_pad_ratio: Optional[float] = None,
+) -> Optional[FrameSize]:
+    """
+    Smallest (width, height) in `sizes` that contains an image of `shape`;
+    None if none does, or if its area exceeds `max_pad_ratio` times the image's.
+    """
+    height, width = shape[:2]
+    fitting = [(w, h) for w, h in sizes if w >= width and h >= height]
+    bucket = min(fitting, key=lambda size: size[0] * size[1], default=None)
+    if bucket is not None and max_pad_ratio is not None and bucket[0] * bucket[1] > max_pad_ratio * width * height:
+        return None
+    return bucket
+
+
+class BucketedFaceDetector(FaceDetectorWrapper):
+    """
+    Wraps any face detector backend (same detect_with_quality interface) and
+    runs it on images padded to a frame bucket.
+
+    Images that already match a bucket, fit none, or would grow by more than
+    `max_pad_ratio` in area are passed straight through.
+    """
+
+    def __init__(
+        self,
+        detector: Any,
+        frame_sizes: Sequence[FrameSize],
+        max_pad_ratio: float = MAX_PAD_RATIO,
+    ) -> None:
+        super().__init__(detector)
+        self.frame_sizes = [tuple(size) for size in frame_sizes]
+        self.max_pad_ratio = max_pad_ratio
+
+    def detect_with_quality(
+        self,
+        image: np.ndarray,
+        confidence_threshold: float = 0.7,
+        return_crops: bool = True,
+    ) -> List[Any]:
+        height, width = image.shape[:2]
+        bucket = frame_bucket(image.shape, self.frame_sizes, self.max_pad_ratio)
+        if bucket is None or bucket == (width, height):
+            return self.detector.detect_with_quality(
+                image, confidence_threshold=confidence_threshold, return_crops=return_crops
+            )
+
+        bucket_w, bucket_h = bucket
+        with get_buffer_pool().borrow((bucket_h, bucket_w) + image.shape[2:], image.dtype) as padded:
+            padded[:height, :width] = image
+            padded[height:] = 0
+            padded[:height, width:] = 0
+            faces = self.detector.detect_with_quality(
+                padded, confidence_threshold=confidence_threshold, return_crops=False
+            )
+        # Same coordinates: clip to the real image and cut crops from it
+        return [rescale_face(face, image, 1.0, 1.0, return_crops) for face in faces]
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["BucketedFaceDetector", "FrameSize", "MAX_PAD_RATIO", "batch_bucket", "frame_bucket", "pad_batch"]
@@ -0,0 +1,208 @@
+"""
+apps/ai/src/services/ml/warmup.py
+Shape-bucketed model warmup, inline or on a background thread.
+
+- One task per (model, shape bucket): face detector per WARMUP_FRAME_SIZES
+  entry, FaceNet and YOLO per WARMUP_BATCH_BUCKETS size; each task runs
+  WARMUP_ITERATIONS times so allocators and kernel caches settle
+- Tasks run one after another on one thread, so warmup never competes
+  with itself for the inference cores
+- Face model tasks take their models from a callable evaluated on every
+  iteration, so a replica is only warmed while it is checked out
+- With a health registry every bucket is a component
+  (warmup.<model>.<bucket>): UNKNOWN while pending, HEALTHY once warm,
+  DEGRADED if its warmup failed; readiness probes wait for all of them
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+import numpy as np
+import structlog
+
+from src.services.ml.autotune import synthetic_frames
+from src.services.ml.detection_batching import DetectionParams
+from src.services.ml.shape_buckets import FrameSize
+
+logger = structlog.get_logger("sssp.ai.warmup")
+
+
+@dataclass
+class WarmupTask:
+    component: str  # health registry name, warmup.<model>.<bucket>
+    run: Callable[[], Any]  # one warmup iteration
+    bucket: str = ""
+
+
+def component_name(model: str, bucket: str) -> str:
+    return f"warmup.{model}.{bucket}"
+
+
+def batch_label(size: int) -> str:
+    return f"batch_{size}"
+
+
+def frame_label(size: FrameSize) -> str:
+    return f"{size[0]}x{size[1]}"
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+class ShapeWarmup:
+    """Runs every task `iterations` times; per-bucket status goes to `registry` (HealthRegistry) if given."""
+
+    def __init__(self, tasks: Sequence[WarmupTask], iterations: int = 5, registry: Optional[Any] = None) -> None:
+        self.tasks = list(tasks)
+        self.iterations = max(1, iterations)
+        self.registry = registry
+        self.failed: List[str] = []
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def start(self) -> None:
+        """Warm up on a daemon thread (the caller serves meanwhile)."""
+        self._mark_pending()
+        self._thread = threading.Thread(target=self._run, name="model-warmup", daemon=True)
+        self._thread.start()
+
+    def run(self) -> List[str]:
+        """Warm up on this thread; returns the components that failed."""
+        self._mark_pending()
+        self._run()
+        return self.failed
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def _mark_pending(self) -> None:
+        if self.registry is None:
+            return
+        for task in self.tasks:  # registered as UNKNOWN
+            self.registry.register_component(task.component, state="pending", bucket=task.bucket)
+
+    def _run(self) -> None:
+        start = time.perf_counter()
+        for task in self.tasks:
+            task_start = time.perf_counter()
+            try:
+                for _ in range(self.iterations):
+                    task.run()
+            except Exception as e:
+                self.failed.append(task.component)
+                logger.error("warmup_bucket_failed", component=task.component, error=str(e), exc_info=True)
+                if self.registry is not None:
+                    self.registry.mark_degraded(task.component, f"warmup failed: {e}", state="failed")
+                continue
+
+            elapsed_ms = round((time.perf_counter() - task_start) * 1000.0, 2)
+            logger.info("warmup_bucket_ready", component=task.component, elapsed_ms=elapsed_ms)
+            if self.registry is not None:
+                self.registry.mark_healthy(
+                    task.component, state="ready", iterations=self.iterations, elapsed_ms=elapsed_ms
+                )
+
+        logger.info(
+            "model_warmup_completed",
+            buckets=len(self.tasks),
+            failed=len(self.failed),
+            elapsed_ms=round((time.perf_counter() - start) * 1000.0, 2),
+        )
+        self._done.set()
+
+
+# ============================================================================
+# Task builders
+# ============================================================================
+
+def detection_tasks(
+    predictor: Any,
+    batch_buckets: Sequence[int],
+    frame_sizes: Sequence[FrameSize],
+    model: str = "object_detector",
+) -> List[WarmupTask]:
+    """
+    YOLO warmup per batch bucket. The model input is a fixed letterboxed square,
+    so the frame sizes only vary the letterbox; a batch cycles through them.
+    Predictors without predict_batch() only ever see batches of one.
+    """
+    frames = [synthetic_frames(1, height, width)[0] for width, height in frame_sizes] or synthetic_frames(1)
+    if not hasattr(predictor, "predict_batch"):
+        return [WarmupTask(component_name(model, batch_label(1)), lambda: predictor.predict(image=frames[0]),
+                           batch_label(1))]
+
+    def task(size: int) -> WarmupTask:
+        images = [frames[i % len(frames)] for i in range(size)]
+        params = [DetectionParams()] * size
+        return WarmupTask(
+            component_name(model, batch_label(size)),
+            lambda: predictor.predict_batch(images, params),
+            batch_label(size),
+        )
+
+    return [task(size) for size in sorted(set(batch_buckets))]
+
+
+def face_detector_tasks(
+    detectors: Callable[[], Iterable[Any]],
+    frame_sizes: Sequence[FrameSize],
+    model: str = "face_detector",
+) -> List[WarmupTask]:
+    """
+    Face detector warmup per frame size. `detectors` is called every iteration
+    and yields every detector (replicas, per-camera backends), each one while
+    the caller may use it.
+    """
+    def task(size: FrameSize) -> WarmupTask:
+        frame = synthetic_frames(1, size[1], size[0])[0]
+
+        def run() -> None:
+            for detector in detectors():
+                detector.detect_with_quality(frame, confidence_threshold=0.7, return_crops=True)
+        return WarmupTask(component_name(model, frame_label(size)), run, frame_label(size))
+
+    return [task(tuple(size)) for size in frame_sizes]
+
+
+def embedder_tasks(
+    embedders: Callable[[], Iterable[Any]],
+    batch_buckets: Sequence[int],
+    crop_size: int = 160,
+    model: str = "face_embedder",
+) -> List[WarmupTask]:
+    """
+    Embedder warmup per batch bucket, straight on the embedders (not through a
+    batcher). `embedders` is called every iteration, like face_detector_tasks.
+    """
+    rng = np.random.default_rng(0)
+
+    def task(size: int) -> WarmupTask:
+        crops = [rng.integers(0, 256, (crop_size, crop_size, 3), dtype=np.uint8) for _ in range(size)]
+
+        def run() -> None:
+            for embedder in embedders():
+                embedder.embed_batch(crops)
+        return WarmupTask(component_name(model, batch_label(size)), run, batch_label(size))
+
+    return [task(size) for size in sorted(set(batch_buckets))]
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = [
+    "ShapeWarmup",
+    "WarmupTask",
+    "component_name",
+    "detection_tasks",
+    "embedder_tasks",
+    "face_detector_tasks",
+]
@@ -0,0 +1,255 @@
+"""
+apps/ai/src/services/streaming/admission.py
+Latest-frame-wins adaptive admission for live camera streams.
+
+Per camera:
+- One-slot mailbox: a newer frame replaces the pending one (counted as dropped)
+- Staleness budget: frames older than `max_age_ms` (server receive time)
+  when they are taken for processing are discarded (counted as stale)
+- AIMD rate control: the admitted FPS backs off multiplicatively (at most
+  once per `decrease_interval_ms`) while the smoothed end-to-end latency is
+  above target, and recovers by about `increase_fps` per second below it
+
+The reader thread calls `offer()` and never blocks, so the socket is always
+drained; the processing side pulls with `take()` / `drain()` and reports
+each finished frame with `complete()`. At most `max_in_flight` frames are
+handed out at once, so newer frames keep replacing older ones in the
+mailbox instead of piling up in downstream queues.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger("sssp.ai.stream_admission")
+
+
+@dataclass
+class AdmissionStats:
+    """Per-camera admission counters (reported back to the client)."""
+    frames_received: int = 0
+    frames_admitted: int = 0
+    frames_dropped: int = 0   # rate-limited or superseded by a newer frame
+    frames_stale: int = 0     # exceeded the staleness budget while pending
+    target_fps: float = 0.0
+    latency_ewma_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "frames_received": self.frames_received,
+            "frames_admitted": self.frames_admitted,
+            "frames_dropped": self.frames_dropped,
+            "frames_stale": self.frames_stale,
+            "target_fps": round(self.target_fps, 2),
+            "latency_ewma_ms": round(self.latency_ewma_ms, 2),
+        }
+
+
+@dataclass
+class _CameraSlot:
+    stats: AdmissionStats
+    pending: Optional[Any] = None
+    pending_received_at: float = 0.0
+    last_admit_at: float = float("-inf")
+    last_decrease_at: float = float("-inf")
+
+
+class FrameAdmission:
+    """
+    Adaptive admission controller for one stream (may carry several cameras).
+
+    Thread-safe: `offer()` is called by the request reader, `take()` /
+    `complete()` / `stats()` by the processing side.
+    """
+
+    def __init__(
+        self,
+        max_fps: float = 30.0,
+        min_fps: float = 1.0,
+        max_age_ms: float = 500.0,
+        target_latency_ms: float = 200.0,
+        ewma_alpha: float = 0.2,
+        increase_fps: float = 1.0,
+        decrease_factor: float = 0.7,
+        decrease_interval_ms: float = 500.0,
+        max_in_flight: int = 4,
+    ) -> None:
+        self.max_fps = max(min_fps, max_fps)
+        self.min_fps = max(0.1, min_fps)
+        self.max_age_s = max(0.0, max_age_ms) / 1000.0
+        self.target_latency_ms = target_latency_ms
+        self.ewma_alpha = ewma_alpha
+        self.increase_fps = increase_fps
+        self.decrease_factor = decrease_factor
+        self.decrease_interval_s = decrease_interval_ms / 1000.0
+        self.max_in_flight = max(1, max_in_flight)
+
+        self._slots: Dict[str, _CameraSlot] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._aborted = False
+        self._in_flight = 0
+
+    # =========================================================================
+    # READER SIDE
+    # =========================================================================
+
+    def offer(self, camera_id: str, item: Any, received_at: Optional[float] = None) -> bool:
+        """
+        Offer a frame. Returns False if it was rate-limited. An admitted frame
+        replaces (drops) any frame still pending for the same camera.
+        """
+        now = time.monotonic() if received_at is None else received_at
+
+        with self._cond:
+            slot = self._slot(camera_id)
+            slot.stats.frames_received += 1
+
+            # Rate gate on server receive time
+            if now - slot.last_admit_at < 1.0 / slot.stats.target_fps:
+                slot.stats.frames_dropped += 1
+                return False
+
+            if slot.pending is not None:
+                slot.stats.frames_dropped += 1
+
+            slot.pending = item
+            slot.pending_received_at = now
+            slot.last_admit_at = now
+            self._cond.notify()
+            return True
+
+    def close(self) -> None:
+        """No more frames will be offered; `drain()` ends once mailboxes are empty."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def abort(self) -> None:
+        """Stop immediately: pending frames are discarded and `take()` returns None."""
+        with self._cond:
+            self._closed = True
+            self._aborted = True
+            for slot in self._slots.values():
+                slot.pending = None
+            self._cond.notify_all()
+
+    # =========================================================================
+    # PROCESSING SIDE
+    # =========================================================================
+
+    def take(self, timeout: Optional[float] = None) -> Optional[Tuple[Any, float]]:
+        """
+        Block until a fresh frame is pending and an in-flight slot is free,
+        then return (item, received_at). The oldest pending frame across
+        cameras goes first. Returns None when closed and empty, or on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._cond:
+            while True:
+                if self._aborted:
+                    return None
+                if self._in_flight < self.max_in_flight:
+                    taken = self._pop_fresh()
+                    if taken is not None:
+                        self._in_flight += 1
+                        return taken
+                    if self._closed:
+                        return None
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(timeout=remaining)
+
+    def drain(self) -> Iterator[Tuple[Any, float]]:
+        """Yield (item, received_at) until closed and empty."""
+        while True:
+            taken = self.take()
+            if taken is None:
+                return
+            yield taken
+
+    def complete(self, camera_id: str, latency_ms: float) -> None:
+        """
+        Mark a taken frame as finished and feed back its end-to-end latency
+        (receive -> response) for AIMD.
+        """
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify()
+
+            slot = self._slot(camera_id)
+            stats = slot.stats
+
+            if stats.latency_ewma_ms == 0.0:
+                stats.latency_ewma_ms = latency_ms
+            else:
+                stats.latency_ewma_ms += self.ewma_alpha * (latency_ms - stats.latency_ewma_ms)
+
+            now = time.monotonic()
+            if stats.latency_ewma_ms > self.target_latency_ms:
+                if now - slot.last_decrease_at < self.decrease_interval_s:
+                    return
+                slot.last_decrease_at = now
+                stats.target_fps = max(self.min_fps, stats.target_fps * self.decrease_factor)
+                logger.debug(
+                    "stream_admission_backoff",
+                    camera_id=camera_id,
+                    latency_ewma_ms=round(stats.latency_ewma_ms, 2),
+                    target_fps=round(stats.target_fps, 2),
+                )
+            else:
+                # One step per frame at the current rate ~= increase_fps per second
+                step = self.increase_fps / stats.target_fps
+                stats.target_fps = min(self.max_fps, stats.target_fps + step)
+
+    def stats(self, camera_id: str) -> AdmissionStats:
+        """Snapshot of a camera's counters."""
+        with self._cond:
+            s = self._slot(camera_id).stats
+            return AdmissionStats(**s.__dict__)
+
+    # =========================================================================
+    # INTERNALS (lock held)
+    # =========================================================================
+
+    def _slot(self, camera_id: str) -> _CameraSlot:
+        slot = self._slots.get(camera_id)
+        if slot is None:
+            slot = _CameraSlot(stats=AdmissionStats(target_fps=self.max_fps))
+            self._slots[camera_id] = slot
+        return slot
+
+    def _pop_fresh(self) -> Optional[Tuple[Any, float]]:
+        now = time.monotonic()
+        oldest: Optional[_CameraSlot] = None
+
+        for slot in self._slots.values():
+            if slot.pending is None:
+                continue
+            if self.max_age_s and now - slot.pending_received_at > self.max_age_s:
+                slot.pending = None
+                slot.stats.frames_stale += 1
+                continue
+            if oldest is None or slot.pending_received_at < oldest.pending_received_at:
+                oldest = slot
+
+        if oldest is None:
+            return None
+
+        item, received_at = oldest.pending, oldest.pending_received_at
+        oldest.pending = None
+        oldest.stats.frames_admitted += 1
+        return item, received_at
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["FrameAdmission", "AdmissionStats"]
@@ -0,0 +1,181 @@
+"""
+apps/ai/src/services/streaming/pipeline.py
+Staged, bounded-queue pipeline for per-stream frame processing.
+
+Each stage runs on its own worker thread and stages are joined by bounded
+queues, so stage N of frame k overlaps stage N-1 of frame k+1 while frame
+order is preserved (every stage is FIFO with a single worker).
+
+When the first queue is full, the feeder stops pulling from the source
+iterator - for gRPC that means the reader stops reading and HTTP/2 flow
+control pushes back on the client.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger("sssp.ai.stream_pipeline")
+
+Stage = Tuple[str, Callable[[Any], Any]]
+
+_END = object()
+
+
+@dataclass
+class _Failure:
+    """Unexpected exception raised by a stage or by the source iterator."""
+    stage: str
+    error: BaseException
+
+
+class StagePipeline:
+    """
+    Run items from a source iterator through ordered stages.
+
+    Stage callables take an item and return the (possibly same) item for the
+    next stage. They are expected to handle per-item errors themselves; an
+    exception escaping a stage is treated as fatal and re-raised from `run()`.
+    """
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        queue_size: int = 2,
+        name: str = "pipeline",
+        poll_interval_s: float = 0.1,
+    ) -> None:
+        if not stages:
+            raise ValueError("StagePipeline needs at least one stage")
+
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.name = name
+        self._poll = poll_interval_s
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """
+        Start the feeder and stage workers, then yield finished items in
+        source order. Closing the generator stops every worker.
+        """
+        queues: List[queue.Queue] = [
+            queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)
+        ]
+
+        self._spawn(f"{self.name}-feeder", self._feed, source, queues[0])
+        for i, (stage_name, fn) in enumerate(self.stages):
+            self._spawn(
+                f"{self.name}-{stage_name}",
+                self._work,
+                stage_name,
+                fn,
+                queues[i],
+                queues[i + 1],
+            )
+
+        output = queues[-1]
+        try:
+            while True:
+                item = self._get(output)
+                if item is None or item is _END:
+                    return
+                if isinstance(item, _Failure):
+                    logger.error(
+                        "pipeline_stage_failed",
+                        pipeline=self.name,
+                        stage=item.stage,
+                        error=str(item.error),
+                    )
+                    raise item.error
+                yield item
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Signal all workers to exit (idempotent)."""
+        self._stop.set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    # =========================================================================
+    # WORKERS
+    # =========================================================================
+
+    def _spawn(self, thread_name: str, target: Callable, *args: Any) -> None:
+        thread = threading.Thread(target=target, args=args, name=thread_name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _feed(self, source: Iterable[Any], out: queue.Queue) -> None:
+        try:
+            for item in source:
+                if not self._put(out, item):
+                    return
+        except BaseException as e:  # source iterator broke (e.g. client went away)
+            if not self.stopped:
+                self._put(out, _Failure(stage="source", error=e))
+            return
+        self._put(out, _END)
+
+    def _work(
+        self,
+        stage_name: str,
+        fn: Callable[[Any], Any],
+        inp: queue.Queue,
+        out: queue.Queue,
+    ) -> None:
+        while True:
+            item = self._get(inp)
+            if item is None:
+                return
+            if item is _END or isinstance(item, _Failure):
+                self._put(out, item)
+                return
+            try:
+                result = fn(item)
+            except BaseException as e:
+                self._put(out, _Failure(stage=stage_name, error=e))
+                return
+            if not self._put(out, result):
+                return
+
+    # =========================================================================
+    # STOP-AWARE QUEUE OPS
+    # =========================================================================
+
+    def _put(self, q: queue.Queue, item: Any) -> bool:
+        """Blocking put that gives up once the pipeline is stopped."""
+        while not self.stopped:
+            try:
+                q.put(item, timeout=self._poll)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: queue.Queue) -> Optional[Any]:
+        """Blocking get that returns None once the pipeline is stopped."""
+        while not self.stopped:
+            try:
+                return q.get(timeout=self._poll)
+            except queue.Empty:
+                continue
+        return None
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["StagePipeline", "Stage"]
@@ -0,0 +1,305 @@
+"""
+apps/ai/src/services/streaming/scheduler.py
+Fair inference scheduling across camera streams.
+
+All StreamFrames calls share one CameraScheduler. Before running detection a
+stream asks for a turn for its camera; a fixed number of turns run at once
+(`slots`). Free slots are handed out by deficit round robin:
+
+- every visit credits a camera `quantum_ms * weight`
+- a camera is served while its deficit is positive
+- the measured cost of the turn (detect + embed ms) is charged afterwards
+
+A camera whose frames are expensive (many faces) therefore gets
+proportionally fewer turns instead of starving the others. The quantum
+should be on the order of a cheap frame's cost: a camera costing k quanta
+per turn is served about once every k rounds. Cameras with
+faces seen in the last `activity_window_s` get `active_weight`.
+
+Per-camera state is evicted after `idle_ttl_s` without traffic, and the
+least recently seen idle camera is evicted once `max_cameras` is reached.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+import structlog
+
+logger = structlog.get_logger("sssp.ai.stream_scheduler")
+
+
+@dataclass
+class _Ticket:
+    camera_id: str
+    granted: bool = False
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _CameraState:
+    camera_id: str
+    deficit_ms: float = 0.0
+    waiting: Deque[_Ticket] = field(default_factory=deque)
+    running: int = 0
+    turns: int = 0
+    total_cost_ms: float = 0.0
+    total_wait_ms: float = 0.0
+    last_seen: float = field(default_factory=time.monotonic)
+    last_active: float = float("-inf")
+    grant_times: Deque[float] = field(default_factory=lambda: deque(maxlen=64))
+
+    @property
+    def idle(self) -> bool:
+        return self.running == 0 and not self.waiting
+
+
+class TurnHandle:
+    """Handed to the caller for one turn; add cost/activity before it ends."""
+
+    def __init__(self, camera_id: str) -> None:
+        self.camera_id = camera_id
+        self.faces = 0
+        self.extra_cost_ms = 0.0
+
+
+class CameraScheduler:
+    """
+    Deficit-round-robin gate for inference turns across cameras.
+
+    Thread-safe; intended to be shared by every stream on the server.
+    """
+
+    def __init__(
+        self,
+        slots: int = 2,
+        quantum_ms: float = 20.0,
+        active_weight: float = 2.0,
+        activity_window_s: float = 10.0,
+        idle_ttl_s: float = 60.0,
+        max_cameras: int = 256,
+    ) -> None:
+        self.slots = max(1, slots)
+        self.quantum_ms = max(1.0, quantum_ms)
+        self.active_weight = max(1.0, active_weight)
+        self.activity_window_s = activity_window_s
+        self.idle_ttl_s = idle_ttl_s
+        self.max_cameras = max(1, max_cameras)
+
+        self._cameras: "OrderedDict[str, _CameraState]" = OrderedDict()
+        self._rotation: Deque[str] = deque()  # cameras with waiters, DRR order
+        self._running = 0
+        self._cond = threading.Condition()
+        self._last_sweep = time.monotonic()
+        self.evicted = 0
+
+        logger.info(
+            "camera_scheduler_initialized",
+            slots=self.slots,
+            quantum_ms=self.quantum_ms,
+            active_weight=self.active_weight,
+            idle_ttl_s=idle_ttl_s,
+            max_cameras=self.max_cameras,
+        )
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    @contextmanager
+    def turn(self, camera_id: str, timeout: Optional[float] = None) -> Iterator[TurnHandle]:
+        """
+        Block until `camera_id` is granted an inference slot, run the body,
+        then charge the elapsed time (+ handle.extra_cost_ms) to the camera.
+        Raises TimeoutError if no slot is granted within `timeout`.
+        """
+        if not self.acquire(camera_id, timeout=timeout):
+            raise TimeoutError(f"No inference slot for camera '{camera_id}' within {timeout}s")
+
+        handle = TurnHandle(camera_id)
+        start = time.perf_counter()
+        try:
+            yield handle
+        finally:
+            cost_ms = (time.perf_counter() - start) * 1000.0 + handle.extra_cost_ms
+            self.release(camera_id, cost_ms=cost_ms, faces=handle.faces)
+
+    def acquire(self, camera_id: str, timeout: Optional[float] = None) -> bool:
+        """Wait for a slot. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._cond:
+            self._maybe_sweep()
+            state = self._state(camera_id)
+            ticket = _Ticket(camera_id=camera_id)
+            if not state.waiting:
+                self._rotation.append(camera_id)
+            state.waiting.append(ticket)
+            self._dispatch()
+
+            while not ticket.granted:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._cancel(state, ticket)
+                    return False
+                self._cond.wait(timeout=remaining)
+
+            state.total_wait_ms += (time.monotonic() - ticket.enqueued_at) * 1000.0
+            return True
+
+    def release(self, camera_id: str, cost_ms: float, faces: int = 0) -> None:
+        """End a turn: free the slot and charge its cost to the camera."""
+        with self._cond:
+            self._running = max(0, self._running - 1)
+            state = self._state(camera_id)
+            state.running = max(0, state.running - 1)
+            state.deficit_ms -= cost_ms
+            state.total_cost_ms += cost_ms
+            if faces > 0:
+                state.last_active = time.monotonic()
+            self._dispatch()
+
+    def charge(self, camera_id: str, cost_ms: float) -> None:
+        """Charge work done outside a turn (e.g. shared embedding batches)."""
+        with self._cond:
+            state = self._cameras.get(camera_id)
+            if state is not None:
+                state.deficit_ms -= cost_ms
+                state.total_cost_ms += cost_ms
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-camera scheduling metrics."""
+        now = time.monotonic()
+        with self._cond:
+            return {
+                cid: {
+                    "queue_depth": len(s.waiting),
+                    "running": s.running,
+                    "weight": self._weight(s, now),
+                    "granted_fps": round(self._granted_fps(s, now), 2),
+                    "turns": s.turns,
+                    "deficit_ms": round(s.deficit_ms, 2),
+                    "avg_cost_ms": round(s.total_cost_ms / s.turns, 2) if s.turns else 0.0,
+                    "avg_wait_ms": round(s.total_wait_ms / s.turns, 2) if s.turns else 0.0,
+                    "idle_seconds": round(now - s.last_seen, 1),
+                }
+                for cid, s in self._cameras.items()
+            }
+
+    @property
+    def camera_count(self) -> int:
+        with self._cond:
+            return len(self._cameras)
+
+    # =========================================================================
+    # DRR (lock held)
+    # =========================================================================
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiting cameras in deficit-round-robin order."""
+        granted = False
+        now = time.monotonic()
+
+        while self._running < self.slots and self._rotation:
+            camera_id = self._rotation[0]
+            state = self._cameras[camera_id]
+
+            if state.deficit_ms <= 0:
+                # Credit and move on; the camera is served on a later visit.
+                # Credit is only given while in debt, so idle cameras cannot
+                # bank more than one quantum.
+                state.deficit_ms += self.quantum_ms * self._weight(state, now)
+                self._rotation.rotate(-1)
+                continue
+
+            ticket = state.waiting.popleft()
+            ticket.granted = True
+            granted = True
+            self._running += 1
+            state.running += 1
+            state.turns += 1
+            state.grant_times.append(now)
+
+            self._rotation.popleft()
+            if state.waiting:
+                self._rotation.append(camera_id)
+
+        if granted:
+            self._cond.notify_all()
+
+    def _cancel(self, state: _CameraState, ticket: _Ticket) -> None:
+        try:
+            state.waiting.remove(ticket)
+        except ValueError:
+            return
+        if not state.waiting:
+            try:
+                self._rotation.remove(state.camera_id)
+            except ValueError:
+                pass
+
+    def _weight(self, state: _CameraState, now: float) -> float:
+        if now - state.last_active <= self.activity_window_s:
+            return self.active_weight
+        return 1.0
+
+    @staticmethod
+    def _granted_fps(state: _CameraState, now: float) -> float:
+        times = state.grant_times
+        if not times:
+            return 0.0
+        span = now - times[0]
+        return len(times) / span if span > 0 else 0.0
+
+    # =========================================================================
+    # STATE / EVICTION (lock held)
+    # =========================================================================
+
+    def _state(self, camera_id: str) -> _CameraState:
+        state = self._cameras.get(camera_id)
+        if state is None:
+            self._evict_lru(reserve=1)  # before inserting: the new camera is idle too
+            state = _CameraState(camera_id=camera_id)
+            self._cameras[camera_id] = state
+        else:
+            self._cameras.move_to_end(camera_id)
+        state.last_seen = time.monotonic()
+        return state
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < 1.0:
+            return
+        self._last_sweep = now
+
+        expired: List[str] = [
+            cid for cid, s in self._cameras.items()
+            if s.idle and now - s.last_seen > self.idle_ttl_s
+        ]
+        for cid in expired:
+            del self._cameras[cid]
+        if expired:
+            self.evicted += len(expired)
+            logger.debug("camera_state_expired", cameras=expired)
+
+    def _evict_lru(self, reserve: int = 0) -> None:
+        """Drop idle cameras, oldest first, until `reserve` more fit under max_cameras."""
+        limit = self.max_cameras - reserve
+        if len(self._cameras) <= limit:
+            return
+        for cid in list(self._cameras.keys()):
+            if len(self._cameras) <= limit:
+                return
+            if self._cameras[cid].idle:
+                del self._cameras[cid]
+                self.evicted += 1
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["CameraScheduler", "TurnHandle"]
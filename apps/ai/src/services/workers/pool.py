@@ -0,0 +1,478 @@
+"""
+apps/ai/src/services/workers/pool.py
+Pool of inference worker processes.
+
+Each worker is a separate interpreter (own GIL) that builds its own model
+replicas through a runtime factory given as "module:function". Jobs go to
+the worker with the fewest outstanding jobs (or a pinned worker, for
+multi-step work whose state lives in one worker). Decoded frames travel
+through a shared-memory FrameRing; frames too large for a slot (or sent
+while the ring is full) fall back to pickling.
+
+A collector thread in the parent resolves job futures, frees ring slots and
+checks worker liveness every LIVENESS_INTERVAL_S (whatever the result
+traffic). A dead worker's outstanding jobs fail with WorkerError and it is
+restarted: at once after a crash following a successful start, with
+exponential backoff while it keeps failing, and not at all after
+`max_restarts` consecutive failures.
+
+Jobs are marked running when queued: a job handed to a worker cannot be
+withdrawn, so `Future.cancel()` returns False and the result still lands.
+
+The runtime returned by the factory must provide `handle(op, frame, **kwargs)`.
+"""
+
+import importlib
+import itertools
+import multiprocessing as mp
+import os
+import queue
+import signal
+import threading
+import time
+import traceback
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import structlog
+
+from src.core.cpu_budget import limit_threads, pin_process
+from src.services.workers.shm_ring import FrameRef, FrameRing, RingSpec
+
+logger = structlog.get_logger("sssp.ai.inference_pool")
+
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+LIVENESS_INTERVAL_S = 0.5
+
+
+class WorkerError(Exception):
+    """An exception raised inside a worker (or the worker died)."""
+
+    def __init__(self, kind: str, message: str, details: Optional[dict] = None) -> None:
+        super().__init__(message)
+        self.kind = kind
+        self.message = message
+        self.details = details or {}
+
+    def __reduce__(self):
+        return (WorkerError, (self.kind, self.message, self.details))
+
+    @classmethod
+    def from_exception(cls, error: BaseException) -> "WorkerError":
+        details = dict(getattr(error, "details", None) or {})
+        details["traceback"] = "".join(traceback.format_exception_only(type(error), error)).strip()
+        return cls(type(error).__name__, getattr(error, "message", None) or str(error), details)
+
+
+# ============================================================================
+# Worker process
+# ============================================================================
+
+def _load_factory(path: str):
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _worker_main(
+    worker_id: int,
+    runtime_factory: str,
+    ring_spec: RingSpec,
+    jobs: "mp.Queue",
+    results: "mp.Queue",
+    threads: int,
+    cpus: Optional[Sequence[int]] = None,
+) -> None:
+    """Worker entry point: build the runtime, then serve jobs until None."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent owns shutdown
+    for var in _THREAD_ENV_VARS:
+        os.environ[var] = str(threads)  # before torch / BLAS are imported
+    if cpus:
+        pin_process(cpus)
+    limit_threads(threads)
+
+    ring = FrameRing.attach(ring_spec)
+    try:
+        runtime = _load_factory(runtime_factory)()
+    except BaseException as e:
+        results.put((worker_id, None, False, WorkerError.from_exception(e)))
+        ring.close()
+        return
+    results.put((worker_id, None, True, os.getpid()))
+
+    while True:
+        message = jobs.get()
+        if message is None:
+            break
+
+        job_id, op, ref, inline_frame, kwargs = message
+        frame = ring.view(ref) if ref is not None else inline_frame
+        try:
+            payload = runtime.handle(op, frame, **kwargs)
+            results.put((worker_id, job_id, True, payload))
+        except BaseException as e:
+            results.put((worker_id, job_id, False, WorkerError.from_exception(e)))
+        finally:
+            frame = None  # the slot is reused as soon as the result lands
+
+    ring.close()
+
+
+# ============================================================================
+# Parent side
+# ============================================================================
+
+@dataclass
+class _Job:
+    future: Future
+    worker_id: int
+    slot: Optional[int] = None
+
+
+@dataclass
+class _Worker:
+    worker_id: int
+    process: Any
+    jobs: Any
+    outstanding: int = 0
+    restarts: int = 0
+    failures: int = 0  # consecutive deaths / failed starts since the last successful start
+    down: bool = False  # dead; respawned at respawn_at unless gave_up
+    respawn_at: float = 0.0
+    gave_up: bool = False
+    pid: Optional[int] = None
+    ready: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def available(self) -> bool:
+        return not self.down
+
+
+class InferenceProcessPool:
+    """
+    Out-of-process model executor.
+
+    Thread-safe: any number of server threads may `submit()` concurrently.
+    """
+
+    def __init__(
+        self,
+        runtime_factory: str,
+        num_workers: int,
+        ring_slots: int = 16,
+        slot_bytes: int = 8 * 1024 * 1024,
+        threads_per_worker: Optional[int] = None,
+        cpu_sets: Optional[Sequence[Sequence[int]]] = None,
+        start_method: str = "spawn",
+        ready_timeout_s: float = 300.0,
+        max_restarts: int = 5,
+        restart_backoff_s: float = 1.0,
+        max_restart_backoff_s: float = 30.0,
+    ) -> None:
+        self.runtime_factory = runtime_factory
+        self.num_workers = max(1, num_workers)
+        self.ring_slots = max(1, ring_slots)
+        self.slot_bytes = slot_bytes
+        self.threads_per_worker = threads_per_worker or max(
+            1, (os.cpu_count() or 1) // self.num_workers
+        )
+        self.cpu_sets = [tuple(cpus) for cpus in cpu_sets] if cpu_sets else None  # per worker; None = no pinning
+        self.ready_timeout_s = ready_timeout_s
+        self.max_restarts = max_restarts  # consecutive failures before a worker is given up
+        self.restart_backoff_s = restart_backoff_s  # doubles per consecutive failure
+        self.max_restart_backoff_s = max_restart_backoff_s
+
+        self._ctx = mp.get_context(start_method)
+        self._ring: Optional[FrameRing] = None
+        self._results: Optional["mp.Queue"] = None
+        self._workers: List[_Worker] = []
+        self._jobs: Dict[int, _Job] = {}
+        self._job_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._collector: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        self._inline_frames = 0
+
+    # =========================================================================
+    # LIFECYCLE
+    # =========================================================================
+
+    def start(self) -> None:
+        """Spawn workers and wait until every runtime is built."""
+        self._ring = FrameRing.create(self.ring_slots, self.slot_bytes)
+        self._results = self._ctx.Queue()
+        self._workers = [self._spawn(worker_id) for worker_id in range(self.num_workers)]
+
+        self._collector = threading.Thread(
+            target=self._collect, name="inference-pool-collector", daemon=True
+        )
+        self._collector.start()
+
+        deadline = time.monotonic() + self.ready_timeout_s
+        for worker_id in range(self.num_workers):
+            while not self._workers[worker_id].ready.wait(timeout=LIVENESS_INTERVAL_S):
+                if self._workers[worker_id].gave_up or time.monotonic() > deadline:
+                    self.close()
+                    raise RuntimeError(f"Inference worker {worker_id} did not become ready")
+
+        logger.info(
+            "inference_pool_started",
+            workers=self.num_workers,
+            threads_per_worker=self.threads_per_worker,
+            cpu_sets=self.cpu_sets,
+            ring_slots=self.ring_slots,
+            slot_mb=round(self.slot_bytes / (1024 * 1024), 1),
+            pids=[w.pid for w in self._workers],
+        )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop workers, fail outstanding jobs and release the ring."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+
+        for worker in self._workers:
+            try:
+                worker.jobs.put(None)
+            except Exception:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+
+        with self._lock:
+            jobs, self._jobs = self._jobs, {}
+        for job in jobs.values():
+            self._resolve(job.future, False, WorkerError("PoolClosed", "Inference pool closed"))
+
+        if self._collector is not None:
+            self._collector.join(timeout=timeout)
+        if self._ring is not None:
+            self._ring.close()
+        logger.info("inference_pool_closed")
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers) and not self._closed.is_set()
+
+    # =========================================================================
+    # SUBMISSION
+    # =========================================================================
+
+    def submit(
+        self,
+        op: str,
+        frame: Optional[np.ndarray] = None,
+        worker: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """
+        Queue `op` on a worker. The future's result is the runtime's return
+        value; its `worker_id` attribute says which worker ran it.
+        """
+        if self._closed.is_set():
+            raise WorkerError("PoolClosed", "Inference pool closed")
+
+        ref: Optional[FrameRef] = None
+        inline_frame = None
+        if frame is not None:
+            ref = self._ring.put(frame, timeout=0.0)
+            if ref is None:
+                inline_frame = frame
+                self._inline_frames += 1
+
+        future: Future = Future()
+        future.set_running_or_notify_cancel()  # queued work cannot be withdrawn from a worker
+        with self._lock:
+            if worker is not None:
+                target = self._workers[worker]
+                if not target.available:
+                    self._release_ref(ref)
+                    raise WorkerError("WorkerDied", f"Inference worker {worker} is down")
+            else:
+                available = [w for w in self._workers if w.available]
+                if not available:
+                    self._release_ref(ref)
+                    raise WorkerError("NoWorkers", "No inference worker is running")
+                target = min(available, key=lambda w: w.outstanding)
+            job_id = next(self._job_ids)
+            self._jobs[job_id] = _Job(
+                future=future,
+                worker_id=target.worker_id,
+                slot=ref.slot if ref is not None else None,
+            )
+            target.outstanding += 1
+            future.worker_id = target.worker_id
+
+        target.jobs.put((job_id, op, ref, inline_frame, kwargs))
+        return future
+
+    def call(
+        self,
+        op: str,
+        frame: Optional[np.ndarray] = None,
+        worker: Optional[int] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """submit() and wait for the result."""
+        return self.submit(op, frame=frame, worker=worker, **kwargs).result(timeout=timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": [
+                    {
+                        "worker_id": w.worker_id,
+                        "pid": w.pid,
+                        "alive": w.process.is_alive(),
+                        "outstanding": w.outstanding,
+                        "restarts": w.restarts,
+                        "gave_up": w.gave_up,
+                    }
+                    for w in self._workers
+                ],
+                "jobs_outstanding": len(self._jobs),
+                "shm_free_slots": self._ring.free_slots if self._ring else 0,
+                "inline_frames": self._inline_frames,
+            }
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _spawn(self, worker_id: int) -> _Worker:
+        jobs = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                worker_id,
+                self.runtime_factory,
+                self._ring.spec,
+                jobs,
+                self._results,
+                self.threads_per_worker,
+                self.cpu_sets[worker_id % len(self.cpu_sets)] if self.cpu_sets else None,
+            ),
+            name=f"inference-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        return _Worker(worker_id=worker_id, process=process, jobs=jobs)
+
+    def _collect(self) -> None:
+        """Resolve futures from the result queue; restart dead workers."""
+        next_check = time.monotonic() + LIVENESS_INTERVAL_S
+        while not self._closed.is_set():
+            # Liveness is checked on a fixed interval, also under steady result traffic
+            if time.monotonic() >= next_check:
+                self._reap_dead_workers()
+                next_check = time.monotonic() + LIVENESS_INTERVAL_S
+            try:
+                worker_id, job_id, ok, payload = self._results.get(
+                    timeout=max(0.0, next_check - time.monotonic())
+                )
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                return
+
+            if job_id is None:
+                self._on_worker_started(worker_id, ok, payload)
+                continue
+
+            with self._lock:
+                job = self._jobs.pop(job_id, None)
+                if job is None:
+                    continue
+                self._workers[job.worker_id].outstanding -= 1
+            if job.slot is not None:
+                self._ring.release(job.slot)
+            self._resolve(job.future, ok, payload)
+
+    def _on_worker_started(self, worker_id: int, ok: bool, payload: Any) -> None:
+        worker = self._workers[worker_id]
+        if ok:
+            worker.pid = payload
+            worker.failures = 0
+            worker.ready.set()
+            logger.info("inference_worker_ready", worker_id=worker_id, pid=payload)
+            return
+
+        # The runtime could not be built: jobs already queued to it fail now
+        logger.error("inference_worker_start_failed", worker_id=worker_id, error=str(payload))
+        self._fail_jobs(worker_id, payload)
+
+    def _reap_dead_workers(self) -> None:
+        now = time.monotonic()
+        for worker_id, worker in enumerate(list(self._workers)):
+            if self._closed.is_set():
+                return
+            if not worker.down:
+                if worker.process.is_alive():
+                    continue
+                self._on_worker_died(worker)
+            if worker.down and not worker.gave_up and now >= worker.respawn_at:
+                with self._lock:
+                    replacement = self._spawn(worker_id)
+                    replacement.restarts = worker.restarts + 1
+                    replacement.failures = worker.failures
+                    self._workers[worker_id] = replacement
+                logger.info("inference_worker_restarted", worker_id=worker_id, restarts=replacement.restarts)
+
+    def _on_worker_died(self, worker: _Worker) -> None:
+        """Fail its jobs; schedule the restart (backoff after repeated failures) or give up."""
+        worker.failures += 1
+        if worker.failures > self.max_restarts:
+            worker.gave_up = True
+        elif worker.failures > 1:
+            backoff = self.restart_backoff_s * 2 ** (worker.failures - 2)
+            worker.respawn_at = time.monotonic() + min(backoff, self.max_restart_backoff_s)
+        worker.down = True
+
+        logger.error(
+            "inference_worker_died",
+            worker_id=worker.worker_id,
+            exitcode=worker.process.exitcode,
+            consecutive_failures=worker.failures,
+            gave_up=worker.gave_up,
+        )
+        self._fail_jobs(
+            worker.worker_id, WorkerError("WorkerDied", f"Inference worker {worker.worker_id} died")
+        )
+
+    def _fail_jobs(self, worker_id: int, error: WorkerError) -> None:
+        with self._lock:
+            lost = [self._jobs.pop(jid) for jid, j in list(self._jobs.items()) if j.worker_id == worker_id]
+            self._workers[worker_id].outstanding -= len(lost)
+        for job in lost:
+            if job.slot is not None:
+                self._ring.release(job.slot)
+            self._resolve(job.future, False, error)
+
+    def _release_ref(self, ref: Optional[FrameRef]) -> None:
+        if ref is not None:
+            self._ring.release(ref.slot)
+
+    @staticmethod
+    def _resolve(future: Future, ok: bool, payload: Any) -> None:
+        """Set a job's outcome once (close() and the collector may race on it)."""
+        if future.done():
+            return
+        try:
+            if ok:
+                future.set_result(payload)
+            else:
+                future.set_exception(payload)
+        except InvalidStateError:
+            pass
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["InferenceProcessPool", "WorkerError"]
@@ -0,0 +1,339 @@
+"""
+apps/ai/src/services/workers/remote.py
+Process-pool backed inference services.
+
+- InferenceWorkerRuntime: lives in each worker process and owns that
+  worker's FaceRecognitionService / ObjectDetectionService replicas
+- RemoteFaceService / RemoteObjectDetectionService: drop-in facades the
+  servicers call in the server process; every call becomes a pool job
+
+The streaming detect / embed stages stay separate: detect_frame leaves its
+FrameDetection in the worker that ran it and returns a token, and
+embed_frame is pinned to that worker.
+"""
+
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, TimeoutError as FutureTimeout, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.config import settings
+from src.core.cpu_budget import intra_op_threads, worker_cpu_sets
+from src.core.deadline import Deadline
+from src.core.exceptions import (
+    DeadlineExceededException,
+    InferenceException,
+    InvalidImageException,
+)
+from src.core.logging import get_logger
+from src.schemas.detection import DetectBatchResponse
+from src.services.ml.object_detection import ObjectDetectionService
+from src.services.workers.pool import InferenceProcessPool, WorkerError
+from src.utils.buffer_pool import configure_buffer_pool
+
+logger = get_logger("sssp.ai.remote_inference")
+
+RUNTIME_FACTORY = "src.services.workers.remote:create_runtime"
+
+
+# ============================================================================
+# Worker side
+# ============================================================================
+
+class InferenceWorkerRuntime:
+    """One replica of every model, serving pool jobs inside a worker."""
+
+    MAX_PENDING_DETECTIONS = 64
+
+    def __init__(self) -> None:
+        import cv2
+        from src.services.ml.Face_Recognition_Service import FaceRecognitionService
+
+        cv2.setNumThreads(1)  # parallelism comes from the worker processes
+        self.face_service = FaceRecognitionService()
+        self.face_service.warmup()
+        self._object_service = None
+        self._detections: "OrderedDict[int, Any]" = OrderedDict()
+        self._next_token = 0
+
+    def handle(self, op: str, frame: Optional[np.ndarray], **kwargs: Any) -> Any:
+        face = self.face_service
+
+        if op == "detect_faces":
+            return face.detect_faces(**kwargs)
+        if op == "extract_embeddings":
+            return face.extract_embeddings(**kwargs)
+        if op == "process_frame":
+            return face.process_frame(frame=frame, **kwargs)
+        if op == "detect_frame":
+            return self._detect_frame(frame, **kwargs)
+        if op == "embed_frame":
+            detection = self._detections.pop(kwargs.pop("token"), None)
+            if detection is None:
+                raise InferenceException("detection expired before embedding")
+            return face.embed_frame(detection, **kwargs)
+        if op == "get_model_info":
+            return face.get_model_info()
+        if op == "detect_objects":
+            return self._objects().detect_objects(**kwargs)
+        if op == "detect_decoded":
+            return self._objects().detect_decoded(frame, **kwargs)
+        raise ValueError(f"Unknown inference op '{op}'")
+
+    def _detect_frame(self, frame: np.ndarray, **kwargs: Any) -> Dict[str, Any]:
+        detection = self.face_service.detect_frame(frame=frame, **kwargs)
+        # Crops (or the frame kept for embed_boxes) may be views into the
+        # shared slot, which is reused once we reply
+        for detected in detection.faces:
+            if getattr(detected, "crop", None) is not None:
+                detected.crop = detected.crop.copy()
+        if detection.frame is not None:
+            detection.frame = detection.frame.copy() if detection.faces else None
+
+        self._next_token += 1
+        self._detections[self._next_token] = detection
+        while len(self._detections) > self.MAX_PENDING_DETECTIONS:
+            self._detections.popitem(last=False)
+
+        return {
+            "token": self._next_token,
+            "faces": [
+                self.face_service._map_detected_face(f, include_crop=False)
+                for f in detection.faces
+            ],
+        }
+
+    def _objects(self) -> ObjectDetectionService:
+        if self._object_service is None:
+            self._object_service = ObjectDetectionService()
+        return self._object_service
+
+
+def create_runtime() -> InferenceWorkerRuntime:
+    """Runtime factory for InferenceProcessPool (see RUNTIME_FACTORY)."""
+    configure_buffer_pool(settings.FRAME_BUFFER_POOL_MB * 1024 * 1024)
+    return InferenceWorkerRuntime()
+
+
+def create_inference_pool() -> InferenceProcessPool:
+    """Pool configured from INFERENCE_PROCESS_* settings (not started)."""
+    return InferenceProcessPool(
+        runtime_factory=RUNTIME_FACTORY,
+        num_workers=settings.INFERENCE_PROCESS_WORKERS,
+        ring_slots=settings.INFERENCE_SHM_SLOTS,
+        slot_bytes=int(settings.INFERENCE_SHM_SLOT_MB * 1024 * 1024),
+        threads_per_worker=settings.INFERENCE_THREADS_PER_WORKER or intra_op_threads() or None,
+        cpu_sets=worker_cpu_sets(settings.INFERENCE_PROCESS_WORKERS),
+    )
+
+
+# ============================================================================
+# Server side
+# ============================================================================
+
+def _call(pool: InferenceProcessPool, op: str, deadline: Optional[Deadline], future=None, **kwargs):
+    """Wait for a pool job, translating worker errors back to service exceptions."""
+    if future is None:
+        future = pool.submit(op, deadline=deadline, **kwargs)
+
+    remaining_ms = deadline.remaining_ms() if deadline is not None else float("inf")
+    timeout = settings.REQUEST_TIMEOUT if remaining_ms == float("inf") else remaining_ms / 1000.0
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeout:
+        # The job stays queued in its worker; the pool drops its result when it lands
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceededException(op)
+        raise InferenceException(f"{op} timed out after {timeout:.1f}s in worker pool")
+    except WorkerError as e:
+        raise _to_service_exception(op, e) from None
+
+
+def _to_service_exception(op: str, error: WorkerError) -> Exception:
+    if error.kind == "DeadlineExceededException":
+        return DeadlineExceededException(error.details.get("stage", op))
+    if error.kind == "InvalidImageException":
+        return InvalidImageException(error.details.get("reason", error.message))
+    return InferenceException(error.message, details={"op": op, "kind": error.kind})
+
+
+@dataclass
+class RemoteFrameDetection:
+    """detect_frame result whose FrameDetection stays in `worker_id`."""
+    worker_id: int
+    token: int
+    faces: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class RemoteFaceService:
+    """
+    FaceRecognitionService facade backed by an InferenceProcessPool.
+
+    Same public methods and keyword arguments; decoded frames are passed
+    through shared memory.
+    """
+
+    def __init__(self, pool: InferenceProcessPool) -> None:
+        self.pool = pool
+
+    @property
+    def is_ready(self) -> bool:
+        return self.pool.is_running
+
+    def warmup(self) -> None:
+        """Workers warm up their own replicas before the pool reports ready."""
+
+    def cleanup(self) -> None:
+        self.pool.close()
+
+    def detect_faces(self, deadline: Optional[Deadline] = None, **kwargs: Any) -> Dict[str, Any]:
+        return _call(self.pool, "detect_faces", deadline, **kwargs)
+
+    def extract_embeddings(self, deadline: Optional[Deadline] = None, **kwargs: Any) -> Dict[str, Any]:
+        return _call(self.pool, "extract_embeddings", deadline, **kwargs)
+
+    def process_frame(
+        self,
+        frame: np.ndarray,
+        deadline: Optional[Deadline] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        future = self.pool.submit("process_frame", frame=frame, deadline=deadline, **kwargs)
+        return _call(self.pool, "process_frame", deadline, future=future)
+
+    def detect_frame(
+        self,
+        frame: np.ndarray,
+        deadline: Optional[Deadline] = None,
+        **kwargs: Any,
+    ) -> RemoteFrameDetection:
+        future = self.pool.submit("detect_frame", frame=frame, deadline=deadline, **kwargs)
+        result = _call(self.pool, "detect_frame", deadline, future=future)
+        return RemoteFrameDetection(
+            worker_id=future.worker_id,
+            token=result["token"],
+            faces=result["faces"],
+        )
+
+    def embed_frame(
+        self,
+        detection: RemoteFrameDetection,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        future = self.pool.submit(
+            "embed_frame",
+            worker=detection.worker_id,
+            token=detection.token,
+            deadline=deadline,
+        )
+        return _call(self.pool, "embed_frame", deadline, future=future)
+
+    def detection_only_frame(
+        self,
+        detection: RemoteFrameDetection,
+        skipped_stages: Sequence[str],
+    ) -> Dict[str, Any]:
+        """Partial result from the faces detect_frame returned (no worker call)."""
+        faces = [dict(face, face_id=i) for i, face in enumerate(detection.faces)]
+        return {
+            "success": True,
+            "faces": faces,
+            "partial": True,
+            "skipped_stages": list(skipped_stages),
+        }
+
+    def get_model_info(self) -> Dict[str, Any]:
+        info = _call(self.pool, "get_model_info", None)
+        info["process_workers"] = self.pool.num_workers
+        return info
+
+
+class RemoteObjectDetectionService:
+    """ObjectDetectionService facade backed by an InferenceProcessPool."""
+
+    def __init__(self, pool: InferenceProcessPool) -> None:
+        self.pool = pool
+
+    def detect_objects(self, request, deadline: Optional[Deadline] = None):
+        return _call(self.pool, "detect_objects", deadline, request=request)
+
+    def detect_waste(self, request, deadline: Optional[Deadline] = None):
+        return self.detect_objects(ObjectDetectionService.waste_request(request), deadline=deadline)
+
+    def detect_decoded(self, image: np.ndarray, request, deadline: Optional[Deadline] = None):
+        future = self.pool.submit("detect_decoded", frame=image, request=request, deadline=deadline)
+        return _call(self.pool, "detect_decoded", deadline, future=future)
+
+    def detect_batch(self, request, deadline: Optional[Deadline] = None) -> DetectBatchResponse:
+        """Whole batch across workers, responses in request order."""
+        start_time = time.time()
+        responses: List[Any] = [None] * len(request.requests)
+        for index, response in self.iter_detect_batch(request, deadline=deadline):
+            responses[index] = response
+        return DetectBatchResponse(
+            responses=responses,
+            total_time_ms=round((time.time() - start_time) * 1000, 2),
+        )
+
+    def iter_detect_batch(
+        self,
+        request,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Fan the batch out across workers; yield (index, response) as each finishes.
+        Items a worker could not take, or still running when `deadline` passes,
+        get error responses instead of failing the batch.
+        """
+        requests = request.requests
+        pending: Dict[Future, int] = {}
+        rejected: List[Tuple[int, str]] = []
+        for index, req in enumerate(requests):
+            try:
+                pending[self.pool.submit("detect_objects", request=req, deadline=deadline)] = index
+            except WorkerError as e:
+                rejected.append((index, _to_service_exception("detect_objects", e).message))
+
+        for index, message in rejected:
+            logger.error("remote_batch_item_failed", batch_index=index, error=message)
+            yield index, ObjectDetectionService._build_error_response(requests[index], message)
+
+        while pending:
+            # Wake up at the deadline even if no worker finishes by then
+            remaining_ms = deadline.remaining_ms() if deadline is not None else float("inf")
+            timeout = None if remaining_ms == float("inf") else remaining_ms / 1000.0
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    yield index, _call(self.pool, "detect_objects", deadline, future=future)
+                except (DeadlineExceededException, InferenceException) as e:
+                    logger.error("remote_batch_item_failed", batch_index=index, error=e.message)
+                    yield index, ObjectDetectionService._build_error_response(
+                        requests[index], e.message
+                    )
+
+            if deadline is not None and deadline.expired and pending:
+                # The jobs stay queued in their workers; the pool drops their results
+                logger.warning("remote_batch_deadline_exceeded", skipped=len(pending))
+                message = DeadlineExceededException("inference").message
+                for index in pending.values():
+                    yield index, ObjectDetectionService._build_error_response(requests[index], message)
+                return
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = [
+    "InferenceWorkerRuntime",
+    "RemoteFaceService",
+    "RemoteFrameDetection",
+    "RemoteObjectDetectionService",
+    "create_inference_pool",
+    "create_runtime",
+]
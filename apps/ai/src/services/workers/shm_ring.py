@@ -0,0 +1,137 @@
+"""
+apps/ai/src/services/workers/shm_ring.py
+Shared-memory frame slots for handing decoded frames to worker processes.
+
+One SharedMemory block is cut into `slots` fixed-size slots. The parent
+copies a frame into a free slot and sends only a FrameRef (slot, shape,
+dtype) through the job queue; workers map the same block and read the frame
+in place, so no frame is ever pickled. A slot returns to the free list when
+its job's result arrives.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Deque, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class FrameRef:
+    """Where a frame lives in the ring (sent to workers instead of pixels)."""
+    slot: int
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+@dataclass(frozen=True)
+class RingSpec:
+    """Everything a worker needs to attach to the parent's ring."""
+    name: str
+    slots: int
+    slot_bytes: int
+
+
+class FrameRing:
+    """
+    Fixed-slot frame ring on top of multiprocessing.shared_memory.
+
+    The owning (parent) process allocates and frees slots; attached
+    (worker) processes only read frames through `view()`.
+    """
+
+    def __init__(self, spec: RingSpec, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self.spec = spec
+        self._shm = shm
+        self._owner = owner
+        self._free: Deque[int] = deque(range(spec.slots))
+        self._cond = threading.Condition()
+
+    # =========================================================================
+    # CONSTRUCTORS
+    # =========================================================================
+
+    @classmethod
+    def create(cls, slots: int, slot_bytes: int) -> "FrameRing":
+        """Allocate a new ring (parent process)."""
+        shm = shared_memory.SharedMemory(create=True, size=max(1, slots * slot_bytes))
+        return cls(RingSpec(name=shm.name, slots=slots, slot_bytes=slot_bytes), shm, owner=True)
+
+    @classmethod
+    def attach(cls, spec: RingSpec) -> "FrameRing":
+        """Map an existing ring (worker process)."""
+        # Workers share the parent's resource tracker, so attaching here does
+        # not add a second owner; only the parent unlinks.
+        shm = shared_memory.SharedMemory(name=spec.name)
+        return cls(spec, shm, owner=False)
+
+    # =========================================================================
+    # PARENT SIDE
+    # =========================================================================
+
+    def put(self, frame: np.ndarray, timeout: Optional[float] = None) -> Optional[FrameRef]:
+        """
+        Copy `frame` into a free slot. Returns None if the frame is larger
+        than a slot or no slot frees up within `timeout` (send it inline).
+        """
+        if frame.nbytes > self.spec.slot_bytes:
+            return None
+
+        with self._cond:
+            if not self._free and not self._cond.wait_for(lambda: self._free, timeout=timeout):
+                return None
+            slot = self._free.popleft()
+
+        offset = slot * self.spec.slot_bytes
+        target = np.ndarray(frame.shape, dtype=frame.dtype, buffer=self._shm.buf, offset=offset)
+        np.copyto(target, frame, casting="no")
+        return FrameRef(slot=slot, shape=tuple(frame.shape), dtype=frame.dtype.str)
+
+    def release(self, slot: int) -> None:
+        """Return a slot to the free list."""
+        with self._cond:
+            self._free.append(slot)
+            self._cond.notify()
+
+    @property
+    def free_slots(self) -> int:
+        with self._cond:
+            return len(self._free)
+
+    # =========================================================================
+    # WORKER SIDE
+    # =========================================================================
+
+    def view(self, ref: FrameRef) -> np.ndarray:
+        """Zero-copy array over a slot; only valid until the job's result is sent."""
+        return np.ndarray(
+            ref.shape,
+            dtype=np.dtype(ref.dtype),
+            buffer=self._shm.buf,
+            offset=ref.slot * self.spec.slot_bytes,
+        )
+
+    # =========================================================================
+    # LIFECYCLE
+    # =========================================================================
+
+    def close(self) -> None:
+        """Unmap the block; the owner also unlinks it."""
+        try:
+            self._shm.close()
+        except BufferError:
+            pass  # a view is still alive; the mapping goes with the process
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["FrameRef", "FrameRing", "RingSpec"]
@@ -0,0 +1,151 @@
+"""
+apps/ai/src/utils/buffer_pool.py
+Reusable numpy buffers for the per-frame image stages.
+
+Every stream camera sends frames of one size, so the intermediate arrays of
+a frame (reduced-decode resize, detector proxy, letterbox canvases, NCHW
+input tensors) have the same shapes frame after frame. The pool keeps the
+released arrays per (shape, dtype) and hands them back out, so steady-state
+frames reuse memory instead of allocating and page-faulting new arrays.
+
+- Bounded: at most `max_bytes` are held; the least recently used shape is
+  evicted first, and `max_per_shape` caps each free list
+- Acquired arrays have undefined contents; callers write them fully
+  (cv2 `dst=` / numpy `out=`)
+- Only arrays handed out by acquire() should be released, and only once
+  nothing references them any more
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger("sssp.ai.buffer_pool")
+
+_Key = Tuple[Tuple[int, ...], str]
+
+
+@dataclass
+class BufferPoolStats:
+    hits: int = 0
+    misses: int = 0
+    releases: int = 0
+    evictions: int = 0
+    pooled_bytes: int = 0
+    pooled_buffers: int = 0
+
+
+class BufferPool:
+    """Thread-safe free lists of numpy arrays keyed by (shape, dtype)."""
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, max_per_shape: int = 8) -> None:
+        self.max_bytes = max_bytes
+        self.max_per_shape = max_per_shape
+        self._free: "OrderedDict[_Key, List[np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = BufferPoolStats()
+
+    def acquire(self, shape: Tuple[int, ...], dtype: Any = np.uint8) -> np.ndarray:
+        """An array of `shape` / `dtype` with undefined contents."""
+        key = (tuple(int(d) for d in shape), np.dtype(dtype).str)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                array = free.pop()
+                if free:
+                    self._free.move_to_end(key)
+                else:
+                    del self._free[key]
+                self._stats.hits += 1
+                self._stats.pooled_bytes -= array.nbytes
+                self._stats.pooled_buffers -= 1
+                return array
+            self._stats.misses += 1
+        return np.empty(key[0], dtype=dtype)
+
+    def release(self, array: np.ndarray) -> None:
+        """Return an acquired array; dropped if the pool is full."""
+        if array.base is not None or not array.flags.c_contiguous or array.nbytes > self.max_bytes:
+            return
+        key = (array.shape, array.dtype.str)
+        with self._lock:
+            self._stats.releases += 1
+            # Only shapes with pooled buffers keep a key, so many one-off
+            # shapes cannot grow the dict without bound
+            free = self._free.get(key)
+            if free is not None:
+                self._free.move_to_end(key)
+                if len(free) >= self.max_per_shape:
+                    return
+            while self._stats.pooled_bytes + array.nbytes > self.max_bytes and self._evict_one(key):
+                pass
+            if self._stats.pooled_bytes + array.nbytes > self.max_bytes or self.max_per_shape <= 0:
+                return
+            self._free.setdefault(key, []).append(array)
+            self._stats.pooled_bytes += array.nbytes
+            self._stats.pooled_buffers += 1
+
+    @contextmanager
+    def borrow(self, shape: Tuple[int, ...], dtype: Any = np.uint8) -> Iterator[np.ndarray]:
+        """acquire() for the duration of a with-block."""
+        array = self.acquire(shape, dtype)
+        try:
+            yield array
+        finally:
+            self.release(array)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return asdict(self._stats)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._free.clear()
+            self._stats.pooled_bytes = 0
+            self._stats.pooled_buffers = 0
+
+    def _evict_one(self, keep: _Key) -> bool:
+        """Drop one buffer of the least recently used other shape (lock held)."""
+        for key, free in self._free.items():
+            if key != keep and free:
+                array = free.pop()
+                if not free:
+                    del self._free[key]
+                self._stats.pooled_bytes -= array.nbytes
+                self._stats.pooled_buffers -= 1
+                self._stats.evictions += 1
+                return True
+        return False
+
+
+# ============================================================================
+# Process-wide pool
+# ============================================================================
+
+_pool = BufferPool()
+_pool_lock = threading.Lock()
+
+
+def get_buffer_pool() -> BufferPool:
+    return _pool
+
+
+def configure_buffer_pool(max_bytes: int, max_per_shape: int = 8) -> BufferPool:
+    """Replace the process-wide pool (FRAME_BUFFER_POOL_MB; 0 disables reuse)."""
+    global _pool
+    with _pool_lock:
+        _pool = BufferPool(max_bytes=max_bytes, max_per_shape=max_per_shape)
+    logger.info("buffer_pool_configured", max_mb=round(max_bytes / 2**20, 1), max_per_shape=max_per_shape)
+    return _pool
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["BufferPool", "BufferPoolStats", "configure_buffer_pool", "get_buffer_pool"]
@@ -0,0 +1,213 @@
+"""
+apps/ai/src/utils/image_decode.py
+Header-aware image decoding shared by the face, detection and stream paths.
+
+- JPEG / PNG dimensions are read from the header (SOFn / IHDR) without
+  decoding, so oversized, undersized and decompression-bomb images are
+  rejected before any pixel work
+- JPEGs that must be shrunk anyway are decoded at 1/2, 1/4 or 1/8 scale
+  (IMREAD_REDUCED_COLOR_*, libjpeg's DCT scaling), never below the target
+  size, and only the remainder goes through cv2.resize
+- Other formats (and headers that cannot be parsed) fall back to a full
+  decode followed by the same checks
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+import structlog
+
+from src.core.exceptions import InvalidImageException
+
+logger = structlog.get_logger("sssp.ai.image_decode")
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# SOF0..SOF15 minus DHT (C4), JPG (C8) and DAC (CC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_REDUCED_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+@dataclass(frozen=True)
+class ImageHeader:
+    format: str  # "jpeg" | "png"
+    width: int
+    height: int
+
+
+@dataclass(frozen=True)
+class DecodePlan:
+    """How an image will be decoded, and the size it will come out at."""
+    header: Optional[ImageHeader]
+    reduce_factor: int  # 1, 2, 4 or 8 (JPEG only)
+    output_size: Optional[Tuple[int, int]]  # (width, height) after decode + resize; None = unknown
+
+
+# ============================================================================
+# Header parsing
+# ============================================================================
+
+def read_image_header(data: bytes) -> Optional[ImageHeader]:
+    """Format and dimensions of a JPEG / PNG from its header; None if not parseable."""
+    if data[:8] == _PNG_SIGNATURE and data[12:16] == b"IHDR" and len(data) >= 24:
+        width = int.from_bytes(data[16:20], "big")
+        height = int.from_bytes(data[20:24], "big")
+        return ImageHeader("png", width, height)
+    if data[:2] == b"\xff\xd8":
+        size = _jpeg_size(data)
+        if size is not None:
+            return ImageHeader("jpeg", *size)
+    return None
+
+
+def _jpeg_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """Walk the JPEG marker segments up to the first SOFn."""
+    i, n = 2, len(data)
+    while i + 4 <= n:
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # standalone markers
+            i += 2
+            continue
+        if marker == 0xDA:  # scan data before any frame header
+            return None
+        length = int.from_bytes(data[i + 2:i + 4], "big")
+        if marker in _JPEG_SOF_MARKERS:
+            if i + 9 > n:
+                return None
+            height = int.from_bytes(data[i + 5:i + 7], "big")
+            width = int.from_bytes(data[i + 7:i + 9], "big")
+            return width, height
+        i += 2 + length
+    return None
+
+
+# ============================================================================
+# Planning + decoding
+# ============================================================================
+
+def _fit(width: int, height: int, max_dimension: int) -> Tuple[int, int]:
+    if max_dimension <= 0 or max(width, height) <= max_dimension:
+        return width, height
+    scale = float(max_dimension) / float(max(width, height))
+    return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+
+def plan_decode(header: Optional[ImageHeader], max_dimension: int = 0) -> DecodePlan:
+    """
+    Largest JPEG reduction that still leaves the long side >= max_dimension
+    (so the final resize only ever shrinks).
+    """
+    if header is None:
+        return DecodePlan(header=None, reduce_factor=1, output_size=None)
+
+    factor = 1
+    if header.format == "jpeg" and max_dimension > 0:
+        long_side = max(header.width, header.height)
+        for candidate in (8, 4, 2):
+            if -(-long_side // candidate) >= max_dimension:
+                factor = candidate
+                break
+    return DecodePlan(
+        header=header,
+        reduce_factor=factor,
+        output_size=_fit(header.width, header.height, max_dimension),
+    )
+
+
+def check_image_size(
+    width: int,
+    height: int,
+    min_dimension: int = 0,
+    max_pixels: int = 0,
+) -> None:
+    """
+    Raises:
+        InvalidImageException: image smaller than min_dimension or larger than max_pixels
+    """
+    if max_pixels and width * height > max_pixels:
+        raise InvalidImageException(f"Image too large: {width}x{height} (max {max_pixels} pixels)")
+    if width < min_dimension or height < min_dimension:
+        raise InvalidImageException(f"Image too small: {width}x{height} (min {min_dimension}px)")
+
+
+def decode_image(
+    data: bytes,
+    max_dimension: int = 0,
+    min_dimension: int = 0,
+    max_pixels: int = 0,
+    max_source_pixels: int = 0,
+) -> np.ndarray:
+    """
+    Decode JPEG/PNG bytes to BGR, long side at most `max_dimension` (0 = as is).
+
+    Args:
+        data: Encoded image
+        max_dimension: Target long side; larger images are shrunk (reduced decode + INTER_AREA)
+        min_dimension: Reject images whose source is smaller than this
+        max_pixels: Reject images that would still exceed this after shrinking
+        max_source_pixels: Reject sources above this before decoding (decompression bombs)
+
+    Raises:
+        InvalidImageException: undecodable, or outside the size limits
+    """
+    if not data:
+        raise InvalidImageException("Empty image data")
+
+    plan = plan_decode(read_image_header(data), max_dimension)
+    if plan.header is not None:
+        if max_source_pixels and plan.header.width * plan.header.height > max_source_pixels:
+            raise InvalidImageException(
+                f"Image too large: {plan.header.width}x{plan.header.height} "
+                f"(max {max_source_pixels} source pixels)"
+            )
+        check_image_size(plan.header.width, plan.header.height, min_dimension=min_dimension)
+        check_image_size(*plan.output_size, max_pixels=max_pixels)
+
+    image = cv2.imdecode(np.frombuffer(data, np.uint8), _REDUCED_FLAGS[plan.reduce_factor])
+    if image is None:
+        raise InvalidImageException("Could not decode image bytes")
+
+    h, w = image.shape[:2]
+    if plan.header is None:
+        check_image_size(w, h, min_dimension=min_dimension)
+    new_w, new_h = _fit(w, h, max_dimension)
+    if (new_w, new_h) != (w, h):
+        image = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_AREA)
+    if plan.header is None:
+        check_image_size(new_w, new_h, max_pixels=max_pixels)
+
+    if plan.reduce_factor > 1 or (new_w, new_h) != (w, h):
+        logger.debug(
+            "image_decoded_reduced",
+            orig_w=plan.header.width if plan.header else w,
+            orig_h=plan.header.height if plan.header else h,
+            reduce_factor=plan.reduce_factor,
+            new_w=new_w,
+            new_h=new_h,
+        )
+    return image
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = [
+    "DecodePlan",
+    "ImageHeader",
+    "check_image_size",
+    "decode_image",
+    "plan_decode",
+    "read_image_header",
+]
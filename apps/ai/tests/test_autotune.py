@@ -0,0 +1,98 @@
+import time
+
+from src.services.ml.autotune import (
+    AutotuneTarget,
+    Measurement,
+    apply_profile,
+    benchmark,
+    candidate_grid,
+    choose,
+    detection_executors,
+    load_profile,
+    save_profile,
+    synthetic_frames,
+    tune,
+)
+
+
+def _fake_factory(loaded):
+    """Latency grows with image size and batch, shrinks with threads."""
+    def factory(candidate):
+        loaded.append((candidate.model, candidate.image_size, candidate.threads))
+        cost = 5e-6 * candidate.image_size * (2 if candidate.model == "big" else 1) / candidate.threads
+        return lambda frames: time.sleep(cost * len(frames))
+    return factory
+
+
+def test_picks_largest_model_and_input_that_meet_the_target():
+    grid = candidate_grid({"small": "s.onnx", "big": "b.onnx"}, [320, 640, 1280], [1, 4], [1])
+    target = AutotuneTarget(cameras=2, fps=50, p95_ms=5.0)  # 100 frames/s, 5 ms per call
+    loaded = []
+    frames = synthetic_frames(1, 64, 96)
+
+    results = benchmark(grid, _fake_factory(loaded), target, 2, frames, iterations=3, warmup_iterations=1)
+    chosen = choose(results, target, ["small", "big"])
+
+    assert chosen.meets(target)
+    assert (chosen.candidate.model, chosen.candidate.image_size) == ("big", 320)
+    # big at 640 px (6.4 ms per frame) misses p95; so does small at 1280 px, whose larger
+    # batches were then never measured
+    measured = {(m.candidate.model, m.candidate.image_size, m.candidate.batch_size) for m in results}
+    assert ("small", 1280, 1) in measured and ("small", 1280, 4) not in measured
+    # each model/size/threads loaded once per stream: no predictor is shared between threads
+    assert all(loaded.count(key) == 2 for key in loaded)
+
+
+def test_falls_back_to_best_throughput_within_latency():
+    target = AutotuneTarget(cameras=100, fps=30, p95_ms=10)
+    grid = candidate_grid({"m": "m.onnx"}, [320], [1, 2], [1])
+    slow = Measurement(grid[0], streams=1, throughput_fps=50, p95_ms=20)
+    fast = Measurement(grid[1], streams=1, throughput_fps=40, p95_ms=8)
+    assert choose([slow, fast], target, ["m"]) is fast
+    assert choose([Measurement(grid[0], 1, error="boom")], target, ["m"]) is None
+
+
+class _Settings:
+    DETECTION_IMAGE_SIZE = 640
+    GRPC_PREFORK_WORKERS = 0
+    INFERENCE_PROCESS_WORKERS = 0
+
+
+def test_streams_follow_the_detection_executors():
+    settings = _Settings()
+    assert detection_executors(settings) == 1  # the in-process batcher
+    settings.INFERENCE_PROCESS_WORKERS = 3
+    assert detection_executors(settings) == 3
+    settings.GRPC_PREFORK_WORKERS = 2
+    assert detection_executors(settings) == 2
+
+
+def test_profile_round_trip_and_fingerprint(tmp_path):
+    target = AutotuneTarget(cameras=1, fps=1, p95_ms=100)
+    grid = candidate_grid({"small": "s.onnx"}, [320], [2], [1])
+    host = {"inference_cores": 1}
+    profile = tune(grid, _fake_factory([]), target, ["small"], "onnxruntime", host, "abc",
+                   synthetic_frames(1, 64, 96), iterations=2, warmup_iterations=0)
+
+    path = tmp_path / "autotune_profile.json"
+    save_profile(path, profile)
+    assert load_profile(path, "abc").settings == profile.settings
+    assert load_profile(path, "other-host") is None
+    assert load_profile(tmp_path / "missing.json") is None
+    assert "CPU_INFERENCE_CONCURRENCY" not in profile.settings  # the lifespan counts executors
+    assert "GRPC_MAX_WORKERS" not in profile.settings  # not benchmarked; keeps the configured value
+
+    settings = _Settings()
+    apply_profile(settings, load_profile(path))
+    assert (settings.DETECTION_IMAGE_SIZE, settings.BATCH_SIZE, settings.DETECTION_ONNX_THREADS) == (320, 2, 1)
+    assert str(settings.DETECTION_ONNX_PATH) == "s.onnx"
+
+
+def test_torch_profile_keeps_the_measured_threads():
+    grid = candidate_grid({"small": "s.pt"}, [320], [1], [2])
+    profile = tune(grid, _fake_factory([]), AutotuneTarget(cameras=1, fps=1, p95_ms=100), ["small"],
+                   "ultralytics", {"inference_cores": 4}, "abc", synthetic_frames(1, 64, 96),
+                   iterations=2, warmup_iterations=0)
+
+    assert profile.settings["CPU_INTRA_OP_THREADS"] == 2  # applied by the CPU budget at startup
+    assert "DETECTION_ONNX_THREADS" not in profile.settings
@@ -0,0 +1,72 @@
+import os
+import threading
+
+import pytest
+
+from src.services.ml.batching import DynamicBatcher
+
+
+def test_concurrent_callers_share_one_batch():
+    calls = []
+
+    def batch_fn(items):
+        calls.append(list(items))
+        return [x * 10 for x in items]
+
+    batcher = DynamicBatcher(batch_fn, max_batch_size=32, max_wait_ms=50)
+    results = {}
+
+    def worker(i):
+        results[i] = batcher.run([i, i + 100])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batcher.close()
+
+    for i in range(4):
+        assert results[i] == [i * 10, (i + 100) * 10]
+    assert len(calls) < 4
+    assert batcher.stats.items == 8
+
+
+def test_oversized_request_is_chunked():
+    sizes = []
+
+    def batch_fn(items):
+        sizes.append(len(items))
+        return list(items)
+
+    batcher = DynamicBatcher(batch_fn, max_batch_size=4, max_wait_ms=0)
+    assert batcher.run(list(range(10))) == list(range(10))
+    batcher.close()
+    assert sizes == [4, 4, 2]
+
+
+def test_errors_reach_every_caller():
+    def batch_fn(items):
+        raise ValueError("boom")
+
+    batcher = DynamicBatcher(batch_fn, max_batch_size=8, max_wait_ms=0)
+    with pytest.raises(ValueError):
+        batcher.run([1])
+    batcher.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork() not available")
+def test_batcher_keeps_working_in_forked_child():
+    batcher = DynamicBatcher(lambda items: [x + 1 for x in items], max_batch_size=4, max_wait_ms=0)
+    assert batcher.run([1]) == [2]
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os._exit(0 if batcher.run([41], timeout=5) == [42] else 1)
+        finally:
+            os._exit(1)
+
+    _, status = os.waitpid(pid, 0)
+    batcher.close()
+    assert os.waitstatus_to_exitcode(status) == 0
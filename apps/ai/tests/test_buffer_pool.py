@@ -0,0 +1,44 @@
+import numpy as np
+
+from src.utils.buffer_pool import BufferPool
+
+
+def test_released_buffers_are_reused_per_shape():
+    pool = BufferPool(max_bytes=1 << 20)
+    a = pool.acquire((64, 64, 3))
+    pool.release(a)
+
+    assert pool.acquire((64, 64, 3)) is a
+    assert pool.acquire((64, 64, 3), np.float32).dtype == np.float32
+    pool.release(a[:8])  # views are never pooled
+
+    stats = pool.stats()
+    assert (stats["hits"], stats["misses"], stats["pooled_buffers"]) == (1, 2, 0)
+
+
+def test_pool_stays_within_budget():
+    pool = BufferPool(max_bytes=3 * 4096, max_per_shape=2)
+    first = [pool.acquire((4096,)) for _ in range(3)]
+    for array in first:
+        pool.release(array)
+    assert pool.stats()["pooled_buffers"] == 2  # per-shape cap
+
+    with pool.borrow((2, 4096)) as big:
+        assert big.shape == (2, 4096)
+    stats = pool.stats()
+    assert stats["pooled_bytes"] <= 3 * 4096
+    assert stats["evictions"] == 1
+
+
+def test_shapes_without_pooled_buffers_leave_no_keys():
+    pool = BufferPool(max_bytes=4 * 4096, max_per_shape=2)
+    for width in range(1, 200):
+        with pool.borrow((width, 64)):
+            pass
+        pool.release(pool.acquire((width, 64)))
+
+    assert len(pool._free) <= pool.stats()["pooled_buffers"] <= 4 * 4096 // 64
+
+    for key in list(pool._free):
+        pool.acquire(*key)
+    assert not pool._free
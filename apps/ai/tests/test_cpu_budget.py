@@ -0,0 +1,37 @@
+import pytest
+
+from src.core.cpu_budget import plan_cpu_layout, read_cgroup_quota
+
+
+def test_cgroup_quota_v2_and_v1(tmp_path):
+    (tmp_path / "cpu.max").write_text("400000 100000\n")
+    assert read_cgroup_quota(tmp_path) == 4.0
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    assert read_cgroup_quota(tmp_path) is None
+
+    v1 = tmp_path / "v1"
+    (v1 / "cpu").mkdir(parents=True)
+    (v1 / "cpu" / "cpu.cfs_quota_us").write_text("150000\n")
+    (v1 / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+    assert read_cgroup_quota(v1) == pytest.approx(1.5)
+    assert read_cgroup_quota(tmp_path / "missing") is None
+
+
+def test_splits_cores_between_io_and_inference():
+    layout = plan_cpu_layout(range(16), inference_concurrency=4)
+    assert (layout.cores, layout.io_cores, layout.inference_cores) == (16, 4, 12)
+    assert (layout.intra_op_threads, layout.interop_threads) == (3, 1)
+    assert layout.io_cpus == (0, 1, 2, 3) and layout.inference_cpus == tuple(range(4, 16))
+    assert [layout.worker_cpus(i, 4) for i in range(4)] == [(4, 5, 6), (7, 8, 9), (10, 11, 12), (13, 14, 15)]
+
+    # 10 RPC threads on a 6-core quota: one thread each, never 16 x 10
+    layout = plan_cpu_layout(range(16), quota_cores=5.5, inference_concurrency=10)
+    assert (layout.cores, layout.io_cores, layout.inference_cores, layout.intra_op_threads) == (6, 1, 5, 1)
+
+    single = plan_cpu_layout([3], io_cores=2)
+    assert (single.io_cores, single.inference_cores, single.intra_op_threads) == (1, 1, 1)
+    assert single.worker_cpus(1, 2) == (3,)
+
+    # Autotuned thread count wins over the even split
+    tuned = plan_cpu_layout(range(16), inference_concurrency=4, intra_op_threads=8)
+    assert tuned.intra_op_threads == 8
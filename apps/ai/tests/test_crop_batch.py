@@ -0,0 +1,36 @@
+import cv2
+import numpy as np
+import pytest
+
+from src.services.ml.crop_batch import crop_views, preprocess_boxes, preprocess_crops
+
+
+def _reference(crop_rgb, size):
+    """The per-crop path this replaces: resize, float, standardize, CHW."""
+    resized = cv2.resize(crop_rgb, (size, size), interpolation=cv2.INTER_LINEAR).astype(np.float32)
+    return ((resized - 127.5) / 128.0).transpose(2, 0, 1)
+
+
+def test_boxes_match_per_crop_reference():
+    frame = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    boxes = [(10, 20, 90, 110), (300.4, 200.6, 160, 160), (600, 400, 80, 120)]  # last one clipped
+
+    batch = preprocess_boxes(frame, boxes, size=160)
+
+    assert batch.shape == (3, 3, 160, 160) and batch.dtype == np.float32
+    for got, view in zip(batch, crop_views(frame, boxes)):
+        expected = _reference(cv2.cvtColor(view, cv2.COLOR_BGR2RGB), 160)
+        np.testing.assert_array_equal(got, expected)
+    assert crop_views(frame, boxes)[2].shape == (80, 40, 3)
+    assert np.shares_memory(crop_views(frame, boxes)[0], frame)
+
+
+def test_writes_into_given_buffer():
+    crops = [np.full((50, 40, 3), (255, 0, 10), dtype=np.uint8), np.zeros((0, 0, 3), dtype=np.uint8)]
+    out = np.empty((2, 3, 16, 16), dtype=np.float32)
+
+    assert preprocess_crops(crops, 16, out=out) is out
+    assert out[0, :, 0, 0] == pytest.approx([(255 - 127.5) / 128, -127.5 / 128, (10 - 127.5) / 128])
+    assert np.allclose(out[1], 0.5 / 128)  # empty crop -> mid-grey
+    with pytest.raises(ValueError):
+        preprocess_crops(crops, 32, out=out)
@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from src.core.deadline import Deadline, StageCostTracker
+from src.core.exceptions import DeadlineExceededException
+
+
+class _Context:
+    def __init__(self, remaining):
+        self._remaining = remaining
+
+    def time_remaining(self):
+        return self._remaining
+
+
+def test_expired_deadline_raises_with_stage():
+    deadline = Deadline(time.monotonic() - 1.0)
+
+    assert deadline.expired
+    assert deadline.remaining_ms() == 0.0
+    with pytest.raises(DeadlineExceededException) as exc:
+        deadline.check("detect")
+    assert exc.value.details["stage"] == "detect"
+    assert exc.value.error_code == "TIMEOUT"
+
+
+def test_grpc_deadline_is_capped_and_earliest_wins():
+    assert not Deadline.from_grpc_context(_Context(None)).expired
+    assert Deadline.from_grpc_context(_Context(None)).allows(1e9)
+
+    capped = Deadline.from_grpc_context(_Context(1e6), max_seconds=1.0)
+    assert 0 < capped.remaining_ms() <= 1000.0
+
+    tight = Deadline.after(0.05)
+    assert Deadline.earliest(None, capped, tight).expires_at == tight.expires_at
+    assert not tight.allows(1000.0)
+
+
+def test_stage_cost_tracker_smooths_observations():
+    tracker = StageCostTracker(alpha=0.5)
+    assert tracker.estimate("embed") == 0.0
+
+    tracker.record("embed", 10.0)
+    tracker.record("embed", 20.0)
+    assert tracker.estimate("embed") == 15.0
+    assert tracker.snapshot() == {"embed": 15.0}
@@ -0,0 +1,151 @@
+import threading
+import time
+
+import numpy as np
+
+from packages.contracts.python import detection_pb2
+from src.api.grpc.servicers.detection_servicer import DetectionServicer
+from src.core.deadline import Deadline
+from src.core.exceptions import DeadlineExceededException, InvalidImageException
+from src.schemas.detection import DetectBatchRequest, DetectRequest, DetectResponse, ImageMetadata
+from src.services.ml.object_detection import ObjectDetectionService
+
+
+class _Engine:
+    def __init__(self):
+        self.batches = []
+
+    def predict_batch(self, images, params):
+        self.batches.append(len(images))
+        metrics = {
+            "inference_time_ms": 1.0,
+            "preprocessing_time_ms": 0.0,
+            "postprocessing_time_ms": 0.0,
+            "total_time_ms": 1.0,
+        }
+        return [([], ImageMetadata(width=img.shape[1], height=img.shape[0], channels=3), metrics) for img in images]
+
+
+def _service(release=None):
+    """Decode: b"bad" fails, b"slow" waits for `release`, otherwise an image len(bytes) wide."""
+    service = ObjectDetectionService()
+    service.detector = object()
+    service.engine = _Engine()
+
+    def decode(image_bytes):
+        if image_bytes == b"bad":
+            raise InvalidImageException("corrupt")
+        if image_bytes == b"slow":
+            release.wait(5)
+        return np.zeros((4, len(image_bytes), 3), dtype=np.uint8)
+
+    service._decode_image = decode
+    return service
+
+
+def _batch(*images):
+    return DetectBatchRequest(
+        requests=[DetectRequest(image=img, request_id=f"r{i}") for i, img in enumerate(images)]
+    )
+
+
+def test_parallel_batch_keeps_request_order_and_per_item_errors():
+    release = threading.Event()
+    service = _service(release)
+    threading.Timer(0.05, release.set).start()
+
+    result = service.detect_batch(_batch(b"a", b"slow", b"bad", b"abcd"))
+
+    assert [r.request_id for r in result.responses] == ["r0", "r1", "r2", "r3"]
+    assert [r.success for r in result.responses] == [True, True, False, True]
+    assert "corrupt" in result.responses[2].error_message
+    assert [r.image_metadata.width for r in (result.responses[0], result.responses[3])] == [1, 4]
+    assert sum(service.engine.batches) == 3
+
+
+def test_items_pending_at_the_deadline_are_expired():
+    release = threading.Event()
+    service = _service(release)
+
+    start = time.monotonic()
+    try:
+        results = dict(service.iter_detect_batch(_batch(b"a", b"slow"), deadline=Deadline.after(0.1)))
+    finally:
+        release.set()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 1.0  # woke at the deadline, not when the slow decode finished
+    assert results[0].success
+    assert not results[1].success
+    assert results[1].error_message == DeadlineExceededException("decode").message
+    assert results[1].request_id == "r1"
+
+
+class _BatchService:
+    def iter_detect_batch(self, request, deadline=None):
+        for index in (2, 0, 1):
+            yield index, DetectResponse(success=True, request_id=request.requests[index].request_id)
+
+
+class _Context:
+    def __init__(self, active_for):
+        self.active_for = active_for
+
+    def peer(self):
+        return "test"
+
+    def time_remaining(self):
+        return None
+
+    def is_active(self):
+        self.active_for -= 1
+        return self.active_for >= 0
+
+
+def _proto_batch(n):
+    return detection_pb2.DetectBatchRequest(
+        requests=[detection_pb2.DetectRequest(image=b"img", request_id=f"r{i}") for i in range(n)]
+    )
+
+
+def test_batch_stream_tags_batch_index_and_stops_when_cancelled():
+    servicer = DetectionServicer(_BatchService())
+
+    streamed = list(servicer.DetectObjectsBatchStream(_proto_batch(3), _Context(active_for=3)))
+    cancelled = list(servicer.DetectObjectsBatchStream(_proto_batch(3), _Context(active_for=1)))
+
+    assert [(r.batch_index, r.request_id) for r in streamed] == [(2, "r2"), (0, "r0"), (1, "r1")]
+    assert [r.batch_index for r in cancelled] == [2]
+
+
+class _DeadlineContext(_Context):
+    def time_remaining(self):
+        return 5.0
+
+
+def test_detect_objects_batch_maps_items_in_request_order():
+    service = _service()
+    deadlines = []
+    detect_batch = service.detect_batch
+
+    def record(request, deadline=None):
+        deadlines.append(deadline)
+        return detect_batch(request, deadline=deadline)
+
+    service.detect_batch = record
+    request = detection_pb2.DetectBatchRequest(
+        requests=[
+            detection_pb2.DetectRequest(image=img, request_id=f"r{i}")
+            for i, img in enumerate((b"ab", b"bad", b"abc"))
+        ],
+        parallel_processing=True,
+    )
+
+    response = DetectionServicer(service).DetectObjectsBatch(request, _DeadlineContext(active_for=0))
+
+    assert 0 < deadlines[0].remaining_ms() <= 5000
+    assert [(r.batch_index, r.request_id, r.success) for r in response.responses] == [
+        (0, "r0", True), (1, "r1", False), (2, "r2", True)
+    ]
+    assert "corrupt" in response.responses[1].error_message
+    assert [r.image_metadata.width for r in (response.responses[0], response.responses[2])] == [2, 3]
@@ -0,0 +1,152 @@
+import threading
+
+import numpy as np
+import pytest
+
+from src.schemas.detection import ImageMetadata
+from src.services.ml.detection_batching import BatchedYoloEngine, DetectionParams
+
+
+class _NativeDetector:
+    """Backend with predict_batch(); echoes each image's fill value as the result."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict_batch(self, images, params):
+        self.calls.append((len(images), list(params)))
+        return [([], ImageMetadata(width=1, height=1, channels=3), {"fill": int(img[0, 0, 0])}) for img in images]
+
+
+class _SequentialDetector:
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, image, conf_threshold, iou_threshold, target_classes, max_detections):
+        self.calls.append((conf_threshold, iou_threshold, target_classes, max_detections))
+        return [], ImageMetadata(width=1, height=1, channels=3), {"fill": int(image[0, 0, 0])}
+
+
+def _image(fill):
+    return np.full((8, 8, 3), fill, dtype=np.uint8)
+
+
+def test_concurrent_predicts_share_one_batch_with_own_params():
+    detector = _NativeDetector()
+    engine = BatchedYoloEngine(detector, max_batch_size=4, max_wait_ms=500)
+    results = {}
+
+    def caller(i):
+        results[i] = engine.predict(
+            _image(i),
+            conf_threshold=0.1 * (i + 1),
+            iou_threshold=0.5,
+            target_classes=[f"class_{i}"],
+            max_detections=10 + i,
+        )
+
+    threads = [threading.Thread(target=caller, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    engine.close()
+
+    assert len(detector.calls) == 1
+    size, params = detector.calls[0]
+    assert size == 4
+    assert sorted((p.target_classes[0], p.max_detections) for p in params) == [
+        (f"class_{i}", 10 + i) for i in range(4)
+    ]
+    for i in range(4):
+        assert results[i][2]["fill"] == i  # every caller gets its own image's result
+
+
+def test_padded_batches_are_trimmed():
+    detector = _NativeDetector()
+    engine = BatchedYoloEngine(detector, image_size=16, max_batch_size=8, batch_buckets=[4, 8])
+
+    results = engine.predict_batch([_image(i) for i in range(3)], [DetectionParams()] * 3)
+    engine.close()
+
+    assert [r[2]["fill"] for r in results] == [0, 1, 2]
+    size, params = detector.calls[0]
+    assert size == 4
+    assert params[3].conf_threshold == 1.0  # padding frame yields nothing
+
+
+def test_sequential_fallback_keeps_order_and_params():
+    detector = _SequentialDetector()
+    engine = BatchedYoloEngine(detector, max_batch_size=4, batch_buckets=[4])
+    params = [DetectionParams(conf_threshold=0.3, target_classes=["car"]), DetectionParams(max_detections=5)]
+
+    results = engine.predict_batch([_image(7), _image(9)], params)
+    engine.close()
+
+    assert engine.mode == "sequential"
+    assert [r[2]["fill"] for r in results] == [7, 9]  # never padded
+    assert detector.calls == [(0.3, 0.45, ["car"], 300), (0.25, 0.45, None, 5)]
+
+
+class _Names:
+    names = {0: "person", 1: "car"}
+
+
+class _NamedDetector(_SequentialDetector):
+    model = _Names()
+
+
+def test_class_names_map_to_ids():
+    engine = BatchedYoloEngine(_NamedDetector())
+    try:
+        assert engine._class_ids(None) is None
+        assert engine._class_ids(["car", "dog"]) == [1]
+        assert engine._class_ids(["dog"]) == []  # unknown only: no detections, not "all classes"
+
+        (det,) = engine._to_detections(np.array([[10, 5, 30, 15, 0.9, 1]]), (20, 40, 3))
+        assert det.class_name == "car"
+        assert (det.bbox.x1_norm, det.bbox.y2_norm) == (0.25, 0.75)
+        assert det.area == 200.0
+    finally:
+        engine.close()
+
+
+def test_ultralytics_boxes_are_scaled_back_to_source_pixels():
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("ultralytics")
+
+    class _Net(torch.nn.Module):
+        names = {0: "person", 1: "car"}
+
+        def __init__(self):
+            super().__init__()
+            self.weight = torch.nn.Parameter(torch.zeros(1))
+
+        def forward(self, x):
+            # One anchor per image: xywh in letterboxed 64x64 pixels, then class scores
+            row = torch.tensor([20.0, 32.0, 20.0, 8.0, 0.0, 0.9])
+            return row.view(1, 6, 1).repeat(x.shape[0], 1, 1)
+
+    class _Yolo:
+        model = _Net()
+        names = _Net.names
+
+    class _Detector:
+        model = _Yolo()
+
+    engine = BatchedYoloEngine(_Detector(), image_size=64)
+    source = np.zeros((32, 128, 3), dtype=np.uint8)  # scaled by 0.5, padded 24px top/bottom
+    try:
+        ((det,), meta, metrics), (filtered, _, _) = engine.predict_batch(
+            [source, source],
+            [DetectionParams(), DetectionParams(target_classes=["person"])],
+        )
+    finally:
+        engine.close()
+
+    assert engine.mode == "ultralytics"
+    assert det.class_name == "car"
+    assert (det.bbox.x1, det.bbox.y1, det.bbox.x2, det.bbox.y2) == pytest.approx((20, 8, 60, 24), abs=1)
+    assert (meta.width, meta.height) == (128, 32)
+    assert metrics["batch_size"] == 2
+    assert filtered == []
@@ -0,0 +1,90 @@
+import grpc
+
+from packages.contracts.python import detection_pb2
+from src.api.grpc.servicers.detection_servicer import DetectionServicer
+from src.core.config import settings
+from src.core.exceptions import DeadlineExceededException
+from src.schemas.detection import BoundingBox, Detection, DetectResponse
+from src.services.ml.object_detection import ObjectDetectionService
+
+
+class _Context:
+    def __init__(self, remaining=None):
+        self.remaining = remaining
+        self.code = None
+        self.details = None
+
+    def peer(self):
+        return "test"
+
+    def time_remaining(self):
+        return self.remaining
+
+    def set_code(self, code):
+        self.code = code
+
+    def set_details(self, details):
+        self.details = details
+
+
+def _service(calls):
+    service = ObjectDetectionService()
+
+    def detect_objects(request, deadline=None):
+        calls.append((request, deadline))
+        det = Detection(
+            class_id=0,
+            class_name="bottle",
+            confidence=0.8,
+            bbox=BoundingBox(x1=1, y1=2, x2=3, y2=4),
+        )
+        return DetectResponse(success=True, detections=[det], request_id=request.request_id)
+
+    service.detect_objects = detect_objects
+    return service
+
+
+def test_detect_objects_runs_under_the_caller_deadline():
+    calls = []
+    servicer = DetectionServicer(_service(calls))
+
+    response = servicer.DetectObjects(
+        detection_pb2.DetectRequest(image=b"img", request_id="r1"), _Context(remaining=2.0)
+    )
+
+    (request, deadline), = calls
+    assert 0 < deadline.remaining_ms() <= 2000
+    assert request.confidence_threshold == settings.DETECTION_CONFIDENCE
+    assert response.success and response.request_id == "r1"
+    assert [(d.class_name, d.bbox.x2) for d in response.detections] == [("bottle", 3)]
+
+
+def test_detect_waste_narrows_to_waste_classes():
+    calls = []
+    servicer = DetectionServicer(_service(calls))
+
+    response = servicer.DetectWaste(
+        detection_pb2.DetectRequest(image=b"img", confidence_threshold=0.99, target_classes=["car"]),
+        _Context(),
+    )
+
+    (request, deadline), = calls
+    assert deadline is not None
+    assert request.target_classes == settings.WASTE_CLASSES
+    assert request.confidence_threshold == settings.WASTE_CONFIDENCE
+    assert response.success
+
+
+def test_detect_objects_maps_deadline_exceeded_status():
+    class _ExpiredService:
+        def detect_objects(self, request, deadline=None):
+            raise DeadlineExceededException("inference")
+
+    context = _Context(remaining=0.0)
+    response = DetectionServicer(_ExpiredService()).DetectObjects(
+        detection_pb2.DetectRequest(image=b"img", request_id="r1"), context
+    )
+
+    assert context.code == grpc.StatusCode.DEADLINE_EXCEEDED
+    assert not response.success
+    assert response.error_message == DeadlineExceededException("inference").message
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from src.services.ml import face_detectors
+from src.services.ml.face_detectors import (
+    available_face_detectors,
+    build_face_detector,
+    faces_from_yunet,
+    register_face_detector,
+)
+
+
+def _row(x, y, w, h, score):
+    """One FaceDetectorYN output row: box, 5 landmarks, score."""
+    landmarks = [x + w * 0.3, y + h * 0.4, x + w * 0.7, y + h * 0.4, x + w * 0.5, y + h * 0.6,
+                 x + w * 0.35, y + h * 0.8, x + w * 0.65, y + h * 0.8]
+    return [x, y, w, h, *landmarks, score]
+
+
+def test_faces_from_yunet_matches_detected_face_layout():
+    image = np.random.default_rng(0).integers(0, 255, (120, 200, 3), dtype=np.uint8)
+    image[..., 0] = 10  # blue channel: crops must come back RGB
+    raw = np.array([
+        _row(10, 10, 50, 60, 0.8),
+        _row(150, 80, 80, 80, 0.95),  # runs off the frame: clipped to 50x40
+        _row(5, 5, 20, 20, 0.99),     # below min_face_size
+    ], dtype=np.float32)
+
+    faces = faces_from_yunet(raw, image, min_face_size=30, max_faces=10)
+
+    assert [f.confidence for f in faces] == pytest.approx([0.95, 0.8])
+    assert faces[0].bbox == (150, 80, 50, 40)
+    assert faces[1].bbox == (10, 10, 50, 60)
+    assert faces[1].landmarks.shape == (5, 2)
+    assert faces[1].crop.shape == (60, 50, 3) and (faces[1].crop[..., 2] == 10).all()
+    assert 0.0 <= faces[1].quality.overall_score <= 1.0
+    assert faces[1].quality.face_size_pixels == 50
+
+    assert len(faces_from_yunet(raw, image, min_face_size=30, max_faces=1)) == 1
+    assert faces_from_yunet(raw, image, return_crops=False, min_face_size=30)[0].crop is None
+    assert faces_from_yunet(None, image) == []
+
+
+def test_registry_builds_by_name(monkeypatch):
+    monkeypatch.setattr(face_detectors, "_FACE_DETECTORS", dict(face_detectors._FACE_DETECTORS))
+    sentinel = object()
+    register_face_detector("stub")(lambda config: sentinel)
+    assert {"mtcnn", "yunet", "stub"} <= set(available_face_detectors())
+    assert build_face_detector("stub", config=None) is sentinel
+    with pytest.raises(ValueError):
+        build_face_detector("missing", config=None)
@@ -0,0 +1,58 @@
+from packages.contracts.python import face_pb2
+from src.api.grpc.servicers.face_servicer import FaceServicer
+from src.services.ml.Face_Recognition_Service import FaceRecognitionService, Timer
+
+
+class _Context:
+    def time_remaining(self):
+        return None
+
+
+class _FaceService:
+    def __init__(self):
+        self.calls = []
+
+    def extract_embeddings(self, **kwargs):
+        self.calls.append(kwargs)
+        return {
+            "success": True,
+            "face_detected": True,
+            "time_ms": 3.0,
+            "faces": [
+                {
+                    "bbox": (1, 2, 30, 40),
+                    "embedding": [0.5, 0.25],
+                    "confidence": 0.9,
+                    "face_id": 0,
+                    "crop_jpeg": b"jpeg-bytes",
+                }
+            ],
+        }
+
+
+def test_extract_embedding_returns_requested_crops():
+    service = _FaceService()
+    servicer = FaceServicer(service)
+
+    resp = servicer.ExtractEmbedding(
+        face_pb2.FaceEmbeddingRequest(image=b"img", include_crops=True), _Context()
+    )
+
+    assert service.calls[0]["include_crops"] is True
+    assert resp.success
+    assert len(resp.faces) == 1
+    assert resp.faces[0].cropped_image == b"jpeg-bytes"
+    assert list(resp.faces[0].embedding_vector) == [0.5, 0.25]
+    assert resp.faces[0].bbox.w == 30.0
+
+
+def test_no_faces_response_reports_partial_like_the_other_builders():
+    service = FaceRecognitionService.__new__(FaceRecognitionService)
+
+    empty = service._build_no_faces_response(camera_id="cam", timer=Timer(), image_shape=(8, 8, 3))
+    frame = service._build_frame_response(
+        faces=[], frame_id=1, camera_id="cam", timer=Timer(), image_width=8, image_height=8
+    )
+
+    assert (empty["partial"], empty["skipped_stages"]) == (frame["partial"], frame["skipped_stages"])
+    assert (empty["partial"], empty["skipped_stages"]) == (False, [])
@@ -0,0 +1,97 @@
+import threading
+
+import cv2
+import numpy as np
+
+from src.schemas.detection import BoundingBox, Detection, DetectResponse
+from src.services.ml.frame_analysis import FrameAnalysisService
+
+
+class _Detections:
+    """Records every decoded frame it is given; finds one person."""
+
+    def __init__(self, fail_waste=False, fail_objects=False):
+        self.frames = []
+        self.requests = []
+        self.fail_waste = fail_waste
+        self.fail_objects = fail_objects
+        self.threads = set()
+
+    def detect_decoded(self, image, request, deadline=None):
+        self.frames.append(image)
+        self.requests.append(request)
+        self.threads.add(threading.get_ident())
+        if self.fail_waste and "person" not in request.target_classes and request.target_classes:
+            raise RuntimeError("boom")
+        if self.fail_objects and not request.target_classes:
+            return DetectResponse(success=False, error_message="model down")
+        person = Detection(
+            class_id=0,
+            class_name="person",
+            confidence=0.9,
+            bbox=BoundingBox(x1=10, y1=10, x2=60, y2=100),
+        )
+        return DetectResponse(success=True, detections=[person], total_objects=1)
+
+
+class _Faces:
+    def __init__(self):
+        self.calls = []
+
+    def process_frame(self, frame, **kwargs):
+        self.calls.append((frame, kwargs))
+        return {"success": True, "faces": [{"bbox": (20, 15, 10, 10)}], "skipped_stages": []}
+
+
+def _jpeg():
+    ok, buf = cv2.imencode(".jpg", np.full((120, 160, 3), 127, dtype=np.uint8))
+    return buf.tobytes()
+
+
+def test_one_decode_feeds_every_analyzer():
+    detections, faces = _Detections(), _Faces()
+    service = FrameAnalysisService(faces, detections, max_workers=2)
+
+    result = service.analyze_frame(_jpeg(), analyzers=["objects", "waste", "face_embeddings"])
+
+    assert result["success"] and not result["partial"]
+    assert result["image"] == {"width": 160, "height": 120, "channels": 3}
+    assert result["objects"].total_objects == 1 and result["waste"] is not None
+    assert len(result["faces"]["faces"]) == 1
+    frame, kwargs = faces.calls[0]
+    assert all(f is frame for f in detections.frames)  # same buffer, decoded once
+    assert kwargs["skip_embedding"] is False and kwargs["person_boxes"] is None
+    assert threading.get_ident() not in detections.threads  # objects ran beside faces
+    service.close()
+
+
+def test_faces_in_persons_only_and_failures_are_reported():
+    detections, faces = _Detections(fail_waste=True), _Faces()
+    service = FrameAnalysisService(faces, detections, max_workers=2)
+
+    result = service.analyze_frame(
+        _jpeg(), analyzers=["waste", "faces"], faces_in_persons_only=True
+    )
+
+    assert result["success"] and result["partial"]
+    assert result["waste"] is None and result["failed_analyzers"][0].startswith("waste")
+    assert any(r.target_classes == ["person"] for r in detections.requests)
+    _, kwargs = faces.calls[0]
+    assert kwargs["person_boxes"] == [[10, 10, 60, 100]]
+    assert kwargs["skip_embedding"] is True
+
+    bad = service.analyze_frame(b"not an image")
+    assert not bad["success"] and bad["error_message"]
+    service.close()
+
+
+def test_failed_person_pass_falls_back_to_full_frame_once():
+    detections, faces = _Detections(fail_objects=True), _Faces()
+    service = FrameAnalysisService(faces, detections, max_workers=2)
+
+    result = service.analyze_frame(_jpeg(), analyzers=["objects", "faces"], faces_in_persons_only=True)
+
+    _, kwargs = faces.calls[0]
+    assert kwargs["person_boxes"] is None  # scan the whole frame, not "no person"
+    assert result["failed_analyzers"] == ["objects: model down"]  # shared future, reported once
+    service.close()
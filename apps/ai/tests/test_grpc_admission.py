@@ -0,0 +1,156 @@
+import threading
+import time
+
+import grpc
+import pytest
+
+from packages.contracts.python import detection_pb2
+from src.api.grpc.admission import AdmissionController, AdmissionRejected, Lane, lane_for_method
+from src.api.grpc.servicers.detection_servicer import DetectionServicer
+from src.schemas.detection import DetectResponse
+
+
+def test_lane_mapping():
+    assert lane_for_method("/sssp.ai.stream.VideoStreamService/StreamFrames") is Lane.STREAM
+    assert lane_for_method("/sssp.ai.detection.DetectionService/DetectObjectsBatch") is Lane.BATCH
+    assert lane_for_method("/sssp.ai.face.FaceService/ExtractEmbeddings") is Lane.UNARY
+    assert lane_for_method("/sssp.ai.face.FaceService/GetModelInfo") is None
+    assert lane_for_method("/grpc.health.v1.Health/Check") is None
+
+
+def test_higher_priority_lane_is_served_first():
+    controller = AdmissionController(max_in_flight=1)
+    held = controller.acquire(Lane.UNARY)
+    order = []
+
+    def waiter(lane):
+        with controller.slot(lane):
+            order.append(lane)
+
+    threads = [threading.Thread(target=waiter, args=(lane,)) for lane in (Lane.BATCH, Lane.STREAM)]
+    for t in threads:
+        t.start()
+        time.sleep(0.02)
+    controller.release(held)
+    for t in threads:
+        t.join()
+
+    assert order == [Lane.STREAM, Lane.BATCH]
+
+
+def test_rejects_when_wait_exceeds_budget():
+    controller = AdmissionController(max_in_flight=1, queue_budgets_ms={Lane.UNARY: 50.0})
+    held = controller.acquire(Lane.UNARY)
+
+    with pytest.raises(AdmissionRejected):
+        controller.acquire(Lane.UNARY)  # times out after 50ms
+
+    time.sleep(0.2)
+    controller.release(held)  # service EWMA is now ~250ms
+
+    held = controller.acquire(Lane.UNARY)
+    start = time.monotonic()
+    with pytest.raises(AdmissionRejected) as exc:
+        controller.acquire(Lane.UNARY)
+    assert time.monotonic() - start < 0.02  # shed up front, no waiting
+    assert exc.value.retry_after_ms > 50.0
+    controller.release(held)
+
+    lanes = controller.snapshot()["lanes"]
+    assert lanes["unary"]["rejected_timeout"] == 1
+    assert lanes["unary"]["rejected_projected"] == 1
+
+
+def test_time_queued_before_acquire_counts_against_budget():
+    controller = AdmissionController(max_in_flight=1, queue_budgets_ms={Lane.UNARY: 100.0})
+
+    ticket = controller.try_acquire(Lane.UNARY)
+    assert ticket is not None
+    assert controller.try_acquire(Lane.UNARY) is None  # would have to queue
+
+    start = time.monotonic()
+    with pytest.raises(AdmissionRejected):
+        controller.acquire(Lane.UNARY, since=start - 0.1)  # budget already spent elsewhere
+    assert time.monotonic() - start < 0.02
+    controller.release(ticket)
+
+    assert controller.snapshot()["lanes"]["unary"]["rejected_timeout"] == 1
+
+
+class _Context:
+    def peer(self):
+        return "test"
+
+    def time_remaining(self):
+        return None
+
+
+class _DetectionService:
+    def detect_objects(self, request, deadline=None):
+        return DetectResponse(success=True, request_id=request.request_id)
+
+
+def test_detect_stream_frames_take_stream_slots():
+    controller = AdmissionController(max_in_flight=1, queue_budgets_ms={Lane.STREAM: 20.0})
+    servicer = DetectionServicer(_DetectionService(), admission=controller)
+    requests = [detection_pb2.DetectRequest(image=b"img", request_id="f0")]
+
+    held = controller.acquire(Lane.UNARY)
+    shed = list(servicer.DetectObjectsStream(iter(requests), _Context()))
+    controller.release(held)
+    served = list(servicer.DetectObjectsStream(iter(requests), _Context()))
+
+    assert not shed[0].success and shed[0].request_id == "f0"
+    assert "overloaded" in shed[0].error_message
+    assert served[0].success
+    lanes = controller.snapshot()["lanes"]
+    assert lanes["stream"]["admitted"] == 1
+    assert lanes["stream"]["rejected_timeout"] == 1
+
+
+def test_unary_call_reaches_admission_past_open_streams(monkeypatch):
+    from src.api.grpc import server as grpc_server
+    from src.core.config import settings
+
+    monkeypatch.setattr(settings, "GRPC_MAX_WORKERS", 2)
+    monkeypatch.setattr(settings, "GRPC_MAX_CONCURRENT_RPCS", 8)
+    controller = AdmissionController(max_in_flight=1, queue_budgets_ms={Lane.UNARY: 100.0})
+    release_streams = threading.Event()
+
+    def stream(request_iterator, context):
+        for _ in request_iterator:
+            release_streams.wait(timeout=10)
+            yield b"frame"
+
+    handler = grpc.method_handlers_generic_handler("test.VideoStreamService", {
+        "StreamFrames": grpc.stream_stream_rpc_method_handler(stream),
+        "DetectFaces": grpc.unary_unary_rpc_method_handler(lambda request, context: b"ok"),
+    })
+    server = grpc_server.create_sync_server(controller)
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+    try:
+        open_stream = channel.stream_stream("/test.VideoStreamService/StreamFrames")
+        unary = channel.unary_unary("/test.VideoStreamService/DetectFaces")
+        streams = [open_stream(iter([b"frame"])) for _ in range(4)]  # 4 > GRPC_MAX_WORKERS
+        time.sleep(0.2)
+
+        start = time.monotonic()
+        assert unary(b"x", timeout=5.0) == b"ok"  # a free slot: admitted at once
+        assert time.monotonic() - start < 1.0
+
+        held = controller.acquire(Lane.UNARY)
+        start = time.monotonic()
+        with pytest.raises(grpc.RpcError) as exc:
+            unary(b"x", timeout=5.0)
+        assert exc.value.code() is grpc.StatusCode.RESOURCE_EXHAUSTED
+        assert time.monotonic() - start < 1.0  # shed within its 100ms budget
+        controller.release(held)
+    finally:
+        release_streams.set()
+        for call in streams:
+            call.cancel()
+        channel.close()
+        server.stop(0)
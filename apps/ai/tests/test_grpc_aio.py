@@ -0,0 +1,175 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+import pytest
+
+from packages.contracts.python import detection_pb2, detection_pb2_grpc, face_pb2, face_pb2_grpc
+from src.api.grpc.admission import AdmissionController, AioAdmissionInterceptor, Lane
+from src.api.grpc.aio_bridge import AioDetectionServicer, AioFaceServicer
+from src.api.grpc.servicers.detection_servicer import DetectionServicer
+from src.schemas.detection import DetectResponse
+
+
+class _SyncFaceServicer:
+    def __init__(self):
+        self.threads = set()
+
+    def GetModelInfo(self, request, context):
+        self.threads.add(threading.current_thread().name)
+        return face_pb2.FaceModelInfoResponse(model_name="stub", is_ready=True)
+
+    def DetectFaces(self, request, context):
+        self.threads.add(threading.current_thread().name)
+        assert context.is_active()
+        # Deadline propagated; grpc-timeout is rounded up on the wire (by < 5%)
+        assert 0.0 < context.time_remaining() <= 5.0 * 1.05
+        context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+        context.set_details("no model")
+        return face_pb2.FaceDetectResponse(success=False)
+
+
+async def _serve(servicer, controller, call):
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="inference")
+    server = grpc.aio.server(interceptors=[AioAdmissionInterceptor(controller)])
+    face_pb2_grpc.add_FaceServiceServicer_to_server(AioFaceServicer(servicer, executor), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+            return await call(face_pb2_grpc.FaceServiceStub(channel))
+    finally:
+        await server.stop(0)
+        executor.shutdown()
+
+
+def test_sync_handlers_run_on_inference_executor():
+    servicer = _SyncFaceServicer()
+
+    async def call(stub):
+        info = await stub.GetModelInfo(face_pb2.FaceModelInfoRequest())
+        with pytest.raises(grpc.aio.AioRpcError) as exc:
+            await stub.DetectFaces(face_pb2.FaceDetectRequest(), timeout=5.0)
+        return info, exc.value
+
+    info, error = asyncio.run(_serve(servicer, AdmissionController(), call))
+
+    assert info.model_name == "stub"
+    assert error.code() is grpc.StatusCode.FAILED_PRECONDITION
+    assert error.details() == "no model"
+    assert all(name.startswith("inference") for name in servicer.threads)
+
+
+def test_aio_interceptor_sheds_with_retry_hint():
+    controller = AdmissionController(max_in_flight=1, queue_budgets_ms={Lane.UNARY: 20.0})
+    held = controller.acquire(Lane.UNARY)
+
+    async def call(stub):
+        with pytest.raises(grpc.aio.AioRpcError) as exc:
+            await stub.DetectFaces(face_pb2.FaceDetectRequest())
+        return exc.value
+
+    error = asyncio.run(_serve(_SyncFaceServicer(), controller, call))
+    controller.release(held)
+
+    assert error.code() is grpc.StatusCode.RESOURCE_EXHAUSTED
+    assert error.trailing_metadata()["retry-after-ms"] == "20"
+
+
+class _Context:
+    def time_remaining(self):
+        return None
+
+
+def test_aio_interceptor_releases_slot_granted_after_cancel():
+    controller = AdmissionController(max_in_flight=1)
+    interceptor = AioAdmissionInterceptor(controller)
+    held = controller.acquire(Lane.UNARY)
+
+    async def scenario():
+        admit = asyncio.ensure_future(interceptor._admit(Lane.UNARY, "/m", _Context()))
+        await asyncio.sleep(0.05)
+        assert controller.snapshot()["lanes"]["unary"]["queued"] == 1
+
+        admit.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await admit
+
+        controller.release(held)  # the abandoned waiter is granted now
+        for _ in range(100):
+            if controller.snapshot()["in_flight"] == 0:
+                break
+            await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+
+    snapshot = controller.snapshot()
+    assert snapshot["in_flight"] == 0
+    assert snapshot["lanes"]["unary"]["admitted"] == 2
+
+
+class _AbortContext(_Context):
+    def __init__(self):
+        self.trailing_metadata = None
+
+    def set_trailing_metadata(self, metadata):
+        self.trailing_metadata = dict(metadata)
+
+    async def abort(self, code, details):
+        raise grpc.RpcError(code, details)
+
+
+def test_aio_interceptor_sheds_on_the_loop_without_a_wait_thread():
+    controller = AdmissionController(max_in_flight=1, queue_budgets_ms={Lane.UNARY: 20.0})
+    interceptor = AioAdmissionInterceptor(controller, wait_threads=1)
+    held = controller.acquire(Lane.UNARY)
+    controller._service_ewma_ms = 1000.0  # a queued request would wait ~1s
+    context = _AbortContext()
+
+    async def admit():
+        return await interceptor._admit(Lane.UNARY, "/m", context)
+
+    with pytest.raises(grpc.RpcError):
+        asyncio.run(admit())
+    controller.release(held)
+    interceptor.close()
+
+    assert context.trailing_metadata["retry-after-ms"] == "1000"
+    assert controller.snapshot()["lanes"]["unary"]["rejected_projected"] == 1
+    assert not interceptor._waiters._threads
+
+
+class _DetectionService:
+    def __init__(self):
+        self.threads = set()
+
+    def detect_objects(self, request, deadline=None):
+        self.threads.add(threading.current_thread().name)
+        return DetectResponse(success=True, request_id=request.request_id)
+
+
+def test_detect_objects_stream_is_served_in_aio_mode():
+    service = _DetectionService()
+
+    async def scenario():
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="inference")
+        server = grpc.aio.server(interceptors=[AioAdmissionInterceptor(AdmissionController())])
+        detection_pb2_grpc.add_DetectionServiceServicer_to_server(
+            AioDetectionServicer(DetectionServicer(service), executor), server
+        )
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        try:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = detection_pb2_grpc.DetectionServiceStub(channel)
+                requests = [
+                    detection_pb2.DetectRequest(image=b"img", request_id=f"f{i}") for i in range(3)
+                ]
+                return [r.request_id async for r in stub.DetectObjectsStream(iter(requests))]
+        finally:
+            await server.stop(0)
+            executor.shutdown()
+
+    assert asyncio.run(scenario()) == ["f0", "f1", "f2"]
+    assert all(name.startswith("inference") for name in service.threads)
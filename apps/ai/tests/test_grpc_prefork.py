@@ -0,0 +1,118 @@
+import gc
+import os
+import time
+
+import pytest
+
+from src.api.grpc.prefork import PreforkSupervisor
+from src.api.lifespan.health_registry import HealthStatus, get_health_registry
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="fork() not available")
+
+
+class _StubServer:
+    """Stands in for GRPCServer; `weights` was built in the parent before fork."""
+
+    def __init__(self, weights):
+        self.weights = weights
+        self.is_running = False
+
+    def start(self):
+        assert self.weights == list(range(1000))
+        self.is_running = True
+
+    def stop(self, grace_period):
+        self.is_running = False
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def _parent_pid(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        return int(f.read().rsplit(")", 1)[1].split()[1])
+
+
+@pytest.fixture
+def health():
+    registry = get_health_registry()
+    registry.clear()
+    yield registry
+    registry.clear()
+
+
+def test_workers_restart_and_report_health(health):
+    weights = list(range(1000))
+    supervisor = PreforkSupervisor(
+        lambda: _StubServer(weights),
+        num_workers=2,
+        host="127.0.0.1",
+        port=0,
+        heartbeat_s=0.1,
+        restart_backoff_s=0.0,
+    )
+    supervisor.start()
+    try:
+        pids = {w["pid"] for w in supervisor.stats()}
+        assert len(pids) == 2 and os.getpid() not in pids
+        assert _wait_for(
+            lambda: health.get_component_health("grpc_server").status is HealthStatus.HEALTHY
+        )
+
+        victim = supervisor.stats()[0]["pid"]
+        os.kill(victim, 9)
+
+        assert _wait_for(lambda: supervisor.stats()[0]["restarts"] == 1)
+        assert _wait_for(lambda: supervisor.stats()[0]["ready"])
+        assert supervisor.stats()[0]["pid"] != victim
+        assert _wait_for(
+            lambda: health.get_component_health("grpc_server").status is HealthStatus.HEALTHY
+        )
+        assert health.get_component_health("grpc_worker_0").metadata["restarts"] == 1
+    finally:
+        supervisor.stop(grace_period=1)
+
+    assert not supervisor.is_running
+    assert not any(w["alive"] for w in supervisor.stats())
+
+
+def test_startup_failure_raises(health):
+    def broken_factory():
+        raise RuntimeError("port in use")
+
+    supervisor = PreforkSupervisor(broken_factory, num_workers=1, host="127.0.0.1", port=0)
+    with pytest.raises(RuntimeError):
+        supervisor.start()
+    assert health.get_component_health("grpc_server").status is not HealthStatus.HEALTHY
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="needs /proc")
+def test_parent_gc_unfrozen_and_restarts_forked_by_spawner(health):
+    weights = list(range(1000))
+    supervisor = PreforkSupervisor(
+        lambda: _StubServer(weights),
+        num_workers=1,
+        host="127.0.0.1",
+        port=0,
+        heartbeat_s=0.1,
+        restart_backoff_s=0.0,
+    )
+    supervisor.start()
+    try:
+        assert gc.get_freeze_count() == 0
+
+        victim = supervisor.stats()[0]["pid"]
+        spawner = _parent_pid(victim)
+        assert spawner != os.getpid()
+        os.kill(victim, 9)
+
+        assert _wait_for(lambda: supervisor.stats()[0]["ready"] and supervisor.stats()[0]["restarts"] == 1)
+        assert _parent_pid(supervisor.stats()[0]["pid"]) == spawner
+    finally:
+        supervisor.stop(grace_period=1)
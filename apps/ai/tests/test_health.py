@@ -17,3 +17,34 @@ def test_root():
     assert response.status_code == 200
     data = response.json()
     assert "service" in data
+
+
+class _Scheduler:
+    def snapshot(self):
+        values = {"queue_depth": 3, "granted_fps": 1.0, "weight": 1.0, "avg_cost_ms": 0.0, "avg_wait_ms": 0.0}
+        return {'cam"1\\\n}': values}
+
+
+class _VideoStream:
+    scheduler = _Scheduler()
+
+
+class _GrpcServer:
+    is_running = True
+    mode = "sync"
+    admission = None
+    video_stream_servicer = _VideoStream()
+
+
+def test_metrics_escape_hostile_camera_ids():
+    previous = getattr(app.state, "grpc_server", None)
+    app.state.grpc_server = _GrpcServer()
+    try:
+        response = client.get("/metrics")
+    finally:
+        app.state.grpc_server = previous
+
+    assert response.status_code == 200
+    lines = response.json().split("\n")
+    assert 'stream_camera_queue_depth{camera_id="cam\\"1\\\\\\n}"} 3' in lines
+    assert not any(line.startswith("}") for line in lines)  # the newline did not split the sample
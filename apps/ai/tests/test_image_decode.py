@@ -0,0 +1,54 @@
+import struct
+import zlib
+
+import cv2
+import numpy as np
+import pytest
+
+from src.core.exceptions import InvalidImageException
+from src.utils.image_decode import ImageHeader, decode_image, plan_decode, read_image_header
+
+
+def _encode(ext, width, height, *params):
+    image = np.random.default_rng(0).integers(0, 255, (height, width, 3), dtype=np.uint8)
+    ok, buf = cv2.imencode(ext, image, list(params))
+    assert ok
+    return buf.tobytes()
+
+
+def _png_header_only(width, height):
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    chunk = b"IHDR" + ihdr
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I", len(ihdr)) + chunk + struct.pack(">I", zlib.crc32(chunk))
+
+
+def test_reads_dimensions_from_headers():
+    assert read_image_header(_encode(".png", 64, 48)) == ImageHeader("png", 64, 48)
+    header = read_image_header(_encode(".jpg", 320, 200))
+    assert (header.format, header.width, header.height) == ("jpeg", 320, 200)
+    progressive = _encode(".jpg", 320, 200, cv2.IMWRITE_JPEG_PROGRESSIVE, 1)
+    assert read_image_header(progressive).width == 320
+    assert read_image_header(b"GIF89a....") is None
+
+
+def test_reduced_jpeg_decode_lands_on_target():
+    data = _encode(".jpg", 3840, 2160)
+    assert plan_decode(read_image_header(data), 1280).reduce_factor == 2
+    assert plan_decode(read_image_header(data), 480).reduce_factor == 8
+    assert plan_decode(read_image_header(_encode(".png", 3840, 2160)), 480).reduce_factor == 1
+
+    assert decode_image(data, max_dimension=1280).shape == (720, 1280, 3)
+    assert decode_image(data, max_dimension=960).shape == (540, 960, 3)
+    assert decode_image(data).shape == (2160, 3840, 3)
+
+
+def test_limits_are_enforced_before_decoding():
+    bomb = _png_header_only(50000, 50000)  # no pixel data at all
+    with pytest.raises(InvalidImageException, match="too large"):
+        decode_image(bomb, max_source_pixels=8192 * 8192)
+    with pytest.raises(InvalidImageException, match="too large"):
+        decode_image(_png_header_only(5000, 5000), max_pixels=4096 * 4096)
+    with pytest.raises(InvalidImageException, match="too small"):
+        decode_image(_encode(".jpg", 30, 30), min_dimension=40)
+    with pytest.raises(InvalidImageException):
+        decode_image(b"\xff\xd8 not really a jpeg")
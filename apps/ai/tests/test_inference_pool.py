@@ -0,0 +1,120 @@
+import os
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+import numpy as np
+import pytest
+
+from src.core.deadline import Deadline
+from src.core.exceptions import DeadlineExceededException
+from src.schemas.detection import DetectBatchRequest, DetectRequest, DetectResponse
+from src.services.workers.pool import InferenceProcessPool, WorkerError
+from src.services.workers.remote import RemoteObjectDetectionService
+
+RUNTIME = "tests.test_inference_pool:create_echo_runtime"
+
+
+class _EchoRuntime:
+    def handle(self, op, frame, **kwargs):
+        if op == "sum":
+            return int(frame.sum()), frame.base is not None, os.getpid()
+        if op == "fail":
+            raise ValueError("boom")
+        if op == "die":
+            os._exit(1)
+        if op == "sleep":
+            time.sleep(kwargs["seconds"])
+        return kwargs
+
+
+def create_echo_runtime():
+    return _EchoRuntime()
+
+
+def create_broken_runtime():
+    raise RuntimeError("no model")
+
+
+@pytest.fixture
+def pool():
+    pool = InferenceProcessPool(RUNTIME, num_workers=2, ring_slots=2, slot_bytes=64 * 64 * 3)
+    pool.start()
+    yield pool
+    pool.close()
+
+
+def test_frames_go_through_shared_memory(pool):
+    frame = np.ones((64, 64, 3), dtype=np.uint8)
+    total, zero_copy, pid = pool.call("sum", frame=frame, timeout=10)
+    assert total == frame.size
+    assert zero_copy  # worker saw a view over the shared slot
+    assert pid != os.getpid()
+
+    big = np.ones((128, 128, 3), dtype=np.uint8)  # larger than a slot: pickled
+    assert pool.call("sum", frame=big, timeout=10)[0] == big.size
+    assert pool.stats()["inline_frames"] == 1
+    assert pool.stats()["shm_free_slots"] == 2
+
+
+def test_errors_and_dead_workers_fail_only_their_jobs(pool):
+    with pytest.raises(WorkerError) as exc:
+        pool.call("fail", timeout=10)
+    assert exc.value.kind == "ValueError"
+
+    with pytest.raises(WorkerError) as exc:
+        pool.call("die", worker=0, timeout=10)
+    assert exc.value.kind == "WorkerDied"
+
+    assert pool.call("echo", worker=0, timeout=60, value=3) == {"value": 3}  # restarted
+    assert pool.stats()["workers"][0]["restarts"] == 1
+
+
+def test_timed_out_job_does_not_break_the_collector(pool):
+    slow = pool.submit("sleep", worker=0, seconds=0.5)
+    with pytest.raises(FutureTimeout):
+        slow.result(timeout=0.05)
+    assert not slow.cancel()  # already handed to the worker
+
+    assert pool.call("echo", worker=0, timeout=10, value=1) == {"value": 1}
+    assert slow.result(timeout=10) == {"seconds": 0.5}
+
+
+def test_worker_that_cannot_start_is_given_up():
+    pool = InferenceProcessPool(
+        "tests.test_inference_pool:create_broken_runtime",
+        num_workers=1,
+        max_restarts=1,
+        restart_backoff_s=0.01,
+        ready_timeout_s=60,
+    )
+    with pytest.raises(RuntimeError):
+        pool.start()
+    worker = pool.stats()["workers"][0]
+    assert worker["gave_up"] and worker["restarts"] == 1
+
+
+class _StuckPool:
+    """Request "done" finishes, "full" cannot be queued, anything else never finishes."""
+
+    def submit(self, op, request=None, deadline=None, **kwargs):
+        if request.request_id == "full":
+            raise WorkerError("PoolClosed", "Inference pool closed")
+        future = Future()
+        if request.request_id == "done":
+            future.set_result(DetectResponse(success=True, request_id="done"))
+        return future
+
+
+def test_remote_batch_expires_stuck_items_and_reports_submit_errors():
+    request = DetectBatchRequest(
+        requests=[DetectRequest(image=b"img", request_id=rid) for rid in ("done", "full", "stuck")]
+    )
+    service = RemoteObjectDetectionService(_StuckPool())
+
+    start = time.monotonic()
+    results = dict(service.iter_detect_batch(request, deadline=Deadline.after(0.1)))
+
+    assert time.monotonic() - start < 1.0
+    assert results[0].success
+    assert not results[1].success and "closed" in results[1].error_message
+    assert results[2].error_message == DeadlineExceededException("inference").message
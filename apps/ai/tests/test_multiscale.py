@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+import pytest
+
+from src.services.ml.multiscale import MultiScaleFaceDetector, proxy_scale
+
+
+@dataclass
+class _Quality:
+    overall_score: float
+    face_size_pixels: int
+
+
+@dataclass
+class _Face:
+    bbox: tuple
+    confidence: float
+    landmarks: np.ndarray
+    quality: _Quality
+    crop: np.ndarray = None
+
+
+class _BlobDetector:
+    """'Faces' are the white squares of the image; remembers what it was shown."""
+
+    def __init__(self):
+        self.calls = []
+
+    def detect_with_quality(self, image, confidence_threshold=0.7, return_crops=True):
+        self.calls.append((image.shape, return_crops))
+        mask = (image[..., 0] > 200).astype(np.uint8)
+        count, _, stats, _ = cv2.connectedComponentsWithStats(mask)
+        faces = []
+        for x, y, w, h, _ in stats[1:count]:
+            landmarks = np.array([[x + w * 0.5, y + h * 0.5]] * 5, dtype=np.float32)
+            crop = image[y:y + h, x:x + w] if return_crops else None
+            faces.append(_Face((int(x), int(y), int(w), int(h)), 0.9, landmarks, _Quality(0.8, min(w, h)), crop))
+        return faces
+
+
+def test_proxy_scale_respects_min_face_floor():
+    assert proxy_scale((1080, 1920), 640) == pytest.approx(1 / 3)
+    assert proxy_scale((1080, 1920), 640, detector_min_face=40, min_face_size=60) == pytest.approx(2 / 3)
+    assert proxy_scale((480, 640), 1280) == 1.0
+
+
+def test_detects_on_proxy_and_crops_from_source():
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    frame[300:420, 900:1020] = 255
+    frame[330:340, 930:940] = (255, 0, 0)  # detail only the source resolution has
+    inner = _BlobDetector()
+
+    faces = MultiScaleFaceDetector(inner, max_dimension=640).detect_with_quality(frame)
+
+    assert inner.calls == [((360, 640, 3), False)]
+    (face,) = faces
+    assert face.bbox == (900, 300, 120, 120)
+    assert face.crop.shape == (120, 120, 3)
+    assert tuple(face.crop[32, 32]) == (0, 0, 255)  # RGB, from the full-resolution frame
+    assert face.quality.face_size_pixels == 120
+    assert face.landmarks[0] == pytest.approx([960, 360])
+
+    small = np.zeros((480, 640, 3), dtype=np.uint8)
+    MultiScaleFaceDetector(inner, max_dimension=640).detect_with_quality(small)
+    assert inner.calls[-1] == ((480, 640, 3), True)
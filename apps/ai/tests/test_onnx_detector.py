@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from src.services.ml.detection_batching import DetectionParams
+from src.services.ml.onnx_detector import OnnxYoloDetector, letterbox, postprocess
+
+
+def _pred(rows):
+    """YOLOv8 output layout (4 + num_classes, anchors) from (cx, cy, w, h, *scores) rows."""
+    return np.asarray(rows, dtype=np.float32).T
+
+
+def test_nms_is_per_class():
+    pred = _pred([
+        (50, 50, 20, 20, 0.9, 0.0),
+        (51, 50, 20, 20, 0.8, 0.0),  # overlaps the first, same class: suppressed
+        (50, 51, 20, 20, 0.0, 0.7),  # same place, other class: kept
+        (10, 10, 4, 4, 0.1, 0.0),    # below threshold
+    ])
+    out = postprocess(pred, conf_threshold=0.25, iou_threshold=0.45, class_ids=None, max_detections=10)
+
+    assert out[:, 5].tolist() == [0.0, 1.0]
+    assert out[0, :4].tolist() == [40.0, 40.0, 60.0, 60.0]
+
+    only_second = postprocess(pred, 0.25, 0.45, class_ids=[1], max_detections=10)
+    assert only_second[:, 5].tolist() == [1.0]
+
+
+def test_letterbox_pads_to_square():
+    image = np.zeros((64, 128, 3), dtype=np.uint8)
+    canvas, gain, (pad_x, pad_y) = letterbox(image, 64)
+    assert canvas.shape == (64, 64, 3)
+    assert gain == 0.5 and (pad_x, pad_y) == (0, 16)
+    assert canvas[0, 0, 0] == 114 and canvas[32, 32, 0] == 0
+
+
+def _constant_model(path, rows):
+    onnx = pytest.importorskip("onnx")
+    from onnx import TensorProto, helper, numpy_helper
+
+    pred = _pred(rows)[None]
+    graph = helper.make_graph(
+        [
+            helper.make_node("Shape", ["images"], ["shape"]),
+            helper.make_node("Constant", [], ["pred"], value=numpy_helper.from_array(pred)),
+        ],
+        "yolo_stub",
+        [helper.make_tensor_value_info("images", TensorProto.FLOAT, [1, 3, 64, 64])],
+        [helper.make_tensor_value_info("pred", TensorProto.FLOAT, list(pred.shape))],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    helper.set_model_props(model, {"names": "{0: 'person', 1: 'car'}"})
+    onnx.save(model, str(path))
+
+
+def test_detector_rescales_to_original_frame(tmp_path):
+    pytest.importorskip("onnxruntime")
+    model_path = tmp_path / "best.onnx"
+    _constant_model(model_path, [(32, 32, 20, 10, 0.9, 0.0), (32, 32, 20, 10, 0.0, 0.6)])
+
+    detector = OnnxYoloDetector(model_path, intra_op_threads=1)
+    assert detector.image_size == 64 and not detector.dynamic_batch
+
+    image = np.zeros((64, 128, 3), dtype=np.uint8)
+    detections, metadata, metrics = detector.predict(image, target_classes=["person"])
+    assert [d.class_name for d in detections] == ["person"]
+    assert detections[0].bbox.to_xyxy() == [44.0, 22.0, 84.0, 42.0]
+    assert (metadata.width, metadata.height) == (128, 64)
+
+    results = detector.predict_batch([image, image], [DetectionParams(), DetectionParams()])
+    assert [len(r[0]) for r in results] == [2, 2]
+    assert results[0][2]["batch_size"] == 2
+
+
+def test_model_input_matches_reference_layout():
+    from src.services.ml.onnx_detector import to_model_input
+
+    rng = np.random.default_rng(0)
+    canvases = [rng.integers(0, 255, (32, 32, 3), dtype=np.uint8) for _ in range(2)]
+    reference = np.stack(canvases)[..., ::-1].transpose(0, 3, 1, 2).astype(np.float32) / 255.0
+    out = np.empty((2, 3, 32, 32), dtype=np.float32)
+
+    batch = to_model_input(canvases, out=out)
+    assert batch is out and batch.dtype == np.float32
+    np.testing.assert_allclose(batch, reference, rtol=1e-6)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from src.services.ml.onnx_embedder import OnnxEmbedderConfig, OnnxFaceEmbedder, cosine_agreement
+
+
+def _pooling_model(path, weights):
+    """(n, 3, s, s) -> mean per channel -> (n, 3) @ weights; dynamic batch like the FaceNet export."""
+    onnx = pytest.importorskip("onnx")
+    from onnx import TensorProto, helper, numpy_helper
+
+    graph = helper.make_graph(
+        [
+            helper.make_node("GlobalAveragePool", ["crops"], ["pooled"]),
+            helper.make_node("Flatten", ["pooled"], ["flat"]),
+            helper.make_node("MatMul", ["flat", "w"], ["embeddings"]),
+        ],
+        "facenet_stub",
+        [helper.make_tensor_value_info("crops", TensorProto.FLOAT, ["batch", 3, 160, 160])],
+        [helper.make_tensor_value_info("embeddings", TensorProto.FLOAT, ["batch", weights.shape[1]])],
+        initializer=[numpy_helper.from_array(weights, name="w")],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    onnx.save(model, str(path))
+
+
+def test_embed_batch_matches_facenet_preprocessing(tmp_path):
+    pytest.importorskip("onnxruntime")
+    weights = np.random.default_rng(0).normal(size=(3, 8)).astype(np.float32)
+    _pooling_model(tmp_path / "facenet.onnx", weights)
+    embedder = OnnxFaceEmbedder(OnnxEmbedderConfig(model_path=tmp_path / "facenet.onnx"))
+
+    crops = [
+        np.full((160, 160, 3), (200, 100, 0), dtype=np.uint8),
+        np.full((90, 70, 3), (10, 20, 30), dtype=np.uint8),  # resized to 160
+    ]
+    embeddings = embedder.embed_batch(crops)
+
+    expected = np.array([[200, 100, 0], [10, 20, 30]], dtype=np.float32)
+    expected = ((expected - 127.5) / 128.0) @ weights
+    assert len(embeddings) == 2
+    assert np.allclose(np.linalg.norm(embeddings, axis=1), 1.0, atol=1e-5)
+    assert cosine_agreement(expected, np.stack(embeddings)).min() > 0.9999
+    assert embedder.embed_batch([]) == []
+
+
+def test_cosine_agreement_is_row_wise():
+    a = np.array([[1.0, 0.0], [0.0, 2.0]])
+    b = np.array([[3.0, 0.0], [1.0, 0.0]])
+    assert cosine_agreement(a, b).tolist() == [1.0, 0.0]
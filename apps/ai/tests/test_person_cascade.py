@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from src.services.ml.person_cascade import PersonFaceCascade, merge_regions, pack_regions
+
+
+@dataclass
+class _Face:
+    bbox: tuple
+    confidence: float
+    landmarks: np.ndarray
+    crop: np.ndarray = None
+
+
+class _BlobDetector:
+    """'Faces' are the white squares of the image; remembers what it was shown."""
+
+    def __init__(self):
+        self.shapes = []
+        self.return_crops = []
+
+    def detect_with_quality(self, image, confidence_threshold=0.7, return_crops=True):
+        self.shapes.append(image.shape)
+        self.return_crops.append(return_crops)
+        mask = (image[..., 0] == 255).astype(np.uint8)
+        count, _, stats, _ = cv2.connectedComponentsWithStats(mask)
+        faces = []
+        for x, y, w, h, _ in stats[1:count]:
+            landmarks = np.array([[x + w * 0.3, y + h * 0.4]] * 5, dtype=np.float32)
+            crop = image[y:y + h, x:x + w] if return_crops else None
+            faces.append(_Face((int(x), int(y), int(w), int(h)), 0.9, landmarks, crop))
+        return faces
+
+
+def _frame():
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+    frame[110:150, 1030:1070] = 255  # head of a person in the top right corner
+    frame[500:540, 100:140] = 255    # head of a person bottom left
+    frame[50:90, 100:140] = 255      # a poster nobody is standing in front of
+    return frame
+
+
+def test_cascade_finds_faces_in_person_boxes_only():
+    detector = _BlobDetector()
+    persons = [[1000, 100, 1100, 400], [80, 490, 160, 720]]
+
+    faces, stats = PersonFaceCascade().detect(detector, _frame(), persons)
+
+    assert stats.mode == "cascade" and stats.regions == 2 and stats.coverage < 0.1
+    assert sorted(f.bbox for f in faces) == [(100, 500, 40, 40), (1030, 110, 40, 40)]
+    top_right = next(f for f in faces if f.bbox[0] == 1030)
+    assert top_right.landmarks[0].tolist() == [1042.0, 126.0]
+    h, w = detector.shapes[0][:2]
+    assert h * w < 0.1 * 720 * 1280
+    assert detector.return_crops == [False]  # crops come from the frame, not the mosaic
+    assert top_right.crop.shape == (40, 40, 3)
+
+
+def test_cascade_falls_back_to_full_frame_and_skips_empty_scenes():
+    detector = _BlobDetector()
+    faces, stats = PersonFaceCascade().detect(detector, _frame(), [[0, 0, 1280, 720]])
+    assert stats.mode == "full_frame" and len(faces) == 3
+
+    faces, stats = PersonFaceCascade().detect(detector, _frame(), [])
+    assert stats.mode == "no_person" and faces == []
+    assert len(detector.shapes) == 1
+
+
+def test_mosaic_detector_only_sees_mosaics():
+    detector, mosaic_detector = _BlobDetector(), _BlobDetector()
+    cascade = PersonFaceCascade()
+
+    cascade.detect(detector, _frame(), [[1000, 100, 1100, 400]], mosaic_detector=mosaic_detector)
+    cascade.detect(detector, _frame(), [[0, 0, 1280, 720]], mosaic_detector=mosaic_detector)
+
+    assert len(mosaic_detector.shapes) == 1 and mosaic_detector.shapes[0] != (720, 1280, 3)
+    assert detector.shapes == [(720, 1280, 3)]
+
+
+def test_regions_merge_and_pack_without_overlap():
+    assert merge_regions([(0, 0, 10, 10), (5, 5, 20, 20), (30, 30, 40, 40)]) == [
+        (0, 0, 20, 20), (30, 30, 40, 40)
+    ]
+    regions = [(0, 0, 60, 50), (0, 0, 60, 40), (0, 0, 60, 30)]
+    positions, size = pack_regions(regions, max_width=130, gap=10)
+    assert positions == [(0, 0), (70, 0), (0, 60)]
+    assert size == (130, 90)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime.quantization")
+onnx = pytest.importorskip("onnx")
+
+from onnx import TensorProto, helper, numpy_helper  # noqa: E402
+
+from src.services.ml.onnx_embedder import cosine_agreement, preprocess_crops  # noqa: E402
+from src.services.ml.quantization import (  # noqa: E402
+    BatchCalibrationReader,
+    quantize_int8,
+    similarity_drift,
+    yolo_head_nodes,
+)
+
+
+def _conv_model(path):
+    """(n, 3, 16, 16) -> Conv -> Relu -> pool -> MatMul, named like an Ultralytics export."""
+    rng = np.random.default_rng(0)
+    graph = helper.make_graph(
+        [
+            helper.make_node("Conv", ["crops", "w", "b"], ["c"], name="/model.0/conv/Conv", pads=[1, 1, 1, 1]),
+            helper.make_node("Relu", ["c"], ["r"], name="/model.0/act/Relu"),
+            helper.make_node("GlobalAveragePool", ["r"], ["p"], name="/model.1/pool"),
+            helper.make_node("Flatten", ["p"], ["f"], name="/model.1/flatten"),
+            helper.make_node("MatMul", ["f", "m"], ["embeddings"], name="/model.1/MatMul"),
+        ],
+        "quant_stub",
+        [helper.make_tensor_value_info("crops", TensorProto.FLOAT, ["batch", 3, 16, 16])],
+        [helper.make_tensor_value_info("embeddings", TensorProto.FLOAT, ["batch", 4])],
+        initializer=[
+            numpy_helper.from_array(rng.normal(size=(8, 3, 3, 3)).astype(np.float32), name="w"),
+            numpy_helper.from_array(rng.normal(size=8).astype(np.float32), name="b"),
+            numpy_helper.from_array(rng.normal(size=(8, 4)).astype(np.float32), name="m"),
+        ],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    onnx.save(model, str(path))
+
+
+def _crops(count, seed):
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, 255, (16, 16, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def test_reader_rewinds():
+    reader = BatchCalibrationReader("crops", _crops(5, 0), lambda b: preprocess_crops(b, 16), batch_size=2)
+    assert len(reader) == 3
+    first = [reader.get_next()["crops"].shape[0] for _ in range(3)]
+    assert first == [2, 2, 1] and reader.get_next() is None
+
+    reader.rewind()
+    assert reader.get_next()["crops"].shape == (2, 3, 16, 16)
+
+
+def test_quantize_int8_writes_qdq_model_close_to_float(tmp_path):
+    import onnxruntime as ort
+
+    _conv_model(tmp_path / "model.onnx")
+    reader = BatchCalibrationReader("crops", _crops(32, 0), lambda b: preprocess_crops(b, 16), batch_size=8)
+    out = quantize_int8(
+        tmp_path / "model.onnx",
+        tmp_path / "model.int8.onnx",
+        reader,
+        nodes_to_exclude=yolo_head_nodes(tmp_path / "model.onnx"),
+    )
+
+    ops = {node.op_type for node in onnx.load(str(out)).graph.node}
+    assert {"QuantizeLinear", "DequantizeLinear"} <= ops
+    assert not (tmp_path / "model.int8.prep.onnx").exists()
+
+    batch = preprocess_crops(_crops(8, 1), 16)
+    ref = ort.InferenceSession(str(tmp_path / "model.onnx")).run(None, {"crops": batch})[0]
+    cand = ort.InferenceSession(str(out)).run(None, {"crops": batch})[0]
+    assert cosine_agreement(ref, cand).min() > 0.99
+    assert similarity_drift(ref, cand) < 0.05
+
+
+def test_yolo_head_nodes_picks_last_module(tmp_path):
+    _conv_model(tmp_path / "model.onnx")
+    assert sorted(yolo_head_nodes(tmp_path / "model.onnx")) == [
+        "/model.1/MatMul", "/model.1/flatten", "/model.1/pool"
+    ]
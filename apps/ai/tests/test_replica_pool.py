@@ -0,0 +1,57 @@
+import threading
+import time
+
+import pytest
+
+from src.core.exceptions import ResourceException
+from src.services.ml.replica_pool import ModelReplicaPool
+
+
+def test_checkout_is_exclusive():
+    pool = ModelReplicaPool(["a", "b"], name="test")
+    active, peak, lock = set(), [0], threading.Lock()
+
+    def request():
+        with pool.checkout(timeout=5) as replica:
+            with lock:
+                assert replica not in active  # never shared between two requests
+                active.add(replica)
+                peak[0] = max(peak[0], len(active))
+            time.sleep(0.01)
+            with lock:
+                active.discard(replica)
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = pool.stats()
+    assert peak[0] == 2
+    assert stats["checkouts"] == 8 and stats["in_use"] == 0
+    assert stats["wait_seconds_total"] > 0 and 0 < stats["utilization"] <= 1
+
+
+def test_checkout_times_out_when_all_busy():
+    pool = ModelReplicaPool(["only"], name="test")
+    with pool.checkout():
+        with pytest.raises(ResourceException):
+            with pool.checkout(timeout=0.01):
+                pass
+    assert pool.stats()["timeouts"] == 1
+    with pool.checkout(timeout=0.01) as replica:  # returned after the with-block
+        assert replica == "only"
+
+
+def test_checkout_each_holds_one_replica_at_a_time():
+    pool = ModelReplicaPool(["a", "b", "c"], name="test")
+    seen = []
+    for replica in pool.checkout_each(timeout=1):
+        seen.append(replica)
+        assert pool.stats()["in_use"] == 1
+        with pool.checkout(timeout=1) as other:
+            assert other != replica  # live requests never get the warming replica
+
+    assert sorted(seen) == ["a", "b", "c"]
+    assert pool.stats()["in_use"] == 0
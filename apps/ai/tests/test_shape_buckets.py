@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from src.services.ml.detection_batching import BatchedYoloEngine, DetectionParams
+from src.services.ml.shape_buckets import BucketedFaceDetector, batch_bucket, frame_bucket, pad_batch
+
+
+@dataclass
+class _Quality:
+    overall_score: float
+    face_size_pixels: int
+
+
+@dataclass
+class _Face:
+    bbox: tuple
+    confidence: float
+    quality: _Quality
+    crop: np.ndarray = None
+
+
+class _BlobDetector:
+    """'Faces' are the white squares of the image; remembers what it was shown."""
+
+    def __init__(self):
+        self.calls = []
+
+    def detect_with_quality(self, image, confidence_threshold=0.7, return_crops=True):
+        self.calls.append((image.shape, return_crops))
+        mask = (image[..., 0] > 200).astype(np.uint8)
+        count, _, stats, _ = cv2.connectedComponentsWithStats(mask)
+        return [
+            _Face((int(x), int(y), int(w), int(h)), 0.9, _Quality(0.8, min(w, h)),
+                  image[y:y + h, x:x + w] if return_crops else None)
+            for x, y, w, h, _ in stats[1:count]
+        ]
+
+
+class _BatchDetector:
+    """Native-batch detector: one result per image, records the batch sizes it ran."""
+
+    def __init__(self):
+        self.batches = []
+
+    def predict_batch(self, images, params):
+        self.batches.append(len(images))
+        return [([], image.shape, {"conf": p.conf_threshold}) for image, p in zip(images, params)]
+
+
+def test_batch_bucket_rounds_up_to_the_next_bucket():
+    buckets = [1, 2, 4, 8]
+    assert [batch_bucket(n, buckets) for n in (1, 2, 3, 5, 8)] == [1, 2, 4, 8, 8]
+    assert batch_bucket(9, buckets) == 9  # above the largest bucket: unchanged
+    assert batch_bucket(3, []) == 3
+    assert pad_batch(["a", "b", "c"], buckets, "pad") == ["a", "b", "c", "pad"]
+
+
+def test_frame_bucket_picks_smallest_containing_size():
+    sizes = [(640, 480), (1280, 720), (1920, 1080)]
+    assert frame_bucket((360, 640, 3), sizes) == (640, 480)
+    assert frame_bucket((720, 1000, 3), sizes) == (1280, 720)
+    assert frame_bucket((1280, 720, 3), sizes) is None  # portrait fits none
+    assert frame_bucket((720, 1000, 3), sizes, max_pad_ratio=1.25) is None  # +32% area: not worth it
+    assert frame_bucket((700, 1200, 3), sizes, max_pad_ratio=1.25) == (1280, 720)
+
+
+def test_detector_sees_padded_frame_and_crops_come_from_source():
+    image = np.zeros((700, 1200, 3), dtype=np.uint8)
+    image[600:700, 1100:1200] = 255  # face touching the bottom-right edge
+    inner = _BlobDetector()
+
+    (face,) = BucketedFaceDetector(inner, [(640, 480), (1280, 720)]).detect_with_quality(image)
+
+    assert inner.calls == [((720, 1280, 3), False)]
+    assert face.bbox == (1100, 600, 100, 100)
+    assert face.crop.shape == (100, 100, 3)
+
+
+def test_bucket_sized_and_oversized_frames_pass_through():
+    inner = _BlobDetector()
+    detector = BucketedFaceDetector(inner, [(640, 480)])
+
+    detector.detect_with_quality(np.zeros((480, 640, 3), np.uint8))
+    detector.detect_with_quality(np.zeros((1080, 1920, 3), np.uint8))
+    detector.detect_with_quality(np.zeros((300, 400, 3), np.uint8))  # bucket is 2.56x its area
+
+    assert inner.calls == [((480, 640, 3), True), ((1080, 1920, 3), True), ((300, 400, 3), True)]
+
+
+def test_engine_pads_batches_to_buckets_and_drops_filler_results():
+    detector = _BatchDetector()
+    engine = BatchedYoloEngine(detector, image_size=64, max_batch_size=8, batch_buckets=[1, 2, 4, 8, 16])
+    try:
+        images = [np.zeros((48, 64, 3), np.uint8)] * 3
+        results = engine.predict_batch(images, [DetectionParams()] * 3)
+    finally:
+        engine.close()
+
+    assert detector.batches == [4]
+    assert [shape for _, shape, _ in results] == [(48, 64, 3)] * 3
+    assert engine.batch_buckets == [1, 2, 4, 8]  # above max_batch_size never happens
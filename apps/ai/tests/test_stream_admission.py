@@ -0,0 +1,59 @@
+from src.services.streaming.admission import FrameAdmission
+
+
+def test_newest_frame_replaces_pending_one():
+    admission = FrameAdmission(max_fps=1000.0, max_age_ms=0)
+    for i in range(5):
+        admission.offer("cam", i, received_at=100.0 + i)
+
+    item, _ = admission.take(timeout=0)
+    assert item == 4
+    assert admission.stats("cam").frames_dropped == 4
+
+
+def test_stale_frames_are_discarded():
+    admission = FrameAdmission(max_fps=1000.0, max_age_ms=50)
+    admission.offer("cam", "old", received_at=0.0)
+
+    assert admission.take(timeout=0) is None
+    assert admission.stats("cam").frames_stale == 1
+
+
+def test_rate_gate_and_aimd_backoff():
+    admission = FrameAdmission(
+        max_fps=10.0, min_fps=1.0, max_age_ms=0, target_latency_ms=100.0
+    )
+    assert admission.offer("cam", 1, received_at=10.0)
+    assert not admission.offer("cam", 2, received_at=10.05)  # < 100ms apart
+    admission.take(timeout=0)
+
+    admission.complete("cam", latency_ms=500.0)
+    assert admission.stats("cam").target_fps < 10.0
+
+    for _ in range(200):
+        admission.complete("cam", latency_ms=10.0)
+    assert admission.stats("cam").target_fps == 10.0
+
+
+def test_drain_ends_after_close():
+    admission = FrameAdmission(max_fps=1000.0, max_age_ms=0)
+    admission.offer("a", "a1", received_at=1.0)
+    admission.offer("b", "b1", received_at=2.0)
+    admission.close()
+
+    items = []
+    for item, _ in admission.drain():
+        items.append(item)
+        admission.complete(item[0], latency_ms=1.0)
+    assert items == ["a1", "b1"]
+
+
+def test_abort_releases_a_blocked_taker():
+    admission = FrameAdmission(max_fps=1000.0, max_age_ms=0, max_in_flight=1)
+    admission.offer("cam", 1, received_at=1.0)
+    admission.take(timeout=0)
+    admission.offer("cam", 2, received_at=2.0)
+
+    assert admission.take(timeout=0.01) is None  # in-flight slot still taken
+    admission.abort()
+    assert admission.take() is None
@@ -0,0 +1,140 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.api.grpc.admission import AdmissionController, Lane
+from src.api.grpc.servicers.video_stream_servicer import VideoStreamService, _FrameJob
+from src.core.deadline import Deadline
+from src.core.exceptions import DeadlineExceededException
+from src.services.streaming.scheduler import CameraScheduler
+from src.services.streaming.pipeline import StagePipeline
+
+
+def test_stages_overlap_and_keep_order():
+    def slow(tag):
+        def fn(item):
+            time.sleep(0.02)
+            return item + [tag]
+        return fn
+
+    pipeline = StagePipeline([("a", slow("a")), ("b", slow("b")), ("c", slow("c"))], queue_size=2)
+    start = time.perf_counter()
+    out = list(pipeline.run([[i] for i in range(10)]))
+    elapsed = time.perf_counter() - start
+
+    assert out == [[i, "a", "b", "c"] for i in range(10)]
+    # Sequential would take 10 * 3 * 20ms = 600ms
+    assert elapsed < 0.45
+
+
+def test_feeder_stops_reading_when_queues_are_full():
+    read = []
+    release = threading.Event()
+
+    def source():
+        for i in range(100):
+            read.append(i)
+            yield i
+
+    def blocked(item):
+        release.wait()
+        return item
+
+    pipeline = StagePipeline([("blocked", blocked)], queue_size=1)
+    results = pipeline.run(source())
+    consumer = threading.Thread(target=lambda: list(results))
+    consumer.start()
+    time.sleep(0.1)
+
+    # One item in the stage, one in each bounded queue, one held by the feeder
+    assert len(read) <= 4
+    release.set()
+    consumer.join(timeout=5)
+    assert len(read) == 100
+
+
+def test_stage_exception_is_raised_to_consumer():
+    def boom(item):
+        if item == 3:
+            raise RuntimeError("boom")
+        return item
+
+    pipeline = StagePipeline([("boom", boom)], queue_size=2)
+    with pytest.raises(RuntimeError):
+        list(pipeline.run(range(10)))
+    assert pipeline.stopped
+
+
+class _LateFaceService:
+    def detect_frame(self, frame, camera_id="unknown", deadline=None, **kwargs):
+        raise DeadlineExceededException("detect")
+
+
+def _job():
+    return _FrameJob(
+        camera_id="cam", frame_id=7, timestamp_ms=0, image_jpeg=b"",
+        frame=np.zeros((8, 8, 3), dtype=np.uint8),
+    )
+
+
+def test_skipped_frames_are_flagged_partial():
+    controller = AdmissionController(max_in_flight=1, queue_budgets_ms={Lane.STREAM: 20.0})
+    service = VideoStreamService(_LateFaceService(), admission=controller)
+
+    late = service._stage_detect(_job())
+
+    held = controller.acquire(Lane.UNARY)
+    shed = service._stage_detect(_job())
+    controller.release(held)
+
+    for job in (late, shed):
+        assert job.failed
+        assert job.response.frame_id == 7
+        assert job.response.partial_result
+        assert list(job.response.skipped_stages) == ["faces"]
+
+
+def test_frame_waiting_past_its_deadline_for_a_turn_is_partial():
+    scheduler = CameraScheduler(slots=1)
+    service = VideoStreamService(_LateFaceService(), scheduler=scheduler)
+    scheduler.acquire("other")
+
+    job = _job()
+    job.deadline = Deadline.after(0.05)
+    start = time.monotonic()
+    job = service._stage_detect(job)
+    scheduler.release("other", cost_ms=0.0)
+
+    assert time.monotonic() - start < 1.0
+    assert job.failed
+    assert job.response.partial_result
+    assert list(job.response.skipped_stages) == ["faces"]
+
+
+class _SlowEmbedFaceService:
+    def embed_frame(self, detection, deadline=None):
+        raise DeadlineExceededException("embed")
+
+    def detection_only_frame(self, detection, skipped_stages):
+        return {
+            "success": True,
+            "faces": [{"face_id": 0, "bbox": (1.0, 2.0, 3.0, 4.0), "confidence": 0.9}],
+            "partial": True,
+            "skipped_stages": list(skipped_stages),
+        }
+
+
+def test_embedding_past_its_deadline_keeps_the_detections():
+    service = VideoStreamService(_SlowEmbedFaceService())
+    job = _job()
+    job.detection = object()
+
+    job = service._stage_serialize(service._stage_embed(job))
+
+    assert not job.failed
+    assert job.response.partial_result
+    assert list(job.response.skipped_stages) == ["embedding"]
+    assert len(job.response.faces) == 1
+    assert not job.response.faces[0].HasField("embedding")
@@ -0,0 +1,89 @@
+import threading
+
+import numpy as np
+
+from src.services.ml.warmup import ShapeWarmup, WarmupTask, detection_tasks, embedder_tasks, face_detector_tasks
+
+
+class _Registry:
+    """HealthRegistry stand-in: last state per component."""
+
+    def __init__(self):
+        self.states = {}
+
+    def register_component(self, name, status=None, **metadata):
+        self.states[name] = metadata["state"]
+
+    def mark_healthy(self, name, **metadata):
+        self.states[name] = "healthy"
+
+    def mark_degraded(self, name, reason, **metadata):
+        self.states[name] = "degraded"
+
+
+class _Embedder:
+    def __init__(self):
+        self.batches = []
+
+    def embed_batch(self, crops):
+        self.batches.append(len(crops))
+        return [np.zeros(4)] * len(crops)
+
+
+class _Detector:
+    def __init__(self):
+        self.shapes = []
+
+    def detect_with_quality(self, image, confidence_threshold=0.7, return_crops=True):
+        self.shapes.append(image.shape)
+        return []
+
+    def predict_batch(self, images, params):
+        self.shapes.append(len(images))
+        return []
+
+
+def test_every_bucket_runs_iterations_times_per_model():
+    embedders, detector = [_Embedder(), _Embedder()], _Detector()
+    tasks = embedder_tasks(lambda: embedders, [4, 1, 2], crop_size=16) + face_detector_tasks(
+        lambda: [detector], [(64, 48)]
+    )
+
+    assert ShapeWarmup(tasks, iterations=2).run() == []
+    assert [t.component for t in tasks] == [
+        "warmup.face_embedder.batch_1",
+        "warmup.face_embedder.batch_2",
+        "warmup.face_embedder.batch_4",
+        "warmup.face_detector.64x48",
+    ]
+    assert embedders[0].batches == embedders[1].batches == [1, 1, 2, 2, 4, 4]
+    assert detector.shapes == [(48, 64, 3)] * 2
+
+
+def test_detection_batches_cycle_frame_sizes():
+    detector = _Detector()
+    (task,) = detection_tasks(detector, [3], [(64, 48), (32, 32)])
+    task.run()
+    assert task.component == "warmup.object_detector.batch_3"
+    assert detector.shapes == [3]
+
+
+def test_background_warmup_reports_per_bucket_readiness():
+    registry, release = _Registry(), threading.Event()
+
+    def fail():
+        raise RuntimeError("kernel missing")
+
+    tasks = [
+        WarmupTask("warmup.m.batch_1", lambda: release.wait(5), "batch_1"),
+        WarmupTask("warmup.m.batch_2", fail, "batch_2"),
+    ]
+    warmup = ShapeWarmup(tasks, iterations=1, registry=registry)
+    warmup.start()
+    assert registry.states == {"warmup.m.batch_1": "pending", "warmup.m.batch_2": "pending"}
+    assert not warmup.done
+
+    release.set()
+    assert warmup.wait(5)
+    assert registry.states == {"warmup.m.batch_1": "healthy", "warmup.m.batch_2": "degraded"}
+    assert warmup.failed == ["warmup.m.batch_2"]
@@ -1,8 +1,9 @@
 # apps/ai/validate_model.py
 from ultralytics import YOLO
 import cv2
+import torch
 
-def validate_model(model_path='runs/detect/sssp_v1/weights/best.pt'):
+def validate_model(model_path='runs/detect/sssp_v1/weights/best.pt', data='data/dataset.yaml'):
     """
     Validate trained model on test set
     """
@@ -10,7 +11,7 @@ def validate_model(model_path='runs/detect/sssp_v1/weights/best.pt'):
     
     # Validate
     metrics = model.val(
-        data='data/dataset.yaml',
+        data=data,
         imgsz=640,
         batch=16,
         conf=0.25,  # Confidence threshold
@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0f\x64\x65tection.proto\x12\x11sssp.ai.detection\"\x8e\x02\n\rDetectRequest\x12\r\n\x05image\x18\x01 \x01(\x0c\x12\x1c\n\x14\x63onfidence_threshold\x18\x02 \x01(\x02\x12\x15\n\riou_threshold\x18\x03 \x01(\x02\x12\x16\n\x0etarget_classes\x18\x04 \x03(\t\x12\x17\n\x0f\x65xclude_classes\x18\x05 \x03(\t\x12\x11\n\tcamera_id\x18\x06 \x01(\t\x12\x11\n\ttimestamp\x18\x07 \x01(\x03\x12\x12\n\nrequest_id\x18\x08 \x01(\t\x12\x17\n\x0f\x65nable_tracking\x18\t \x01(\x08\x12\x1d\n\x15return_cropped_images\x18\n \x01(\x08\x12\x16\n\x0emax_detections\x18\x0b \x01(\x05\"e\n\x12\x44\x65tectBatchRequest\x12\x32\n\x08requests\x18\x01 \x03(\x0b\x32 .sssp.ai.detection.DetectRequest\x12\x1b\n\x13parallel_processing\x18\x02 \x01(\x08\"\x12\n\x10ModelInfoRequest\"\xd3\x02\n\x0e\x44\x65tectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x30\n\ndetections\x18\x03 \x03(\x0b\x32\x1c.sssp.ai.detection.Detection\x12\x15\n\rtotal_objects\x18\x04 \x01(\x05\x12\x19\n\x11inference_time_ms\x18\x05 \x01(\x02\x12\x1d\n\x15preprocessing_time_ms\x18\x06 \x01(\x02\x12\x1e\n\x16postprocessing_time_ms\x18\x07 \x01(\x02\x12\x15\n\rtotal_time_ms\x18\x08 \x01(\x02\x12\x12\n\nrequest_id\x18\t \x01(\t\x12\x11\n\ttimestamp\x18\n \x01(\x03\x12\x38\n\x0eimage_metadata\x18\x0b \x01(\x0b\x32 .sssp.ai.detection.ImageMetadata\"b\n\x13\x44\x65tectBatchResponse\x12\x34\n\tresponses\x18\x01 \x03(\x0b\x32!.sssp.ai.detection.DetectResponse\x12\x15\n\rtotal_time_ms\x18\x02 \x01(\x02\"\x9f\x01\n\x11ModelInfoResponse\x12\x12\n\nmodel_name\x18\x01 \x01(\t\x12\x15\n\rmodel_version\x18\x02 \x01(\t\x12\x0f\n\x07\x63lasses\x18\x03 \x03(\t\x12\x13\n\x0bnum_classes\x18\x04 \x01(\x05\x12\x0e\n\x06\x64\x65vice\x18\x05 \x01(\t\x12\x15\n\rmodel_size_mb\x18\x06 \x01(\x02\x12\x12\n\ninput_size\x18\x07 \x01(\x05\"\xb8\x01\n\tDetection\x12\x12\n\nclass_name\x18\x01 \x01(\t\x12\x10\n\x08\x63lass_id\x18\x02 \x01(\x05\x12\x12\n\nconfidence\x18\x03 \x01(\x02\x12,\n\x04\x62\x62ox\x18\x04 \x01(\x0b\x32\x1e.sssp.ai.detection.BoundingBox\x12\x10\n\x08track_id\x18\x05 \x01(\x05\x12\x15\n\rcropped_image\x18\x06 \x01(\x0c\x12\x0c\n\x04\x61rea\x18\x07 \x01(\x02\x12\x0c\n\x04zone\x18\x08 \x01(\t\"\x81\x01\n\x0b\x42oundingBox\x12\n\n\x02x1\x18\x01 \x01(\x02\x12\n\n\x02y1\x18\x02 \x01(\x02\x12\n\n\x02x2\x18\x03 \x01(\x02\x12\n\n\x02y2\x18\x04 \x01(\x02\x12\x0f\n\x07x1_norm\x18\x05 \x01(\x02\x12\x0f\n\x07y1_norm\x18\x06 \x01(\x02\x12\x0f\n\x07x2_norm\x18\x07 \x01(\x02\x12\x0f\n\x07y2_norm\x18\x08 \x01(\x02\"P\n\rImageMetadata\x12\r\n\x05width\x18\x01 \x01(\x05\x12\x0e\n\x06height\x18\x02 \x01(\x05\x12\x10\n\x08\x63hannels\x18\x03 \x01(\x05\x12\x0e\n\x06\x66ormat\x18\x04 \x01(\t2\xb4\x04\n\x10\x44\x65tectionService\x12T\n\rDetectObjects\x12 .sssp.ai.detection.DetectRequest\x1a!.sssp.ai.detection.DetectResponse\x12R\n\x0b\x44\x65tectWaste\x12 .sssp.ai.detection.DetectRequest\x1a!.sssp.ai.detection.DetectResponse\x12V\n\x0f\x44\x65tectVandalism\x12 .sssp.ai.detection.DetectRequest\x1a!.sssp.ai.detection.DetectResponse\x12\x63\n\x12\x44\x65tectObjectsBatch\x12%.sssp.ai.detection.DetectBatchRequest\x1a&.sssp.ai.detection.DetectBatchResponse\x12^\n\x13\x44\x65tectObjectsStream\x12 .sssp.ai.detection.DetectRequest\x1a!.sssp.ai.detection.DetectResponse(\x01\x30\x01\x12Y\n\x0cGetModelInfo\x12#.sssp.ai.detection.ModelInfoRequest\x1a$.sssp.ai.detection.ModelInfoResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0f\x64\x65tection.proto\x12\x11sssp.ai.detection\"\x8e\x02\n\rDetectRequest\x12\r\n\x05image\x18\x01 \x01(\x0c\x12\x1c\n\x14\x63onfidence_threshold\x18\x02 \x01(\x02\x12\x15\n\riou_threshold\x18\x03 \x01(\x02\x12\x16\n\x0etarget_classes\x18\x04 \x03(\t\x12\x17\n\x0f\x65xclude_classes\x18\x05 \x03(\t\x12\x11\n\tcamera_id\x18\x06 \x01(\t\x12\x11\n\ttimestamp\x18\x07 \x01(\x03\x12\x12\n\nrequest_id\x18\x08 \x01(\t\x12\x17\n\x0f\x65nable_tracking\x18\t \x01(\x08\x12\x1d\n\x15return_cropped_images\x18\n \x01(\x08\x12\x16\n\x0emax_detections\x18\x0b \x01(\x05\"e\n\x12\x44\x65tectBatchRequest\x12\x32\n\x08requests\x18\x01 \x03(\x0b\x32 .sssp.ai.detection.DetectRequest\x12\x1b\n\x13parallel_processing\x18\x02 \x01(\x08\"\x12\n\x10ModelInfoRequest\"\xe8\x02\n\x0e\x44\x65tectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x30\n\ndetections\x18\x03 \x03(\x0b\x32\x1c.sssp.ai.detection.Detection\x12\x15\n\rtotal_objects\x18\x04 \x01(\x05\x12\x19\n\x11inference_time_ms\x18\x05 \x01(\x02\x12\x1d\n\x15preprocessing_time_ms\x18\x06 \x01(\x02\x12\x1e\n\x16postprocessing_time_ms\x18\x07 \x01(\x02\x12\x15\n\rtotal_time_ms\x18\x08 \x01(\x02\x12\x12\n\nrequest_id\x18\t \x01(\t\x12\x11\n\ttimestamp\x18\n \x01(\x03\x12\x38\n\x0eimage_metadata\x18\x0b \x01(\x0b\x32 .sssp.ai.detection.ImageMetadata\x12\x13\n\x0b\x62\x61tch_index\x18\x0c \x01(\x05\"b\n\x13\x44\x65tectBatchResponse\x12\x34\n\tresponses\x18\x01 \x03(\x0b\x32!.sssp.ai.detection.DetectResponse\x12\x15\n\rtotal_time_ms\x18\x02 \x01(\x02\"\x9f\x01\n\x11ModelInfoResponse\x12\x12\n\nmodel_name\x18\x01 \x01(\t\x12\x15\n\rmodel_version\x18\x02 \x01(\t\x12\x0f\n\x07\x63lasses\x18\x03 \x03(\t\x12\x13\n\x0bnum_classes\x18\x04 \x01(\x05\x12\x0e\n\x06\x64\x65vice\x18\x05 \x01(\t\x12\x15\n\rmodel_size_mb\x18\x06 \x01(\x02\x12\x12\n\ninput_size\x18\x07 \x01(\x05\"\xb8\x01\n\tDetection\x12\x12\n\nclass_name\x18\x01 \x01(\t\x12\x10\n\x08\x63lass_id\x18\x02 \x01(\x05\x12\x12\n\nconfidence\x18\x03 \x01(\x02\x12,\n\x04\x62\x62ox\x18\x04 \x01(\x0b\x32\x1e.sssp.ai.detection.BoundingBox\x12\x10\n\x08track_id\x18\x05 \x01(\x05\x12\x15\n\rcropped_image\x18\x06 \x01(\x0c\x12\x0c\n\x04\x61rea\x18\x07 \x01(\x02\x12\x0c\n\x04zone\x18\x08 \x01(\t\"\x81\x01\n\x0b\x42oundingBox\x12\n\n\x02x1\x18\x01 \x01(\x02\x12\n\n\x02y1\x18\x02 \x01(\x02\x12\n\n\x02x2\x18\x03 \x01(\x02\x12\n\n\x02y2\x18\x04 \x01(\x02\x12\x0f\n\x07x1_norm\x18\x05 \x01(\x02\x12\x0f\n\x07y1_norm\x18\x06 \x01(\x02\x12\x0f\n\x07x2_norm\x18\x07 \x01(\x02\x12\x0f\n\x07y2_norm\x18\x08 \x01(\x02\"P\n\rImageMetadata\x12\r\n\x05width\x18\x01 \x01(\x05\x12\x0e\n\x06height\x18\x02 \x01(\x05\x12\x10\n\x08\x63hannels\x18\x03 \x01(\x05\x12\x0e\n\x06\x66ormat\x18\x04 \x01(\t2\x9c\x05\n\x10\x44\x65tectionService\x12T\n\rDetectObjects\x12 .sssp.ai.detection.DetectRequest\x1a!.sssp.ai.detection.DetectResponse\x12R\n\x0b\x44\x65tectWaste\x12 .sssp.ai.detection.DetectRequest\x1a!.sssp.ai.detection.DetectResponse\x12V\n\x0f\x44\x65tectVandalism\x12 .sssp.ai.detection.DetectRequest\x1a!.sssp.ai.detection.DetectResponse\x12\x63\n\x12\x44\x65tectObjectsBatch\x12%.sssp.ai.detection.DetectBatchRequest\x1a&.sssp.ai.detection.DetectBatchResponse\x12\x66\n\x18\x44\x65tectObjectsBatchStream\x12%.sssp.ai.detection.DetectBatchRequest\x1a!.sssp.ai.detection.DetectResponse0\x01\x12^\n\x13\x44\x65tectObjectsStream\x12 .sssp.ai.detection.DetectRequest\x1a!.sssp.ai.detection.DetectResponse(\x01\x30\x01\x12Y\n\x0cGetModelInfo\x12#.sssp.ai.detection.ModelInfoRequest\x1a$.sssp.ai.detection.ModelInfoResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -28,17 +28,17 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_MODELINFOREQUEST']._serialized_start=414
   _globals['_MODELINFOREQUEST']._serialized_end=432
   _globals['_DETECTRESPONSE']._serialized_start=435
-  _globals['_DETECTRESPONSE']._serialized_end=774
-  _globals['_DETECTBATCHRESPONSE']._serialized_start=776
-  _globals['_DETECTBATCHRESPONSE']._serialized_end=874
-  _globals['_MODELINFORESPONSE']._serialized_start=877
-  _globals['_MODELINFORESPONSE']._serialized_end=1036
-  _globals['_DETECTION']._serialized_start=1039
-  _globals['_DETECTION']._serialized_end=1223
-  _globals['_BOUNDINGBOX']._serialized_start=1226
-  _globals['_BOUNDINGBOX']._serialized_end=1355
-  _globals['_IMAGEMETADATA']._serialized_start=1357
-  _globals['_IMAGEMETADATA']._serialized_end=1437
-  _globals['_DETECTIONSERVICE']._serialized_start=1440
-  _globals['_DETECTIONSERVICE']._serialized_end=2004
+  _globals['_DETECTRESPONSE']._serialized_end=795
+  _globals['_DETECTBATCHRESPONSE']._serialized_start=797
+  _globals['_DETECTBATCHRESPONSE']._serialized_end=895
+  _globals['_MODELINFORESPONSE']._serialized_start=898
+  _globals['_MODELINFORESPONSE']._serialized_end=1057
+  _globals['_DETECTION']._serialized_start=1060
+  _globals['_DETECTION']._serialized_end=1244
+  _globals['_BOUNDINGBOX']._serialized_start=1247
+  _globals['_BOUNDINGBOX']._serialized_end=1376
+  _globals['_IMAGEMETADATA']._serialized_start=1378
+  _globals['_IMAGEMETADATA']._serialized_end=1458
+  _globals['_DETECTIONSERVICE']._serialized_start=1461
+  _globals['_DETECTIONSERVICE']._serialized_end=2129
 # @@protoc_insertion_point(module_scope)
@@ -38,6 +38,11 @@ class DetectionServiceStub(object):
                 request_serializer=detection__pb2.DetectBatchRequest.SerializeToString,
                 response_deserializer=detection__pb2.DetectBatchResponse.FromString,
                 )
+        self.DetectObjectsBatchStream = channel.unary_stream(
+                '/sssp.ai.detection.DetectionService/DetectObjectsBatchStream',
+                request_serializer=detection__pb2.DetectBatchRequest.SerializeToString,
+                response_deserializer=detection__pb2.DetectResponse.FromString,
+                )
         self.DetectObjectsStream = channel.stream_stream(
                 '/sssp.ai.detection.DetectionService/DetectObjectsStream',
                 request_serializer=detection__pb2.DetectRequest.SerializeToString,
@@ -85,6 +90,13 @@ class DetectionServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def DetectObjectsBatchStream(self, request, context):
+        """Batch detection, streaming each response back as soon as it is ready
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def DetectObjectsStream(self, request_iterator, context):
         """Stream detection (for video streams)
         """
@@ -122,6 +134,11 @@ def add_DetectionServiceServicer_to_server(servicer, server):
                     request_deserializer=detection__pb2.DetectBatchRequest.FromString,
                     response_serializer=detection__pb2.DetectBatchResponse.SerializeToString,
             ),
+            'DetectObjectsBatchStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.DetectObjectsBatchStream,
+                    request_deserializer=detection__pb2.DetectBatchRequest.FromString,
+                    response_serializer=detection__pb2.DetectResponse.SerializeToString,
+            ),
             'DetectObjectsStream': grpc.stream_stream_rpc_method_handler(
                     servicer.DetectObjectsStream,
                     request_deserializer=detection__pb2.DetectRequest.FromString,
@@ -214,6 +231,23 @@ class DetectionService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def DetectObjectsBatchStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/sssp.ai.detection.DetectionService/DetectObjectsBatchStream',
+            detection__pb2.DetectBatchRequest.SerializeToString,
+            detection__pb2.DetectResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def DetectObjectsStream(request_iterator,
             target,
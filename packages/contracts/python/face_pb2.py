@@ -14,15 +14,15 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nface.proto\x12\x0csssp.ai.face\"j\n\x11\x46\x61\x63\x65\x44\x65tectRequest\x12\r\n\x05image\x18\x01 \x01(\x0c\x12\x1c\n\x14\x63onfidence_threshold\x18\x02 \x01(\x02\x12\x11\n\tmax_faces\x18\x03 \x01(\x05\x12\x15\n\rinclude_crops\x18\x04 \x01(\x08\"\x9d\x01\n\x14\x46\x61\x63\x65\x45mbeddingRequest\x12\r\n\x05image\x18\x01 \x01(\x0c\x12\x11\n\tcamera_id\x18\x02 \x01(\t\x12\x1c\n\x14\x63onfidence_threshold\x18\x03 \x01(\x02\x12\x11\n\tmax_faces\x18\x04 \x01(\x05\x12\x15\n\rinclude_crops\x18\x05 \x01(\x08\x12\x1b\n\x13max_image_dimension\x18\x06 \x01(\x05\"p\n\x11\x46\x61\x63\x65VerifyRequest\x12\r\n\x05image\x18\x01 \x01(\x0c\x12\x11\n\tcamera_id\x18\x02 \x01(\t\x12\x1c\n\x14\x63onfidence_threshold\x18\x03 \x01(\x02\x12\x1b\n\x13return_largest_only\x18\x04 \x01(\x08\"\x80\x01\n\x11\x46\x61\x63\x65\x45nrollRequest\x12\x11\n\tperson_id\x18\x01 \x01(\t\x12\x13\n\x0bperson_name\x18\x02 \x01(\t\x12\x0e\n\x06images\x18\x03 \x03(\x0c\x12\x18\n\x10\x63ompute_template\x18\x04 \x01(\x08\x12\x19\n\x11quality_threshold\x18\x05 \x01(\x02\"\x16\n\x14\x46\x61\x63\x65ModelInfoRequest\"\x80\x01\n\x13\x46rameProcessRequest\x12\r\n\x05\x66rame\x18\x01 \x01(\x0c\x12\x11\n\tcamera_id\x18\x02 \x01(\t\x12\x1c\n\x14\x63onfidence_threshold\x18\x03 \x01(\x02\x12\x11\n\tmax_faces\x18\x04 \x01(\x05\x12\x16\n\x0eskip_embedding\x18\x05 \x01(\x08\"\xc6\x01\n\x12\x46\x61\x63\x65\x44\x65tectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12)\n\x05\x66\x61\x63\x65s\x18\x03 \x03(\x0b\x32\x1a.sssp.ai.face.DetectedFace\x12\x13\n\x0btotal_faces\x18\x04 \x01(\x05\x12\x15\n\rtotal_time_ms\x18\x05 \x01(\x02\x12\x31\n\x07metrics\x18\x06 \x01(\x0b\x32 .sssp.ai.face.PerformanceMetrics\"\x83\x02\n\x15\x46\x61\x63\x65\x45mbeddingResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x15\n\rface_detected\x18\x03 \x01(\x08\x12!\n\x05\x66\x61\x63\x65s\x18\x04 \x03(\x0b\x32\x12.sssp.ai.face.Face\x12\x15\n\rtotal_time_ms\x18\x05 \x01(\x02\x12\x31\n\x07metrics\x18\x06 \x01(\x0b\x32 .sssp.ai.face.PerformanceMetrics\x12\x11\n\tcamera_id\x18\x07 \x01(\t\x12+\n\nerror_code\x18\x08 \x01(\x0e\x32\x17.sssp.ai.face.ErrorCode\"\xea\x01\n\x12\x46\x61\x63\x65VerifyResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x15\n\rface_detected\x18\x03 \x01(\x08\x12(\n\x0clargest_face\x18\x04 \x01(\x0b\x32\x12.sssp.ai.face.Face\x12!\n\x05\x66\x61\x63\x65s\x18\x05 \x03(\x0b\x32\x12.sssp.ai.face.Face\x12\x15\n\rtotal_time_ms\x18\x06 \x01(\x02\x12\x31\n\x07metrics\x18\x07 \x01(\x0b\x32 .sssp.ai.face.PerformanceMetrics\"\xd1\x01\n\x12\x46\x61\x63\x65\x45nrollResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x11\n\tperson_id\x18\x03 \x01(\t\x12\x18\n\x10images_processed\x18\x04 \x01(\x05\x12\x18\n\x10valid_embeddings\x18\x05 \x01(\x05\x12\x1a\n\x12template_embedding\x18\x06 \x03(\x02\x12\x19\n\x11\x61vg_quality_score\x18\x07 \x01(\x02\x12\x15\n\rtotal_time_ms\x18\x08 \x01(\x02\"\x92\x02\n\x15\x46\x61\x63\x65ModelInfoResponse\x12\x12\n\nmodel_name\x18\x01 \x01(\t\x12\x15\n\rmodel_version\x18\x02 \x01(\t\x12\x0e\n\x06\x64\x65vice\x18\x03 \x01(\t\x12\x15\n\rmodel_size_mb\x18\x04 \x01(\x02\x12\x12\n\ninput_size\x18\x05 \x01(\x05\x12\x15\n\rembedding_dim\x18\x06 \x01(\x05\x12\x1c\n\x14total_faces_enrolled\x18\x07 \x01(\x05\x12\x10\n\x08is_ready\x18\x08 \x01(\x08\x12\x15\n\rdetector_type\x18\t \x01(\t\x12\x35\n\x0f\x64\x65tector_config\x18\n \x01(\x0b\x32\x1c.sssp.ai.face.DetectorConfig\"\xd0\x01\n\x14\x46rameProcessResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12!\n\x05\x66\x61\x63\x65s\x18\x03 \x03(\x0b\x32\x12.sssp.ai.face.Face\x12\x10\n\x08\x66rame_id\x18\x04 \x01(\x05\x12\x11\n\tcamera_id\x18\x05 \x01(\t\x12\x15\n\rtotal_time_ms\x18\x06 \x01(\x02\x12\x31\n\x07metrics\x18\x07 \x01(\x0b\x32 .sssp.ai.face.PerformanceMetrics\"\xb1\x01\n\x04\x46\x61\x63\x65\x12\'\n\x04\x62\x62ox\x18\x01 \x01(\x0b\x32\x19.sssp.ai.face.BoundingBox\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x18\n\x10\x65mbedding_vector\x18\x03 \x03(\x02\x12\x15\n\rcropped_image\x18\x04 \x01(\x0c\x12*\n\x07quality\x18\x05 \x01(\x0b\x32\x19.sssp.ai.face.FaceQuality\x12\x0f\n\x07\x66\x61\x63\x65_id\x18\x06 \x01(\x05\"\x9f\x01\n\x0c\x44\x65tectedFace\x12\'\n\x04\x62\x62ox\x18\x01 \x01(\x0b\x32\x19.sssp.ai.face.BoundingBox\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x15\n\rcropped_image\x18\x03 \x01(\x0c\x12*\n\x07quality\x18\x04 \x01(\x0b\x32\x19.sssp.ai.face.FaceQuality\x12\x0f\n\x07\x66\x61\x63\x65_id\x18\x05 \x01(\x05\"9\n\x0b\x42oundingBox\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\x12\t\n\x01w\x18\x03 \x01(\x02\x12\t\n\x01h\x18\x04 \x01(\x02\"\x8f\x01\n\x0b\x46\x61\x63\x65Quality\x12\x15\n\roverall_score\x18\x01 \x01(\x02\x12\x11\n\tsharpness\x18\x02 \x01(\x02\x12\x12\n\nbrightness\x18\x03 \x01(\x02\x12\x18\n\x10\x66\x61\x63\x65_size_pixels\x18\x04 \x01(\x05\x12\r\n\x05pitch\x18\x05 \x01(\x02\x12\x0b\n\x03yaw\x18\x06 \x01(\x02\x12\x0c\n\x04roll\x18\x07 \x01(\x02\"\xaf\x01\n\x12PerformanceMetrics\x12\x14\n\x0c\x64\x65tection_ms\x18\x01 \x01(\x02\x12\x14\n\x0c\x65mbedding_ms\x18\x02 \x01(\x02\x12\x18\n\x10preprocessing_ms\x18\x03 \x01(\x02\x12\x10\n\x08total_ms\x18\x04 \x01(\x02\x12\x13\n\x0bimage_width\x18\x05 \x01(\x05\x12\x14\n\x0cimage_height\x18\x06 \x01(\x05\x12\x16\n\x0e\x66\x61\x63\x65s_detected\x18\x07 \x01(\x05\"j\n\x0e\x44\x65tectorConfig\x12\x15\n\rmin_face_size\x18\x01 \x01(\x05\x12\x1c\n\x14\x63onfidence_threshold\x18\x02 \x01(\x02\x12\x11\n\tmax_faces\x18\x03 \x01(\x05\x12\x10\n\x08keep_all\x18\x04 \x01(\x08*\x83\x01\n\tErrorCode\x12\x1a\n\x16\x45RROR_CODE_UNSPECIFIED\x10\x00\x12\x11\n\rINVALID_IMAGE\x10\x01\x12\x11\n\rNO_FACE_FOUND\x10\x02\x12\x12\n\x0eINTERNAL_ERROR\x10\x03\x12\x13\n\x0fMODEL_NOT_READY\x10\x04\x12\x0b\n\x07TIMEOUT\x10\x05\x32\xec\x04\n\x0b\x46\x61\x63\x65Service\x12P\n\x0b\x44\x65tectFaces\x12\x1f.sssp.ai.face.FaceDetectRequest\x1a .sssp.ai.face.FaceDetectResponse\x12[\n\x10\x45xtractEmbedding\x12\".sssp.ai.face.FaceEmbeddingRequest\x1a#.sssp.ai.face.FaceEmbeddingResponse\x12\\\n\x11\x45xtractEmbeddings\x12\".sssp.ai.face.FaceEmbeddingRequest\x1a#.sssp.ai.face.FaceEmbeddingResponse\x12O\n\nVerifyFace\x12\x1f.sssp.ai.face.FaceVerifyRequest\x1a .sssp.ai.face.FaceVerifyResponse\x12O\n\nEnrollFace\x12\x1f.sssp.ai.face.FaceEnrollRequest\x1a .sssp.ai.face.FaceEnrollResponse\x12W\n\x0cGetModelInfo\x12\".sssp.ai.face.FaceModelInfoRequest\x1a#.sssp.ai.face.FaceModelInfoResponse\x12U\n\x0cProcessFrame\x12!.sssp.ai.face.FrameProcessRequest\x1a\".sssp.ai.face.FrameProcessResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nface.proto\x12\x0csssp.ai.face\"j\n\x11\x46\x61\x63\x65\x44\x65tectRequest\x12\r\n\x05image\x18\x01 \x01(\x0c\x12\x1c\n\x14\x63onfidence_threshold\x18\x02 \x01(\x02\x12\x11\n\tmax_faces\x18\x03 \x01(\x05\x12\x15\n\rinclude_crops\x18\x04 \x01(\x08\"\x9d\x01\n\x14\x46\x61\x63\x65\x45mbeddingRequest\x12\r\n\x05image\x18\x01 \x01(\x0c\x12\x11\n\tcamera_id\x18\x02 \x01(\t\x12\x1c\n\x14\x63onfidence_threshold\x18\x03 \x01(\x02\x12\x11\n\tmax_faces\x18\x04 \x01(\x05\x12\x15\n\rinclude_crops\x18\x05 \x01(\x08\x12\x1b\n\x13max_image_dimension\x18\x06 \x01(\x05\"p\n\x11\x46\x61\x63\x65VerifyRequest\x12\r\n\x05image\x18\x01 \x01(\x0c\x12\x11\n\tcamera_id\x18\x02 \x01(\t\x12\x1c\n\x14\x63onfidence_threshold\x18\x03 \x01(\x02\x12\x1b\n\x13return_largest_only\x18\x04 \x01(\x08\"\x80\x01\n\x11\x46\x61\x63\x65\x45nrollRequest\x12\x11\n\tperson_id\x18\x01 \x01(\t\x12\x13\n\x0bperson_name\x18\x02 \x01(\t\x12\x0e\n\x06images\x18\x03 \x03(\x0c\x12\x18\n\x10\x63ompute_template\x18\x04 \x01(\x08\x12\x19\n\x11quality_threshold\x18\x05 \x01(\x02\"\x16\n\x14\x46\x61\x63\x65ModelInfoRequest\"\x80\x01\n\x13\x46rameProcessRequest\x12\r\n\x05\x66rame\x18\x01 \x01(\x0c\x12\x11\n\tcamera_id\x18\x02 \x01(\t\x12\x1c\n\x14\x63onfidence_threshold\x18\x03 \x01(\x02\x12\x11\n\tmax_faces\x18\x04 \x01(\x05\x12\x16\n\x0eskip_embedding\x18\x05 \x01(\x08\"\xf6\x01\n\x12\x46\x61\x63\x65\x44\x65tectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12)\n\x05\x66\x61\x63\x65s\x18\x03 \x03(\x0b\x32\x1a.sssp.ai.face.DetectedFace\x12\x13\n\x0btotal_faces\x18\x04 \x01(\x05\x12\x15\n\rtotal_time_ms\x18\x05 \x01(\x02\x12\x31\n\x07metrics\x18\x06 \x01(\x0b\x32 .sssp.ai.face.PerformanceMetrics\x12\x16\n\x0epartial_result\x18\x07 \x01(\x08\x12\x16\n\x0eskipped_stages\x18\x08 \x03(\t\"\xb3\x02\n\x15\x46\x61\x63\x65\x45mbeddingResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x15\n\rface_detected\x18\x03 \x01(\x08\x12!\n\x05\x66\x61\x63\x65s\x18\x04 \x03(\x0b\x32\x12.sssp.ai.face.Face\x12\x15\n\rtotal_time_ms\x18\x05 \x01(\x02\x12\x31\n\x07metrics\x18\x06 \x01(\x0b\x32 .sssp.ai.face.PerformanceMetrics\x12\x11\n\tcamera_id\x18\x07 \x01(\t\x12+\n\nerror_code\x18\x08 \x01(\x0e\x32\x17.sssp.ai.face.ErrorCode\x12\x16\n\x0epartial_result\x18\t \x01(\x08\x12\x16\n\x0eskipped_stages\x18\n \x03(\t\"\xea\x01\n\x12\x46\x61\x63\x65VerifyResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x15\n\rface_detected\x18\x03 \x01(\x08\x12(\n\x0clargest_face\x18\x04 \x01(\x0b\x32\x12.sssp.ai.face.Face\x12!\n\x05\x66\x61\x63\x65s\x18\x05 \x03(\x0b\x32\x12.sssp.ai.face.Face\x12\x15\n\rtotal_time_ms\x18\x06 \x01(\x02\x12\x31\n\x07metrics\x18\x07 \x01(\x0b\x32 .sssp.ai.face.PerformanceMetrics\"\xd1\x01\n\x12\x46\x61\x63\x65\x45nrollResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x11\n\tperson_id\x18\x03 \x01(\t\x12\x18\n\x10images_processed\x18\x04 \x01(\x05\x12\x18\n\x10valid_embeddings\x18\x05 \x01(\x05\x12\x1a\n\x12template_embedding\x18\x06 \x03(\x02\x12\x19\n\x11\x61vg_quality_score\x18\x07 \x01(\x02\x12\x15\n\rtotal_time_ms\x18\x08 \x01(\x02\"\x92\x02\n\x15\x46\x61\x63\x65ModelInfoResponse\x12\x12\n\nmodel_name\x18\x01 \x01(\t\x12\x15\n\rmodel_version\x18\x02 \x01(\t\x12\x0e\n\x06\x64\x65vice\x18\x03 \x01(\t\x12\x15\n\rmodel_size_mb\x18\x04 \x01(\x02\x12\x12\n\ninput_size\x18\x05 \x01(\x05\x12\x15\n\rembedding_dim\x18\x06 \x01(\x05\x12\x1c\n\x14total_faces_enrolled\x18\x07 \x01(\x05\x12\x10\n\x08is_ready\x18\x08 \x01(\x08\x12\x15\n\rdetector_type\x18\t \x01(\t\x12\x35\n\x0f\x64\x65tector_config\x18\n \x01(\x0b\x32\x1c.sssp.ai.face.DetectorConfig\"\x80\x02\n\x14\x46rameProcessResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12!\n\x05\x66\x61\x63\x65s\x18\x03 \x03(\x0b\x32\x12.sssp.ai.face.Face\x12\x10\n\x08\x66rame_id\x18\x04 \x01(\x05\x12\x11\n\tcamera_id\x18\x05 \x01(\t\x12\x15\n\rtotal_time_ms\x18\x06 \x01(\x02\x12\x31\n\x07metrics\x18\x07 \x01(\x0b\x32 .sssp.ai.face.PerformanceMetrics\x12\x16\n\x0epartial_result\x18\x08 \x01(\x08\x12\x16\n\x0eskipped_stages\x18\t \x03(\t\"\xb1\x01\n\x04\x46\x61\x63\x65\x12\'\n\x04\x62\x62ox\x18\x01 \x01(\x0b\x32\x19.sssp.ai.face.BoundingBox\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x18\n\x10\x65mbedding_vector\x18\x03 \x03(\x02\x12\x15\n\rcropped_image\x18\x04 \x01(\x0c\x12*\n\x07quality\x18\x05 \x01(\x0b\x32\x19.sssp.ai.face.FaceQuality\x12\x0f\n\x07\x66\x61\x63\x65_id\x18\x06 \x01(\x05\"\x9f\x01\n\x0c\x44\x65tectedFace\x12\'\n\x04\x62\x62ox\x18\x01 \x01(\x0b\x32\x19.sssp.ai.face.BoundingBox\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x15\n\rcropped_image\x18\x03 \x01(\x0c\x12*\n\x07quality\x18\x04 \x01(\x0b\x32\x19.sssp.ai.face.FaceQuality\x12\x0f\n\x07\x66\x61\x63\x65_id\x18\x05 \x01(\x05\"9\n\x0b\x42oundingBox\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\x12\t\n\x01w\x18\x03 \x01(\x02\x12\t\n\x01h\x18\x04 \x01(\x02\"\x8f\x01\n\x0b\x46\x61\x63\x65Quality\x12\x15\n\roverall_score\x18\x01 \x01(\x02\x12\x11\n\tsharpness\x18\x02 \x01(\x02\x12\x12\n\nbrightness\x18\x03 \x01(\x02\x12\x18\n\x10\x66\x61\x63\x65_size_pixels\x18\x04 \x01(\x05\x12\r\n\x05pitch\x18\x05 \x01(\x02\x12\x0b\n\x03yaw\x18\x06 \x01(\x02\x12\x0c\n\x04roll\x18\x07 \x01(\x02\"\xaf\x01\n\x12PerformanceMetrics\x12\x14\n\x0c\x64\x65tection_ms\x18\x01 \x01(\x02\x12\x14\n\x0c\x65mbedding_ms\x18\x02 \x01(\x02\x12\x18\n\x10preprocessing_ms\x18\x03 \x01(\x02\x12\x10\n\x08total_ms\x18\x04 \x01(\x02\x12\x13\n\x0bimage_width\x18\x05 \x01(\x05\x12\x14\n\x0cimage_height\x18\x06 \x01(\x05\x12\x16\n\x0e\x66\x61\x63\x65s_detected\x18\x07 \x01(\x05\"j\n\x0e\x44\x65tectorConfig\x12\x15\n\rmin_face_size\x18\x01 \x01(\x05\x12\x1c\n\x14\x63onfidence_threshold\x18\x02 \x01(\x02\x12\x11\n\tmax_faces\x18\x03 \x01(\x05\x12\x10\n\x08keep_all\x18\x04 \x01(\x08*\x83\x01\n\tErrorCode\x12\x1a\n\x16\x45RROR_CODE_UNSPECIFIED\x10\x00\x12\x11\n\rINVALID_IMAGE\x10\x01\x12\x11\n\rNO_FACE_FOUND\x10\x02\x12\x12\n\x0eINTERNAL_ERROR\x10\x03\x12\x13\n\x0fMODEL_NOT_READY\x10\x04\x12\x0b\n\x07TIMEOUT\x10\x05\x32\xec\x04\n\x0b\x46\x61\x63\x65Service\x12P\n\x0b\x44\x65tectFaces\x12\x1f.sssp.ai.face.FaceDetectRequest\x1a .sssp.ai.face.FaceDetectResponse\x12[\n\x10\x45xtractEmbedding\x12\".sssp.ai.face.FaceEmbeddingRequest\x1a#.sssp.ai.face.FaceEmbeddingResponse\x12\\\n\x11\x45xtractEmbeddings\x12\".sssp.ai.face.FaceEmbeddingRequest\x1a#.sssp.ai.face.FaceEmbeddingResponse\x12O\n\nVerifyFace\x12\x1f.sssp.ai.face.FaceVerifyRequest\x1a .sssp.ai.face.FaceVerifyResponse\x12O\n\nEnrollFace\x12\x1f.sssp.ai.face.FaceEnrollRequest\x1a .sssp.ai.face.FaceEnrollResponse\x12W\n\x0cGetModelInfo\x12\".sssp.ai.face.FaceModelInfoRequest\x1a#.sssp.ai.face.FaceModelInfoResponse\x12U\n\x0cProcessFrame\x12!.sssp.ai.face.FrameProcessRequest\x1a\".sssp.ai.face.FrameProcessResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'face_pb2', _globals)
 if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
-  _globals['_ERRORCODE']._serialized_start=2930
-  _globals['_ERRORCODE']._serialized_end=3061
+  _globals['_ERRORCODE']._serialized_start=3074
+  _globals['_ERRORCODE']._serialized_end=3205
   _globals['_FACEDETECTREQUEST']._serialized_start=28
   _globals['_FACEDETECTREQUEST']._serialized_end=134
   _globals['_FACEEMBEDDINGREQUEST']._serialized_start=137
@@ -36,29 +36,29 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_FRAMEPROCESSREQUEST']._serialized_start=566
   _globals['_FRAMEPROCESSREQUEST']._serialized_end=694
   _globals['_FACEDETECTRESPONSE']._serialized_start=697
-  _globals['_FACEDETECTRESPONSE']._serialized_end=895
-  _globals['_FACEEMBEDDINGRESPONSE']._serialized_start=898
-  _globals['_FACEEMBEDDINGRESPONSE']._serialized_end=1157
-  _globals['_FACEVERIFYRESPONSE']._serialized_start=1160
-  _globals['_FACEVERIFYRESPONSE']._serialized_end=1394
-  _globals['_FACEENROLLRESPONSE']._serialized_start=1397
-  _globals['_FACEENROLLRESPONSE']._serialized_end=1606
-  _globals['_FACEMODELINFORESPONSE']._serialized_start=1609
-  _globals['_FACEMODELINFORESPONSE']._serialized_end=1883
-  _globals['_FRAMEPROCESSRESPONSE']._serialized_start=1886
-  _globals['_FRAMEPROCESSRESPONSE']._serialized_end=2094
-  _globals['_FACE']._serialized_start=2097
-  _globals['_FACE']._serialized_end=2274
-  _globals['_DETECTEDFACE']._serialized_start=2277
-  _globals['_DETECTEDFACE']._serialized_end=2436
-  _globals['_BOUNDINGBOX']._serialized_start=2438
-  _globals['_BOUNDINGBOX']._serialized_end=2495
-  _globals['_FACEQUALITY']._serialized_start=2498
-  _globals['_FACEQUALITY']._serialized_end=2641
-  _globals['_PERFORMANCEMETRICS']._serialized_start=2644
-  _globals['_PERFORMANCEMETRICS']._serialized_end=2819
-  _globals['_DETECTORCONFIG']._serialized_start=2821
-  _globals['_DETECTORCONFIG']._serialized_end=2927
-  _globals['_FACESERVICE']._serialized_start=3064
-  _globals['_FACESERVICE']._serialized_end=3684
+  _globals['_FACEDETECTRESPONSE']._serialized_end=943
+  _globals['_FACEEMBEDDINGRESPONSE']._serialized_start=946
+  _globals['_FACEEMBEDDINGRESPONSE']._serialized_end=1253
+  _globals['_FACEVERIFYRESPONSE']._serialized_start=1256
+  _globals['_FACEVERIFYRESPONSE']._serialized_end=1490
+  _globals['_FACEENROLLRESPONSE']._serialized_start=1493
+  _globals['_FACEENROLLRESPONSE']._serialized_end=1702
+  _globals['_FACEMODELINFORESPONSE']._serialized_start=1705
+  _globals['_FACEMODELINFORESPONSE']._serialized_end=1979
+  _globals['_FRAMEPROCESSRESPONSE']._serialized_start=1982
+  _globals['_FRAMEPROCESSRESPONSE']._serialized_end=2238
+  _globals['_FACE']._serialized_start=2241
+  _globals['_FACE']._serialized_end=2418
+  _globals['_DETECTEDFACE']._serialized_start=2421
+  _globals['_DETECTEDFACE']._serialized_end=2580
+  _globals['_BOUNDINGBOX']._serialized_start=2582
+  _globals['_BOUNDINGBOX']._serialized_end=2639
+  _globals['_FACEQUALITY']._serialized_start=2642
+  _globals['_FACEQUALITY']._serialized_end=2785
+  _globals['_PERFORMANCEMETRICS']._serialized_start=2788
+  _globals['_PERFORMANCEMETRICS']._serialized_end=2963
+  _globals['_DETECTORCONFIG']._serialized_start=2965
+  _globals['_DETECTORCONFIG']._serialized_end=3071
+  _globals['_FACESERVICE']._serialized_start=3208
+  _globals['_FACESERVICE']._serialized_end=3828
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: frame_analysis.proto
+# Protobuf Python Version: 4.25.0
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+import detection_pb2 as detection__pb2
+import face_pb2 as face__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14\x66rame_analysis.proto\x12\x10sssp.ai.analysis\x1a\x0f\x64\x65tection.proto\x1a\nface.proto\"\xce\x02\n\x13\x41nalyzeFrameRequest\x12\r\n\x05image\x18\x01 \x01(\x0c\x12\x11\n\tcamera_id\x18\x02 \x01(\t\x12\x12\n\nrequest_id\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\x03\x12-\n\tanalyzers\x18\x05 \x03(\x0e\x32\x1a.sssp.ai.analysis.Analyzer\x12#\n\x1bobject_confidence_threshold\x18\x06 \x01(\x02\x12\x15\n\riou_threshold\x18\x07 \x01(\x02\x12\x16\n\x0etarget_classes\x18\x08 \x03(\t\x12\x16\n\x0emax_detections\x18\t \x01(\x05\x12!\n\x19\x66\x61\x63\x65_confidence_threshold\x18\n \x01(\x02\x12\x11\n\tmax_faces\x18\x0b \x01(\x05\x12\x1d\n\x15\x66\x61\x63\x65s_in_persons_only\x18\x0c \x01(\x08\"\xec\x03\n\x14\x41nalyzeFrameResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x11\n\tcamera_id\x18\x03 \x01(\t\x12\x12\n\nrequest_id\x18\x04 \x01(\t\x12\x11\n\ttimestamp\x18\x05 \x01(\x03\x12\x38\n\x0eimage_metadata\x18\x06 \x01(\x0b\x32 .sssp.ai.detection.ImageMetadata\x12\x32\n\x07objects\x18\x07 \x01(\x0b\x32!.sssp.ai.detection.DetectResponse\x12\x30\n\x05waste\x18\x08 \x01(\x0b\x32!.sssp.ai.detection.DetectResponse\x12!\n\x05\x66\x61\x63\x65s\x18\t \x03(\x0b\x32\x12.sssp.ai.face.Face\x12\x36\n\x0c\x66\x61\x63\x65_metrics\x18\n \x01(\x0b\x32 .sssp.ai.face.PerformanceMetrics\x12\x16\n\x0e\x64\x65\x63ode_time_ms\x18\x0b \x01(\x02\x12\x15\n\rtotal_time_ms\x18\x0c \x01(\x02\x12\x16\n\x0epartial_result\x18\r \x01(\x08\x12\x16\n\x0eskipped_stages\x18\x0e \x03(\t\x12\x18\n\x10\x66\x61iled_analyzers\x18\x0f \x03(\t*\\\n\x08\x41nalyzer\x12\x18\n\x14\x41NALYZER_UNSPECIFIED\x10\x00\x12\x0b\n\x07OBJECTS\x10\x01\x12\t\n\x05WASTE\x10\x02\x12\t\n\x05\x46\x41\x43\x45S\x10\x03\x12\x13\n\x0f\x46\x41\x43\x45_EMBEDDINGS\x10\x04\x32u\n\x14\x46rameAnalysisService\x12]\n\x0c\x41nalyzeFrame\x12%.sssp.ai.analysis.AnalyzeFrameRequest\x1a&.sssp.ai.analysis.AnalyzeFrameResponseb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'frame_analysis_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_ANALYZER']._serialized_start=903
+  _globals['_ANALYZER']._serialized_end=995
+  _globals['_ANALYZEFRAMEREQUEST']._serialized_start=72
+  _globals['_ANALYZEFRAMEREQUEST']._serialized_end=406
+  _globals['_ANALYZEFRAMERESPONSE']._serialized_start=409
+  _globals['_ANALYZEFRAMERESPONSE']._serialized_end=901
+  _globals['_FRAMEANALYSISSERVICE']._serialized_start=997
+  _globals['_FRAMEANALYSISSERVICE']._serialized_end=1114
+# @@protoc_insertion_point(module_scope)
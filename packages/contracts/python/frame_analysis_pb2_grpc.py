@@ -0,0 +1,79 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+
+import frame_analysis_pb2 as frame__analysis__pb2
+
+
+class FrameAnalysisServiceStub(object):
+    """============================================================================
+    Frame Analysis Service - one decode, several analyzers
+    ============================================================================
+
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.AnalyzeFrame = channel.unary_unary(
+                '/sssp.ai.analysis.FrameAnalysisService/AnalyzeFrame',
+                request_serializer=frame__analysis__pb2.AnalyzeFrameRequest.SerializeToString,
+                response_deserializer=frame__analysis__pb2.AnalyzeFrameResponse.FromString,
+                )
+
+
+class FrameAnalysisServiceServicer(object):
+    """============================================================================
+    Frame Analysis Service - one decode, several analyzers
+    ============================================================================
+
+    """
+
+    def AnalyzeFrame(self, request, context):
+        """Decode the frame once and run the selected analyzers on it
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_FrameAnalysisServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'AnalyzeFrame': grpc.unary_unary_rpc_method_handler(
+                    servicer.AnalyzeFrame,
+                    request_deserializer=frame__analysis__pb2.AnalyzeFrameRequest.FromString,
+                    response_serializer=frame__analysis__pb2.AnalyzeFrameResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'sssp.ai.analysis.FrameAnalysisService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class FrameAnalysisService(object):
+    """============================================================================
+    Frame Analysis Service - one decode, several analyzers
+    ============================================================================
+
+    """
+
+    @staticmethod
+    def AnalyzeFrame(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/sssp.ai.analysis.FrameAnalysisService/AnalyzeFrame',
+            frame__analysis__pb2.AnalyzeFrameRequest.SerializeToString,
+            frame__analysis__pb2.AnalyzeFrameResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)